@@ -6,14 +6,16 @@ No hardcoded patterns - all decisions made by LLM.
 
 Flow:
 1. THINK: LLM analyzes the query and plans approach
-2. ACT: LLM calls appropriate tool(s)
-3. OBSERVE: LLM sees tool result
-4. DECIDE: LLM decides if done or needs more steps
-5. REPEAT until done (max steps limit)
+2. ACT: LLM calls appropriate tool(s); independent calls from one response run concurrently
+3. OBSERVE: LLM sees tool results
+4. DECIDE: Folded into the next ACT call - the LLM either calls more tools or answers
+5. REPEAT until done (max steps limit, counted in tool batches)
 """
+import asyncio
 import json
 import logging
 import datetime
+import time
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 
@@ -42,6 +44,9 @@ class AgentResult:
     tool_calls: List[Dict[str, Any]]
     tool_results: List[Any]  # Added: Full tool outputs
     final_answer: str
+    llm_round_trips: int = 0  # LLM calls made for this query
+    tool_batches: int = 0  # ACT steps that executed tools (each may run several tools)
+    wall_time_ms: float = 0.0
 
 
 class LLMDrivenPMAgent:
@@ -68,6 +73,7 @@ class LLMDrivenPMAgent:
         self.on_tool_result = on_tool_result  # PLAN 9: Callback for real-time tool result streaming
         self.steps: List[AgentStep] = []
         self.tool_results: List[Tuple[str, str, str]] = []  # (tool_name, args, result)
+        self.llm_round_trips = 0
         self.global_optimizer = GlobalContextOptimizer()  # NEW: Global Optimizer instance
     
     def _get_system_prompt(self) -> str:
@@ -233,6 +239,7 @@ For each user request, you will:
 
 ## Important Guidelines
 - You can call multiple tools if needed to fully answer a question
+- When several tool calls do not depend on each other's results, request them together in one response - they run in parallel
 - Always aim to provide complete, actionable information. **List all relevant items found.**
 - For analysis requests (e.g., "who is overloaded"), process the data yourself
 - Be concise but thorough in your final response
@@ -286,7 +293,7 @@ IMPORTANT:
         )
         
         # Get LLM's thinking (without tool calls for this step)
-        response = await self.llm.ainvoke(optimized_conversation)
+        response = await self._invoke_llm(optimized_conversation)
         thinking = response.content
         
         self.steps.append(AgentStep(
@@ -299,130 +306,153 @@ IMPORTANT:
         
         return thinking
     
-    async def _act(self, user_query: str, conversation: List) -> Optional[Tuple[str, Dict, str]]:
-        """Execute a tool call."""
-        # Bind tools and invoke
-        llm_with_tools = self.llm.bind_tools(self.tools, tool_choice="auto")
-        
-        response = await llm_with_tools.ainvoke(conversation)
-        
-        if not hasattr(response, 'tool_calls') or not response.tool_calls:
-            # No tool call - LLM is providing final answer
-            return None
-        
-        tool_call = response.tool_calls[0]
+    async def _invoke_llm(self, messages: List, with_tools: bool = False):
+        """Invoke the LLM, counting round-trips."""
+        self.llm_round_trips += 1
+        if with_tools:
+            llm_with_tools = self.llm.bind_tools(self.tools, tool_choice="auto")
+            return await llm_with_tools.ainvoke(messages)
+        return await self.llm.ainvoke(messages)
+
+    async def _execute_tool_call(self, tool_call: Dict[str, Any], user_query: str) -> Tuple[str, Dict, str, str, str]:
+        """Execute one tool call and optimize its result."""
         tool_name = tool_call['name']
         tool_args = tool_call['args']
         tool_call_id = tool_call['id']
-        
-        # ALWAYS inject the canonical project_id from context
-        # The LLM sometimes extracts partial IDs from tool results (e.g., "478" instead of "uuid:478")
-        tool_args['project_id'] = self.project_id
-        
-        self.steps.append(AgentStep(
-            type="tool_call",
-            content=f"{tool_name}({json.dumps(tool_args)})",
-            metadata={"tool": tool_name, "args": tool_args, "id": tool_call_id}
-        ))
-        
-        logger.info(f"[PM-AGENT] 🔧 TOOL CALL: {tool_name}({tool_args})")
-        
-        # Execute tool
+
         tool_result = None
         for tool in self.tools:
             if tool.name == tool_name:
-                tool_result = await tool.ainvoke(tool_args)
+                try:
+                    tool_result = await tool.ainvoke(tool_args)
+                except Exception as e:
+                    # Report the failure to the LLM instead of failing the whole batch
+                    logger.error(f"[PM-AGENT] Tool {tool_name} failed: {e}")
+                    tool_result = f"Error: Tool '{tool_name}' failed: {e}"
                 break
-        
+
         if tool_result is None:
             tool_result = f"Error: Tool '{tool_name}' not found"
-        
+
         result_str = str(tool_result)
-        
+
         # PLAN 9: Call callback for real-time streaming
         if self.on_tool_result:
             try:
                 await self.on_tool_result(tool_name, tool_call_id, result_str)
             except Exception as e:
                 logger.error(f"[PM-AGENT] Error in tool result callback: {e}")
-        
+
         # OPTIMIZATION: Reduce result size if too large
         optimized_result = await self.global_optimizer.optimize_tool_result(tool_name, result_str, user_query)
-        
-        self.steps.append(AgentStep(
-            type="tool_result",
-            content=optimized_result, # Store optimized result
-            metadata={"tool": tool_name, "length": len(optimized_result), "original_length": len(result_str), "id": tool_call_id}
-        ))
-        
-        
-        self.tool_results.append((tool_name, json.dumps(tool_args), optimized_result))
-        
-        logger.info(f"[PM-AGENT] 📋 TOOL RESULT: {len(result_str)} -> {len(optimized_result)} chars")
+
+        logger.info(f"[PM-AGENT] 📋 TOOL RESULT: {tool_name} {len(result_str)} -> {len(optimized_result)} chars")
         logger.info(f"[COUNTER-DEBUG] {datetime.datetime.now().isoformat()} pm_agent captured: tool={tool_name}, result_len={len(result_str)}")
-        
-        return tool_name, tool_args, result_str, tool_call_id
-    
-    async def _decide(self, user_query: str, tool_result: str, conversation: List) -> Tuple[bool, str]:
-        """Let LLM decide if we're done or need more steps."""
-        
+
+        return tool_name, tool_args, result_str, tool_call_id, optimized_result
+
+    async def _act(self, user_query: str, conversation: List, is_follow_up: bool = False) -> Tuple[Optional[str], List[Tuple[str, Dict, str, str]]]:
+        """
+        Ask the LLM for its next tool calls and execute them concurrently.
+
+        Returns (final_answer, executed_calls). When the LLM answers without
+        calling tools, executed_calls is empty and final_answer holds the answer.
+        On follow-up steps this call also records the DECIDE outcome, so no
+        separate decision round-trip is needed.
+        """
+        response = await self._invoke_llm(conversation, with_tools=True)
+
+        if not hasattr(response, 'tool_calls') or not response.tool_calls:
+            # No tool call - LLM is providing final answer
+            if is_follow_up:
+                self.steps.append(AgentStep(
+                    type="decision",
+                    content="Complete - providing final answer",
+                    metadata={"action": "done"}
+                ))
+                logger.info(f"[PM-AGENT] ✅ DECISION: Complete")
+            return response.content, []
+
+        if is_follow_up:
+            self.steps.append(AgentStep(
+                type="decision",
+                content="Need more information, calling another tool",
+                metadata={"action": "continue"}
+            ))
+            logger.info(f"[PM-AGENT] 🔄 DECISION: Need more info, continuing...")
+
+        tool_calls = []
+        for tool_call in response.tool_calls:
+            # ALWAYS inject the canonical project_id from context
+            # The LLM sometimes extracts partial IDs from tool results (e.g., "478" instead of "uuid:478")
+            tool_args = {**tool_call['args'], 'project_id': self.project_id}
+            tool_calls.append({"id": tool_call['id'], "name": tool_call['name'], "args": tool_args})
+
+            self.steps.append(AgentStep(
+                type="tool_call",
+                content=f"{tool_call['name']}({json.dumps(tool_args)})",
+                metadata={"tool": tool_call['name'], "args": tool_args, "id": tool_call['id']}
+            ))
+            logger.info(f"[PM-AGENT] 🔧 TOOL CALL: {tool_call['name']}({tool_args})")
+
+        if len(tool_calls) > 1:
+            logger.info(f"[PM-AGENT] ⚡ Executing {len(tool_calls)} tool calls in parallel")
+        executed = await asyncio.gather(*(
+            self._execute_tool_call(tool_call, user_query) for tool_call in tool_calls
+        ))
+
+        # Add tool calls and results to conversation
+        conversation.append(AIMessage(content="", tool_calls=tool_calls))
+        results = []
+        for tool_name, tool_args, result_str, tool_call_id, optimized_result in executed:
+            self.steps.append(AgentStep(
+                type="tool_result",
+                content=optimized_result,  # Store optimized result
+                metadata={"tool": tool_name, "length": len(optimized_result), "original_length": len(result_str), "id": tool_call_id}
+            ))
+            self.tool_results.append((tool_name, json.dumps(tool_args), optimized_result))
+            conversation.append(ToolMessage(
+                content=result_str[:50000],  # Limit for context
+                tool_call_id=tool_call_id,
+                name=tool_name
+            ))
+            results.append((tool_name, tool_args, result_str, tool_call_id))
+
+        return None, results
+
+    def _decide_prompt(self, user_query: str) -> str:
+        """Prompt asking the LLM to either answer or call more tools, sent with the next ACT call."""
         # Build summary of already-called tools to prevent duplicate calls
         called_tools_summary = ""
         if self.tool_results:
             called_tools_summary = "\n\n## IMPORTANT: Tools Already Called (DO NOT REPEAT)\n"
             for tool_name, tool_args, result in self.tool_results:
-                result_preview = result[:200] + "..." if len(result) > 200 else result
                 called_tools_summary += f"- **{tool_name}**({tool_args}): {len(result)} chars\n"
             called_tools_summary += "\n⚠️ Do NOT call the same tool with the same arguments again - you already have that data!\n"
-        
-        decide_prompt = f"""Based on the tool result, decide:
 
-1. Does this result fully answer the user's question: "{user_query}"?
-2. Do I need to call ANOTHER tool (with DIFFERENT parameters) for more information?
+        return f"""Based on the tool results, decide:
+
+1. Do these results fully answer the user's question: "{user_query}"?
+2. Do I need to call OTHER tools (with DIFFERENT parameters) for more information?
 3. Do I need to analyze/process this data further?
 {called_tools_summary}
 If you have enough information, provide your final answer now.
-If you need more data (e.g., missing metrics for a report), call a DIFFERENT tool or use DIFFERENT parameters.
+If you need more data (e.g., missing metrics for a report), call DIFFERENT tools or use DIFFERENT parameters. Request independent tool calls together so they run in parallel.
 **CRITICAL**: If the user asked for a REPORT (Sprint/Weekly) and you are missing data (like story points or completion rate), do NOT just provide a partial list. Try to calculate it from `list_tasks` or call another tool. If you truly cannot find it, state that explicitly.
 
 Be concise and actionable."""
 
-        conversation.append(HumanMessage(content=decide_prompt))
-        
-        # Check if LLM wants to call another tool
-        llm_with_tools = self.llm.bind_tools(self.tools, tool_choice="auto")
-        response = await llm_with_tools.ainvoke(conversation)
-        
-        if hasattr(response, 'tool_calls') and response.tool_calls:
-            # LLM wants to call another tool
-            self.steps.append(AgentStep(
-                type="decision",
-                content="Need more information, calling another tool",
-                metadata={"action": "continue"}
-            ))
-            logger.info(f"[PM-AGENT] 🔄 DECISION: Need more info, continuing...")
-            return False, ""
-        
-        # LLM is done - this is the final answer
-        final_answer = response.content
-        
-        self.steps.append(AgentStep(
-            type="decision",
-            content="Complete - providing final answer",
-            metadata={"action": "done"}
-        ))
-        
-        logger.info(f"[PM-AGENT] ✅ DECISION: Complete")
-        
-        return True, final_answer
-    
     async def run(self, user_query: str) -> AgentResult:
         """
         Run the agent on a user query.
         
+        Each step is one ACT call whose tool calls run concurrently; max_steps
+        limits these batches, not individual tools.
+        
         Returns AgentResult with success status, result, and all steps.
         """
         logger.info(f"[PM-AGENT] 🚀 Starting agent for: {user_query[:100]}...")
+        started = time.perf_counter()
         
         # Build initial conversation
         system_msg = SystemMessage(content=self._get_system_prompt())
@@ -432,6 +462,7 @@ Be concise and actionable."""
         final_result = ""
         all_tool_calls = []
         all_tool_outputs = [] # Capture actual results
+        tool_batches = 0
         
         for step in range(self.max_steps):
             step_ts = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
@@ -443,39 +474,40 @@ Be concise and actionable."""
                 think_ts = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
                 logger.info(f"[{think_ts}] [PM-AGENT] 🧠 Starting initial thinking phase...")
                 await self._think(user_query, conversation)
+            else:
+                # DECIDE: folded into this step's ACT call
+                conversation.append(HumanMessage(content=self._decide_prompt(user_query)))
             
-            # ACT: Try to call a tool
-            act_result = await self._act(user_query, conversation)
+            # ACT: Try to call tools
+            final_answer, executed = await self._act(user_query, conversation, is_follow_up=step > 0)
             
-            if act_result is None:
+            if not executed:
                 # No tool call - LLM is providing final answer directly
-                llm_response = await self.llm.ainvoke(conversation)
-                final_result = llm_response.content
+                final_result = final_answer
+                if not final_result:
+                    llm_response = await self._invoke_llm(conversation)
+                    final_result = llm_response.content
                 break
             
-            tool_name, tool_args, tool_result, tool_call_id = act_result
-            all_tool_calls.append({
-                "result_length": len(tool_result)
-            })
-            all_tool_outputs.append(tool_result)
-            
-            # Add tool call and result to conversation
-            conversation.append(AIMessage(
-                content="",
-                tool_calls=[{"id": tool_call_id, "name": tool_name, "args": tool_args}]
-            ))
-            conversation.append(ToolMessage(
-                content=tool_result[:50000],  # Limit for context
-                tool_call_id=tool_call_id,
-                name=tool_name
-            ))
-            
-            # DECIDE: Check if we're done
-            is_done, final_answer = await self._decide(user_query, tool_result, conversation)
-            
-            if is_done:
-                final_result = final_answer or tool_result
-                break
+            tool_batches += 1
+            for tool_name, tool_args, tool_result, tool_call_id in executed:
+                all_tool_calls.append({
+                    "result_length": len(tool_result)
+                })
+                all_tool_outputs.append(tool_result)
+        else:
+            # Step budget used up while still calling tools: answer from what we have
+            if self.tool_results:
+                conversation.append(HumanMessage(
+                    content=f"{self._decide_prompt(user_query)}\n\nNo more tool calls are possible. Provide your final answer now."
+                ))
+                llm_response = await self._invoke_llm(conversation)
+                final_result = llm_response.content
+                self.steps.append(AgentStep(
+                    type="decision",
+                    content="Complete - providing final answer",
+                    metadata={"action": "done"}
+                ))
         
         # Build final result
         if not final_result:
@@ -485,7 +517,12 @@ Be concise and actionable."""
             else:
                 final_result = "Unable to complete the request within the allowed steps."
         
-        logger.info(f"[PM-AGENT] 🏁 Agent complete with {len(self.steps)} steps")
+        wall_time_ms = (time.perf_counter() - started) * 1000
+        logger.info(
+            f"[PM-AGENT] 🏁 Agent complete with {len(self.steps)} steps: "
+            f"{self.llm_round_trips} LLM round-trips, {tool_batches} tool batches, "
+            f"{len(all_tool_calls)} tool calls, {wall_time_ms:.0f}ms"
+        )
         
         return AgentResult(
             success=True,
@@ -493,7 +530,10 @@ Be concise and actionable."""
             steps=self.steps,
             tool_calls=all_tool_calls,
             tool_results=all_tool_outputs,
-            final_answer=final_result
+            final_answer=final_result,
+            llm_round_trips=self.llm_round_trips,
+            tool_batches=tool_batches,
+            wall_time_ms=wall_time_ms
         )
     
     def get_thoughts_for_ui(self) -> List[Dict[str, Any]]:
@@ -569,7 +609,7 @@ async def run_pm_agent(
         user_query: User's question/request
         project_id: Current project ID
         thread_id: Conversation ID for context optimization
-        max_steps: Maximum iterations
+        max_steps: Maximum number of tool batches (parallel tool calls count once)
         on_tool_result: Async callback for real-time tool result streaming
     
     Returns:
@@ -6,12 +6,159 @@ information relevant to the user's query.
 """
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 from langchain_core.messages import SystemMessage, HumanMessage
 from backend.llms.llm import get_llm_by_type
 
 logger = logging.getLogger(__name__)
 
+# Keys under which list tools wrap their items
+LIST_WRAPPER_KEYS = ["tasks", "issues", "items", "results", "data"]
+
+# Fields the system needs regardless of the query (IDs, status, story points)
+CRITICAL_FIELDS = {
+    "id", "title", "name", "status", "state",
+    "sprint_id", "project_id",
+    "story_points", "storyPoints", "story_point", "custom_fields", # Story Points robustness
+    "_links", "sprint", "version"
+}
+
+# Query classes, matched by keywords at the start of a word in the user query
+QUERY_CLASS_KEYWORDS = {
+    "detail": ["describe", "description", "detail", "explain", "content", "what is", "about"],
+    "assignment": ["assign", "who", "own", "member", "workload", "doing"],
+    "effort": ["point", "estimate", "effort", "hour", "velocity", "capacity", "progress", "spent"],
+    "schedule": ["due", "deadline", "overdue", "late", "date", "when", "timeline", "schedule"],
+    "priority": ["priority", "urgent", "critical", "blocker", "important"],
+    "count": ["how many", "count", "number of", "total"],
+}
+
+# Declared output schemas of task list tools.
+# "fields" are always kept; "query_fields" adds fields per query class.
+_TASK_LIST_SCHEMA = {
+    "list_key": "tasks",
+    "fields": [
+        "id", "title", "status", "project_id", "sprint_id", "task_type",
+        "story_points", "storyPoints", "story_point",
+        # Top-level wrapper fields
+        "total", "count",
+    ],
+    "query_fields": {
+        "detail": ["description", "parent_id", "has_children", "assignee_name", "priority"],
+        "assignment": ["assignee_id", "assignee_name"],
+        "effort": [
+            "estimated_hours", "spent_hours", "remaining_hours", "actual_hours", "progress",
+        ],
+        "schedule": ["due_date", "start_date", "created_at", "updated_at"],
+        "priority": ["priority"],
+        "count": [],
+        "general": ["assignee_name", "priority", "due_date"],
+    },
+}
+
+TOOL_OUTPUT_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "list_tasks": _TASK_LIST_SCHEMA,
+    "list_my_tasks": _TASK_LIST_SCHEMA,
+    "list_tasks_by_assignee": _TASK_LIST_SCHEMA,
+    "list_tasks_in_sprint": _TASK_LIST_SCHEMA,
+    "list_unassigned_tasks": _TASK_LIST_SCHEMA,
+    "get_sprint_tasks": _TASK_LIST_SCHEMA,
+    "search_tasks": _TASK_LIST_SCHEMA,
+}
+
+
+def classify_query(user_query: str) -> str:
+    """
+    Normalize a user query into a stable query class such as "assignment+schedule".
+
+    Queries asking for the same kind of information map to the same class, so
+    field selections can be reused across differently worded questions.
+    """
+    text = re.sub(r"\s+", " ", (user_query or "").lower())
+    classes = [
+        query_class
+        for query_class, keywords in QUERY_CLASS_KEYWORDS.items()
+        if any(re.search(r"\b" + re.escape(keyword), text) for keyword in keywords)
+    ]
+    return "+".join(sorted(classes)) if classes else "general"
+
+
+class FieldSelectionCache:
+    """LRU cache of field selections keyed by (tool name, query class)."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], List[str]]" = OrderedDict()
+
+    def get(self, tool_name: str, query_class: str) -> Optional[List[str]]:
+        key = (tool_name, query_class)
+        if key not in self._entries:
+            return None
+        self._entries.move_to_end(key)
+        return list(self._entries[key])
+
+    def put(self, tool_name: str, query_class: str, fields: List[str]) -> None:
+        key = (tool_name, query_class)
+        self._entries[key] = list(fields)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared across optimizer instances, since agents are created per request
+_field_selection_cache = FieldSelectionCache()
+
+_metrics: Dict[str, Any] = {}
+
+
+def reset_optimizer_metrics() -> None:
+    """Reset the optimizer metrics counters."""
+    _metrics.clear()
+    _metrics.update({
+        "calls": 0,
+        "skipped": 0,
+        "schema_projections": 0,
+        "cache_hits": 0,
+        "cache_misses": 0,
+        "llm_field_selections": 0,
+        "llm_rewrites": 0,
+        "failures": 0,
+        "chars_in": 0,
+        "chars_out": 0,
+        "latency_ms": {},
+    })
+
+
+reset_optimizer_metrics()
+
+
+def get_optimizer_metrics() -> Dict[str, Any]:
+    """
+    Get optimizer metrics: how often each path ran, its total latency and the
+    estimated tokens saved (chars / 4).
+    """
+    metrics = dict(_metrics)
+    metrics["latency_ms"] = dict(_metrics["latency_ms"])
+    metrics["field_cache_size"] = len(_field_selection_cache)
+    metrics["estimated_tokens_saved"] = max(0, _metrics["chars_in"] - _metrics["chars_out"]) // 4
+    return metrics
+
+
+def _record(path: str, started: float, chars_in: int, chars_out: int) -> None:
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    _metrics["latency_ms"][path] = _metrics["latency_ms"].get(path, 0.0) + elapsed_ms
+    _metrics["chars_in"] += chars_in
+    _metrics["chars_out"] += chars_out
+
 class PMToolContextOptimizer:
     """
     Optimizes structured tool outputs (PM Data) for the agent's context.
@@ -22,7 +169,8 @@ class PMToolContextOptimizer:
     def __init__(self, threshold_chars: int = 2000):
         self.threshold_chars = threshold_chars
         # Use basic/fast LLM for optimization to minimize latency
-        self.llm = get_llm_by_type("basic") 
+        self.llm = get_llm_by_type("basic")
+        self.field_cache = _field_selection_cache
         
     async def optimize(self, user_query: str, tool_name: str, tool_result: str) -> str:
         """
@@ -36,8 +184,12 @@ class PMToolContextOptimizer:
         Returns:
             Optimized string (or original if optimization failed/not needed)
         """
+        _metrics["calls"] += 1
+        started = time.perf_counter()
+
         # 1. Chech threshold
         if len(tool_result) < self.threshold_chars:
+            _metrics["skipped"] += 1
             return tool_result
             
         try:
@@ -46,22 +198,47 @@ class PMToolContextOptimizer:
             try:
                 data = json.loads(tool_result)
             except json.JSONDecodeError:
+                _metrics["skipped"] += 1
                 return tool_result
                 
             # If it's a simple small dict, skip
             if isinstance(data, dict) and len(str(data)) < self.threshold_chars:
+                _metrics["skipped"] += 1
                 return tool_result
 
+            query_class = classify_query(user_query)
+
+            # Deterministic projection for tools with a declared output schema (no LLM)
+            schema = TOOL_OUTPUT_SCHEMAS.get(tool_name)
+            if schema:
+                required_fields = self._fields_from_schema(schema, query_class)
+                filtered_result = self._apply_dynamic_filter(tool_name, data, required_fields)
+                if filtered_result:
+                    _metrics["schema_projections"] += 1
+                    _record("schema", started, len(tool_result), len(filtered_result))
+                    self._log_reduction("Schema Projection", tool_name, query_class, tool_result, filtered_result)
+                    return filtered_result
+
             # 🟢 NEW: Dynamic Schema Discovery (LLM-driven)
-            # Instead of hardcoding fields, we ask the LLM *once* what to keep based on the query.
+            # Instead of hardcoding fields, we ask the LLM *once* per (tool, query class)
+            # what to keep, and reuse the answer for every later call.
             if "task" in tool_name.lower() or "list_tasks" in tool_name or "sprint_report" in tool_name:
-                required_fields = await self._identify_required_fields(tool_name, data, user_query)
+                path = "cache"
+                required_fields = self.field_cache.get(tool_name, query_class)
+                if required_fields:
+                    _metrics["cache_hits"] += 1
+                else:
+                    _metrics["cache_misses"] += 1
+                    path = "llm_fields"
+                    required_fields = await self._identify_required_fields(tool_name, data, user_query)
+                    if required_fields:
+                        _metrics["llm_field_selections"] += 1
+                        self.field_cache.put(tool_name, query_class, required_fields)
                 if required_fields:
                     filtered_result = self._apply_dynamic_filter(tool_name, data, required_fields)
                     if filtered_result:
-                         filtered_len = len(filtered_result)
-                         reduction = (1 - filtered_len / len(tool_result)) * 100
-                         logger.info(f"[OPTIMIZER] Dynamic Filter ({tool_name}): kept {len(required_fields)} fields -> {len(tool_result)} to {filtered_len} chars ({reduction:.1f}%)")
+                         _record(path, started, len(tool_result), len(filtered_result))
+                         self._log_reduction("Dynamic Filter", tool_name, query_class, tool_result, filtered_result)
                          return filtered_result
 
             # Fallback to standard optimization if not a list tool or dynamic filter failed
@@ -118,13 +295,33 @@ Optimize this data to be as compact as possible while answering the user's query
             
             reduction = (1 - len(optimized_result) / len(tool_result)) * 100
             logger.info(f"[OPTIMIZER] Success: {len(tool_result)} -> {len(optimized_result)} chars ({reduction:.1f}% reduction)")
+            _metrics["llm_rewrites"] += 1
+            _record("llm_rewrite", started, len(tool_result), len(optimized_result))
             
             return optimized_result
             
         except Exception as e:
             logger.warning(f"[OPTIMIZER] Failed to optimize: {e}. Returning original.")
+            _metrics["failures"] += 1
             return tool_result
 
+    @staticmethod
+    def _fields_from_schema(schema: Dict[str, Any], query_class: str) -> List[str]:
+        """Resolve the fields to keep for a query class from a declared output schema."""
+        query_fields = schema.get("query_fields", {})
+        fields = set(schema.get("fields", [])) | CRITICAL_FIELDS
+        for part in query_class.split("+"):
+            fields.update(query_fields.get(part, query_fields.get("general", [])))
+        return sorted(fields)
+
+    @staticmethod
+    def _log_reduction(label: str, tool_name: str, query_class: str, original: str, optimized: str) -> None:
+        reduction = (1 - len(optimized) / len(original)) * 100
+        logger.info(
+            f"[OPTIMIZER] {label} ({tool_name}, {query_class}): "
+            f"{len(original)} -> {len(optimized)} chars ({reduction:.1f}%)"
+        )
+
     async def _identify_required_fields(self, tool_name: str, data: Any, user_query: str) -> Optional[List[str]]:
         """
         Ask LLM which fields are required for the query, using a single sample item.
@@ -135,7 +332,7 @@ Optimize this data to be as compact as possible while answering the user's query
                 sample_item = data[0]
             elif isinstance(data, dict):
                 # Try to find the list wrapper
-                for key in ["tasks", "issues", "items", "results", "data"]:
+                for key in LIST_WRAPPER_KEYS:
                     if key in data and isinstance(data[key], list) and data[key]:
                         sample_item = data[key][0]
                         break
@@ -173,13 +370,7 @@ Rules:
             fields = json.loads(content.strip())
             
             # Enforce critical fields that LLM might forget but system needs
-            critical_fields = {
-                "id", "title", "name", "status", "state", 
-                "sprint_id", "project_id", 
-                "story_points", "storyPoints", "story_point", "custom_fields", # Story Points robustness
-                "_links", "sprint", "version"
-            }
-            fields = list(set(fields) | critical_fields)
+            fields = sorted(set(fields) | CRITICAL_FIELDS)
             
             return fields
             
@@ -196,7 +387,7 @@ Rules:
             wrapper_key = None
             
             if isinstance(data, dict):
-                for key in ["tasks", "issues", "items", "results", "data"]:
+                for key in LIST_WRAPPER_KEYS:
                     if key in data and isinstance(data[key], list):
                         items = data[key]
                         wrapper_key = key
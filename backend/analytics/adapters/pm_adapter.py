@@ -19,6 +19,7 @@ from pm_providers.base import BasePMProvider
 from pm_providers.models import PMTask, PMSprint, PMProject
 from .base import BaseAnalyticsAdapter
 from .task_status_resolver import TaskStatusResolver, create_task_status_resolver
+from shared.resolution import get_entity_resolver
 
 logger = logging.getLogger(__name__)
 
@@ -176,25 +177,48 @@ class PMProviderAnalyticsAdapter(BaseAnalyticsAdapter):
                     f"Error: {str(e)}"
                 ) from e
         
-        # Check if it's a numeric ID
-        if sprint_key.isdigit():
-            # If we have project_key, prefer listing sprints in that project to ensure correct context
-            # This avoids 403 errors when the sprint belongs to a specific project
-            if project_key:
-                try:
-                    logger.info(f"[PMProviderAnalyticsAdapter] Looking for sprint {sprint_key} in project {project_key} via list_sprints")
-                    all_sprints = await self.provider.list_sprints(project_id=project_key)
-                    # Find sprint by ID in the project's sprints
-                    for s in all_sprints:
-                        if str(s.id) == sprint_key:
-                            logger.info(f"[PMProviderAnalyticsAdapter] Found sprint {sprint_key} in project {project_key}: {s.name}")
-                            return sprint_key, s
-                    logger.warning(f"[PMProviderAnalyticsAdapter] Sprint {sprint_key} not found in project {project_key}")
-                except Exception as e:
-                    logger.warning(f"[PMProviderAnalyticsAdapter] Failed to list sprints for project {project_key}: {e}")
-                    # Fall through to direct get_sprint call
+        # Ids, names ("Sprint 4", "sprint-4") and numbers ("4") resolve against
+        # a cached name map of the project's sprints instead of a fresh listing
+        resolver = get_entity_resolver()
+        all_sprints: list = []
+        if project_key:
+            loader = lambda: self.provider.list_sprints(project_id=project_key)
+            try:
+                index = await resolver.get_index(
+                    "sprint", loader, scope=self._resolver_scope, project_id=project_key
+                )
+                matches = await resolver.lookup(
+                    "sprint", sprint_key, loader, scope=self._resolver_scope, project_id=project_key
+                )
+                all_sprints = [entity for _, _, entity in index.entries]
+            except Exception as e:
+                logger.warning(f"[PMProviderAnalyticsAdapter] Failed to list sprints for project '{project_key}': {e}")
+                matches = []
+            
+            # If multiple matches found, it's ambiguous - ask user to clarify
+            if len(matches) > 1:
+                match_list = [f"'{m.name}' (ID: {m.id}, Status: {m.entity.status})" for m in matches]
+                error_msg = (
+                    f"Ambiguous sprint reference: '{sprint_key}' matches multiple sprints in project '{project_key}':\n"
+                    f"  - {chr(10).join('  - ' + m for m in match_list)}\n\n"
+                    f"Please specify which sprint you mean by:\n"
+                    f"  - Using the exact sprint name (e.g., '{matches[0].name}')\n"
+                    f"  - Using the sprint ID (e.g., '{matches[0].id}')\n"
+                    f"  - Or provide more context to identify the correct sprint"
+                )
+                logger.warning(f"[PMProviderAnalyticsAdapter] {error_msg}")
+                raise ValueError(error_msg)
             
-            # Fallback: try direct get_sprint (may fail with 403 if sprint requires project context)
+            if matches:
+                sprint = matches[0].entity
+                logger.info(
+                    f"[PMProviderAnalyticsAdapter] Resolved '{sprint_id}' to sprint ID={sprint.id} "
+                    f"(name={sprint.name}) via {matches[0].match} match"
+                )
+                return str(sprint.id), sprint
+        
+        # Fallback for numeric IDs: direct get_sprint (may fail with 403 if sprint requires project context)
+        if sprint_key.isdigit():
             try:
                 logger.info(f"[PMProviderAnalyticsAdapter] Attempting direct get_sprint({sprint_key})")
                 sprint = await self.provider.get_sprint(sprint_key)
@@ -218,83 +242,6 @@ class PMProviderAnalyticsAdapter(BaseAnalyticsAdapter):
                         ) from e
                 logger.warning(f"[PMProviderAnalyticsAdapter] get_sprint({sprint_key}) failed: {e}")
         
-        # Not a numeric ID or lookup failed - try to find by name
-        logger.info(f"[PMProviderAnalyticsAdapter] Sprint '{sprint_key}' is not a numeric ID, searching by name in project '{project_key}'...")
-        
-        # Normalize the sprint name for comparison
-        # Handle formats like "sprint-4", "Sprint 4", "sprint_4", "4"
-        search_name = sprint_key.lower().replace("-", " ").replace("_", " ").strip()
-        
-        # Also extract just the number if present (e.g., "sprint 4" -> "4")
-        import re
-        number_match = re.search(r'\d+', sprint_key)
-        search_number = number_match.group() if number_match else None
-        
-        # List all sprints and find by name
-        try:
-            all_sprints = await self.provider.list_sprints(project_id=project_key)
-            logger.info(f"[PMProviderAnalyticsAdapter] Found {len(all_sprints)} sprints in project '{project_key}'")
-        except Exception as e:
-            logger.warning(f"[PMProviderAnalyticsAdapter] Failed to list sprints for project '{project_key}': {e}")
-            all_sprints = []
-        
-        # Collect all potential matches (by name and by number)
-        exact_name_matches = []
-        partial_name_matches = []
-        number_matches = []
-        
-        for sprint in all_sprints:
-            sprint_name_normalized = sprint.name.lower().replace("-", " ").replace("_", " ").strip()
-            
-            # Check for exact match
-            if sprint_name_normalized == search_name:
-                exact_name_matches.append(sprint)
-            
-            # Check for partial match (search_name in sprint name)
-            elif search_name in sprint_name_normalized:
-                partial_name_matches.append(sprint)
-            
-            # Also try matching by sprint number (e.g., "Sprint 4" matches "4")
-            if search_number:
-                sprint_number_match = re.search(r'\d+', sprint.name)
-                if sprint_number_match and sprint_number_match.group() == search_number:
-                    number_matches.append(sprint)
-        
-        # Prioritize matches: exact name > partial name > number match
-        # But if multiple matches in any category, it's ambiguous
-        matches = []
-        match_type = None
-        
-        if exact_name_matches:
-            matches = exact_name_matches
-            match_type = "exact name"
-        elif partial_name_matches:
-            matches = partial_name_matches
-            match_type = "partial name"
-        elif number_matches:
-            matches = number_matches
-            match_type = "number"
-        
-        # If multiple matches found, it's ambiguous - ask user to clarify
-        if len(matches) > 1:
-            match_list = [f"'{s.name}' (ID: {s.id}, Status: {s.status})" for s in matches]
-            error_msg = (
-                f"Ambiguous sprint reference: '{sprint_key}' matches multiple sprints in project '{project_key}':\n"
-                f"  - {chr(10).join('  - ' + m for m in match_list)}\n\n"
-                f"Please specify which sprint you mean by:\n"
-                f"  - Using the exact sprint name (e.g., '{matches[0].name}')\n"
-                f"  - Using the sprint ID (e.g., '{matches[0].id}')\n"
-                f"  - Or provide more context to identify the correct sprint"
-            )
-            logger.warning(f"[PMProviderAnalyticsAdapter] {error_msg}")
-            raise ValueError(error_msg)
-        
-        # Single match found - return it
-        if len(matches) == 1:
-            sprint = matches[0]
-            logger.info(f"[PMProviderAnalyticsAdapter] Resolved '{sprint_id}' to sprint ID={sprint.id} (name={sprint.name}) via {match_type} match")
-            return str(sprint.id), sprint
-        
         # No match found - raise error with helpful message
         available_sprints = [f"{s.name} (id={s.id})" for s in all_sprints[:10]]
         error_msg = (
@@ -303,6 +250,12 @@ class PMProviderAnalyticsAdapter(BaseAnalyticsAdapter):
         )
         logger.error(f"[PMProviderAnalyticsAdapter] {error_msg}")
         raise ValueError(error_msg)
+    
+    @property
+    def _resolver_scope(self) -> str:
+        """Entity resolver scope: one provider instance (type and base URL)."""
+        config = getattr(self.provider, "config", None)
+        return f"{getattr(config, 'provider_type', self.provider.__class__.__name__)}|{getattr(config, 'base_url', id(self.provider))}"
 
     async def get_burndown_data(
         self,
@@ -12,6 +12,8 @@ from enum import Enum
 from dataclasses import dataclass
 from datetime import datetime
 
+from backend.conversation.intent_router import get_intent_router
+
 logger = logging.getLogger(__name__)
 
 class IntentType(Enum):
@@ -4702,11 +4704,26 @@ class IntentClassifier:
                 self.llm = None
     
     async def classify(self, message: str, conversation_history: Optional[List[Dict[str, str]]] = None) -> IntentType:
-        """Classify user intent from message using LLM or fallback to keywords"""
+        """Classify user intent from message using LLM or fallback to keywords
+        
+        With an LLM, the intent router answers from its semantic cache or
+        local classifier first and only awaits the LLM when neither is confident.
+        """
         
         # Use LLM if available
         if self.llm:
-            return await self._classify_with_llm(message, conversation_history)
+            async def classify_with_llm(text: str) -> Optional[str]:
+                intent = await self._classify_with_llm(text, conversation_history)
+                # UNKNOWN means the LLM failed or was unsure; don't cache it
+                return None if intent == IntentType.UNKNOWN else intent.value
+            
+            decision = await get_intent_router("flow_intent").route(
+                message, classify_with_llm, fallback=IntentType.UNKNOWN.value
+            )
+            try:
+                return IntentType(decision.label)
+            except ValueError:
+                return IntentType.UNKNOWN
         else:
             return await self._classify_with_keywords(message)
     
@@ -0,0 +1,454 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""
+Intent routing layer in front of the LLM intent classifiers.
+
+Each routing decision tries three paths in order:
+
+1. ``cache``: a bounded semantic cache. Exact repeats hit directly, and
+   paraphrases hit through nearest-neighbour search over message embeddings
+   above a similarity threshold.
+2. ``local``: a nearest-centroid classifier trained from the
+   ``IntentClassification`` and ``LearnedIntentPattern`` tables. It answers
+   only when it is confident.
+3. ``llm``: the caller's LLM classifier. Its answer is cached.
+
+Latency is recorded per path and exposed through ``get_intent_routing_stats``.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+import numpy as np
+
+from shared.config.loader import get_int_env, get_str_env
+from shared.search import hash_embed
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_DIMS = 512
+
+
+def embed_text(text: str, dims: int = EMBEDDING_DIMS) -> np.ndarray:
+    """
+    Embed ``text`` as a hashed bag of words and character trigrams.
+
+    This runs locally in microseconds and works for any language, which is
+    enough to match paraphrases of short routing queries.
+    """
+    return hash_embed(text, dims)
+
+
+def normalize_message(text: str) -> str:
+    return " ".join(text.lower().split())[:200]
+
+
+_NEGATION_RE = re.compile(
+    r"\b(?:not|no|never|none|nothing|nobody|neither|nor|without|cannot|\w+n['’]?t)\b"
+)
+
+
+def negation_signature(text: str) -> tuple[str, ...]:
+    """
+    Sorted negation words of a normalized message.
+
+    "show my tasks" and "don't show my tasks" embed close together, so a
+    cached label is only reused for a paraphrase with the same negations.
+    """
+    return tuple(sorted(_NEGATION_RE.findall(text)))
+
+
+@dataclass
+class IntentDecision:
+    """Result of one routing decision."""
+
+    label: str
+    confidence: float
+    path: str  # "cache" | "local" | "llm" | "fallback"
+    latency_ms: float
+
+
+class SemanticIntentCache:
+    """
+    Bounded LRU cache of intent labels with nearest-neighbour lookup.
+
+    Embeddings live in a preallocated matrix, so a lookup is one
+    matrix-vector product over at most ``max_entries`` rows. A paraphrase
+    hit also needs the same negation words as the cached message.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        similarity_threshold: float = 0.85,
+        embed: Callable[[str], np.ndarray] = embed_text,
+    ):
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self._embed = embed
+        self._lock = threading.Lock()
+        self._slots: OrderedDict[str, int] = OrderedDict()
+        self._labels: list[Optional[str]] = [None] * max_entries
+        self._negations: list[tuple[str, ...]] = [()] * max_entries
+        self._vectors: Optional[np.ndarray] = None
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    def get(self, text: str) -> Optional[tuple[str, float]]:
+        """Return ``(label, similarity)`` for ``text`` or a close paraphrase."""
+        key = normalize_message(text)
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is not None:
+                self._slots.move_to_end(key)
+                self.exact_hits += 1
+                return self._labels[slot], 1.0
+            if self._vectors is None or not self._slots:
+                self.misses += 1
+                return None
+            scores = self._vectors @ self._embed(key)
+            best = int(np.argmax(scores))
+            similarity = float(scores[best])
+            label = self._labels[best]
+            if (
+                label is None
+                or similarity < self.similarity_threshold
+                or self._negations[best] != negation_signature(key)
+            ):
+                self.misses += 1
+                return None
+            self.semantic_hits += 1
+            return label, similarity
+
+    def put(self, text: str, label: str) -> None:
+        key = normalize_message(text)
+        vector = self._embed(key)
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.max_entries, vector.shape[0]), dtype=np.float32)
+            slot = self._slots.get(key)
+            if slot is None:
+                if len(self._slots) >= self.max_entries:
+                    _, slot = self._slots.popitem(last=False)
+                else:
+                    slot = len(self._slots)
+            self._slots[key] = slot
+            self._slots.move_to_end(key)
+            self._vectors[slot] = vector
+            self._labels[slot] = label
+            self._negations[slot] = negation_signature(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._slots.clear()
+            self._labels = [None] * self.max_entries
+            self._negations = [()] * self.max_entries
+            self._vectors = None
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def get_stats(self) -> dict[str, Any]:
+        lookups = self.exact_hits + self.semantic_hits + self.misses
+        return {
+            "size": len(self._slots),
+            "max_entries": self.max_entries,
+            "exact_hits": self.exact_hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.exact_hits + self.semantic_hits) / lookups, 3) if lookups else 0.0,
+        }
+
+
+class LocalIntentClassifier:
+    """
+    Nearest-centroid classifier over hashed message embeddings.
+
+    ``predict`` returns the best label with its cosine similarity and the
+    margin over the runner-up label; the router only trusts predictions
+    above both thresholds.
+    """
+
+    def __init__(self, embed: Callable[[str], np.ndarray] = embed_text):
+        self._embed = embed
+        self.labels: list[str] = []
+        self._centroids: Optional[np.ndarray] = None
+        self.example_count = 0
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    def fit(self, examples: Iterable[tuple[str, str, float]]) -> "LocalIntentClassifier":
+        """Train from ``(text, label, weight)`` examples."""
+        sums: dict[str, np.ndarray] = {}
+        count = 0
+        for text, label, weight in examples:
+            if not text or not label or weight <= 0:
+                continue
+            vector = self._embed(normalize_message(text)) * weight
+            sums[label] = sums[label] + vector if label in sums else vector
+            count += 1
+        if len(sums) < 2:
+            # A single class cannot be told apart from anything else
+            self.labels, self._centroids, self.example_count = [], None, count
+            return self
+        self.labels = sorted(sums)
+        centroids = np.stack([sums[label] for label in self.labels])
+        norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        self._centroids = centroids / np.where(norms == 0, 1.0, norms)
+        self.example_count = count
+        return self
+
+    def predict(self, text: str) -> Optional[tuple[str, float, float]]:
+        """Return ``(label, similarity, margin)`` or None when untrained."""
+        if self._centroids is None:
+            return None
+        scores = self._centroids @ self._embed(normalize_message(text))
+        order = np.argsort(scores)[::-1]
+        best = float(scores[order[0]])
+        margin = best - float(scores[order[1]])
+        return self.labels[int(order[0])], best, margin
+
+
+class _PathStats:
+    def __init__(self, window: int = 512):
+        self.count = 0
+        self.total_ms = 0.0
+        self.recent: deque[float] = deque(maxlen=window)
+
+    def record(self, latency_ms: float) -> None:
+        self.count += 1
+        self.total_ms += latency_ms
+        self.recent.append(latency_ms)
+
+    def snapshot(self) -> dict[str, Any]:
+        recent = sorted(self.recent)
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(recent[len(recent) // 2], 3) if recent else 0.0,
+            "p95_ms": round(recent[min(len(recent) - 1, int(len(recent) * 0.95))], 3) if recent else 0.0,
+        }
+
+
+class IntentRouter:
+    """Routes a message to an intent label through cache, local classifier, then LLM."""
+
+    def __init__(
+        self,
+        name: str,
+        cache: Optional[SemanticIntentCache] = None,
+        classifier: Optional[LocalIntentClassifier] = None,
+        min_similarity: float = 0.6,
+        min_margin: float = 0.1,
+        min_words: int = 1,
+    ):
+        self.name = name
+        self.cache = cache if cache is not None else SemanticIntentCache()
+        self.classifier = classifier if classifier is not None else LocalIntentClassifier()
+        self.min_similarity = min_similarity
+        self.min_margin = min_margin
+        # Very short messages ("yes", "do it") depend on conversation context,
+        # so they always go to the LLM
+        self.min_words = min_words
+        self._stats: dict[str, _PathStats] = defaultdict(_PathStats)
+
+    def _fast_path(self, text: str, started: float) -> Optional[IntentDecision]:
+        if len(text.split()) < self.min_words:
+            return None
+        cached = self.cache.get(text)
+        if cached is not None:
+            return self._decide(cached[0], cached[1], "cache", started)
+        prediction = self.classifier.predict(text)
+        if prediction is not None:
+            label, similarity, margin = prediction
+            if similarity >= self.min_similarity and margin >= self.min_margin:
+                self.cache.put(text, label)
+                return self._decide(label, similarity, "local", started)
+        return None
+
+    def _decide(self, label: str, confidence: float, path: str, started: float) -> IntentDecision:
+        latency_ms = (time.perf_counter() - started) * 1000
+        self._stats[path].record(latency_ms)
+        logger.info(f"[INTENT_ROUTER] {self.name}: {label} via {path} in {latency_ms:.1f}ms")
+        return IntentDecision(label=label, confidence=confidence, path=path, latency_ms=latency_ms)
+
+    def _llm_decision(self, text: str, label: Optional[str], fallback: str, started: float) -> IntentDecision:
+        if label is None:
+            return self._decide(fallback, 0.0, "fallback", started)
+        if len(text.split()) >= self.min_words:
+            self.cache.put(text, label)
+        return self._decide(label, 1.0, "llm", started)
+
+    async def route(
+        self,
+        text: str,
+        classify_with_llm: Callable[[str], Awaitable[Optional[str]]],
+        fallback: str,
+    ) -> IntentDecision:
+        """
+        Route ``text``, awaiting ``classify_with_llm`` only when the fast paths miss.
+
+        The LLM classifier returns a label, or None when it failed; failures
+        return ``fallback`` and are not cached.
+        """
+        started = time.perf_counter()
+        decision = self._fast_path(text, started)
+        if decision is not None:
+            return decision
+        return self._llm_decision(text, await classify_with_llm(text), fallback, started)
+
+    def route_sync(
+        self,
+        text: str,
+        classify_with_llm: Callable[[str], Optional[str]],
+        fallback: str,
+    ) -> IntentDecision:
+        """Synchronous ``route`` for graph nodes that run in LangGraph's executor."""
+        started = time.perf_counter()
+        decision = self._fast_path(text, started)
+        if decision is not None:
+            return decision
+        return self._llm_decision(text, classify_with_llm(text), fallback, started)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "paths": {path: stats.snapshot() for path, stats in self._stats.items()},
+            "cache": self.cache.get_stats(),
+            "classifier": {
+                "trained": self.classifier.is_trained,
+                "labels": len(self.classifier.labels),
+                "examples": self.classifier.example_count,
+            },
+        }
+
+
+# Flow-manager IntentType values -> coordinator PM routing labels
+PM_LABEL_BY_FLOW_INTENT = {
+    "list_projects": "PM_LIST",
+    "list_tasks": "PM_LIST",
+    "list_sprints": "PM_LIST",
+    "list_my_tasks": "PM_LIST",
+    "sprint_planning": "PM_SPRINT",
+    "update_sprint": "PM_SPRINT",
+    "switch_sprint": "PM_SPRINT",
+    "create_report": "PM_REPORT",
+    "get_status": "PM_HEALTH",
+    "get_project_status": "PM_HEALTH",
+    "dependency_analysis": "PM_ANALYTICS",
+    "gantt_chart": "PM_ANALYTICS",
+    "check_resources": "PM_RESOURCES",
+    "assign_tasks": "PM_RESOURCES",
+    "create_project": "PM_GENERAL",
+    "plan_tasks": "PM_GENERAL",
+    "update_project": "PM_GENERAL",
+    "update_task": "PM_GENERAL",
+    "create_wbs": "PM_GENERAL",
+    "task_breakdown": "PM_GENERAL",
+    "switch_project": "PM_GENERAL",
+    "switch_task": "PM_GENERAL",
+    "research_topic": "NOT_PM",
+}
+
+
+def load_intent_examples(db_session: Any, limit: int = 5000) -> list[tuple[str, str, float]]:
+    """
+    Load ``(text, flow_intent, weight)`` training examples.
+
+    Classifications count when they were confirmed, corrected by the user
+    (the correction is the label) or unreviewed with high confidence. Learned
+    patterns count when they succeed more often than they fail, weighted by
+    their confidence.
+    """
+    from database.orm_models import IntentClassification, LearnedIntentPattern
+
+    examples: list[tuple[str, str, float]] = []
+    rows = (
+        db_session.query(IntentClassification)
+        .order_by(IntentClassification.created_at.desc())
+        .limit(limit)
+        .all()
+    )
+    for row in rows:
+        if row.user_corrected_intent:
+            examples.append((row.message, row.user_corrected_intent, 1.0))
+        elif row.was_correct or (row.was_correct is None and (row.confidence_score or 0.0) >= 0.8):
+            examples.append((row.message, row.classified_intent, 1.0))
+
+    patterns = db_session.query(LearnedIntentPattern).limit(limit).all()
+    for pattern in patterns:
+        if (pattern.success_count or 0) > (pattern.failure_count or 0):
+            examples.append((pattern.pattern_text, pattern.intent_type, float(pattern.confidence or 0.0)))
+
+    return [example for example in examples if example[1] != "unknown"]
+
+
+_routers: dict[str, IntentRouter] = {}
+_routers_lock = threading.Lock()
+
+# Router name -> minimum word count for the cache/local fast paths
+_ROUTER_MIN_WORDS = {"pm_intent": 1, "escalation": 3, "flow_intent": 3}
+
+
+def get_intent_router(name: str) -> IntentRouter:
+    """Return the process-wide router called ``name``, creating it on first use."""
+    router = _routers.get(name)
+    if router is not None:
+        return router
+    with _routers_lock:
+        if name not in _routers:
+            _routers[name] = IntentRouter(
+                name,
+                cache=SemanticIntentCache(
+                    max_entries=get_int_env("INTENT_CACHE_MAX_ENTRIES", 1024),
+                    similarity_threshold=float(get_str_env("INTENT_CACHE_SIMILARITY", "0.85")),
+                ),
+                min_similarity=float(get_str_env("INTENT_LOCAL_MIN_SIMILARITY", "0.6")),
+                min_margin=float(get_str_env("INTENT_LOCAL_MIN_MARGIN", "0.1")),
+                min_words=_ROUTER_MIN_WORDS.get(name, 1),
+            )
+        return _routers[name]
+
+
+def train_intent_routers(examples: list[tuple[str, str, float]]) -> None:
+    """Fit the local classifiers of the flow-intent and PM-intent routers."""
+    get_intent_router("flow_intent").classifier.fit(examples)
+    get_intent_router("pm_intent").classifier.fit(
+        (text, PM_LABEL_BY_FLOW_INTENT[label], weight)
+        for text, label, weight in examples
+        if label in PM_LABEL_BY_FLOW_INTENT
+    )
+    logger.info(f"[INTENT_ROUTER] Local classifiers trained on {len(examples)} examples")
+
+
+def load_and_train_intent_routers() -> None:
+    """Train the local classifiers from the database; routing still works if this fails."""
+    try:
+        from database.connection import get_db_session
+
+        db = next(get_db_session())
+        try:
+            examples = load_intent_examples(db)
+        finally:
+            db.close()
+        train_intent_routers(examples)
+    except Exception as e:
+        logger.warning(f"[INTENT_ROUTER] Could not train local intent classifiers: {e}")
+
+
+def get_intent_routing_stats() -> dict[str, Any]:
+    return {name: router.get_stats() for name, router in _routers.items()}
+
+
+def reset_intent_routers() -> None:
+    """Drop all routers (tests)."""
+    with _routers_lock:
+        _routers.clear()
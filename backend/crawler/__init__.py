@@ -5,5 +5,14 @@ from .article import Article
 from .crawler import Crawler
 from .jina_client import JinaClient
 from .readability_extractor import ReadabilityExtractor
+from .web_cache import WebCache, get_web_cache, get_web_cache_stats
 
-__all__ = ["Article", "Crawler", "JinaClient", "ReadabilityExtractor"]
+__all__ = [
+    "Article",
+    "Crawler",
+    "JinaClient",
+    "ReadabilityExtractor",
+    "WebCache",
+    "get_web_cache",
+    "get_web_cache_stats",
+]
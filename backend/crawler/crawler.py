@@ -1,16 +1,87 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import asyncio
 import logging
+from typing import Optional, Sequence, Union
+from urllib.parse import urldefrag, urlparse
+
+import httpx
+
+from shared.config.loader import get_int_env
 
 from .article import Article
 from .jina_client import JinaClient
 from .readability_extractor import ReadabilityExtractor
+from .web_cache import WebCache, get_web_cache
 
 logger = logging.getLogger(__name__)
 
+ARTICLE_NAMESPACE = "article"
+
 
 class Crawler:
+    def __init__(
+        self,
+        cache: Optional[WebCache] = None,
+        use_cache: bool = True,
+        max_concurrency: Optional[int] = None,
+        per_host_limit: Optional[int] = None,
+    ):
+        """
+        Args:
+            cache: Article cache; defaults to the process-wide web cache
+            use_cache: Set to False to always fetch and extract
+            max_concurrency: Max in-flight fetches for acrawl_many (CRAWL_MAX_CONCURRENCY)
+            per_host_limit: Max in-flight fetches per target host (CRAWL_PER_HOST_LIMIT)
+        """
+        self.cache = (cache if cache is not None else get_web_cache()) if use_cache else None
+        self.max_concurrency = max_concurrency or get_int_env("CRAWL_MAX_CONCURRENCY", 8)
+        self.per_host_limit = per_host_limit or get_int_env("CRAWL_PER_HOST_LIMIT", 2)
+
+    @staticmethod
+    def _cache_identity(url: str) -> str:
+        # Fragments never change what the server returns
+        return urldefrag(url.strip())[0]
+
+    def _load_cached(self, url: str) -> Optional[Article]:
+        if self.cache is None:
+            return None
+        try:
+            cached = self.cache.get_json(ARTICLE_NAMESPACE, self._cache_identity(url))
+        except Exception as e:
+            logger.warning(f"Web cache read failed for {url}: {repr(e)}")
+            return None
+        if cached is None:
+            return None
+        article = Article(title=cached["title"], html_content=cached["html_content"])
+        article.url = url
+        return article
+
+    def _store(self, url: str, article: Article) -> None:
+        if self.cache is None or not isinstance(article, Article):
+            return
+        try:
+            self.cache.set_json(
+                ARTICLE_NAMESPACE,
+                self._cache_identity(url),
+                {"title": article.title, "html_content": article.html_content},
+            )
+        except Exception as e:
+            logger.warning(f"Web cache write failed for {url}: {repr(e)}")
+
+    def _extract(self, url: str, html: str) -> Article:
+        try:
+            extractor = ReadabilityExtractor()
+            article = extractor.extract_article(html)
+        except Exception as e:
+            logger.error(f"Failed to extract article from {url}: {repr(e)}")
+            raise
+
+        article.url = url
+        self._store(url, article)
+        return article
+
     def crawl(self, url: str) -> Article:
         # To help LLMs better understand content, we extract clean
         # articles from HTML, convert them to markdown, and split
@@ -22,19 +93,60 @@ class Crawler:
         #
         # Instead of using Jina's own markdown converter, we'll use
         # our own solution to get better readability results.
+        #
+        # Extracted articles are cached, so a URL revisited by another
+        # plan step or thread skips both the fetch and readability.
+        cached = self._load_cached(url)
+        if cached is not None:
+            return cached
+
         try:
             jina_client = JinaClient()
             html = jina_client.crawl(url, return_format="html")
         except Exception as e:
             logger.error(f"Failed to fetch URL {url} from Jina: {repr(e)}")
             raise
-        
+
+        return self._extract(url, html)
+
+    async def acrawl(self, url: str, client: Optional[httpx.AsyncClient] = None) -> Article:
+        """Async crawl(); readability extraction runs in a worker thread."""
+        cached = self._load_cached(url)
+        if cached is not None:
+            return cached
+
         try:
-            extractor = ReadabilityExtractor()
-            article = extractor.extract_article(html)
+            html = await JinaClient().acrawl(url, return_format="html", client=client)
         except Exception as e:
-            logger.error(f"Failed to extract article from {url}: {repr(e)}")
+            logger.error(f"Failed to fetch URL {url} from Jina: {repr(e)}")
             raise
-        
-        article.url = url
-        return article
+
+        return await asyncio.to_thread(self._extract, url, html)
+
+    async def acrawl_many(self, urls: Sequence[str]) -> list[Union[Article, Exception]]:
+        """
+        Crawl several URLs concurrently.
+
+        At most ``max_concurrency`` fetches are in flight overall and
+        ``per_host_limit`` per target host. Duplicate URLs are fetched once.
+
+        Returns:
+            One entry per input URL, in order: the Article, or the exception
+            raised while crawling it
+        """
+        overall = asyncio.Semaphore(self.max_concurrency)
+        per_host: dict[str, asyncio.Semaphore] = {}
+
+        async def crawl_one(url: str, client: httpx.AsyncClient) -> Article:
+            host = urlparse(url).netloc.lower()
+            host_limit = per_host.setdefault(host, asyncio.Semaphore(self.per_host_limit))
+            async with host_limit, overall:
+                return await self.acrawl(url, client=client)
+
+        unique = list(dict.fromkeys(urls))
+        async with httpx.AsyncClient(timeout=JinaClient().timeout) as client:
+            results = await asyncio.gather(
+                *(crawl_one(url, client) for url in unique), return_exceptions=True
+            )
+        by_url = dict(zip(unique, results))
+        return [by_url[url] for url in urls]
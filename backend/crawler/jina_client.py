@@ -3,14 +3,22 @@
 
 import logging
 import os
+from typing import Optional
 
+import httpx
 import requests
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_JINA_READER_URL = "https://r.jina.ai/"
+
 
 class JinaClient:
-    def crawl(self, url: str, return_format: str = "html") -> str:
+    def __init__(self, base_url: Optional[str] = None, timeout: float = 60.0):
+        self.base_url = base_url or os.getenv("JINA_READER_URL", DEFAULT_JINA_READER_URL)
+        self.timeout = timeout
+
+    def _headers(self, return_format: str) -> dict[str, str]:
         headers = {
             "Content-Type": "application/json",
             "X-Return-Format": return_format,
@@ -21,13 +29,34 @@ class JinaClient:
             logger.warning(
                 "Jina API key is not set. Provide your own key to access a higher rate limit. See https://jina.ai/reader for more information."
             )
-        data = {"url": url}
-        response = requests.post("https://r.jina.ai/", headers=headers, json=data)
-        
-        if response.status_code != 200:
-            raise ValueError(f"Jina API returned status {response.status_code}: {response.text}")
-        
-        if not response.text or not response.text.strip():
+        return headers
+
+    @staticmethod
+    def _check_response(status_code: int, text: str) -> str:
+        if status_code != 200:
+            raise ValueError(f"Jina API returned status {status_code}: {text}")
+
+        if not text or not text.strip():
             raise ValueError("Jina API returned empty response")
-        
-        return response.text
+
+        return text
+
+    def crawl(self, url: str, return_format: str = "html") -> str:
+        data = {"url": url}
+        response = requests.post(self.base_url, headers=self._headers(return_format), json=data)
+        return self._check_response(response.status_code, response.text)
+
+    async def acrawl(
+        self,
+        url: str,
+        return_format: str = "html",
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> str:
+        """Async variant of crawl(); pass a shared client to reuse connections."""
+        data = {"url": url}
+        if client is None:
+            async with httpx.AsyncClient(timeout=self.timeout) as own_client:
+                response = await own_client.post(self.base_url, headers=self._headers(return_format), json=data)
+        else:
+            response = await client.post(self.base_url, headers=self._headers(return_format), json=data)
+        return self._check_response(response.status_code, response.text)
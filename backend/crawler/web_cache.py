@@ -0,0 +1,245 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""
+Persistent, content-addressed cache for web search results and crawled articles.
+
+Entries live in one SQLite file and are keyed by the SHA-256 of their
+namespace and identity (a URL, or a search query plus tool parameters), so
+the same page or query is served from disk across plan steps, threads and
+process restarts. Entries expire after a TTL, and the least recently used
+ones are evicted once the stored payload exceeds a size cap.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from shared.config.loader import get_bool_env, get_int_env, get_str_env
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = ".cache/web_cache.sqlite3"
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_MAX_MB = 256
+
+# Fraction of max_bytes kept after an eviction pass, so a full cache does not
+# evict on every write
+_EVICT_TO_RATIO = 0.9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS web_cache (
+    key TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_web_cache_accessed_at ON web_cache (accessed_at);
+"""
+
+
+def cache_key(namespace: str, identity: Any) -> str:
+    """Content address of an entry: sha256 over namespace and canonical identity."""
+    if not isinstance(identity, str):
+        identity = json.dumps(identity, sort_keys=True, default=str)
+    return hashlib.sha256(f"{namespace}\0{identity}".encode("utf-8")).hexdigest()
+
+
+class WebCache:
+    """
+    SQLite-backed cache with a TTL and a total size cap.
+
+    Safe to share between threads; every statement runs under one lock on a
+    single autocommit connection. Per-namespace hit/miss counters are kept
+    in memory and exposed through ``get_stats()``.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_PATH,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024,
+    ):
+        self.path = str(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        if self.path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM web_cache").fetchone()[0]
+        self._evictions = 0
+        self._namespaces: dict[str, dict[str, int]] = {}
+
+    def _count(self, namespace: str, field: str) -> None:
+        stats = self._namespaces.setdefault(
+            namespace, {"hits": 0, "misses": 0, "expired": 0, "writes": 0}
+        )
+        stats[field] += 1
+
+    def get(self, namespace: str, identity: Any, ttl_seconds: Optional[int] = None) -> Optional[str]:
+        """
+        Return the cached value, or None on a miss or an expired entry.
+
+        Args:
+            namespace: Entry family, e.g. "article" or "search"
+            identity: URL, query or any JSON-serializable description of the request
+            ttl_seconds: Overrides the cache-wide TTL for this lookup
+        """
+        key = cache_key(namespace, identity)
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, size, created_at FROM web_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._count(namespace, "misses")
+                return None
+            value, size, created_at = row
+            if now - created_at > ttl:
+                self._conn.execute("DELETE FROM web_cache WHERE key = ?", (key,))
+                self._total_bytes -= size
+                self._count(namespace, "expired")
+                self._count(namespace, "misses")
+                return None
+            self._conn.execute("UPDATE web_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._count(namespace, "hits")
+            return value
+
+    def set(self, namespace: str, identity: Any, value: str) -> None:
+        """Store ``value``, evicting least recently used entries past the size cap."""
+        key = cache_key(namespace, identity)
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            logger.debug(f"Skipping web cache write of {size} bytes (cap {self.max_bytes})")
+            return
+        now = time.time()
+        with self._lock:
+            previous = self._conn.execute("SELECT size FROM web_cache WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO web_cache (key, namespace, value, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, namespace, value, size, now, now),
+            )
+            self._total_bytes += size - (previous[0] if previous else 0)
+            self._count(namespace, "writes")
+            if self._total_bytes > self.max_bytes:
+                self._evict(int(self.max_bytes * _EVICT_TO_RATIO))
+
+    def get_json(self, namespace: str, identity: Any, ttl_seconds: Optional[int] = None) -> Any:
+        value = self.get(namespace, identity, ttl_seconds)
+        return None if value is None else json.loads(value)
+
+    def set_json(self, namespace: str, identity: Any, value: Any) -> None:
+        self.set(namespace, identity, json.dumps(value, ensure_ascii=False))
+
+    def _evict(self, target_bytes: int) -> None:
+        # Other processes may share the file, so re-read the real total first
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM web_cache").fetchone()[0]
+        while self._total_bytes > target_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM web_cache ORDER BY accessed_at LIMIT 64"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                self._conn.execute("DELETE FROM web_cache WHERE key = ?", (key,))
+                self._total_bytes -= size
+                self._evictions += 1
+                if self._total_bytes <= target_bytes:
+                    break
+
+    def purge_expired(self) -> int:
+        """Delete every entry older than the cache-wide TTL."""
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            deleted = self._conn.execute("DELETE FROM web_cache WHERE created_at < ?", (cutoff,)).rowcount
+            self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM web_cache").fetchone()[0]
+        return deleted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM web_cache")
+            self._total_bytes = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM web_cache").fetchone()[0]
+
+    def get_stats(self) -> dict[str, Any]:
+        hits = sum(s["hits"] for s in self._namespaces.values())
+        misses = sum(s["misses"] for s in self._namespaces.values())
+        return {
+            "path": self.path,
+            "entries": len(self),
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+            "evictions": self._evictions,
+            "namespaces": {name: dict(stats) for name, stats in self._namespaces.items()},
+        }
+
+
+_web_cache: Optional[WebCache] = None
+_web_cache_lock = threading.Lock()
+
+
+def get_web_cache() -> Optional[WebCache]:
+    """
+    Return the process-wide web cache, or None when it is disabled.
+
+    Configured with WEB_CACHE_ENABLED, WEB_CACHE_PATH, WEB_CACHE_TTL_SECONDS
+    and WEB_CACHE_MAX_MB. A cache file that cannot be opened disables
+    caching instead of failing the crawl.
+    """
+    global _web_cache
+    if not get_bool_env("WEB_CACHE_ENABLED", True):
+        return None
+    if _web_cache is None:
+        with _web_cache_lock:
+            if _web_cache is None:
+                try:
+                    _web_cache = WebCache(
+                        path=get_str_env("WEB_CACHE_PATH", DEFAULT_CACHE_PATH),
+                        ttl_seconds=get_int_env("WEB_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS),
+                        max_bytes=get_int_env("WEB_CACHE_MAX_MB", DEFAULT_MAX_MB) * 1024 * 1024,
+                    )
+                except (OSError, sqlite3.Error) as e:
+                    logger.warning(f"Web cache disabled, could not open it: {e}")
+                    return None
+    return _web_cache
+
+
+def get_web_cache_stats() -> dict[str, Any]:
+    if _web_cache is None:
+        return {"enabled": get_bool_env("WEB_CACHE_ENABLED", True), "initialized": False}
+    return {"enabled": True, "initialized": True, **_web_cache.get_stats()}
+
+
+def reset_web_cache() -> None:
+    """Close and drop the process-wide cache (tests and config reload)."""
+    global _web_cache
+    with _web_cache_lock:
+        if _web_cache is not None:
+            _web_cache.close()
+        _web_cache = None
@@ -1,9 +1,23 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
-from .builder import build_graph, build_graph_with_memory
+import importlib
 
-__all__ = [
-    "build_graph_with_memory",
-    "build_graph",
-]
+# Exported name -> submodule. The builder pulls in every node, agent and tool,
+# so it is only imported when a graph is built, not whenever a light submodule
+# such as backend.graph.checkpoint is imported.
+_EXPORTS = {
+    "build_graph_with_memory": ".builder",
+    "build_graph": ".builder",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,30 +1,98 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import asyncio
 import json
 import logging
-import uuid
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 import psycopg
-from langgraph.store.memory import InMemoryStore
 from psycopg.rows import dict_row
 from pymongo import MongoClient
+from pymongo.errors import BulkWriteError
 
-from shared.config.loader import get_bool_env, get_str_env
+from shared.config.loader import get_bool_env, get_int_env, get_str_env
+
+# Sentinel placed on the write queue to stop the background writer
+_STOP_WRITER = object()
+
+_MESSAGE_CHUNK_PREFIX = "event: message_chunk\ndata: "
+# Fields concatenated when token chunks of one message are compacted
+_CONCATENATED_FIELDS = ("content", "reasoning_content")
+# MongoDB write error code for a unique index violation
+_MONGO_DUPLICATE_KEY = 11000
+
+
+def compact_stream_events(events: List[str]) -> List[str]:
+    """
+    Collapse the token chunks of each message into one final message event.
+
+    Every ``message_chunk`` event with the same message id is merged into the
+    position of its first chunk: text fields are concatenated and the other
+    fields (finish_reason and so on) take their latest value. Every other
+    event is kept as is, so replaying the compacted list renders the same
+    conversation as replaying the raw chunks.
+    """
+    # Raw event strings, or a message id whose merged chunks go in that slot
+    compacted: List[Tuple[bool, str]] = []
+    merged: Dict[str, dict] = {}
+    for event in events:
+        if not event.startswith(_MESSAGE_CHUNK_PREFIX):
+            compacted.append((False, event))
+            continue
+        try:
+            data = json.loads(event[len(_MESSAGE_CHUNK_PREFIX):])
+        except ValueError:
+            compacted.append((False, event))
+            continue
+        message_id = data.get("id") if isinstance(data, dict) else None
+        if not message_id:
+            compacted.append((False, event))
+            continue
+
+        if message_id not in merged:
+            merged[message_id] = data
+            compacted.append((True, message_id))
+            continue
+
+        message = merged[message_id]
+        for key, value in data.items():
+            if key in _CONCATENATED_FIELDS and isinstance(value, str):
+                message[key] = message.get(key, "") + value
+            else:
+                message[key] = value
+
+    return [
+        f"{_MESSAGE_CHUNK_PREFIX}{json.dumps(merged[value], ensure_ascii=False)}\n\n"
+        if is_message
+        else value
+        for is_message, value in compacted
+    ]
 
 
 class ChatStreamManager:
     """
-    Manages chat stream messages with persistent storage and in-memory caching.
+    Manages chat stream messages with persistent storage and in-memory buffering.
+
+    This class handles the storage and retrieval of chat messages using a
+    per-thread in-memory buffer for message chunks and MongoDB or PostgreSQL for
+    persistent storage. Chunks are appended to the buffer of their thread without
+    touching any store; when a conversation finishes the buffer is detached and
+    handed to a background writer that persists completed conversations in
+    batches, so the streaming path never waits on the database.
 
-    This class handles the storage and retrieval of chat messages using both
-    an in-memory store for temporary data and MongoDB or PostgreSQL for persistent storage.
-    It tracks message chunks and consolidates them when a conversation finishes.
+    Events are stored append-only, one row (or document) per event keyed by
+    (thread_id, seq), so each completion writes only its own events instead
+    of rewriting the thread's history. ``iter_thread_events`` replays a
+    thread in order, one page at a time.
 
     Attributes:
-        store (InMemoryStore): In-memory storage for temporary message chunks
         mongo_client (MongoClient): MongoDB client connection
         mongo_db (Database): MongoDB database instance
         postgres_conn (psycopg.Connection): PostgreSQL connection
@@ -32,7 +100,13 @@ class ChatStreamManager:
     """
 
     def __init__(
-        self, checkpoint_saver: bool = False, db_uri: Optional[str] = None
+        self,
+        checkpoint_saver: bool = False,
+        db_uri: Optional[str] = None,
+        batch_size: int = 50,
+        max_pending: int = 1000,
+        enqueue_timeout: float = 5.0,
+        compact: bool = False,
     ) -> None:
         """
         Initialize the ChatStreamManager with database connections.
@@ -40,12 +114,54 @@ class ChatStreamManager:
         Args:
             db_uri: Database connection URI. Supports MongoDB (mongodb://) and PostgreSQL (postgresql://)
                    If None, uses LANGGRAPH_CHECKPOINT_DB_URL env var or defaults to localhost
+            batch_size: Maximum number of completed conversations written per batch
+            max_pending: Maximum number of completed conversations waiting to be
+                   written. When the queue is full, callers outside an event loop
+                   block for up to ``enqueue_timeout`` seconds (backpressure)
+                   before the conversation is written inline. Callers on an
+                   event loop never block: the conversation is handed to an
+                   overflow thread that does the same.
+            enqueue_timeout: Seconds to wait for room in the write queue
+            compact: Collapse each message's token chunks into one event
+                   before persisting (see ``compact_stream_events``)
         """
         self.logger = logging.getLogger(__name__)
-        self.store = InMemoryStore()
         self.checkpoint_saver = checkpoint_saver
         # Use provided URI or fall back to environment variable or default
         self.db_uri = db_uri
+        self.batch_size = max(1, batch_size)
+        self.enqueue_timeout = enqueue_timeout
+        self.compact = compact
+
+        # Per-thread chunk buffers, detached when a conversation completes
+        self._buffers: Dict[str, List[str]] = {}
+        self._buffer_lock = threading.Lock()
+
+        # Background writer state
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, max_pending))
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        # Serializes database access between the writer and inline fallbacks
+        self._db_lock = threading.Lock()
+        # Enqueues for event loop callers that found the queue full
+        self._overflow: Optional[ThreadPoolExecutor] = None
+        self._overflow_pending: Set[Future] = set()
+        self._overflow_lock = threading.Lock()
+
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "chunks_processed": 0,
+            "chunk_latency_total_ms": 0.0,
+            "chunk_latency_max_ms": 0.0,
+            "conversations_enqueued": 0,
+            "conversations_flushed": 0,
+            "batches_flushed": 0,
+            "flush_failures": 0,
+            "inline_flushes": 0,
+            "overflow_handoffs": 0,
+            "events_written": 0,
+            "event_bytes_written": 0,
+        }
 
         # Initialize database connections
         self.mongo_client = None
@@ -75,6 +191,9 @@ class ChatStreamManager:
             self.mongo_db = self.mongo_client.checkpointing_db
             # Test connection
             self.mongo_client.admin.command("ping")
+            self.mongo_db.chat_stream_events.create_index(
+                [("thread_id", 1), ("seq", 1)], unique=True
+            )
             self.logger.info("Successfully connected to MongoDB")
         except Exception as e:
             self.logger.error(f"Failed to connect to MongoDB: {e}")
@@ -90,7 +209,12 @@ class ChatStreamManager:
             self.logger.error(f"Failed to connect to PostgreSQL: {e}")
 
     def _create_chat_streams_table(self) -> None:
-        """Create the chat_streams table if it doesn't exist."""
+        """
+        Create the chat_stream_events table if it doesn't exist.
+
+        The legacy chat_streams table (one JSONB array per thread) is kept so
+        threads written before the event table existed can still be replayed.
+        """
         try:
             with self.postgres_conn.cursor() as cursor:
                 create_table_sql = """
@@ -103,6 +227,14 @@ class ChatStreamManager:
                 
                 CREATE INDEX IF NOT EXISTS idx_chat_streams_thread_id ON chat_streams(thread_id);
                 CREATE INDEX IF NOT EXISTS idx_chat_streams_ts ON chat_streams(ts);
+
+                CREATE TABLE IF NOT EXISTS chat_stream_events (
+                    thread_id VARCHAR(255) NOT NULL,
+                    seq BIGINT NOT NULL,
+                    event TEXT NOT NULL,
+                    ts TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+                    PRIMARY KEY (thread_id, seq)
+                );
                 """
                 cursor.execute(create_table_sql)
                 self.postgres_conn.commit()
@@ -118,9 +250,9 @@ class ChatStreamManager:
         """
         Process and store a chat stream message chunk.
 
-        This method handles individual message chunks during streaming and consolidates
-        them into a complete message when the stream finishes. Messages are stored
-        temporarily in memory and permanently in MongoDB when complete.
+        This method appends individual message chunks to the in-memory buffer of
+        their thread. When the stream finishes, the buffer is detached and queued
+        for the background writer, which persists it to MongoDB or PostgreSQL.
 
         Args:
             thread_id: Unique identifier for the conversation thread
@@ -138,189 +270,509 @@ class ChatStreamManager:
             self.logger.warning("Empty message provided")
             return False
 
+        start_time = time.perf_counter()
         try:
-            # Create namespace for this thread's messages
-            store_namespace: Tuple[str, str] = ("messages", thread_id)
+            completed: Optional[List[str]] = None
+            with self._buffer_lock:
+                self._buffers.setdefault(thread_id, []).append(message)
+                # Detach the buffer once the conversation is complete so the
+                # thread's memory is released as soon as it is handed off
+                if finish_reason in ("stop", "interrupt"):
+                    completed = self._buffers.pop(thread_id)
 
-            # Get or initialize message cursor for tracking chunks
-            cursor = self.store.get(store_namespace, "cursor")
-            current_index = 0
+            if completed is None:
+                return True
 
-            if cursor is None:
-                # Initialize cursor for new conversation
-                self.store.put(store_namespace, "cursor", {"index": 0})
-            else:
-                # Increment index for next chunk
-                current_index = int(cursor.value.get("index", 0)) + 1
-                self.store.put(store_namespace, "cursor", {"index": current_index})
-
-            # Store the current message chunk
-            self.store.put(store_namespace, f"chunk_{current_index}", message)
-
-            # Check if conversation is complete and should be persisted
-            if finish_reason in ("stop", "interrupt"):
-                return self._persist_complete_conversation(
-                    thread_id, store_namespace, current_index
-                )
-
-            return True
+            return self._enqueue_conversation(thread_id, completed)
 
         except Exception as e:
             self.logger.error(
                 f"Error processing stream message for thread {thread_id}: {e}"
             )
             return False
+        finally:
+            self._record_chunk_latency(time.perf_counter() - start_time)
+
+    def get_buffered_messages(self, thread_id: str) -> List[str]:
+        """Return a copy of the chunks buffered for a thread that has not finished yet."""
+        with self._buffer_lock:
+            return list(self._buffers.get(thread_id, []))
+
+    def _record_chunk_latency(self, elapsed: float) -> None:
+        """Record the time spent handling a single chunk."""
+        elapsed_ms = elapsed * 1000
+        with self._stats_lock:
+            self._stats["chunks_processed"] += 1
+            self._stats["chunk_latency_total_ms"] += elapsed_ms
+            if elapsed_ms > self._stats["chunk_latency_max_ms"]:
+                self._stats["chunk_latency_max_ms"] = elapsed_ms
+
+    def _increment_stat(self, name: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[name] += amount
+
+    def get_stats(self) -> dict:
+        """Get chunk processing latency and persistence statistics."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        with self._buffer_lock:
+            stats["buffered_threads"] = len(self._buffers)
+        processed = stats["chunks_processed"]
+        stats["chunk_latency_avg_ms"] = (
+            stats["chunk_latency_total_ms"] / processed if processed else 0.0
+        )
+        stats["pending_conversations"] = self._queue.qsize()
+        return stats
 
-    def _persist_complete_conversation(
-        self, thread_id: str, store_namespace: Tuple[str, str], final_index: int
-    ) -> bool:
+    def _enqueue_conversation(self, thread_id: str, messages: List[str]) -> bool:
         """
-        Persist completed conversation to database (MongoDB or PostgreSQL).
+        Hand a completed conversation to the background writer.
 
-        Retrieves all message chunks from memory store and saves the complete
-        conversation to the configured database for permanent storage.
+        When the write queue is full, a caller on an event loop hands the
+        conversation to an overflow thread so the loop never blocks; any
+        other caller waits for room itself (see ``_put_or_persist``).
 
         Args:
             thread_id: Unique identifier for the conversation thread
-            store_namespace: Namespace tuple for accessing stored messages
-            final_index: The final chunk index for this conversation
+            messages: All chunks buffered for this conversation
 
         Returns:
-            bool: True if persistence was successful, False otherwise
+            bool: True if the conversation was queued, handed off or persisted,
+            False otherwise
         """
+        if not self.checkpoint_saver:
+            self.logger.warning("Checkpoint saver is disabled")
+            return False
+
+        if self.mongo_db is None and self.postgres_conn is None:
+            self.logger.warning("No database connection available")
+            return False
+
+        self._ensure_writer()
         try:
-            # Retrieve all message chunks from memory store
-            # Get all messages up to the final index including cursor metadata
-            memories = self.store.search(store_namespace, limit=final_index + 2)
-
-            # Extract message content, filtering out cursor metadata
-            messages: List[str] = []
-            for item in memories:
-                value = item.dict().get("value", "")
-                # Skip cursor metadata, only include actual message chunks
-                if value and not isinstance(value, dict):
-                    messages.append(str(value))
-
-            if not messages:
-                self.logger.warning(f"No messages found for thread {thread_id}")
-                return False
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return self._put_or_persist(thread_id, messages)
+
+        try:
+            self._queue.put_nowait((thread_id, messages))
+        except queue.Full:
+            self.logger.warning(
+                f"Chat stream write queue is full; handing thread {thread_id} "
+                "to the overflow writer"
+            )
+            self._increment_stat("overflow_handoffs")
+            self._submit_overflow(thread_id, messages)
+            return True
 
-            if not self.checkpoint_saver:
-                self.logger.warning("Checkpoint saver is disabled")
+        self._increment_stat("conversations_enqueued")
+        return True
+
+    def _put_or_persist(self, thread_id: str, messages: List[str]) -> bool:
+        """
+        Queue a conversation, blocking for up to ``enqueue_timeout`` seconds.
+
+        If the queue is still full afterwards, the conversation is persisted
+        inline so no data is dropped.
+        """
+        try:
+            self._queue.put((thread_id, messages), timeout=self.enqueue_timeout)
+        except queue.Full:
+            self.logger.warning(
+                f"Chat stream write queue is full; persisting thread {thread_id} inline"
+            )
+            self._increment_stat("inline_flushes")
+            return self._persist_batch([(thread_id, messages)])
+
+        self._increment_stat("conversations_enqueued")
+        return True
+
+    def _submit_overflow(self, thread_id: str, messages: List[str]) -> None:
+        """Run ``_put_or_persist`` on the overflow thread, tracked for ``flush``."""
+        with self._overflow_lock:
+            if self._overflow is None:
+                self._overflow = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="chat-stream-overflow"
+                )
+            future = self._overflow.submit(self._put_or_persist, thread_id, messages)
+            self._overflow_pending.add(future)
+        future.add_done_callback(self._overflow_done)
+
+    def _overflow_done(self, future: Future) -> None:
+        with self._overflow_lock:
+            self._overflow_pending.discard(future)
+        if future.exception() is not None:
+            self.logger.error(f"Chat stream overflow write failed: {future.exception()}")
+
+    def _ensure_writer(self) -> None:
+        """Start the background writer thread if it is not running."""
+        with self._writer_lock:
+            if self._writer is not None and self._writer.is_alive():
+                return
+            self._writer = threading.Thread(
+                target=self._writer_loop,
+                name="chat-stream-writer",
+                daemon=True,
+            )
+            self._writer.start()
+
+    def _writer_loop(self) -> None:
+        """Drain the write queue, persisting whatever is pending as one batch."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP_WRITER:
+                self._queue.task_done()
+                return
+
+            batch = [item]
+            stop_requested = False
+            while len(batch) < self.batch_size:
+                try:
+                    next_item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if next_item is _STOP_WRITER:
+                    stop_requested = True
+                    break
+                batch.append(next_item)
+
+            try:
+                self._persist_batch(batch)
+            except Exception as e:
+                self.logger.error(f"Chat stream writer failed: {e}")
+            finally:
+                for _ in range(len(batch) + int(stop_requested)):
+                    self._queue.task_done()
+
+            if stop_requested:
+                return
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued conversation has been written.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            bool: True if the queue was drained, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._overflow_lock:
+            overflow = set(self._overflow_pending)
+        if overflow:
+            _, not_done = wait_futures(overflow, timeout)
+            if not_done:
                 return False
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def _persist_batch(self, batch: List[Tuple[str, List[str]]]) -> bool:
+        """
+        Persist a batch of completed conversations to the configured database.
+
+        Entries for the same thread are merged in arrival order so each thread
+        is written once per batch, and compacted first when ``compact`` is set.
+
+        Args:
+            batch: (thread_id, messages) pairs in completion order
 
-            # Choose persistence method based on available connection
+        Returns:
+            bool: True if persistence was successful, False otherwise
+        """
+        conversations: Dict[str, List[str]] = {}
+        for thread_id, messages in batch:
+            conversations.setdefault(thread_id, []).extend(messages)
+        if self.compact:
+            conversations = {
+                thread_id: compact_stream_events(messages)
+                for thread_id, messages in conversations.items()
+            }
+
+        with self._db_lock:
             if self.mongo_db is not None:
-                return self._persist_to_mongodb(thread_id, messages)
+                success = self._persist_batch_to_mongodb(conversations)
             elif self.postgres_conn is not None:
-                return self._persist_to_postgresql(thread_id, messages)
+                success = self._persist_batch_to_postgresql(conversations)
             else:
                 self.logger.warning("No database connection available")
-                return False
+                success = False
 
-        except Exception as e:
-            self.logger.error(
-                f"Error persisting conversation for thread {thread_id}: {e}"
+        if success:
+            self._increment_stat("batches_flushed")
+            self._increment_stat("conversations_flushed", len(conversations))
+            self._increment_stat(
+                "events_written", sum(len(m) for m in conversations.values())
             )
-            return False
+            self._increment_stat(
+                "event_bytes_written",
+                sum(len(e.encode("utf-8")) for m in conversations.values() for e in m),
+            )
+        else:
+            self._increment_stat("flush_failures")
+        return success
 
     def _persist_to_mongodb(self, thread_id: str, messages: List[str]) -> bool:
-        """Persist conversation to MongoDB."""
-        try:
-            # Get MongoDB collection for chat streams
-            collection = self.mongo_db.chat_streams
+        """Persist a single conversation to MongoDB."""
+        return self._persist_batch_to_mongodb({thread_id: messages})
 
-            # Check if conversation already exists in database
-            existing_document = collection.find_one({"thread_id": thread_id})
-
-            current_timestamp = datetime.now()
+    def _persist_batch_to_mongodb(self, conversations: Dict[str, List[str]]) -> bool:
+        """
+        Append each conversation's events to MongoDB as one document per event.
 
-            if existing_document:
-                # Update existing conversation with new messages
-                update_result = collection.update_one(
-                    {"thread_id": thread_id},
-                    {"$set": {"messages": messages, "ts": current_timestamp}},
-                )
-                self.logger.info(
-                    f"Updated conversation for thread {thread_id}: "
-                    f"{update_result.modified_count} documents modified"
-                )
-                return update_result.modified_count > 0
-            else:
-                # Create new conversation document
-                new_document = {
-                    "thread_id": thread_id,
-                    "messages": messages,
-                    "ts": current_timestamp,
-                    "id": uuid.uuid4().hex,
-                }
-                insert_result = collection.insert_one(new_document)
-                self.logger.info(
-                    f"Created new conversation: {insert_result.inserted_id}"
+        If another writer appended to one of the threads since its last seq was
+        read, the unique (thread_id, seq) index stops the ordered insert at the
+        conflict. The events inserted before it are kept and each thread with
+        events left is retried on its own with a fresh seq, so one conflict
+        does not cost the rest of the batch.
+        """
+        try:
+            collection = self.mongo_db.chat_stream_events
+            try:
+                appended = self._insert_mongodb_events(collection, conversations)
+            except BulkWriteError as e:
+                if any(err.get("code") != _MONGO_DUPLICATE_KEY for err in e.details.get("writeErrors", [])):
+                    raise
+                appended = e.details.get("nInserted", 0)
+                self.logger.warning(
+                    f"Seq conflict in MongoDB batch, retrying per thread: {e}"
                 )
-                return insert_result.inserted_id is not None
+                for thread_id, messages in self._events_after(conversations, appended).items():
+                    try:
+                        appended += self._insert_mongodb_events(collection, {thread_id: messages})
+                    except BulkWriteError as thread_error:
+                        appended += thread_error.details.get("nInserted", 0)
+                        self.logger.error(
+                            f"Error persisting thread {thread_id} to MongoDB: {thread_error}"
+                        )
+
+            self.logger.info(
+                f"Persisted {len(conversations)} conversation(s) to MongoDB: "
+                f"{appended} events appended"
+            )
+            return appended > 0
 
         except Exception as e:
             self.logger.error(f"Error persisting to MongoDB: {e}")
             return False
 
+    def _insert_mongodb_events(self, collection, conversations: Dict[str, List[str]]) -> int:
+        """Insert the events after the last stored seq of each thread, in order."""
+        current_timestamp = datetime.now()
+        documents = []
+        for thread_id, messages in conversations.items():
+            last = collection.find_one(
+                {"thread_id": thread_id}, sort=[("seq", -1)], projection={"seq": 1}
+            )
+            next_seq = last["seq"] + 1 if last else 0
+            documents.extend(
+                {
+                    "thread_id": thread_id,
+                    "seq": next_seq + offset,
+                    "event": message,
+                    "ts": current_timestamp,
+                }
+                for offset, message in enumerate(messages)
+            )
+        if not documents:
+            return 0
+        return len(collection.insert_many(documents, ordered=True).inserted_ids)
+
+    @staticmethod
+    def _events_after(
+        conversations: Dict[str, List[str]], count: int
+    ) -> Dict[str, List[str]]:
+        """The events left per thread once the first ``count`` were inserted."""
+        remaining: Dict[str, List[str]] = {}
+        for thread_id, messages in conversations.items():
+            skipped = min(count, len(messages))
+            count -= skipped
+            if messages[skipped:]:
+                remaining[thread_id] = messages[skipped:]
+        return remaining
+
     def _persist_to_postgresql(self, thread_id: str, messages: List[str]) -> bool:
-        """Persist conversation to PostgreSQL."""
+        """Persist a single conversation to PostgreSQL."""
+        return self._persist_batch_to_postgresql({thread_id: messages})
+
+    def _persist_batch_to_postgresql(
+        self, conversations: Dict[str, List[str]]
+    ) -> bool:
+        """
+        Append each conversation's events to PostgreSQL in one batch and commit.
+
+        If another writer appended to one of the threads since its last seq was
+        read, the (thread_id, seq) primary key rejects the batch. It is then
+        rolled back and each thread is retried in its own transaction with a
+        fresh seq, so one conflict does not cost the rest of the batch.
+        """
         try:
-            with self.postgres_conn.cursor() as cursor:
-                # Check if conversation already exists
-                cursor.execute(
-                    "SELECT id FROM chat_streams WHERE thread_id = %s", (thread_id,)
+            try:
+                appended = self._insert_postgresql_events(conversations)
+            except psycopg.errors.UniqueViolation as e:
+                self.postgres_conn.rollback()
+                self.logger.warning(
+                    f"Seq conflict in PostgreSQL batch, retrying per thread: {e}"
                 )
-                existing_record = cursor.fetchone()
+                appended = 0
+                for thread_id, messages in conversations.items():
+                    try:
+                        appended += self._insert_postgresql_events({thread_id: messages})
+                    except Exception as thread_error:
+                        self.logger.error(
+                            f"Error persisting thread {thread_id} to PostgreSQL: {thread_error}"
+                        )
+                        self.postgres_conn.rollback()
+
+            self.logger.info(
+                f"Persisted {len(conversations)} conversation(s) to PostgreSQL: "
+                f"{appended} events appended"
+            )
+            return appended > 0
 
-                current_timestamp = datetime.now()
-                messages_json = json.dumps(messages)
+        except Exception as e:
+            self.logger.error(f"Error persisting to PostgreSQL: {e}")
+            if self.postgres_conn:
+                self.postgres_conn.rollback()
+            return False
 
-                if existing_record:
-                    # Update existing conversation with new messages
-                    cursor.execute(
-                        """
-                        UPDATE chat_streams 
-                        SET messages = %s, ts = %s 
-                        WHERE thread_id = %s
-                        """,
-                        (messages_json, current_timestamp, thread_id),
-                    )
-                    affected_rows = cursor.rowcount
-                    self.postgres_conn.commit()
+    def _insert_postgresql_events(self, conversations: Dict[str, List[str]]) -> int:
+        """Insert the events after the last stored seq of each thread and commit."""
+        with self.postgres_conn.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT thread_id, MAX(seq) AS max_seq FROM chat_stream_events
+                WHERE thread_id = ANY(%s) GROUP BY thread_id
+                """,
+                (list(conversations),),
+            )
+            last_seq = {row["thread_id"]: row["max_seq"] for row in cursor.fetchall()}
 
-                    self.logger.info(
-                        f"Updated conversation for thread {thread_id}: "
-                        f"{affected_rows} rows modified"
+            current_timestamp = datetime.now()
+            rows = [
+                (thread_id, last_seq.get(thread_id, -1) + 1 + offset, message, current_timestamp)
+                for thread_id, messages in conversations.items()
+                for offset, message in enumerate(messages)
+            ]
+            cursor.executemany(
+                """
+                INSERT INTO chat_stream_events (thread_id, seq, event, ts)
+                VALUES (%s, %s, %s, %s)
+                """,
+                rows,
+            )
+        self.postgres_conn.commit()
+        return len(rows)
+
+    def iter_thread_events(self, thread_id: str, page_size: int = 500) -> Iterator[str]:
+        """
+        Replay a thread's events in order, reading ``page_size`` events at a time.
+
+        Events of a thread stored in the legacy chat_streams format come first,
+        since they predate the event table, followed by the persisted events
+        and then chunks still buffered for an unfinished stream.
+        """
+        with self._db_lock:
+            legacy = self._read_legacy_messages(thread_id)
+        yield from legacy
+
+        page_size = max(1, page_size)
+        after_seq = -1
+        while True:
+            with self._db_lock:
+                page = self._read_events_page(thread_id, after_seq, page_size)
+            if not page:
+                break
+            for seq, event in page:
+                yield event
+            after_seq = page[-1][0]
+            if len(page) < page_size:
+                break
+
+        yield from self.get_buffered_messages(thread_id)
+
+    def _read_events_page(
+        self, thread_id: str, after_seq: int, limit: int
+    ) -> List[Tuple[int, str]]:
+        """Read the next page of (seq, event) pairs after ``after_seq``."""
+        try:
+            if self.mongo_db is not None:
+                cursor = (
+                    self.mongo_db.chat_stream_events.find(
+                        {"thread_id": thread_id, "seq": {"$gt": after_seq}},
+                        projection={"seq": 1, "event": 1},
                     )
-                    return affected_rows > 0
-                else:
-                    # Create new conversation record
-                    conversation_id = uuid.uuid4()
+                    .sort("seq", 1)
+                    .limit(limit)
+                )
+                return [(doc["seq"], doc["event"]) for doc in cursor]
+            if self.postgres_conn is not None:
+                with self.postgres_conn.cursor() as cursor:
                     cursor.execute(
                         """
-                        INSERT INTO chat_streams (id, thread_id, messages, ts) 
-                        VALUES (%s, %s, %s, %s)
+                        SELECT seq, event FROM chat_stream_events
+                        WHERE thread_id = %s AND seq > %s
+                        ORDER BY seq LIMIT %s
                         """,
-                        (conversation_id, thread_id, messages_json, current_timestamp),
+                        (thread_id, after_seq, limit),
                     )
-                    affected_rows = cursor.rowcount
-                    self.postgres_conn.commit()
+                    rows = cursor.fetchall()
+                self.postgres_conn.commit()
+                return [(row["seq"], row["event"]) for row in rows]
+        except Exception as e:
+            self.logger.error(f"Error reading chat stream events for thread {thread_id}: {e}")
+            if self.postgres_conn is not None:
+                self.postgres_conn.rollback()
+        return []
 
-                    self.logger.info(
-                        f"Created new conversation with ID: {conversation_id}"
+    def _read_legacy_messages(self, thread_id: str) -> List[str]:
+        """Read a thread stored as one messages array in chat_streams."""
+        try:
+            if self.mongo_db is not None:
+                doc = self.mongo_db.chat_streams.find_one({"thread_id": thread_id})
+                return list(doc["messages"]) if doc else []
+            if self.postgres_conn is not None:
+                with self.postgres_conn.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT messages FROM chat_streams WHERE thread_id = %s",
+                        (thread_id,),
                     )
-                    return affected_rows > 0
-
+                    row = cursor.fetchone()
+                self.postgres_conn.commit()
+                return list(row["messages"]) if row else []
         except Exception as e:
-            self.logger.error(f"Error persisting to PostgreSQL: {e}")
-            if self.postgres_conn:
+            self.logger.error(f"Error reading legacy chat stream for thread {thread_id}: {e}")
+            if self.postgres_conn is not None:
                 self.postgres_conn.rollback()
-            return False
+        return []
+
+    def get_thread_storage_stats(self, thread_id: str) -> dict:
+        """Return how many events are stored for a thread and their size in bytes."""
+        events = stored_bytes = 0
+        for event in self.iter_thread_events(thread_id):
+            events += 1
+            stored_bytes += len(event.encode("utf-8"))
+        return {"thread_id": thread_id, "events": events, "bytes": stored_bytes}
+
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        """Drain pending writes, stop the background writer and close database connections."""
+        writer = self._writer
+        if writer is not None and writer.is_alive():
+            if not self.flush(timeout):
+                self.logger.warning("Timed out flushing pending chat stream writes")
+            try:
+                self._queue.put(_STOP_WRITER, timeout=timeout)
+                writer.join(timeout)
+            except queue.Full:
+                self.logger.warning("Could not stop chat stream writer: queue is full")
+        if self._overflow is not None:
+            self._overflow.shutdown(wait=False)
 
-    def close(self) -> None:
-        """Close database connections."""
         try:
             if self.mongo_client is not None:
                 self.mongo_client.close()
@@ -349,6 +801,9 @@ class ChatStreamManager:
 _default_manager = ChatStreamManager(
     checkpoint_saver=get_bool_env("LANGGRAPH_CHECKPOINT_SAVER", False),
     db_uri=get_str_env("LANGGRAPH_CHECKPOINT_DB_URL", "mongodb://localhost:27017"),
+    batch_size=get_int_env("CHAT_STREAM_WRITE_BATCH_SIZE", 50),
+    max_pending=get_int_env("CHAT_STREAM_WRITE_MAX_PENDING", 1000),
+    compact=get_bool_env("CHAT_STREAM_COMPACT", False),
 )
 
 
@@ -371,3 +826,13 @@ def chat_stream_message(thread_id: str, message: str, finish_reason: str) -> boo
         )
     else:
         return False
+
+
+def iter_chat_stream_history(thread_id: str) -> Iterator[str]:
+    """Replay a thread's stored chat stream events in order."""
+    return _default_manager.iter_thread_events(thread_id)
+
+
+def close_chat_stream_manager(timeout: Optional[float] = 10.0) -> None:
+    """Flush pending chat stream writes and close the default manager."""
+    _default_manager.close(timeout)
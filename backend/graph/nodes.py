@@ -20,6 +20,7 @@ from langchain_mcp_adapters.client import MultiServerMCPClient
 from langgraph.types import Command, interrupt
 
 from backend.agents import create_agent
+from backend.conversation.intent_router import get_intent_router
 from shared.config.agents import AGENT_LLM_MAP
 from shared.config.configuration import Configuration
 from backend.llms.llm import get_llm_by_type, get_llm_token_limit_by_type
@@ -37,6 +38,7 @@ from backend.tools import (
 from backend.tools.search import LoggedTavilySearch
 from backend.utils.context_manager import ContextManager, validate_message_content
 from backend.utils.json_utils import repair_json_output, sanitize_tool_response
+from backend.utils.pm_read_memo import current_pm_read_memo
 
 from shared.config import SELECTED_SEARCH_ENGINE, SearchEngine
 from .types import State
@@ -104,6 +106,16 @@ def _add_context_optimization_tool_call(state: State, agent_name: str, optimizat
             f"Strategy: {strategy}"
         )
     
+    # PM Service reads answered from the turn's memo so far
+    memo = current_pm_read_memo()
+    pm_read_cache = memo.stats() if memo is not None else None
+    if pm_read_cache and pm_read_cache["reads"]:
+        result_text += (
+            f"\nPM reads: {pm_read_cache['hits'] + pm_read_cache['shared_in_flight']}/"
+            f"{pm_read_cache['reads']} served from turn cache "
+            f"(hit rate {pm_read_cache['hit_rate']:.0%})"
+        )
+    
     # Create tool call result message
     tool_call_message = ToolMessage(
         content=result_text,
@@ -124,7 +136,8 @@ def _add_context_optimization_tool_call(state: State, agent_name: str, optimizat
                 "compression_ratio": compression_ratio,
                 "strategy": strategy,
                 "original_message_count": original_count,
-                "compressed_message_count": compressed_count
+                "compressed_message_count": compressed_count,
+                "pm_read_cache": pm_read_cache
             }
         }]
     )
@@ -202,11 +215,8 @@ def detect_user_needs_more_detail(messages: list) -> bool:
     return detect_escalation_with_llm(last_user_message)
 
 
-def detect_escalation_with_llm(message: str) -> bool:
-    """
-    Use LLM to detect if user needs escalation to more detailed analysis.
-    Fast single call for ambiguous cases.
-    """
+def _classify_escalation_with_llm(message: str) -> str | None:
+    """Ask the LLM whether the user wants MORE detail or is SATISFIED; None on failure."""
     try:
         prompt = f"""Analyze if this user message indicates they want MORE DETAIL or are SATISFIED.
 
@@ -223,13 +233,23 @@ Respond with ONLY one word: MORE or SATISFIED"""
         llm = get_llm_by_type("basic")
         response = llm.invoke(prompt)
         
-        result = "MORE" in response.content.upper()
-        return result
+        return "MORE" if "MORE" in response.content.upper() else "SATISFIED"
         
     except Exception as e:
         logger.error(f"[COORDINATOR] LLM classification failed: {e}")
-        # Conservative: don't escalate on error
-        return False
+        return None
+
+
+def detect_escalation_with_llm(message: str) -> bool:
+    """
+    Use LLM to detect if user needs escalation to more detailed analysis.
+    Fast single call for ambiguous cases; repeated and paraphrased
+    messages are answered by the intent router without the LLM.
+    """
+    decision = get_intent_router("escalation").route_sync(
+        message, _classify_escalation_with_llm, fallback="SATISFIED"  # Conservative: don't escalate on error
+    )
+    return decision.label == "MORE"
 
 
 def extract_project_id(text: str) -> str:
@@ -943,38 +963,7 @@ def human_feedback_node(
     )
 
 
-# LLM-based PM intent detection cache (avoid repeat calls for same message)
-_pm_intent_cache: dict[str, tuple[bool, str]] = {}
-
-def detect_pm_intent_llm(user_message: str) -> tuple[bool, str]:
-    """
-    Use LLM to detect if a message is related to Project Management and classify report type.
-    Works with any language (Vietnamese, English, etc.)
-    
-    Args:
-        user_message: The user's message text
-        
-    Returns:
-        Tuple of (is_pm: bool, report_type: str)
-        report_type: "list" | "sprint" | "health" | "analytics" | "general"
-    """
-    import datetime
-    ts = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-    
-    # Check cache first
-    cache_key = user_message.strip().lower()[:200]  # Limit cache key size
-    if cache_key in _pm_intent_cache:
-        cached = _pm_intent_cache[cache_key]
-        logger.info(f"[{ts}] [DETECT_PM_INTENT] Cache hit: is_pm={cached[0]}, type={cached[1]}")
-        return cached
-    
-    logger.info(f"[{ts}] [DETECT_PM_INTENT] Starting LLM classification for: '{user_message[:100]}...'")
-    
-    try:
-        # Use a fast, cheap model for classification
-        llm = get_llm_by_type("basic")
-        
-        prompt = f"""Classify this message for Project Management:
+_PM_INTENT_PROMPT = """Classify this message for Project Management:
 
 1. Is it PM-related? (YES/NO)
 2. If PM-related, what type?
@@ -991,42 +980,89 @@ Message: "{user_message}"
 
 Reply with ONE of: PM_LIST, PM_SPRINT, PM_REPORT, PM_HEALTH, PM_ANALYTICS, PM_RESOURCES, PM_PERSON, PM_GENERAL, NOT_PM
 """
-        
-        response = llm.invoke([{"role": "user", "content": prompt}])
-        result_text = response.content.strip().upper() if hasattr(response, 'content') else str(response).strip().upper()
-        
-        # Parse result
-        is_pm = "NOT_PM" not in result_text and "PM" in result_text
-        
-        # Extract report type
-        report_type = "general"
-        if "LIST" in result_text:
-            report_type = "list"
-        elif "REPORT" in result_text:
-            report_type = "report"
-        elif "SPRINT" in result_text:
-            report_type = "sprint"
-        elif "HEALTH" in result_text:
-            report_type = "health"
-        elif "ANALYTICS" in result_text:
-            report_type = "analytics"
-        elif "RESOURCES" in result_text:
-            report_type = "resources"
-        elif "PERSON" in result_text:
-            report_type = "person"
-        
-        # Cache the result
-        _pm_intent_cache[cache_key] = (is_pm, report_type)
-        
-        ts2 = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-        logger.info(f"[{ts2}] [DETECT_PM_INTENT] LLM result: '{result_text}' -> is_pm={is_pm}, type={report_type}")
-        
-        return (is_pm, report_type)
-        
+
+
+def _parse_pm_intent(result_text: str) -> tuple[bool, str]:
+    """Map a PM intent label (or raw LLM reply) to (is_pm, report_type)."""
+    is_pm = "NOT_PM" not in result_text and "PM" in result_text
+    
+    # Extract report type
+    report_type = "general"
+    if "LIST" in result_text:
+        report_type = "list"
+    elif "REPORT" in result_text:
+        report_type = "report"
+    elif "SPRINT" in result_text:
+        report_type = "sprint"
+    elif "HEALTH" in result_text:
+        report_type = "health"
+    elif "ANALYTICS" in result_text:
+        report_type = "analytics"
+    elif "RESOURCES" in result_text:
+        report_type = "resources"
+    elif "PERSON" in result_text:
+        report_type = "person"
+    return is_pm, report_type
+
+
+def _pm_intent_label(response) -> str:
+    """Normalize an LLM reply to a canonical label such as PM_LIST or NOT_PM."""
+    result_text = response.content.strip().upper() if hasattr(response, 'content') else str(response).strip().upper()
+    is_pm, report_type = _parse_pm_intent(result_text)
+    label = f"PM_{report_type.upper()}" if is_pm else "NOT_PM"
+    logger.info(f"[DETECT_PM_INTENT] LLM result: '{result_text}' -> {label}")
+    return label
+
+
+def _classify_pm_intent_with_llm(user_message: str) -> str | None:
+    try:
+        # Use a fast, cheap model for classification
+        llm = get_llm_by_type("basic")
+        response = llm.invoke([{"role": "user", "content": _PM_INTENT_PROMPT.format(user_message=user_message)}])
+        return _pm_intent_label(response)
     except Exception as e:
         logger.error(f"[DETECT_PM_INTENT] Error in LLM classification: {e}")
-        # Fallback: assume PM intent with general type
-        return (True, "general")
+        return None
+
+
+async def _aclassify_pm_intent_with_llm(user_message: str) -> str | None:
+    try:
+        llm = get_llm_by_type("basic")
+        response = await llm.ainvoke([{"role": "user", "content": _PM_INTENT_PROMPT.format(user_message=user_message)}])
+        return _pm_intent_label(response)
+    except Exception as e:
+        logger.error(f"[DETECT_PM_INTENT] Error in LLM classification: {e}")
+        return None
+
+
+def detect_pm_intent_llm(user_message: str) -> tuple[bool, str]:
+    """
+    Use LLM to detect if a message is related to Project Management and classify report type.
+    Works with any language (Vietnamese, English, etc.)
+    
+    The intent router answers from its semantic cache or local classifier
+    first and only calls the LLM when neither is confident. On LLM failure
+    the message is treated as a general PM query.
+    
+    Args:
+        user_message: The user's message text
+        
+    Returns:
+        Tuple of (is_pm: bool, report_type: str)
+        report_type: "list" | "sprint" | "health" | "analytics" | "general"
+    """
+    decision = get_intent_router("pm_intent").route_sync(
+        user_message, _classify_pm_intent_with_llm, fallback="PM_GENERAL"
+    )
+    return _parse_pm_intent(decision.label)
+
+
+async def adetect_pm_intent(user_message: str) -> tuple[bool, str]:
+    """Async ``detect_pm_intent_llm`` for request handlers (never blocks the event loop)."""
+    decision = await get_intent_router("pm_intent").route(
+        user_message, _aclassify_pm_intent_with_llm, fallback="PM_GENERAL"
+    )
+    return _parse_pm_intent(decision.label)
 
 
 def coordinator_node(
@@ -1769,10 +1805,8 @@ async def reporter_node(state: State, config: RunnableConfig):
                     
                     if len(str(execution_res)) > max_length_per_step:
                         try:
-                            parsed = json.loads(str(execution_res))
-                            from backend.utils.json_utils import _compress_large_array
-                            compressed = _compress_large_array(parsed, max_items=max_items)
-                            execution_res = json.dumps(compressed, ensure_ascii=False)
+                            from backend.utils.json_compactor import compact_json
+                            execution_res = compact_json(str(execution_res), max_length=max_length_per_step, max_items=max_items)
                         except (json.JSONDecodeError, TypeError):
                             pass
                     
@@ -2446,7 +2480,7 @@ async def _execute_agent_step(
     # CRITICAL: Compress ALL execution results to prevent token overflow
     # Even if individual results are small, the total can exceed limits
     # Note: sanitize_tool_response is already imported at module level
-    from backend.utils.json_utils import _compress_large_array
+    from backend.utils.json_compactor import compact_json
     
     completed_steps_info = ""
     if completed_steps:
@@ -2464,11 +2498,9 @@ async def _execute_agent_step(
                 
                 # Always apply compression/truncation to fit within budget
                 try:
-                    parsed = json.loads(str(execution_res))
-                    # First compress arrays
-                    compressed = _compress_large_array(parsed, max_items=max_items)
-                    compressed_json = json.dumps(compressed, ensure_ascii=False)
-                    # Then sanitize to ensure it fits within step_max_length (sanitize_tool_response imported at top)
+                    # Compress arrays and fit step_max_length in a single pass
+                    compressed_json = compact_json(str(execution_res), max_length=step_max_length, max_items=max_items)
+                    # Then sanitize to clean up the result (sanitize_tool_response imported at top)
                     execution_res = sanitize_tool_response(compressed_json, max_length=step_max_length, compress_arrays=False)
                     logger.info(f"[_execute_agent_step] Compressed execution result for step '{step.title}': {original_length:,} → {len(execution_res):,} chars (budget={step_max_length:,})")
                 except (json.JSONDecodeError, TypeError):
@@ -0,0 +1,203 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""
+Concurrent text-to-speech for podcast scripts.
+
+Script lines are synthesized on a bounded thread pool and handed back in
+script order as soon as each one (and every line before it) is ready, so a
+caller can start streaming the first segments while later lines are still
+being synthesized. Synthesized lines are cached by (voice, speed, text), so
+regenerating a podcast only pays for the lines that changed. The audio cache
+is its own SQLite file with its own size cap, separate from the web cache, so
+audio clips and crawled pages never evict each other.
+"""
+
+import asyncio
+import base64
+import logging
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, Sequence
+
+from shared.config.loader import get_bool_env, get_int_env, get_str_env
+from backend.crawler.web_cache import WebCache
+from backend.tools.tts import VolcengineTTS
+
+from .types import ScriptLine
+
+logger = logging.getLogger(__name__)
+
+MALE_VOICE = "BV002_streaming"
+FEMALE_VOICE = "BV001_streaming"
+DEFAULT_SPEED_RATIO = 1.05
+DEFAULT_MAX_CONCURRENCY = 6
+DEFAULT_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+DEFAULT_CACHE_PATH = ".cache/podcast_tts.sqlite3"
+DEFAULT_CACHE_MAX_MB = 512
+
+_CACHE_NAMESPACE = "podcast_tts"
+
+_tts_cache: Optional[WebCache] = None
+_tts_cache_lock = threading.Lock()
+
+
+def get_tts_cache() -> Optional[WebCache]:
+    """
+    Return the process-wide cache of synthesized lines, or None when it is disabled.
+
+    Configured with PODCAST_TTS_CACHE_ENABLED, PODCAST_TTS_CACHE_PATH,
+    PODCAST_TTS_CACHE_TTL_SECONDS and PODCAST_TTS_CACHE_MAX_MB. A cache file
+    that cannot be opened disables caching instead of failing synthesis.
+    """
+    global _tts_cache
+    if not get_bool_env("PODCAST_TTS_CACHE_ENABLED", True):
+        return None
+    if _tts_cache is None:
+        with _tts_cache_lock:
+            if _tts_cache is None:
+                try:
+                    _tts_cache = WebCache(
+                        path=get_str_env("PODCAST_TTS_CACHE_PATH", DEFAULT_CACHE_PATH),
+                        ttl_seconds=get_int_env(
+                            "PODCAST_TTS_CACHE_TTL_SECONDS", DEFAULT_CACHE_TTL_SECONDS
+                        ),
+                        max_bytes=get_int_env("PODCAST_TTS_CACHE_MAX_MB", DEFAULT_CACHE_MAX_MB)
+                        * 1024
+                        * 1024,
+                    )
+                except (OSError, sqlite3.Error) as e:
+                    logger.warning(f"Podcast TTS cache disabled, could not open it: {e}")
+                    return None
+    return _tts_cache
+
+
+def get_tts_cache_stats() -> dict[str, Any]:
+    if _tts_cache is None:
+        return {"enabled": get_bool_env("PODCAST_TTS_CACHE_ENABLED", True), "initialized": False}
+    return {"enabled": True, "initialized": True, **_tts_cache.get_stats()}
+
+
+def reset_tts_cache() -> None:
+    """Close and drop the process-wide TTS cache (tests and config reload)."""
+    global _tts_cache
+    with _tts_cache_lock:
+        if _tts_cache is not None:
+            _tts_cache.close()
+        _tts_cache = None
+
+
+def voice_for(speaker: str) -> str:
+    return MALE_VOICE if speaker == "male" else FEMALE_VOICE
+
+
+def create_tts_client(voice_type: str) -> VolcengineTTS:
+    app_id = os.getenv("VOLCENGINE_TTS_APPID", "")
+    if not app_id:
+        raise Exception("VOLCENGINE_TTS_APPID is not set")
+    access_token = os.getenv("VOLCENGINE_TTS_ACCESS_TOKEN", "")
+    if not access_token:
+        raise Exception("VOLCENGINE_TTS_ACCESS_TOKEN is not set")
+    cluster = os.getenv("VOLCENGINE_TTS_CLUSTER", "volcano_tts")
+    return VolcengineTTS(
+        appid=app_id,
+        access_token=access_token,
+        cluster=cluster,
+        voice_type=voice_type,
+    )
+
+
+class LineSynthesizer:
+    """
+    Synthesizes script lines concurrently, in order, through a line cache.
+
+    One TTS client is kept per voice, so concurrent calls never share a
+    mutable voice setting. A line whose synthesis fails is logged and
+    skipped, like the sequential node did; errors creating a client
+    (missing credentials) propagate.
+    """
+
+    def __init__(
+        self,
+        tts_factory: Callable[[str], Any] = create_tts_client,
+        cache: Optional[WebCache] = None,
+        max_concurrency: Optional[int] = None,
+        speed_ratio: float = DEFAULT_SPEED_RATIO,
+    ):
+        self.tts_factory = tts_factory
+        self.cache = cache if cache is not None else get_tts_cache()
+        self.max_concurrency = max(
+            1,
+            max_concurrency
+            if max_concurrency is not None
+            else get_int_env("PODCAST_TTS_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY),
+        )
+        self.speed_ratio = speed_ratio
+        self.cache_ttl_seconds = get_int_env(
+            "PODCAST_TTS_CACHE_TTL_SECONDS", DEFAULT_CACHE_TTL_SECONDS
+        )
+        self._clients: dict[str, Any] = {}
+        self._clients_lock = threading.Lock()
+
+    def _client(self, voice: str) -> Any:
+        with self._clients_lock:
+            if voice not in self._clients:
+                self._clients[voice] = self.tts_factory(voice)
+            return self._clients[voice]
+
+    def synthesize(self, line: ScriptLine) -> Optional[bytes]:
+        """Return the audio for one line, or None if synthesis failed."""
+        voice = voice_for(line.speaker)
+        identity = {"voice": voice, "speed": self.speed_ratio, "text": line.paragraph}
+        if self.cache is not None:
+            cached = self.cache.get(_CACHE_NAMESPACE, identity, self.cache_ttl_seconds)
+            if cached is not None:
+                return base64.b64decode(cached)
+
+        result = self._client(voice).text_to_speech(
+            line.paragraph, speed_ratio=self.speed_ratio
+        )
+        if not result["success"]:
+            logger.error(result["error"])
+            return None
+
+        if self.cache is not None:
+            self.cache.set(_CACHE_NAMESPACE, identity, result["audio_data"])
+        return base64.b64decode(result["audio_data"])
+
+    def iter_audio(self, lines: Sequence[ScriptLine]) -> Iterator[bytes]:
+        """Yield each line's audio in script order while later lines synthesize."""
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="podcast-tts"
+        )
+        try:
+            futures = [executor.submit(self.synthesize, line) for line in lines]
+            for future in futures:
+                audio = future.result()
+                if audio:
+                    yield audio
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def aiter_audio(self, lines: Sequence[ScriptLine]) -> AsyncIterator[bytes]:
+        """Async variant of iter_audio for streaming responses."""
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="podcast-tts"
+        )
+        try:
+            futures = [
+                loop.run_in_executor(executor, self.synthesize, line) for line in lines
+            ]
+            try:
+                for future in futures:
+                    audio = await future
+                    if audio:
+                        yield audio
+            finally:
+                for future in futures:
+                    future.cancel()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -27,5 +27,7 @@ if __name__ == "__main__":
 
     load_dotenv()
 
+    import asyncio
+
     report_content = open("examples/nanjing_tangbao.md").read()
-    final_state = workflow.invoke({"input": report_content})
+    final_state = asyncio.run(workflow.ainvoke({"input": report_content}))
@@ -3,23 +3,23 @@
 
 import logging
 import os
-import subprocess
-import uuid
 
 from backend.ppt.graph.state import PPTState
+from backend.ppt.renderer import get_ppt_renderer
 
 logger = logging.getLogger(__name__)
 
 
-def ppt_generator_node(state: PPTState):
+async def ppt_generator_node(state: PPTState):
     logger.info("Generating ppt file...")
     # use marp cli to generate ppt file
     # https://github.com/marp-team/marp-cli?tab=readme-ov-file
-    generated_file_path = os.path.join(
-        os.getcwd(), f"generated_ppt_{uuid.uuid4()}.pptx"
-    )
-    subprocess.run(["marp", state["ppt_file_path"], "-o", generated_file_path])
-    # remove the temp file
-    os.remove(state["ppt_file_path"])
+    try:
+        with open(state["ppt_file_path"], encoding="utf-8") as f:
+            markdown = f.read()
+    finally:
+        # remove the temp file
+        os.remove(state["ppt_file_path"])
+    generated_file_path = await get_ppt_renderer().render(markdown)
     logger.info(f"generated_file_path: {generated_file_path}")
     return {"generated_file_path": generated_file_path}
@@ -0,0 +1,187 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""
+Background PPT generation jobs.
+
+``/api/ppt/generate`` with ``background`` set returns a job id right away;
+the deck is composed and rendered in a task on the server loop, and clients
+poll the job or stream its progress events. Finished jobs are forgotten after
+``PPT_JOB_TTL_SECONDS``; their files live in the renderer cache.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+from shared.config.loader import get_int_env
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOB_TTL_SECONDS = 60 * 60
+DEFAULT_MAX_JOBS = 256
+
+QUEUED = "queued"
+COMPOSING = "composing"
+RENDERING = "rendering"
+DONE = "done"
+FAILED = "failed"
+TERMINAL_STATUSES = (DONE, FAILED)
+
+Progress = Callable[[str], None]
+Runner = Callable[[str, Progress], Awaitable[str]]
+
+
+class PPTJob:
+    """State and progress events of one deck generation."""
+
+    def __init__(self, content: str):
+        self.id = uuid.uuid4().hex
+        self.content = content
+        self.status = QUEUED
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+        self.file_path: Optional[str] = None
+        self.error: Optional[str] = None
+        self.events: list[dict[str, Any]] = []
+        self._changed = asyncio.Event()
+        self._emit(QUEUED)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+    def _emit(self, status: str, **fields: Any) -> None:
+        self.status = status
+        self.updated_at = time.time()
+        self.events.append({"job_id": self.id, "status": status, "at": self.updated_at, **fields})
+        # Wake everyone waiting on the previous event, then start a new one
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def iter_events(self) -> AsyncIterator[dict[str, Any]]:
+        """Yield every event so far, then new ones until the job finishes."""
+        sent = 0
+        while True:
+            changed = self._changed
+            while sent < len(self.events):
+                yield self.events[sent]
+                sent += 1
+            if self.finished:
+                return
+            await changed.wait()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "error": self.error,
+        }
+
+
+async def run_ppt_workflow(content: str, progress: Progress, graph: Any = None) -> str:
+    """
+    Compose and render a deck with the ppt graph; return the pptx path.
+
+    Pass the server's compiled ``graph`` to reuse it; otherwise one is built.
+    """
+    if graph is None:
+        from backend.ppt.graph.builder import build_graph
+
+        graph = build_graph()
+
+    final_state: dict[str, Any] = {}
+    async for update in graph.astream({"input": content}, stream_mode="updates"):
+        for node, values in update.items():
+            if node == "ppt_composer":
+                progress(RENDERING)
+            final_state.update(values or {})
+    return final_state["generated_file_path"]
+
+
+class PPTJobManager:
+    """Runs generation jobs as tasks and keeps their state for polling."""
+
+    def __init__(
+        self,
+        runner: Runner = run_ppt_workflow,
+        ttl_seconds: Optional[int] = None,
+        max_jobs: Optional[int] = None,
+    ):
+        self.runner = runner
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None else get_int_env("PPT_JOB_TTL_SECONDS", DEFAULT_JOB_TTL_SECONDS)
+        )
+        self.max_jobs = max(1, max_jobs or get_int_env("PPT_JOB_MAX_JOBS", DEFAULT_MAX_JOBS))
+        self._jobs: dict[str, PPTJob] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def submit(self, content: str, runner: Optional[Runner] = None) -> PPTJob:
+        """
+        Start generating a deck; must be called on the server loop.
+
+        ``runner`` replaces the manager's runner for this job.
+        """
+        self._prune()
+        job = PPTJob(content)
+        self._jobs[job.id] = job
+        task = asyncio.create_task(self._run(job, runner or self.runner))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    def get(self, job_id: str) -> Optional[PPTJob]:
+        return self._jobs.get(job_id)
+
+    async def _run(self, job: PPTJob, runner: Runner) -> None:
+        job._emit(COMPOSING)
+        try:
+            file_path = await runner(job.content, job._emit)
+        except asyncio.CancelledError:
+            # e.g. shutdown; finish the job so event streams do not wait forever
+            job.error = "PPT job was cancelled"
+            job._emit(FAILED, error=job.error)
+            raise
+        except Exception as e:
+            logger.exception(f"PPT job {job.id} failed: {e}")
+            job.error = str(e)
+            job._emit(FAILED, error=job.error)
+        else:
+            job.file_path = file_path
+            job._emit(DONE)
+        finally:
+            # The content is only needed while the job runs
+            job.content = ""
+
+    def _prune(self) -> None:
+        now = time.time()
+        for job_id, job in list(self._jobs.items()):
+            if job.finished and now - job.updated_at > self.ttl_seconds:
+                del self._jobs[job_id]
+        finished = sorted((j for j in self._jobs.values() if j.finished), key=lambda j: j.updated_at)
+        for job in finished[: max(0, len(self._jobs) - self.max_jobs + 1)]:
+            del self._jobs[job.id]
+
+
+_manager: Optional[PPTJobManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_ppt_job_manager() -> PPTJobManager:
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = PPTJobManager()
+    return _manager
+
+
+def reset_ppt_job_manager() -> None:
+    global _manager
+    with _manager_lock:
+        _manager = None
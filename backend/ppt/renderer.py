@@ -0,0 +1,207 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""
+Marp rendering worker for generated decks.
+
+Decks are rendered by the marp CLI in an async subprocess, at most
+``PPT_RENDER_MAX_CONCURRENCY`` at a time, so a render never blocks the event
+loop and a burst of requests cannot start unbounded Chromium instances.
+Outputs are kept in a content-addressed cache (sha256 of the markdown), so a
+retry or a second request for the same deck returns the earlier file, and
+concurrent requests for the same deck share one render. The cache keeps the
+``PPT_RENDER_CACHE_MAX_ENTRIES`` most recently used decks. Each render works
+in its own temporary directory, removed whether the render succeeds or not.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from typing import Optional, Sequence
+
+from shared.concurrency import SingleFlight
+from shared.config.loader import get_int_env, get_str_env
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 2
+DEFAULT_TIMEOUT_SECONDS = 180
+DEFAULT_CACHE_MAX_ENTRIES = 64
+DEFAULT_CACHE_DIR = ".cache/ppt_renders"
+
+OUTPUT_SUFFIX = ".pptx"
+
+
+class RenderError(RuntimeError):
+    """The marp CLI failed, timed out or is not installed."""
+
+
+class MarpRenderer:
+    """Renders marp markdown to pptx through a bounded, cached worker."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        timeout_seconds: Optional[int] = None,
+        cache_max_entries: Optional[int] = None,
+        command: Sequence[str] = ("marp",),
+    ):
+        self.cache_dir = cache_dir or get_str_env("PPT_RENDER_CACHE_DIR", DEFAULT_CACHE_DIR)
+        self.max_concurrency = max(
+            1,
+            max_concurrency
+            if max_concurrency is not None
+            else get_int_env("PPT_RENDER_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY),
+        )
+        self.timeout_seconds = (
+            timeout_seconds
+            if timeout_seconds is not None
+            else get_int_env("PPT_RENDER_TIMEOUT_SECONDS", DEFAULT_TIMEOUT_SECONDS)
+        )
+        self.cache_max_entries = max(
+            1,
+            cache_max_entries
+            if cache_max_entries is not None
+            else get_int_env("PPT_RENDER_CACHE_MAX_ENTRIES", DEFAULT_CACHE_MAX_ENTRIES),
+        )
+        self.command = tuple(command)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._rendering: SingleFlight[str] = SingleFlight()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "shared": 0, "renders": 0, "failures": 0}
+
+    @staticmethod
+    def content_key(markdown: str) -> str:
+        return hashlib.sha256(markdown.encode("utf-8")).hexdigest()
+
+    def _path_for(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + OUTPUT_SUFFIX)
+
+    def cached_path(self, markdown: str) -> Optional[str]:
+        """Path of the cached render of ``markdown``, if there is one."""
+        path = self._path_for(self.content_key(markdown))
+        return path if os.path.exists(path) else None
+
+    def _slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def render(self, markdown: str) -> str:
+        """
+        Render ``markdown`` and return the path of the pptx file.
+
+        The file belongs to the cache: callers may read it but must not
+        delete it.
+
+        Raises:
+            RenderError: If marp fails, times out or is not installed
+        """
+        key = self.content_key(markdown)
+        path = self._path_for(key)
+        if os.path.exists(path):
+            self.stats["hits"] += 1
+            # Mark as recently used for eviction
+            os.utime(path)
+            return path
+
+        return await self._rendering.run(
+            key, lambda: self._render_to(markdown, path), on_join=self._count_shared
+        )
+
+    def _count_shared(self) -> None:
+        with self._lock:
+            self.stats["shared"] += 1
+
+    async def _render_to(self, markdown: str, path: str) -> str:
+        try:
+            async with self._slots():
+                await self._run_marp(markdown, path)
+        except Exception:
+            self.stats["failures"] += 1
+            raise
+        self.stats["renders"] += 1
+        self._evict()
+        return path
+
+    async def _run_marp(self, markdown: str, path: str) -> None:
+        with tempfile.TemporaryDirectory(prefix="ppt_render_") as workdir:
+            source = os.path.join(workdir, "deck.md")
+            output = os.path.join(workdir, "deck" + OUTPUT_SUFFIX)
+            with open(source, "w", encoding="utf-8") as f:
+                f.write(markdown)
+
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *self.command,
+                    source,
+                    "-o",
+                    output,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+            except FileNotFoundError as e:
+                raise RenderError(f"marp CLI not found: {self.command[0]}") from e
+
+            try:
+                _, stderr = await asyncio.wait_for(
+                    process.communicate(), timeout=self.timeout_seconds or None
+                )
+            except asyncio.TimeoutError:
+                raise RenderError(f"marp timed out after {self.timeout_seconds}s")
+            finally:
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+
+            if process.returncode != 0 or not os.path.exists(output):
+                detail = (stderr or b"").decode("utf-8", errors="replace").strip()[-500:]
+                raise RenderError(f"marp exited with code {process.returncode}: {detail}")
+
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Move in under a unique name first so readers never see a partial file
+            staged = f"{path}.{uuid.uuid4().hex}.tmp"
+            shutil.move(output, staged)
+            os.replace(staged, path)
+
+    def _evict(self) -> None:
+        try:
+            entries = [
+                os.path.join(self.cache_dir, name)
+                for name in os.listdir(self.cache_dir)
+                if name.endswith(OUTPUT_SUFFIX)
+            ]
+            entries.sort(key=os.path.getmtime)
+            for path in entries[: max(0, len(entries) - self.cache_max_entries)]:
+                os.remove(path)
+        except OSError as e:
+            logger.warning(f"Failed to evict rendered decks: {e}")
+
+
+_renderer: Optional[MarpRenderer] = None
+_renderer_lock = threading.Lock()
+
+
+def get_ppt_renderer() -> MarpRenderer:
+    """Process-wide renderer, so the concurrency cap and cache are shared."""
+    global _renderer
+    if _renderer is None:
+        with _renderer_lock:
+            if _renderer is None:
+                _renderer = MarpRenderer()
+    return _renderer
+
+
+def reset_ppt_renderer() -> None:
+    global _renderer
+    with _renderer_lock:
+        _renderer = None
@@ -1,21 +1,30 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
-from .builder import build_retriever
-from .dify import DifyProvider
-from .moi import MOIProvider
-from .ragflow import RAGFlowProvider
-from .retriever import Chunk, Document, Resource, Retriever
-from .vikingdb_knowledge_base import VikingDBKnowledgeBaseProvider
+import importlib
 
-__all__ = [
-    Retriever,
-    Document,
-    Resource,
-    DifyProvider,
-    RAGFlowProvider,
-    MOIProvider,
-    VikingDBKnowledgeBaseProvider,
-    Chunk,
-    build_retriever,
-]
+# Exported name -> submodule. Providers are imported on first access, so code
+# that only needs the retriever types (e.g. Resource) does not load every
+# provider's client library.
+_EXPORTS = {
+    "Retriever": ".retriever",
+    "Document": ".retriever",
+    "Resource": ".retriever",
+    "Chunk": ".retriever",
+    "DifyProvider": ".dify",
+    "RAGFlowProvider": ".ragflow",
+    "MOIProvider": ".moi",
+    "VikingDBKnowledgeBaseProvider": ".vikingdb_knowledge_base",
+    "build_retriever": ".builder",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
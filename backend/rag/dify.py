@@ -6,7 +6,16 @@ from urllib.parse import urlparse
 
 import requests
 
-from backend.rag.retriever import Chunk, Document, Resource, Retriever
+from backend.rag.retriever import (
+    Chunk,
+    Document,
+    Resource,
+    Retriever,
+    async_http_client,
+    credential_fingerprint,
+    gather_resources,
+    merge_documents,
+)
 
 
 class DifyProvider(Retriever):
@@ -28,90 +37,109 @@ class DifyProvider(Retriever):
             raise ValueError("DIFY_API_KEY is not set")
         self.api_key = api_key
 
+    def _headers(self) -> dict:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+
+    def _retrieve_payload(self, query: str) -> dict:
+        return {
+            "query": query,
+            "retrieval_model": {
+                "search_method": "hybrid_search",
+                "reranking_enable": False,
+                "weights": {
+                    "weight_type": "customized",
+                    "keyword_setting": {"keyword_weight": 0.3},
+                    "vector_setting": {"vector_weight": 0.7},
+                },
+                "top_k": 3,
+                "score_threshold_enabled": True,
+                "score_threshold": 0.5,
+            },
+        }
+
+    def _collect_records(self, result: dict, all_documents: dict) -> None:
+        records = result.get("records", {})
+        for record in records:
+            segment = record.get("segment")
+            if not segment:
+                continue
+            document_info = segment.get("document")
+            if not document_info:
+                continue
+            doc_id = document_info.get("id")
+            doc_name = document_info.get("name")
+            if not doc_id or not doc_name:
+                continue
+
+            if doc_id not in all_documents:
+                all_documents[doc_id] = Document(id=doc_id, title=doc_name, chunks=[])
+
+            chunk = Chunk(
+                content=segment.get("content", ""),
+                similarity=record.get("score", 0.0),
+            )
+            all_documents[doc_id].chunks.append(chunk)
+
+    def cache_identity(self) -> str:
+        return f"dify:{self.api_url}:{credential_fingerprint(self.api_key)}"
+
     def query_relevant_documents(
         self, query: str, resources: list[Resource] = []
     ) -> list[Document]:
         if not resources:
             return []
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
         all_documents = {}
         for resource in resources:
             dataset_id, _ = parse_uri(resource.uri)
-            payload = {
-                "query": query,
-                "retrieval_model": {
-                    "search_method": "hybrid_search",
-                    "reranking_enable": False,
-                    "weights": {
-                        "weight_type": "customized",
-                        "keyword_setting": {"keyword_weight": 0.3},
-                        "vector_setting": {"vector_weight": 0.7},
-                    },
-                    "top_k": 3,
-                    "score_threshold_enabled": True,
-                    "score_threshold": 0.5,
-                },
-            }
-
             response = requests.post(
                 f"{self.api_url}/datasets/{dataset_id}/retrieve",
-                headers=headers,
-                json=payload,
+                headers=self._headers(),
+                json=self._retrieve_payload(query),
             )
 
             if response.status_code != 200:
                 raise Exception(f"Failed to query documents: {response.text}")
 
-            result = response.json()
-            records = result.get("records", {})
-            for record in records:
-                segment = record.get("segment")
-                if not segment:
-                    continue
-                document_info = segment.get("document")
-                if not document_info:
-                    continue
-                doc_id = document_info.get("id")
-                doc_name = document_info.get("name")
-                if not doc_id or not doc_name:
-                    continue
-
-                if doc_id not in all_documents:
-                    all_documents[doc_id] = Document(
-                        id=doc_id, title=doc_name, chunks=[]
-                    )
-
-                chunk = Chunk(
-                    content=segment.get("content", ""),
-                    similarity=record.get("score", 0.0),
-                )
-                all_documents[doc_id].chunks.append(chunk)
+            self._collect_records(response.json(), all_documents)
 
         return list(all_documents.values())
 
-    def list_resources(self, query: str | None = None) -> list[Resource]:
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+    async def _aquery_relevant_documents(
+        self, query: str, resources: list[Resource]
+    ) -> list[Document]:
+        if not resources:
+            return []
 
+        async def retrieve(dataset_id: str) -> list[Document]:
+            response = await async_http_client().post(
+                f"{self.api_url}/datasets/{dataset_id}/retrieve",
+                headers=self._headers(),
+                json=self._retrieve_payload(query),
+            )
+            if response.status_code != 200:
+                raise Exception(f"Failed to query documents: {response.text}")
+            documents: dict = {}
+            self._collect_records(response.json(), documents)
+            return list(documents.values())
+
+        # Each dataset has its own endpoint, so they are queried concurrently
+        dataset_ids = dict.fromkeys(parse_uri(r.uri)[0] for r in resources)
+        results = await gather_resources(
+            (retrieve(dataset_id) for dataset_id in dataset_ids), "Dify"
+        )
+        return merge_documents(results)
+
+    def _list_params(self, query: str | None) -> dict:
         params = {}
         if query:
             params["keyword"] = query
+        return params
 
-        response = requests.get(
-            f"{self.api_url}/datasets", headers=headers, params=params
-        )
-
-        if response.status_code != 200:
-            raise Exception(f"Failed to list resources: {response.text}")
-
-        result = response.json()
+    def _parse_resources(self, result: dict) -> list[Resource]:
         resources = []
 
         for item in result.get("data", []):
@@ -124,6 +152,30 @@ class DifyProvider(Retriever):
 
         return resources
 
+    def list_resources(self, query: str | None = None) -> list[Resource]:
+        response = requests.get(
+            f"{self.api_url}/datasets",
+            headers=self._headers(),
+            params=self._list_params(query),
+        )
+
+        if response.status_code != 200:
+            raise Exception(f"Failed to list resources: {response.text}")
+
+        return self._parse_resources(response.json())
+
+    async def _alist_resources(self, query: str | None) -> list[Resource]:
+        response = await async_http_client().get(
+            f"{self.api_url}/datasets",
+            headers=self._headers(),
+            params=self._list_params(query),
+        )
+
+        if response.status_code != 200:
+            raise Exception(f"Failed to list resources: {response.text}")
+
+        return self._parse_resources(response.json())
+
 
 def parse_uri(uri: str) -> tuple[str, str]:
     parsed = urlparse(uri)
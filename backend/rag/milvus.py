@@ -3,8 +3,11 @@
 
 import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from langchain_milvus.vectorstores import Milvus as LangchainMilvus
 from langchain_openai import OpenAIEmbeddings
@@ -12,10 +15,46 @@ from openai import OpenAI
 from pymilvus import CollectionSchema, DataType, FieldSchema, MilvusClient
 
 from shared.config.loader import get_bool_env, get_int_env, get_str_env
+from backend.rag.milvus_ingest import IngestStats, MilvusIngestor
 from backend.rag.retriever import Chunk, Document, Resource, Retriever
 
 logger = logging.getLogger(__name__)
 
+# Rank constant from the original RRF paper; damps the weight of the top ranks
+RRF_K = 60
+
+# After a failed BM25 search, hybrid queries run dense-only for this long,
+# doubling on each consecutive failure up to the maximum
+BM25_RETRY_MIN_SECONDS = 30.0
+BM25_RETRY_MAX_SECONDS = 600.0
+
+
+def reciprocal_rank_fusion(
+    result_lists: Sequence[Sequence[Dict[str, Any]]], id_key: str, k: int = RRF_K
+) -> List[Dict[str, Any]]:
+    """Fuse ranked hit lists with reciprocal rank fusion.
+
+    Each hit scores ``sum(1 / (k + rank))`` over the lists it appears in. The
+    fused hits keep the entity of their first occurrence and carry the fused
+    score in ``distance``, best first.
+    """
+    fused: Dict[str, Dict[str, Any]] = {}
+    for hits in result_lists:
+        for rank, hit in enumerate(hits, start=1):
+            hit_id = hit.get("entity", {}).get(id_key) or hit.get("id")
+            if hit_id is None:
+                continue
+            entry = fused.setdefault(
+                hit_id, {"entity": hit.get("entity", {}), "distance": 0.0}
+            )
+            entry["distance"] += 1.0 / (k + rank)
+    return sorted(fused.values(), key=lambda hit: hit["distance"], reverse=True)
+
+
+def _quote(value: str) -> str:
+    """Return ``value`` as a double-quoted Milvus expression string literal."""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
 
 class DashscopeEmbeddings:
     """OpenAI-compatible embeddings wrapper."""
@@ -64,6 +103,14 @@ class MilvusRetriever(Retriever):
         MILVUS_EMBEDDING_DIM: Override embedding dimensionality.
         MILVUS_AUTO_LOAD_EXAMPLES: Load example *.md files if true.
         MILVUS_EXAMPLES_DIR: Folder containing example markdown files.
+        MILVUS_INGEST_MANIFEST: Manifest of ingested files (default:
+            .cache/milvus_ingest_<collection>.json).
+        MILVUS_INGEST_BATCH_SIZE: Chunks embedded and written per batch.
+        MILVUS_INGEST_WORKERS: Batches embedded and written in parallel.
+        MILVUS_HYBRID_SEARCH: Fuse a BM25 lexical channel with the dense
+            search (Milvus Lite / MilvusClient only, default: false).
+        MILVUS_QUERY_EMBEDDING_CACHE_SIZE: Query embeddings kept in memory
+            (default: 256, 0 disables the cache).
     """
 
     def __init__(self) -> None:
@@ -84,6 +131,17 @@ class MilvusRetriever(Retriever):
         self.title_field: str = get_str_env("MILVUS_TITLE_FIELD", "title")
         self.url_field: str = get_str_env("MILVUS_URL_FIELD", "url")
         self.metadata_field: str = get_str_env("MILVUS_METADATA_FIELD", "metadata")
+        self.sparse_field: str = get_str_env("MILVUS_SPARSE_FIELD", "sparse")
+
+        # --- Hybrid (dense + BM25) search configuration ---
+        self.hybrid_search: bool = get_bool_env("MILVUS_HYBRID_SEARCH", False)
+        # Each channel fetches top_k * factor candidates before fusion
+        self.hybrid_candidate_factor: int = max(
+            1, get_int_env("MILVUS_HYBRID_CANDIDATE_FACTOR", 3)
+        )
+        # BM25 backoff after failures (monotonic deadline and current delay)
+        self._bm25_retry_at: float = 0.0
+        self._bm25_backoff: float = 0.0
 
         # --- Embedding configuration ---
         self.embedding_model = get_str_env("MILVUS_EMBEDDING_MODEL")
@@ -98,9 +156,24 @@ class MilvusRetriever(Retriever):
         # chunk size
         self.chunk_size: int = get_int_env("MILVUS_CHUNK_SIZE", 4000)
 
+        # --- Bulk ingestion configuration ---
+        self.ingest_manifest_path: str = get_str_env(
+            "MILVUS_INGEST_MANIFEST", f".cache/milvus_ingest_{self.collection_name}.json"
+        )
+        self.ingest_batch_size: int = get_int_env("MILVUS_INGEST_BATCH_SIZE", 64)
+        self.ingest_workers: int = get_int_env("MILVUS_INGEST_WORKERS", 1)
+
         # --- Embedding model initialization ---
         self._init_embedding_model()
 
+        # Repeated queries (retries, follow-ups, multi-step research) skip the
+        # embedding API round-trip
+        self.query_cache_size: int = get_int_env(
+            "MILVUS_QUERY_EMBEDDING_CACHE_SIZE", 256
+        )
+        self._query_embeddings: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+
         # Client (MilvusClient or LangchainMilvus) created lazily
         self.client: Any = None
 
@@ -157,19 +230,58 @@ class MilvusRetriever(Retriever):
                 dim=self.embedding_dim,
             ),
             FieldSchema(
-                name=self.content_field, dtype=DataType.VARCHAR, max_length=65535
+                name=self.content_field,
+                dtype=DataType.VARCHAR,
+                max_length=65535,
+                # Tokenized for the BM25 function when hybrid search is on
+                **({"enable_analyzer": True} if self.hybrid_search else {}),
             ),
             FieldSchema(name=self.title_field, dtype=DataType.VARCHAR, max_length=512),
             FieldSchema(name=self.url_field, dtype=DataType.VARCHAR, max_length=1024),
         ]
+        if self.hybrid_search:
+            fields.append(
+                FieldSchema(name=self.sparse_field, dtype=DataType.SPARSE_FLOAT_VECTOR)
+            )
 
         schema = CollectionSchema(
             fields=fields,
             description=f"Collection for Galaxy AI Project Manager RAG documents: {self.collection_name}",
             enable_dynamic_field=True,  # Allow additional dynamic metadata fields
         )
+        if self.hybrid_search:
+            from pymilvus import Function, FunctionType
+
+            # Milvus derives the sparse BM25 vector from content on insert
+            schema.add_function(
+                Function(
+                    name=f"{self.content_field}_bm25",
+                    function_type=FunctionType.BM25,
+                    input_field_names=[self.content_field],
+                    output_field_names=[self.sparse_field],
+                )
+            )
         return schema
 
+    def _create_index_params(self) -> Any:
+        """Return index parameters for a new collection."""
+        dense_index = {
+            "field_name": self.vector_field,
+            "index_type": "IVF_FLAT",
+            "metric_type": "IP",
+            "params": {"nlist": 1024},
+        }
+        if not self.hybrid_search:
+            return dense_index
+        index_params = self.client.prepare_index_params()
+        index_params.add_index(**dense_index)
+        index_params.add_index(
+            field_name=self.sparse_field,
+            index_type="SPARSE_INVERTED_INDEX",
+            metric_type="BM25",
+        )
+        return index_params
+
     def _ensure_collection_exists(self) -> None:
         """Ensure the configured collection exists (create if missing).
         For Milvus Lite we create the collection manually; for the remote
@@ -186,12 +298,7 @@ class MilvusRetriever(Retriever):
                     self.client.create_collection(
                         collection_name=self.collection_name,
                         schema=schema,
-                        index_params={
-                            "field_name": self.vector_field,
-                            "index_type": "IVF_FLAT",
-                            "metric_type": "IP",
-                            "params": {"nlist": 1024},
-                        },
+                        index_params=self._create_index_params(),
                     )
                     logger.info("Created Milvus collection: %s", self.collection_name)
 
@@ -205,8 +312,8 @@ class MilvusRetriever(Retriever):
 
     def _load_example_files(self) -> None:
         """Load example markdown files into the collection (idempotent).
-        Each markdown file is split into chunks and inserted only if a chunk
-        with the derived document id hasn't been previously stored.
+        Files are bulk-ingested in batches; a local manifest of content hashes
+        skips files that are already loaded and lets interrupted loads resume.
         """
         try:
             # Get the project root directory
@@ -219,52 +326,46 @@ class MilvusRetriever(Retriever):
                 return
 
             logger.info("Loading example files from: %s", examples_path)
-
-            # Find all markdown files
-            md_files = list(examples_path.glob("*.md"))
-            if not md_files:
+            stats = self._ingestor().ingest_directory(examples_path, source="examples")
+            if stats.files_seen == 0:
                 logger.info("No markdown files found in examples directory")
                 return
-            # Check if files are already loaded
-            existing_docs = self._get_existing_document_ids()
-            loaded_count = 0
-            for md_file in md_files:
-                doc_id = self._generate_doc_id(md_file)
-
-                # Skip if already loaded
-                if doc_id in existing_docs:
-                    continue
-                try:
-                    # Read and process the file
-                    content = md_file.read_text(encoding="utf-8")
-                    title = self._extract_title_from_markdown(content, md_file.name)
-
-                    # Split content into chunks if it's too long
-                    chunks = self._split_content(content)
-
-                    # Insert each chunk
-                    for i, chunk in enumerate(chunks):
-                        chunk_id = f"{doc_id}_chunk_{i}" if len(chunks) > 1 else doc_id
-                        self._insert_document_chunk(
-                            doc_id=chunk_id,
-                            content=chunk,
-                            title=title,
-                            url=f"milvus://{self.collection_name}/{md_file.name}",
-                            metadata={"source": "examples", "file": md_file.name},
-                        )
-
-                    loaded_count += 1
-
-                except Exception as e:
-                    logger.warning("Error loading %s: %s", md_file.name, e)
-
             logger.info(
-                "Successfully loaded %d example files into Milvus", loaded_count
+                "Successfully loaded %d example files into Milvus", stats.files_ingested
             )
 
         except Exception as e:
             logger.error("Error loading example files: %s", e)
 
+    def _ingestor(self) -> "MilvusIngestor":
+        """Return a bulk ingestor bound to this retriever."""
+        return MilvusIngestor(
+            self, batch_size=self.ingest_batch_size, workers=self.ingest_workers
+        )
+
+    def ingest_directory(
+        self,
+        directory: str,
+        pattern: str = "*.md",
+        recursive: bool = True,
+        source: str = "documents",
+        force: bool = False,
+    ) -> IngestStats:
+        """Bulk-ingest markdown files from ``directory``.
+
+        See ``MilvusIngestor.ingest_directory``; batch size and worker count
+        come from ``MILVUS_INGEST_BATCH_SIZE`` / ``MILVUS_INGEST_WORKERS``.
+        """
+        if not self.client:
+            self._connect()
+        return self._ingestor().ingest_directory(
+            Path(directory),
+            pattern=pattern,
+            recursive=recursive,
+            source=source,
+            force=force,
+        )
+
     def _generate_doc_id(self, file_path: Path) -> str:
         """Return a stable identifier derived from name, size & mtime hash."""
         # Use file name and size for a simple but effective ID
@@ -307,27 +408,29 @@ class MilvusRetriever(Retriever):
 
         return chunks
 
-    def _get_existing_document_ids(self) -> Set[str]:
-        """Return set of existing document identifiers in the collection."""
+    def _find_existing_chunk_ids(self, doc_id: str) -> List[str]:
+        """Return stored chunk ids of ``doc_id`` (the id itself or ``<id>_chunk_N``)."""
+        expr = (
+            f"{self.id_field} == {_quote(doc_id)} or "
+            f"{self.id_field} like {_quote(doc_id + '_chunk_%')}"
+        )
         try:
             if self._is_milvus_lite():
                 results = self.client.query(
                     collection_name=self.collection_name,
-                    filter="",
+                    filter=expr,
                     output_fields=[self.id_field],
-                    limit=10000,
                 )
-                return {
-                    result.get(self.id_field, "")
-                    for result in results
-                    if result.get(self.id_field)
-                }
             else:
-                # For LangChain Milvus, we can't easily query all IDs
-                # Return empty set to allow re-insertion (LangChain will handle duplicates)
-                return set()
+                # LangChain Milvus keeps our ids in the id metadata field
+                if self.client.col is None:
+                    return []
+                results = self.client.col.query(expr=expr, output_fields=[self.id_field])
+            return sorted(
+                {result[self.id_field] for result in results if result.get(self.id_field)}
+            )
         except Exception:
-            return set()
+            return []
 
     def _insert_document_chunk(
         self, doc_id: str, content: str, title: str, url: str, metadata: Dict[str, Any]
@@ -366,6 +469,81 @@ class MilvusRetriever(Retriever):
         except Exception as e:
             raise RuntimeError(f"Failed to insert document chunk: {str(e)}")
 
+    def _embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Return embeddings for ``texts`` with one embedding API call."""
+        try:
+            embeddings = self.embedding_model.embed_documents(
+                [text.strip() for text in texts]
+            )
+            if len(embeddings) != len(texts) or not all(embeddings):
+                raise ValueError(
+                    f"Expected {len(texts)} embeddings, got {len(embeddings)}"
+                )
+            return embeddings
+        except Exception as e:
+            raise RuntimeError(f"Failed to generate embeddings: {str(e)}")
+
+    def _insert_document_chunks(self, chunks: List[Dict[str, Any]]) -> None:
+        """Write a batch of chunks (``id``, ``content``, ``title``, ``url``,
+        ``metadata``) with one embedding call and one upsert."""
+        if not chunks:
+            return
+        try:
+            if self._is_milvus_lite():
+                embeddings = self._embed_documents([c["content"] for c in chunks])
+                data = [
+                    {
+                        self.id_field: chunk["id"],
+                        self.vector_field: embedding,
+                        self.content_field: chunk["content"],
+                        self.title_field: chunk["title"],
+                        self.url_field: chunk["url"],
+                        **chunk["metadata"],
+                    }
+                    for chunk, embedding in zip(chunks, embeddings)
+                ]
+                # Upsert keeps re-running a partially written batch idempotent
+                self.client.upsert(collection_name=self.collection_name, data=data)
+            else:
+                # LangChain Milvus has no upsert: replace any rows with these
+                # ids first so re-running a batch does not duplicate them.
+                # LangChain embeds the texts in batches itself.
+                chunk_ids = [chunk["id"] for chunk in chunks]
+                self._delete_chunks(chunk_ids, strict=True)
+                self.client.add_texts(
+                    texts=[chunk["content"] for chunk in chunks],
+                    metadatas=[
+                        {
+                            self.id_field: chunk["id"],
+                            self.title_field: chunk["title"],
+                            self.url_field: chunk["url"],
+                            **chunk["metadata"],
+                        }
+                        for chunk in chunks
+                    ],
+                    ids=chunk_ids,
+                )
+        except Exception as e:
+            raise RuntimeError(f"Failed to insert document chunks: {str(e)}")
+
+    def _delete_chunks(self, chunk_ids: List[str], strict: bool = False) -> None:
+        """Delete chunks by id; best effort unless ``strict``."""
+        if not chunk_ids:
+            return
+        try:
+            if self._is_milvus_lite():
+                self.client.delete(collection_name=self.collection_name, ids=chunk_ids)
+            elif self.client.col is not None:
+                # Match the id metadata field, which rows written before ids
+                # were passed to add_texts (random primary keys) also carry
+                self.client.delete(
+                    expr=f"{self.id_field} in [{', '.join(_quote(i) for i in chunk_ids)}]"
+                )
+        except Exception as e:
+            if strict:
+                raise
+            logger.warning("Could not delete stale chunks: %s", e)
+
     def _connect(self) -> None:
         """Create the underlying Milvus client (idempotent)."""
         try:
@@ -426,6 +604,108 @@ class MilvusRetriever(Retriever):
         except Exception as e:
             raise RuntimeError(f"Failed to generate embedding: {str(e)}")
 
+    def _get_query_embedding(self, query: str) -> List[float]:
+        """Return the query embedding, served from the LRU cache when possible."""
+        if self.query_cache_size <= 0:
+            return self._get_embedding(query)
+        key = query.strip() if isinstance(query, str) else query
+        with self._query_cache_lock:
+            if key in self._query_embeddings:
+                self._query_embeddings.move_to_end(key)
+                return self._query_embeddings[key]
+        embedding = self._get_embedding(query)
+        with self._query_cache_lock:
+            self._query_embeddings[key] = embedding
+            self._query_embeddings.move_to_end(key)
+            while len(self._query_embeddings) > self.query_cache_size:
+                self._query_embeddings.popitem(last=False)
+        return embedding
+
+    def _build_resource_filter(self, resources: List[Resource]) -> str:
+        """Return a scalar filter expression restricting hits to ``resources``.
+
+        A resource matches chunks whose url equals its uri, or whose id equals
+        the uri without the ``milvus://`` scheme (or its last path segment),
+        mirroring the uris produced by ``list_resources``.
+        """
+        urls: List[str] = []
+        ids: List[str] = []
+        for resource in resources:
+            uri = resource.uri or ""
+            if not uri:
+                continue
+            urls.append(uri)
+            bare = uri.split("://", 1)[-1]
+            ids.append(bare)
+            if "/" in bare:
+                ids.append(bare.rsplit("/", 1)[-1])
+        if not urls:
+            return ""
+        urls = list(dict.fromkeys(urls))
+        ids = list(dict.fromkeys(i for i in ids if i))
+        clauses = [f"{self.url_field} in [{', '.join(_quote(u) for u in urls)}]"]
+        if ids:
+            clauses.append(f"{self.id_field} in [{', '.join(_quote(i) for i in ids)}]")
+        return " or ".join(clauses)
+
+    def _search_lite(
+        self, query: str, query_embedding: List[float], expr: str
+    ) -> List[Dict[str, Any]]:
+        """Run the dense (and, if enabled, BM25) search on a MilvusClient.
+
+        A failed BM25 search falls back to dense results for that query and
+        pauses BM25 with an exponential backoff (see ``BM25_RETRY_*``).
+        """
+        output_fields = [
+            self.id_field,
+            self.content_field,
+            self.title_field,
+            self.url_field,
+        ]
+        use_bm25 = self.hybrid_search and time.monotonic() >= self._bm25_retry_at
+        limit = self.top_k * self.hybrid_candidate_factor if use_bm25 else self.top_k
+        dense_hits = self.client.search(
+            collection_name=self.collection_name,
+            data=[query_embedding],
+            anns_field=self.vector_field,
+            param={"metric_type": "IP", "params": {"nprobe": 10}},
+            limit=limit,
+            output_fields=output_fields,
+            filter=expr,
+        )
+        dense_hits = list(dense_hits[0]) if dense_hits else []
+        if not use_bm25:
+            return dense_hits
+
+        try:
+            sparse_hits = self.client.search(
+                collection_name=self.collection_name,
+                data=[query],
+                anns_field=self.sparse_field,
+                param={"metric_type": "BM25"},
+                limit=limit,
+                output_fields=output_fields,
+                filter=expr,
+            )
+        except Exception as e:
+            # Typically a collection created before hybrid search was enabled
+            self._bm25_backoff = min(
+                BM25_RETRY_MAX_SECONDS,
+                max(BM25_RETRY_MIN_SECONDS, self._bm25_backoff * 2),
+            )
+            self._bm25_retry_at = time.monotonic() + self._bm25_backoff
+            logger.warning(
+                "BM25 search failed on %s, using dense search only for %.0fs: %s",
+                self.collection_name,
+                self._bm25_backoff,
+                e,
+            )
+            return dense_hits[: self.top_k]
+        self._bm25_backoff = 0.0
+        sparse_hits = list(sparse_hits[0]) if sparse_hits else []
+        fused = reciprocal_rank_fusion([dense_hits, sparse_hits], self.id_field)
+        return fused[: self.top_k]
+
     def list_resources(self, query: Optional[str] = None) -> List[Resource]:
         """List available resource summaries.
 
@@ -543,13 +823,13 @@ class MilvusRetriever(Retriever):
     def query_relevant_documents(
         self, query: str, resources: Optional[List[Resource]] = None
     ) -> List[Document]:
-        """Perform vector similarity search returning rich ``Document`` objects.
+        """Perform vector (optionally hybrid) search returning ``Document`` objects.
 
         Args:
             query: Natural language query string.
             resources: Optional subset filter of ``Resource`` objects; if
-                provided, only documents whose id/url appear in the list will
-                be included.
+                provided, the search is restricted to documents whose url or
+                id matches one of them.
 
         Returns:
             List of aggregated ``Document`` objects; each contains one or more
@@ -563,97 +843,47 @@ class MilvusRetriever(Retriever):
             if not self.client:
                 self._connect()
 
-            # Get embeddings for the query
-            query_embedding = self._get_embedding(query)
-
-            # For Milvus Lite, use MilvusClient directly
-            if self._is_milvus_lite():
-                # Perform vector search
-                search_results = self.client.search(
-                    collection_name=self.collection_name,
-                    data=[query_embedding],
-                    anns_field=self.vector_field,
-                    param={"metric_type": "IP", "params": {"nprobe": 10}},
-                    limit=self.top_k,
-                    output_fields=[
-                        self.id_field,
-                        self.content_field,
-                        self.title_field,
-                        self.url_field,
-                    ],
-                )
+            query_embedding = self._get_query_embedding(query)
+            # Resource restriction is pushed into the search so top_k is taken
+            # over matching chunks only, not filtered down afterwards
+            expr = self._build_resource_filter(resources)
 
-                documents = {}
-
-                for result_list in search_results:
-                    for result in result_list:
-                        entity = result.get("entity", {})
-                        doc_id = entity.get(self.id_field, "")
-                        content = entity.get(self.content_field, "")
-                        title = entity.get(self.title_field, "")
-                        url = entity.get(self.url_field, "")
-                        score = result.get("distance", 0.0)
-
-                        # Skip if resource filtering is requested and this doc is not in the list
-                        if resources:
-                            doc_in_resources = False
-                            for resource in resources:
-                                if (
-                                    url and url in resource.uri
-                                ) or doc_id in resource.uri:
-                                    doc_in_resources = True
-                                    break
-                            if not doc_in_resources:
-                                continue
-
-                        # Create or update document
-                        if doc_id not in documents:
-                            documents[doc_id] = Document(
-                                id=doc_id, url=url, title=title, chunks=[]
-                            )
-
-                        # Add chunk to document
-                        chunk = Chunk(content=content, similarity=score)
-                        documents[doc_id].chunks.append(chunk)
-
-                return list(documents.values())
+            documents: Dict[str, Document] = {}
+            hits: List[Tuple[Dict[str, Any], str, float]] = []
 
+            if self._is_milvus_lite():
+                for result in self._search_lite(query, query_embedding, expr):
+                    entity = result.get("entity", {})
+                    hits.append(
+                        (
+                            entity,
+                            entity.get(self.content_field, ""),
+                            result.get("distance", 0.0),
+                        )
+                    )
             else:
-                # For LangChain Milvus, use similarity search
-                search_results = self.client.similarity_search_with_score(
-                    query=query, k=self.top_k
+                # LangChain Milvus: search by the cached vector so the store
+                # does not embed the query a second time
+                search_results = self.client.similarity_search_with_score_by_vector(
+                    embedding=query_embedding, k=self.top_k, expr=expr or None
                 )
-
-                documents = {}
-
                 for doc, score in search_results:
-                    metadata = doc.metadata or {}
-                    doc_id = metadata.get(self.id_field, "")
-                    title = metadata.get(self.title_field, "")
-                    url = metadata.get(self.url_field, "")
-                    content = doc.page_content
-
-                    # Skip if resource filtering is requested and this doc is not in the list
-                    if resources:
-                        doc_in_resources = False
-                        for resource in resources:
-                            if (url and url in resource.uri) or doc_id in resource.uri:
-                                doc_in_resources = True
-                                break
-                        if not doc_in_resources:
-                            continue
-
-                    # Create or update document
-                    if doc_id not in documents:
-                        documents[doc_id] = Document(
-                            id=doc_id, url=url, title=title, chunks=[]
-                        )
-
-                    # Add chunk to document
-                    chunk = Chunk(content=content, similarity=score)
-                    documents[doc_id].chunks.append(chunk)
+                    hits.append((doc.metadata or {}, doc.page_content, score))
+
+            for fields, content, score in hits:
+                doc_id = fields.get(self.id_field, "")
+                if doc_id not in documents:
+                    documents[doc_id] = Document(
+                        id=doc_id,
+                        url=fields.get(self.url_field, ""),
+                        title=fields.get(self.title_field, ""),
+                        chunks=[],
+                    )
+                documents[doc_id].chunks.append(
+                    Chunk(content=content, similarity=score)
+                )
 
-                return list(documents.values())
+            return list(documents.values())
 
         except Exception as e:
             raise RuntimeError(f"Failed to query documents from Milvus: {str(e)}")
@@ -702,6 +932,10 @@ class MilvusRetriever(Retriever):
                         collection_name=self.collection_name, ids=doc_ids
                     )
                     logger.info("Cleared %d existing example documents", len(doc_ids))
+
+                manifest = self._ingestor().manifest
+                if manifest.forget(source="examples"):
+                    manifest.save()
             else:
                 # For LangChain Milvus, we can't easily delete by metadata
                 logger.info(
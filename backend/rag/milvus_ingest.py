@@ -0,0 +1,348 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""
+Batched, resumable bulk ingestion of markdown corpora into Milvus.
+
+Files are deduplicated by content hash against a local JSON manifest, split
+into chunks, embedded in batches and written with one upsert per batch. The
+manifest is checkpointed after every batch, so an interrupted load resumes
+with the files it had not finished. Batches can be embedded and written by
+several worker threads for large corpora.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+STATUS_PARTIAL = "partial"
+STATUS_DONE = "done"
+
+
+@dataclass
+class IngestStats:
+    """Outcome of one ingestion run."""
+
+    files_seen: int = 0
+    files_skipped: int = 0
+    files_ingested: int = 0
+    chunks_written: int = 0
+    batches: int = 0
+    failed_files: List[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+class IngestManifest:
+    """
+    JSON manifest of ingested files, keyed by absolute path.
+
+    Each entry records the content hash, source, document id, chunk ids and
+    whether every chunk has been written. Saves are atomic (write and rename),
+    so a crash never leaves a truncated manifest behind.
+    """
+
+    def __init__(self, path: str, collection: str, uri: str):
+        self.path = Path(path)
+        self.collection = collection
+        self.uri = uri
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable ingest manifest %s: %s", self.path, e)
+            return
+        # A manifest written for another collection says nothing about this one
+        if (
+            data.get("version") != MANIFEST_VERSION
+            or data.get("collection") != self.collection
+            or data.get("uri") != self.uri
+        ):
+            return
+        self.files = data.get("files", {})
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self.files.get(key)
+            return dict(entry) if entry else None
+
+    def put(self, key: str, **entry: Any) -> None:
+        with self._lock:
+            self.files[key] = entry
+
+    def update(self, key: str, **changes: Any) -> None:
+        with self._lock:
+            self.files.setdefault(key, {}).update(changes)
+
+    def forget(self, source: Optional[str] = None) -> int:
+        """Drop entries (all, or those of one source); returns how many."""
+        with self._lock:
+            keys = [
+                key
+                for key, entry in self.files.items()
+                if source is None or entry.get("source") == source
+            ]
+            for key in keys:
+                del self.files[key]
+        return len(keys)
+
+    def save(self) -> None:
+        with self._lock:
+            payload = json.dumps(
+                {
+                    "version": MANIFEST_VERSION,
+                    "collection": self.collection,
+                    "uri": self.uri,
+                    "files": self.files,
+                },
+                ensure_ascii=False,
+                indent=1,
+            )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(payload, encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+
+class MilvusIngestor:
+    """
+    Bulk loader for a ``MilvusRetriever``.
+
+    Uses the retriever's chunking, document ids and batch write path, so
+    documents ingested here are indistinguishable from those loaded one by
+    one. The retriever must be connected before ingesting.
+    """
+
+    def __init__(
+        self,
+        retriever: Any,
+        manifest: Optional[IngestManifest] = None,
+        batch_size: int = 64,
+        workers: int = 1,
+    ):
+        self.retriever = retriever
+        self.manifest = manifest or IngestManifest(
+            retriever.ingest_manifest_path, retriever.collection_name, retriever.uri
+        )
+        self.batch_size = max(1, batch_size)
+        self.workers = max(1, workers)
+
+    def ingest_directory(
+        self,
+        directory: Path,
+        pattern: str = "*.md",
+        recursive: bool = False,
+        source: str = "examples",
+        force: bool = False,
+    ) -> IngestStats:
+        """Ingest every file matching ``pattern`` under ``directory``.
+
+        Args:
+            directory: Folder to walk.
+            pattern: Glob pattern for files to load.
+            recursive: Walk subdirectories as well.
+            source: Value stored in each chunk's ``source`` field.
+            force: Re-ingest files even if the manifest has them.
+
+        Returns:
+            ``IngestStats`` for the run.
+        """
+        started = time.perf_counter()
+        stats = IngestStats()
+        directory = Path(directory)
+        paths = sorted(directory.rglob(pattern) if recursive else directory.glob(pattern))
+
+        # [chunks written, chunks total] per file being ingested
+        progress: Dict[str, List[int]] = {}
+        stale_ids: Dict[str, List[str]] = {}
+        batches = self._batches(
+            self._chunks(paths, directory, source, force, stats, progress, stale_ids)
+        )
+
+        executor = ThreadPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        pending: Deque[Tuple[List[Dict[str, Any]], Future]] = deque()
+        try:
+            for batch in batches:
+                if executor is None:
+                    self._finish_batch(batch, None, stats, progress, stale_ids)
+                    continue
+                pending.append(
+                    (batch, executor.submit(self.retriever._insert_document_chunks, batch))
+                )
+                # Bound memory and keep checkpoints close to what was written
+                while len(pending) >= self.workers * 2:
+                    done_batch, future = pending.popleft()
+                    self._finish_batch(done_batch, future, stats, progress, stale_ids)
+            while pending:
+                done_batch, future = pending.popleft()
+                self._finish_batch(done_batch, future, stats, progress, stale_ids)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+            self.manifest.save()
+
+        stats.seconds = time.perf_counter() - started
+        logger.info(
+            "Ingested %d files (%d chunks, %d batches), skipped %d, failed %d in %.1fs",
+            stats.files_ingested,
+            stats.chunks_written,
+            stats.batches,
+            stats.files_skipped,
+            len(stats.failed_files),
+            stats.seconds,
+        )
+        return stats
+
+    def _chunks(
+        self,
+        paths: List[Path],
+        root: Path,
+        source: str,
+        force: bool,
+        stats: IngestStats,
+        progress: Dict[str, List[int]],
+        stale_ids: Dict[str, List[str]],
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield chunk records for files that are new, changed or unfinished."""
+        retriever = self.retriever
+        for path in paths:
+            if not path.is_file():
+                continue
+            stats.files_seen += 1
+            key = str(path.resolve())
+            try:
+                content = path.read_text(encoding="utf-8")
+            except Exception as e:
+                logger.warning("Error reading %s: %s", path, e)
+                stats.failed_files.append(key)
+                continue
+            digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+            entry = self.manifest.get(key)
+
+            if entry and entry.get("hash") == digest and entry.get("doc_id"):
+                # Resuming: keep the ids already (partly) written
+                doc_id = entry["doc_id"]
+            else:
+                doc_id = retriever._generate_doc_id(path)
+            if not force:
+                if entry and entry.get("hash") == digest and entry.get("status") == STATUS_DONE:
+                    stats.files_skipped += 1
+                    continue
+                if entry is None:
+                    # No manifest record (first run, or manifest lost): look up
+                    # this document's ids instead of enumerating the collection
+                    existing = retriever._find_existing_chunk_ids(doc_id)
+                    if existing:
+                        self.manifest.put(
+                            key,
+                            hash=digest,
+                            source=source,
+                            doc_id=doc_id,
+                            chunk_ids=existing,
+                            status=STATUS_DONE,
+                        )
+                        stats.files_skipped += 1
+                        continue
+
+            title = retriever._extract_title_from_markdown(content, path.name)
+            chunks = [chunk for chunk in retriever._split_content(content) if chunk.strip()]
+            if not chunks:
+                stats.files_skipped += 1
+                continue
+            chunk_ids = [
+                f"{doc_id}_chunk_{i}" if len(chunks) > 1 else doc_id
+                for i in range(len(chunks))
+            ]
+            # Chunks of a previous version are removed once the new one is in
+            if entry and entry.get("hash") != digest:
+                stale_ids[key] = [
+                    chunk_id
+                    for chunk_id in entry.get("chunk_ids", [])
+                    if chunk_id not in chunk_ids
+                ]
+            self.manifest.put(
+                key,
+                hash=digest,
+                source=source,
+                doc_id=doc_id,
+                chunk_ids=chunk_ids,
+                status=STATUS_PARTIAL,
+            )
+            progress[key] = [0, len(chunks)]
+
+            relative = path.relative_to(root).as_posix()
+            for chunk_id, chunk in zip(chunk_ids, chunks):
+                yield {
+                    "file": key,
+                    "id": chunk_id,
+                    "content": chunk,
+                    "title": title,
+                    "url": f"milvus://{retriever.collection_name}/{relative}",
+                    "metadata": {"source": source, "file": relative},
+                }
+
+    def _batches(
+        self, chunks: Iterator[Dict[str, Any]]
+    ) -> Iterator[List[Dict[str, Any]]]:
+        batch: List[Dict[str, Any]] = []
+        for chunk in chunks:
+            batch.append(chunk)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _finish_batch(
+        self,
+        batch: List[Dict[str, Any]],
+        future: Optional[Future],
+        stats: IngestStats,
+        progress: Dict[str, List[int]],
+        stale_ids: Dict[str, List[str]],
+    ) -> None:
+        """Write (or collect) one batch and checkpoint the files it completes."""
+        try:
+            if future is None:
+                self.retriever._insert_document_chunks(batch)
+            else:
+                future.result()
+        except Exception as e:
+            failed = sorted({chunk["file"] for chunk in batch})
+            logger.warning("Batch of %d chunks failed (%s): %s", len(batch), failed, e)
+            for key in failed:
+                if key not in stats.failed_files:
+                    stats.failed_files.append(key)
+            return
+
+        stats.batches += 1
+        stats.chunks_written += len(batch)
+        for chunk in batch:
+            progress[chunk["file"]][0] += 1
+        for key in dict.fromkeys(chunk["file"] for chunk in batch):
+            written, total = progress[key]
+            if written < total or key in stats.failed_files:
+                continue
+            self.manifest.update(key, status=STATUS_DONE)
+            stats.files_ingested += 1
+            stale = stale_ids.pop(key, None)
+            if stale:
+                self.retriever._delete_chunks(stale)
+        self.manifest.save()
@@ -6,7 +6,14 @@ from urllib.parse import urlparse
 
 import requests
 
-from backend.rag.retriever import Chunk, Document, Resource, Retriever
+from backend.rag.retriever import (
+    Chunk,
+    Document,
+    Resource,
+    Retriever,
+    async_http_client,
+    credential_fingerprint,
+)
 
 
 class MOIProvider(Retriever):
@@ -50,12 +57,8 @@ class MOIProvider(Retriever):
         if moi_list_limit:
             self.moi_list_limit = int(moi_list_limit)
 
-    def query_relevant_documents(
-        self, query: str, resources: list[Resource] = []
-    ) -> list[Document]:
-        """
-        Query relevant documents from MOI API using the provided resources.
-        """
+    def _retrieval_request(self, query: str, resources: list[Resource]) -> tuple[dict, dict]:
+        """Return headers and payload for the retrieval API."""
         headers = {
             "moi-key": f"{self.api_key}",
             "Content-Type": "application/json",
@@ -76,15 +79,9 @@ class MOIProvider(Retriever):
             "document_ids": document_ids,
             "page_size": self.page_size,
         }
+        return headers, payload
 
-        response = requests.post(
-            f"{self.api_url}/api/v1/retrieval", headers=headers, json=payload
-        )
-
-        if response.status_code != 200:
-            raise Exception(f"Failed to query documents: {response.text}")
-
-        result = response.json()
+    def _parse_documents(self, result: dict) -> list[Document]:
         data = result.get("data", {})
         doc_aggs = data.get("doc_aggs", [])
         docs: dict[str, Document] = {
@@ -108,10 +105,8 @@ class MOIProvider(Retriever):
 
         return list(docs.values())
 
-    def list_resources(self, query: str | None = None) -> list[Resource]:
-        """
-        List resources from MOI API with optional query filtering and limit support.
-        """
+    def _list_request(self, query: str | None) -> tuple[dict, dict]:
+        """Return headers and query params for the dataset listing API."""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
@@ -123,15 +118,9 @@ class MOIProvider(Retriever):
 
         if self.moi_list_limit:
             params["limit"] = self.moi_list_limit
+        return headers, params
 
-        response = requests.get(
-            f"{self.api_url}/api/v1/datasets", headers=headers, params=params
-        )
-
-        if response.status_code != 200:
-            raise Exception(f"Failed to list resources: {response.text}")
-
-        result = response.json()
+    def _parse_resources(self, result: dict) -> list[Resource]:
         resources = []
 
         for item in result.get("data", []):
@@ -144,6 +133,64 @@ class MOIProvider(Retriever):
 
         return resources
 
+    def cache_identity(self) -> str:
+        return f"moi:{self.api_url}:{credential_fingerprint(self.api_key)}"
+
+    def query_relevant_documents(
+        self, query: str, resources: list[Resource] = []
+    ) -> list[Document]:
+        """
+        Query relevant documents from MOI API using the provided resources.
+        """
+        headers, payload = self._retrieval_request(query, resources)
+        response = requests.post(
+            f"{self.api_url}/api/v1/retrieval", headers=headers, json=payload
+        )
+
+        if response.status_code != 200:
+            raise Exception(f"Failed to query documents: {response.text}")
+
+        return self._parse_documents(response.json())
+
+    async def _aquery_relevant_documents(
+        self, query: str, resources: list[Resource]
+    ) -> list[Document]:
+        # One retrieval call already covers every selected dataset
+        headers, payload = self._retrieval_request(query, resources)
+        response = await async_http_client().post(
+            f"{self.api_url}/api/v1/retrieval", headers=headers, json=payload
+        )
+
+        if response.status_code != 200:
+            raise Exception(f"Failed to query documents: {response.text}")
+
+        return self._parse_documents(response.json())
+
+    def list_resources(self, query: str | None = None) -> list[Resource]:
+        """
+        List resources from MOI API with optional query filtering and limit support.
+        """
+        headers, params = self._list_request(query)
+        response = requests.get(
+            f"{self.api_url}/api/v1/datasets", headers=headers, params=params
+        )
+
+        if response.status_code != 200:
+            raise Exception(f"Failed to list resources: {response.text}")
+
+        return self._parse_resources(response.json())
+
+    async def _alist_resources(self, query: str | None) -> list[Resource]:
+        headers, params = self._list_request(query)
+        response = await async_http_client().get(
+            f"{self.api_url}/api/v1/datasets", headers=headers, params=params
+        )
+
+        if response.status_code != 200:
+            raise Exception(f"Failed to list resources: {response.text}")
+
+        return self._parse_resources(response.json())
+
     def _parse_uri(self, uri: str) -> tuple[str, str]:
         """
         Parse URI to extract dataset ID and document ID.
@@ -7,7 +7,14 @@ from urllib.parse import urlparse
 
 import requests
 
-from backend.rag.retriever import Chunk, Document, Resource, Retriever
+from backend.rag.retriever import (
+    Chunk,
+    Document,
+    Resource,
+    Retriever,
+    async_http_client,
+    credential_fingerprint,
+)
 
 
 class RAGFlowProvider(Retriever):
@@ -40,14 +47,13 @@ class RAGFlowProvider(Retriever):
         if cross_languages:
             self.cross_languages = cross_languages.split(",")
 
-    def query_relevant_documents(
-        self, query: str, resources: list[Resource] = []
-    ) -> list[Document]:
-        headers = {
+    def _headers(self) -> dict:
+        return {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
 
+    def _retrieval_payload(self, query: str, resources: list[Resource]) -> dict:
         dataset_ids: list[str] = []
         document_ids: list[str] = []
 
@@ -66,15 +72,9 @@ class RAGFlowProvider(Retriever):
 
         if self.cross_languages:
             payload["cross_languages"] = self.cross_languages
+        return payload
 
-        response = requests.post(
-            f"{self.api_url}/api/v1/retrieval", headers=headers, json=payload
-        )
-
-        if response.status_code != 200:
-            raise Exception(f"Failed to query documents: {response.text}")
-
-        result = response.json()
+    def _parse_documents(self, result: dict) -> list[Document]:
         data = result.get("data", {})
         doc_aggs = data.get("doc_aggs", [])
         docs: dict[str, Document] = {
@@ -98,24 +98,13 @@ class RAGFlowProvider(Retriever):
 
         return list(docs.values())
 
-    def list_resources(self, query: str | None = None) -> list[Resource]:
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
+    def _list_params(self, query: str | None) -> dict:
         params = {}
         if query:
             params["name"] = query
+        return params
 
-        response = requests.get(
-            f"{self.api_url}/api/v1/datasets", headers=headers, params=params
-        )
-
-        if response.status_code != 200:
-            raise Exception(f"Failed to list resources: {response.text}")
-
-        result = response.json()
+    def _parse_resources(self, result: dict) -> list[Resource]:
         resources = []
 
         for item in result.get("data", []):
@@ -128,6 +117,54 @@ class RAGFlowProvider(Retriever):
 
         return resources
 
+    def cache_identity(self) -> str:
+        return f"ragflow:{self.api_url}:{credential_fingerprint(self.api_key)}"
+
+    def query_relevant_documents(
+        self, query: str, resources: list[Resource] = []
+    ) -> list[Document]:
+        response = requests.post(
+            f"{self.api_url}/api/v1/retrieval",
+            headers=self._headers(),
+            json=self._retrieval_payload(query, resources),
+        )
+        if response.status_code != 200:
+            raise Exception(f"Failed to query documents: {response.text}")
+        return self._parse_documents(response.json())
+
+    async def _aquery_relevant_documents(
+        self, query: str, resources: list[Resource]
+    ) -> list[Document]:
+        # One retrieval call already covers every selected dataset
+        response = await async_http_client().post(
+            f"{self.api_url}/api/v1/retrieval",
+            headers=self._headers(),
+            json=self._retrieval_payload(query, resources),
+        )
+        if response.status_code != 200:
+            raise Exception(f"Failed to query documents: {response.text}")
+        return self._parse_documents(response.json())
+
+    def list_resources(self, query: str | None = None) -> list[Resource]:
+        response = requests.get(
+            f"{self.api_url}/api/v1/datasets",
+            headers=self._headers(),
+            params=self._list_params(query),
+        )
+        if response.status_code != 200:
+            raise Exception(f"Failed to list resources: {response.text}")
+        return self._parse_resources(response.json())
+
+    async def _alist_resources(self, query: str | None) -> list[Resource]:
+        response = await async_http_client().get(
+            f"{self.api_url}/api/v1/datasets",
+            headers=self._headers(),
+            params=self._list_params(query),
+        )
+        if response.status_code != 200:
+            raise Exception(f"Failed to list resources: {response.text}")
+        return self._parse_resources(response.json())
+
 
 def parse_uri(uri: str) -> tuple[str, str]:
     parsed = urlparse(uri)
@@ -2,9 +2,24 @@
 # SPDX-License-Identifier: MIT
 
 import abc
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Hashable, Iterable, Optional
 
+import httpx
 from pydantic import BaseModel, Field
 
+from shared.config.loader import get_int_env
+
+logger = logging.getLogger(__name__)
+
+# Bounds the in-memory query and resource caches
+_CACHE_MAX_ENTRIES = 512
+
 
 class Chunk:
     content: str
@@ -59,9 +74,141 @@ class Resource(BaseModel):
     description: str | None = Field("", description="The description of the resource")
 
 
+class _TTLCache:
+    """Small thread-safe cache whose entries expire after a TTL."""
+
+    def __init__(self, max_entries: int = _CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, ttl: float) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= ttl:
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            if len(self._entries) > self.max_entries:
+                # Dicts keep insertion order, so the first key is the oldest write
+                del self._entries[next(iter(self._entries))]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_query_cache = _TTLCache()
+_resources_cache = _TTLCache()
+
+# One pooled client per event loop; httpx clients must not cross loops
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def async_http_client() -> httpx.AsyncClient:
+    """Return the pooled ``httpx.AsyncClient`` shared by RAG providers on this loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=get_int_env("RAG_QUERY_TIMEOUT_SECONDS", 30),
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
+        _async_clients[loop] = client
+    return client
+
+
+def credential_fingerprint(*credentials: Optional[str]) -> str:
+    """
+    Short digest of API credentials for ``Retriever.cache_identity``.
+
+    Two retrievers on the same URL with different keys may see different
+    datasets, so their cached results must not be shared; the digest keeps
+    the keys themselves out of cache keys and logs.
+    """
+    digest = hashlib.sha256("\0".join(c or "" for c in credentials).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def clear_retriever_caches() -> None:
+    """Drop cached query results and resource listings."""
+    _query_cache.clear()
+    _resources_cache.clear()
+
+
+def merge_documents(results: Iterable[list[Document]]) -> list[Document]:
+    """
+    Fuse document lists from several resources or backends.
+
+    Documents with the same id are merged and duplicate chunks (same content)
+    keep their best similarity. Documents are ordered by their best chunk.
+    """
+    merged: dict[str, Document] = {}
+    chunks: dict[str, dict[str, Chunk]] = {}
+    for documents in results:
+        for doc in documents:
+            if doc.id not in merged:
+                merged[doc.id] = Document(id=doc.id, url=doc.url, title=doc.title, chunks=[])
+                chunks[doc.id] = {}
+            target = merged[doc.id]
+            target.url = target.url or doc.url
+            target.title = target.title or doc.title
+            for chunk in doc.chunks:
+                seen = chunks[doc.id].get(chunk.content)
+                if seen is None:
+                    seen = Chunk(content=chunk.content, similarity=chunk.similarity)
+                    chunks[doc.id][chunk.content] = seen
+                    target.chunks.append(seen)
+                elif (chunk.similarity or 0) > (seen.similarity or 0):
+                    seen.similarity = chunk.similarity
+
+    def best(doc: Document) -> float:
+        return max((c.similarity or 0 for c in doc.chunks), default=0)
+
+    return sorted(merged.values(), key=best, reverse=True)
+
+
+async def gather_resources(coros: Iterable[Any], label: str) -> list[Any]:
+    """
+    Run per-resource queries concurrently, each bounded by
+    RAG_RESOURCE_TIMEOUT_SECONDS.
+
+    Resources that fail or time out are logged and left out, so one slow
+    dataset does not hold up the others; if every query fails the first
+    error is raised.
+    """
+
+    timeout = get_int_env("RAG_RESOURCE_TIMEOUT_SECONDS", 15)
+
+    async def bounded(coro):
+        return await asyncio.wait_for(coro, timeout)
+
+    outcomes = await asyncio.gather(*(bounded(c) for c in coros), return_exceptions=True)
+    results = [o for o in outcomes if not isinstance(o, BaseException)]
+    errors = [o for o in outcomes if isinstance(o, BaseException)]
+    for error in errors:
+        logger.warning("%s resource query failed: %r", label, error)
+    if errors and not results:
+        raise errors[0]
+    return results
+
+
 class Retriever(abc.ABC):
     """
     Define a RAG provider, which can be used to query documents and resources.
+
+    Providers implement the synchronous methods; the async ``a*`` methods add
+    a per-backend timeout and a short-TTL cache on top. Providers with an
+    HTTP API override ``_aquery_relevant_documents`` / ``_alist_resources``
+    to use the pooled async client instead of a worker thread.
     """
 
     @abc.abstractmethod
@@ -79,3 +226,61 @@ class Retriever(abc.ABC):
         Query relevant documents from the resources.
         """
         pass
+
+    def cache_identity(self) -> str:
+        """
+        Identify the backend instance in cache keys.
+
+        Override with the API url and a ``credential_fingerprint`` of the
+        credentials, since what a query returns depends on both.
+        """
+        return type(self).__name__
+
+    async def _aquery_relevant_documents(
+        self, query: str, resources: list[Resource]
+    ) -> list[Document]:
+        return await asyncio.to_thread(self.query_relevant_documents, query, resources)
+
+    async def _alist_resources(self, query: str | None) -> list[Resource]:
+        return await asyncio.to_thread(self.list_resources, query)
+
+    async def aquery_relevant_documents(
+        self, query: str, resources: list[Resource] | None = None
+    ) -> list[Document]:
+        """
+        Async query_relevant_documents, cached for RAG_QUERY_CACHE_TTL_SECONDS.
+        """
+        if resources is None:
+            resources = []
+        ttl = get_int_env("RAG_QUERY_CACHE_TTL_SECONDS", 60)
+        key = (self.cache_identity(), query, tuple(sorted(r.uri for r in resources)))
+        if ttl > 0:
+            cached = _query_cache.get(key, ttl)
+            if cached is not None:
+                return list(cached)
+
+        documents = await asyncio.wait_for(
+            self._aquery_relevant_documents(query, resources),
+            get_int_env("RAG_QUERY_TIMEOUT_SECONDS", 30),
+        )
+        if ttl > 0:
+            _query_cache.set(key, list(documents))
+        return documents
+
+    async def alist_resources(self, query: str | None = None) -> list[Resource]:
+        """
+        Async list_resources, cached for RAG_RESOURCES_CACHE_TTL_SECONDS.
+        """
+        ttl = get_int_env("RAG_RESOURCES_CACHE_TTL_SECONDS", 300)
+        key = (self.cache_identity(), query or "")
+        if ttl > 0:
+            cached = _resources_cache.get(key, ttl)
+            if cached is not None:
+                return list(cached)
+
+        resources = await asyncio.wait_for(
+            self._alist_resources(query), get_int_env("RAG_QUERY_TIMEOUT_SECONDS", 30)
+        )
+        if ttl > 0:
+            _resources_cache.set(key, list(resources))
+        return resources
@@ -11,7 +11,19 @@ from urllib.parse import urlparse
 
 import requests
 
-from backend.rag.retriever import Chunk, Document, Resource, Retriever
+from backend.rag.retriever import (
+    Chunk,
+    Document,
+    Resource,
+    Retriever,
+    async_http_client,
+    credential_fingerprint,
+    gather_resources,
+    merge_documents,
+)
+
+SEARCH_PATH = "/api/knowledge/collection/search_knowledge"
+LIST_PATH = "/api/knowledge/collection/list"
 
 
 class VikingDBKnowledgeBaseProvider(Retriever):
@@ -151,9 +163,9 @@ class VikingDBKnowledgeBaseProvider(Retriever):
 
         return headers
 
-    def _make_signed_request(
+    def _prepare_signed_request(
         self, method: str, path: str, params: dict = None, data: dict = None
-    ):
+    ) -> tuple[str, dict, dict, bytes]:
         if data is None:
             payload = b""
         else:
@@ -165,6 +177,14 @@ class VikingDBKnowledgeBaseProvider(Retriever):
         url = f"https://{self.api_url}{path}"
         headers = {}
         signed_headers = self._create_signature(method, path, params, headers, payload)
+        return url, signed_headers, params, payload
+
+    def _make_signed_request(
+        self, method: str, path: str, params: dict = None, data: dict = None
+    ):
+        url, signed_headers, params, payload = self._prepare_signed_request(
+            method, path, params, data
+        )
         try:
             response = requests.request(
                 method=method,
@@ -178,6 +198,87 @@ class VikingDBKnowledgeBaseProvider(Retriever):
         except Exception as e:
             raise ValueError(f"Request failed: {e}")
 
+    async def _amake_signed_request(
+        self, method: str, path: str, params: dict = None, data: dict = None
+    ):
+        url, signed_headers, params, payload = self._prepare_signed_request(
+            method, path, params, data
+        )
+        try:
+            return await async_http_client().request(
+                method=method,
+                url=url,
+                headers=signed_headers,
+                params=params,
+                content=payload if payload else None,
+                timeout=30,
+            )
+        except Exception as e:
+            raise ValueError(f"Request failed: {e}")
+
+    def _search_params(self, query: str, resource: Resource) -> dict:
+        resource_id, document_id = parse_uri(resource.uri)
+        request_params = {
+            "resource_id": resource_id,
+            "query": query,
+            "limit": self.retrieval_size,
+            "dense_weight": 0.5,
+            "pre_processing": {
+                "need_instruction": True,
+                "rewrite": False,
+                "return_token_usage": True,
+            },
+            "post_processing": {
+                "rerank_switch": True,
+                "chunk_diffusion_count": 0,
+                "chunk_group": True,
+                "get_attachment_link": True,
+            },
+        }
+        if document_id:
+            doc_filter = {"op": "must", "field": "doc_id", "conds": [document_id]}
+            query_param = {"doc_filter": doc_filter}
+            request_params["query_param"] = query_param
+        return request_params
+
+    def _collect_results(self, response, all_documents: dict) -> None:
+        try:
+            response_data = response.json()
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Failed to parse JSON response: {e}")
+
+        if response_data["code"] != 0:
+            raise ValueError(
+                f"Failed to query documents from resource: {response_data['message']}"
+            )
+
+        rsp_data = response_data.get("data", {})
+
+        if "result_list" not in rsp_data:
+            return
+
+        result_list = rsp_data["result_list"]
+
+        for item in result_list:
+            doc_info = item.get("doc_info", {})
+            doc_id = doc_info.get("doc_id")
+
+            if not doc_id:
+                continue
+
+            if doc_id not in all_documents:
+                all_documents[doc_id] = Document(
+                    id=doc_id, title=doc_info.get("doc_name"), chunks=[]
+                )
+
+            chunk = Chunk(
+                content=item.get("content", ""), similarity=item.get("score", 0.0)
+            )
+            all_documents[doc_id].chunks.append(chunk)
+
+    def cache_identity(self) -> str:
+        return f"vikingdb:{self.api_url}:{credential_fingerprint(self.api_ak, self.api_sk)}"
+
     def query_relevant_documents(
         self, query: str, resources: list[Resource] = []
     ) -> list[Document]:
@@ -189,80 +290,33 @@ class VikingDBKnowledgeBaseProvider(Retriever):
 
         all_documents = {}
         for resource in resources:
-            resource_id, document_id = parse_uri(resource.uri)
-            request_params = {
-                "resource_id": resource_id,
-                "query": query,
-                "limit": self.retrieval_size,
-                "dense_weight": 0.5,
-                "pre_processing": {
-                    "need_instruction": True,
-                    "rewrite": False,
-                    "return_token_usage": True,
-                },
-                "post_processing": {
-                    "rerank_switch": True,
-                    "chunk_diffusion_count": 0,
-                    "chunk_group": True,
-                    "get_attachment_link": True,
-                },
-            }
-            if document_id:
-                doc_filter = {"op": "must", "field": "doc_id", "conds": [document_id]}
-                query_param = {"doc_filter": doc_filter}
-                request_params["query_param"] = query_param
-
-            path = "/api/knowledge/collection/search_knowledge"
-
             # 使用新的签名请求方法
             response = self._make_signed_request(
-                method="POST", path=path, data=request_params
+                method="POST", path=SEARCH_PATH, data=self._search_params(query, resource)
             )
-
-            try:
-                response_data = response.json()
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Failed to parse JSON response: {e}")
-
-            if response_data["code"] != 0:
-                raise ValueError(
-                    f"Failed to query documents from resource: {response_data['message']}"
-                )
-
-            rsp_data = response_data.get("data", {})
-
-            if "result_list" not in rsp_data:
-                continue
-
-            result_list = rsp_data["result_list"]
-
-            for item in result_list:
-                doc_info = item.get("doc_info", {})
-                doc_id = doc_info.get("doc_id")
-
-                if not doc_id:
-                    continue
-
-                if doc_id not in all_documents:
-                    all_documents[doc_id] = Document(
-                        id=doc_id, title=doc_info.get("doc_name"), chunks=[]
-                    )
-
-                chunk = Chunk(
-                    content=item.get("content", ""), similarity=item.get("score", 0.0)
-                )
-                all_documents[doc_id].chunks.append(chunk)
+            self._collect_results(response, all_documents)
 
         return list(all_documents.values())
 
-    def list_resources(self, query: str | None = None) -> list[Resource]:
-        """
-        List resources (knowledge bases) from the knowledge base service
-        """
-        path = "/api/knowledge/collection/list"
+    async def _aquery_relevant_documents(
+        self, query: str, resources: list[Resource]
+    ) -> list[Document]:
+        if not resources:
+            return []
 
-        response = self._make_signed_request(method="POST", path=path)
+        async def search(resource: Resource) -> list[Document]:
+            response = await self._amake_signed_request(
+                method="POST", path=SEARCH_PATH, data=self._search_params(query, resource)
+            )
+            documents: dict = {}
+            self._collect_results(response, documents)
+            return list(documents.values())
+
+        # Each knowledge base is searched separately, so run them concurrently
+        results = await gather_resources((search(r) for r in resources), "VikingDB")
+        return merge_documents(results)
 
+    def _parse_resources(self, response, query: str | None) -> list[Resource]:
         try:
             response_data = response.json()
         except json.JSONDecodeError as e:
@@ -291,6 +345,17 @@ class VikingDBKnowledgeBaseProvider(Retriever):
 
         return resources
 
+    def list_resources(self, query: str | None = None) -> list[Resource]:
+        """
+        List resources (knowledge bases) from the knowledge base service
+        """
+        response = self._make_signed_request(method="POST", path=LIST_PATH)
+        return self._parse_resources(response, query)
+
+    async def _alist_resources(self, query: str | None) -> list[Resource]:
+        response = await self._amake_signed_request(method="POST", path=LIST_PATH)
+        return self._parse_resources(response, query)
+
 
 def parse_uri(uri: str) -> tuple[str, str]:
     parsed = urlparse(uri)
@@ -22,40 +22,46 @@ logging.basicConfig(
 
 import requests
 from datetime import datetime
-from typing import Annotated, Any, AsyncIterator, List, Optional
+from typing import Annotated, Any, AsyncIterator, Callable, List, Optional
 from uuid import uuid4
 
 from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from langchain_core.messages import AIMessage, AIMessageChunk, ToolMessage
-from langgraph.checkpoint.mongodb import AsyncMongoDBSaver
-from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 from langgraph.store.memory import InMemoryStore
 from langgraph.types import Command
-from psycopg_pool import AsyncConnectionPool
 
 from shared.config.configuration import get_recursion_limit
 from shared.config.loader import get_bool_env, get_str_env
 from shared.config.report_style import ReportStyle
 from shared.config.tools import SELECTED_RAG_PROVIDER
-from backend.graph.builder import build_graph_with_memory
-from backend.graph.checkpoint import chat_stream_message
+from backend.graph.checkpoint import (
+    chat_stream_message,
+    close_chat_stream_manager,
+    iter_chat_stream_history,
+)
 from backend.graph.utils import (
     build_clarified_topic_from_history,
     reconstruct_clarification_history,
 )
 from backend.llms.llm import get_configured_llm_models
 from backend.llms.model_providers import get_available_providers, detect_provider_from_config
-from backend.podcast.graph.builder import build_graph as build_podcast_graph
-from backend.ppt.graph.builder import build_graph as build_ppt_graph
-from backend.prompt_enhancer.graph.builder import (
-    build_graph as build_prompt_enhancer_graph
-)
-from backend.prose.graph.builder import build_graph as build_prose_graph
-from backend.rag.builder import build_retriever
-from backend.rag.milvus import load_examples
+from backend.podcast.graph.script_writer_node import script_writer_node
+from backend.podcast.synthesis import LineSynthesizer, get_tts_cache_stats
+from backend.ppt.jobs import FAILED as PPT_JOB_FAILED, PPTJob, get_ppt_job_manager, run_ppt_workflow
 from backend.rag.retriever import Resource
+from backend.crawler import get_web_cache_stats
+from backend.conversation.intent_router import (
+    get_intent_routing_stats,
+    load_and_train_intent_routers,
+)
+from backend.server.checkpointer import (
+    bind_checkpointer,
+    close_graph_checkpointer,
+    get_graph_checkpointer,
+    init_graph_checkpointer,
+)
 from backend.server.chat_request import (
     ChatRequest,
     EnhancePromptRequest,
@@ -76,21 +82,24 @@ from backend.server.streaming import (
     cache_thoughts,
     get_cached_thoughts,
     clear_thoughts_cache,
+    get_stream_cache,
+    get_stream_cache_stats,
+    release_stream_state,
 )
 
 # Cache to store react_thoughts by message ID for AIMessageChunk processing
 # This is needed because AIMessageChunk is streamed before the final AIMessage is created
-# NOTE: Now uses streaming module cache, kept for backward compatibility
-_react_thoughts_cache: dict[str, list] = {}
+# Shared with the streaming module; entries are scoped to the active stream
+_react_thoughts_cache = get_stream_cache("react_thoughts")
 
 # Cache to track accumulated reasoning_content for token-by-token thought streaming
 # Reasoning models (o1 series) provide reasoning_content
-_reasoning_content_cache: dict[str, str] = {}  # message_id -> accumulated_reasoning_content
+_reasoning_content_cache = get_stream_cache("reasoning_content")  # message_id -> accumulated_reasoning_content
 
 # Cache to track accumulated content for extracting "Thought:" patterns (like Cursor does)
 # This allows ANY model to show thoughts if they write "Thought:" in content
-_content_cache: dict[str, str] = {}  # message_id -> accumulated_content
-_previous_content_length: dict[str, int] = {}  # message_id -> previous accumulated content length (to detect NEW "Thought:")
+_content_cache = get_stream_cache("content")  # message_id -> accumulated_content
+_previous_content_length = get_stream_cache("previous_content_length")  # message_id -> previous accumulated content length (to detect NEW "Thought:")
 
 # PROGRESSIVE THOUGHTS: Step counter for generating incremental thoughts during streaming
 # Tracks step_index per thread_id so each thought gets a unique sequential index
@@ -102,6 +111,8 @@ _streamed_tool_calls: dict[str, set[str]] = {}  # thread_id -> set of tool_names
 # Import new streaming state module
 from backend.utils import streaming_state
 from backend.utils.streaming_state import current_thread_id
+from backend.utils.pm_read_memo import pm_read_scope
+from backend.utils.subsystems import SubsystemRegistry
 
 
 from backend.server.config_request import ConfigResponse
@@ -129,6 +140,7 @@ from backend.server.pm_provider_request import (
 )
 from pydantic import BaseModel
 from backend.tools import VolcengineTTS
+from backend.tools.search import clear_search_provider_cache
 from backend.utils.json_utils import sanitize_args
 from backend.utils.log_sanitizer import (
     sanitize_agent_name,
@@ -169,6 +181,9 @@ if os.name == "nt":
     )
 
 INTERNAL_SERVER_ERROR_DETAIL = "Internal Server Error"
+PPTX_MEDIA_TYPE = (
+    "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+)
 
 from contextlib import asynccontextmanager
 
@@ -181,11 +196,26 @@ async def lifespan(_app: FastAPI):  # FastAPI requires this parameter
     """
     # Startup: Log startup (sync moved to per-user lazy initialization)
     logger.info("[Startup] Backend API starting...")
+    # Open the checkpoint pool once instead of per chat request
+    await init_graph_checkpointer()
+    # Train the local intent classifiers off the event loop; routing falls back to the LLM until then
+    intent_training = asyncio.create_task(asyncio.to_thread(load_and_train_intent_routers))
+    # Build graphs and heavy clients in the background; requests that arrive
+    # first build what they need themselves
+    if get_bool_env("SUBSYSTEM_PREWARM", True):
+        prewarm = asyncio.create_task(subsystems.prewarm())
+    else:
+        prewarm = asyncio.create_task(subsystems.prewarm(["milvus_examples"]))
     
     yield
     
     # Shutdown: cleanup if needed
     logger.info("[Shutdown] Backend API shutting down...")
+    intent_training.cancel()
+    prewarm.cancel()
+    await close_graph_checkpointer()
+    # Flush chat streams still queued for the background writer
+    await asyncio.to_thread(close_chat_stream_manager)
 
 
 app = FastAPI(
@@ -199,7 +229,17 @@ app = FastAPI(
 @app.get("/health")
 async def health_check():
     """Health check endpoint for Docker healthcheck."""
-    return {"status": "healthy", "service": "backend-api"}
+    checkpointer = get_graph_checkpointer()
+    return {
+        "status": "healthy",
+        "service": "backend-api",
+        "stream_caches": get_stream_cache_stats(),
+        "checkpointer": checkpointer.get_stats() if checkpointer else {"enabled": False},
+        "intent_routing": get_intent_routing_stats(),
+        "web_cache": get_web_cache_stats(),
+        "podcast_tts_cache": get_tts_cache_stats(),
+        "subsystems": subsystems.stats(),
+    }
 
 
 # Add CORS middleware
@@ -363,11 +403,92 @@ async def get_current_user(request: Request):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-# Load examples into Milvus if configured
-load_examples()
+# ==================== Lazy Subsystems ====================
+# Graphs and heavy clients are built on first use (and pre-warmed in the
+# background after startup) instead of at import, so the server starts
+# accepting requests without waiting for them.
+
+def _build_chat_graph():
+    from backend.graph.builder import build_graph_with_memory
+    return build_graph_with_memory()
+
+
+def _load_milvus_examples():
+    # Load examples into Milvus if configured
+    from backend.rag.milvus import load_examples
+    load_examples()
+    return True
+
+
+def _build_ppt_graph():
+    from backend.ppt.graph.builder import build_graph
+    return build_graph()
+
+
+def _build_prose_graph():
+    from backend.prose.graph.builder import build_graph
+    return build_graph()
+
+
+def _build_prompt_enhancer_graph():
+    from backend.prompt_enhancer.graph.builder import build_graph
+    return build_graph()
+
+
+subsystems = SubsystemRegistry()
+subsystems.register("chat_graph", _build_chat_graph)
+subsystems.register("milvus_examples", _load_milvus_examples)
+subsystems.register("ppt_graph", _build_ppt_graph)
+subsystems.register("prose_graph", _build_prose_graph)
+subsystems.register("prompt_enhancer_graph", _build_prompt_enhancer_graph)
+
+
+def build_ppt_graph():
+    """Compiled PPT graph, built on first use and shared by requests."""
+    return subsystems.get("ppt_graph")
+
+
+def build_prose_graph():
+    """Compiled prose graph, built on first use and shared by requests."""
+    return subsystems.get("prose_graph")
+
+
+def build_prompt_enhancer_graph():
+    """Compiled prompt enhancer graph, built on first use and shared by requests."""
+    return subsystems.get("prompt_enhancer_graph")
+
+
+def build_retriever():
+    """Retriever of the configured RAG provider; imports the providers on first call."""
+    from backend.rag.builder import build_retriever as _build_retriever
+    return _build_retriever()
+
 
 in_memory_store = InMemoryStore()
-graph = build_graph_with_memory()
+# Chat graph; None until first use, see _get_chat_graph()
+graph = None
+
+
+def _get_chat_graph():
+    global graph
+    if graph is None:
+        graph = subsystems.get("chat_graph")
+    return graph
+
+
+async def _aget_chat_graph():
+    """``_get_chat_graph()`` for async routes; a first build runs off the event loop."""
+    global graph
+    if graph is None:
+        graph = await subsystems.aget("chat_graph")
+    return graph
+
+
+async def _aget_subsystem(name: str, getter: Callable[[], Any]) -> Any:
+    """Call a lazy subsystem getter from an async route without blocking the event loop."""
+    if subsystems.is_loaded(name):
+        return getter()
+    return await asyncio.to_thread(getter)
 
 # Global ConversationFlowManager singleton to maintain session contexts
 flow_manager = None
@@ -1323,12 +1444,16 @@ async def _stream_graph_events(
     streaming_state.get_tool_result_queue(safe_thread_id)
 
     try:
-        async for event in _stream_graph_events_core(
-            graph_instance, workflow_input, workflow_config, thread_id
-        ):
-            yield event
+        # PM reads repeated by the agents of this turn are served from memory
+        with pm_read_scope():
+            async for event in _stream_graph_events_core(
+                graph_instance, workflow_input, workflow_config, thread_id
+            ):
+                yield event
     finally:
         streaming_state.cleanup_tool_result_queue(safe_thread_id)
+        # Per-message caches are only needed while this stream is running
+        release_stream_state(safe_thread_id)
         current_thread_id.reset(token_ctx)
 
 
@@ -2465,55 +2590,13 @@ async def _astream_workflow_generator(
         "recursion_limit": get_recursion_limit(),
     }
 
-    checkpoint_saver = get_bool_env("LANGGRAPH_CHECKPOINT_SAVER", False)
-    checkpoint_url = get_str_env("LANGGRAPH_CHECKPOINT_DB_URL", "")
-    
-    pass
-    
-    # Handle checkpointer if configured
-    connection_kwargs = {
-        "autocommit": True,
-        "row_factory": "dict_row",
-        "prepare_threshold": 0,
-    }
-    if checkpoint_saver and checkpoint_url != "":
-            logger.info(
-                f"[{safe_thread_id}] Starting async postgres checkpointer"
-            )
-            async with AsyncConnectionPool(
-                checkpoint_url, kwargs=connection_kwargs
-            ) as conn:
-                checkpointer = AsyncPostgresSaver(conn)  # type: ignore
-                await checkpointer.setup()
-                graph.checkpointer = checkpointer
-                graph.store = in_memory_store
-                async for event in _stream_graph_events(
-                    graph, workflow_input, workflow_config, thread_id
-                ):
-                    yield event
-
-            logger.info(
-                f"[{safe_thread_id}] Starting async mongodb checkpointer"
-            )
-            async with AsyncMongoDBSaver.from_conn_string(
-                checkpoint_url
-            ) as mongo_checkpointer:  # type: ignore[assignment]
-                # Type ignore: MongoDB checkpointer is compatible
-                # with graph.checkpointer interface
-                # Type ignore: MongoDB checkpointer compatible interface
-                # type: ignore[assignment]
-                graph.checkpointer = mongo_checkpointer
-                graph.store = in_memory_store
-                async for event in _stream_graph_events(
-                    graph, workflow_input, workflow_config, thread_id
-                ):
-                    yield event
-    else:
-        # Use graph without checkpointer
-        async for event in _stream_graph_events(
-            graph, workflow_input, workflow_config, thread_id
-        ):
-            yield event
+    # Bind the app-lifetime checkpointer (opened in lifespan) to a per-request
+    # copy of the graph instead of mutating the shared compiled graph
+    request_graph = bind_checkpointer(await _aget_chat_graph(), store=in_memory_store)
+    async for event in _stream_graph_events(
+        request_graph, workflow_input, workflow_config, thread_id
+    ):
+        yield event
 
 
 def _make_event(event_type: str, data: dict[str, Any]):
@@ -2557,6 +2640,23 @@ def _make_event(event_type: str, data: dict[str, Any]):
     return event_str
 
 
+@app.get("/api/chat/{thread_id}/history")
+async def chat_history(thread_id: str):
+    """
+    Replay a thread's stored chat stream as Server-Sent Events.
+
+    Events are read from storage page by page in a worker thread and
+    streamed in their original order, so long threads are never loaded
+    into memory at once.
+    """
+    if not get_bool_env("LANGGRAPH_CHECKPOINT_SAVER", False):
+        raise HTTPException(status_code=404, detail="Chat history is not enabled")
+    return StreamingResponse(
+        iter_chat_stream_history(thread_id),
+        media_type="text/event-stream",
+    )
+
+
 @app.post("/api/tts")
 async def text_to_speech(request: TTSRequest):
     """Convert text to speech using volcengine TTS API."""
@@ -2621,34 +2721,66 @@ async def text_to_speech(request: TTSRequest):
 
 @app.post("/api/podcast/generate")
 async def generate_podcast(request: GeneratePodcastRequest):
+    """
+    Stream podcast audio as its lines are synthesized.
+
+    The script is written first; lines are then synthesized concurrently and
+    streamed in script order. The first segment is awaited before the
+    response starts, so script and TTS configuration errors still return 500.
+    """
     try:
         report_content = request.content
-        workflow = build_podcast_graph()
-        final_state = workflow.invoke({"input": report_content})
-        audio_bytes = final_state["output"]
-        return Response(content=audio_bytes, media_type="audio/mp3")
+        script_state = await asyncio.to_thread(
+            script_writer_node, {"input": report_content}
+        )
+        segments = LineSynthesizer().aiter_audio(script_state["script"].lines)
+        first_segment = await anext(segments, b"")
     except Exception as e:
         logger.exception(f"Error occurred during podcast generation: {str(e)}")
         raise HTTPException(
             status_code=500, detail=INTERNAL_SERVER_ERROR_DETAIL
         )
 
+    async def podcast_audio():
+        if first_segment:
+            yield first_segment
+        async for segment in segments:
+            yield segment
+
+    return StreamingResponse(podcast_audio(), media_type="audio/mp3")
+
 
 @app.post("/api/ppt/generate")
 async def generate_ppt(request: GeneratePPTRequest):
+    """
+    Generate a deck from report content.
+
+    By default the pptx is returned once it is rendered. With ``background``
+    set, a job is started and its id returned at once (202); follow it with
+    ``/api/ppt/jobs/{job_id}`` or ``/api/ppt/jobs/{job_id}/events`` and fetch
+    the deck from ``/api/ppt/jobs/{job_id}/file``.
+    """
+    if request.background:
+        job = get_ppt_job_manager().submit(request.content, runner=_run_ppt_job)
+        return JSONResponse(
+            status_code=202,
+            content={
+                **job.to_dict(),
+                "status_url": f"/api/ppt/jobs/{job.id}",
+                "events_url": f"/api/ppt/jobs/{job.id}/events",
+                "file_url": f"/api/ppt/jobs/{job.id}/file",
+            },
+        )
     try:
         report_content = request.content
-        workflow = build_ppt_graph()
-        final_state = workflow.invoke({"input": report_content})
+        workflow = await _aget_subsystem("ppt_graph", build_ppt_graph)
+        final_state = await workflow.ainvoke({"input": report_content})
         generated_file_path = final_state["generated_file_path"]
         with open(generated_file_path, "rb") as f:
             ppt_bytes = f.read()
         return Response(
             content=ppt_bytes,
-            media_type=(
-                "application/vnd.openxmlformats-officedocument."
-                "presentationml.presentation"
-            ),
+            media_type=PPTX_MEDIA_TYPE,
         )
     except Exception as e:
         logger.exception(f"Error occurred during ppt generation: {str(e)}")
@@ -2657,12 +2789,63 @@ async def generate_ppt(request: GeneratePPTRequest):
         )
 
 
+async def _run_ppt_job(content: str, progress: Callable[[str], None]) -> str:
+    """Background PPT job runner on the shared ``ppt_graph`` subsystem."""
+    workflow = await _aget_subsystem("ppt_graph", build_ppt_graph)
+    return await run_ppt_workflow(content, progress, graph=workflow)
+
+
+def _get_ppt_job(job_id: str) -> PPTJob:
+    job = get_ppt_job_manager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="PPT job not found")
+    return job
+
+
+@app.get("/api/ppt/jobs/{job_id}")
+async def get_ppt_job(job_id: str):
+    """Status of a background PPT job."""
+    return _get_ppt_job(job_id).to_dict()
+
+
+@app.get("/api/ppt/jobs/{job_id}/events")
+async def stream_ppt_job_events(job_id: str):
+    """Stream a PPT job's progress as server-sent events until it finishes."""
+    job = _get_ppt_job(job_id)
+
+    async def events():
+        async for event in job.iter_events():
+            yield f"event: ppt_progress\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+@app.get("/api/ppt/jobs/{job_id}/file")
+async def get_ppt_job_file(job_id: str):
+    """The rendered deck of a finished PPT job."""
+    job = _get_ppt_job(job_id)
+    if job.status == PPT_JOB_FAILED:
+        raise HTTPException(status_code=500, detail=INTERNAL_SERVER_ERROR_DETAIL)
+    if not job.finished:
+        raise HTTPException(status_code=409, detail=f"PPT job is {job.status}")
+    try:
+        with open(job.file_path, "rb") as f:
+            ppt_bytes = f.read()
+    except FileNotFoundError:
+        raise HTTPException(status_code=410, detail="Rendered deck has expired")
+    return Response(
+        content=ppt_bytes,
+        media_type=PPTX_MEDIA_TYPE,
+        headers={"Content-Disposition": f"attachment; filename=deck_{job.id}.pptx"},
+    )
+
+
 @app.post("/api/prose/generate")
 async def generate_prose(request: GenerateProseRequest):
     try:
         sanitized_prompt = request.prompt.replace("\r\n", "").replace("\n", "")
         logger.info(f"Generating prose for prompt: {sanitized_prompt}")
-        workflow = build_prose_graph()
+        workflow = await _aget_subsystem("prose_graph", build_prose_graph)
         events = workflow.astream(
             {
                 "content": request.prompt,
@@ -2707,7 +2890,7 @@ async def enhance_prompt(request: EnhancePromptRequest):
         else:
             report_style = ReportStyle.GENERIC
 
-        workflow = build_prompt_enhancer_graph()
+        workflow = await _aget_subsystem("prompt_enhancer_graph", build_prompt_enhancer_graph)
         final_state = workflow.invoke(
             {
                 "prompt": request.prompt,
@@ -2799,7 +2982,7 @@ async def rag_resources(request: Annotated[RAGResourceRequest, Query()]):
     retriever = build_retriever()
     if retriever:
         return RAGResourcesResponse(
-            resources=retriever.list_resources(request.query)
+            resources=await retriever.alist_resources(request.query)
         )
     return RAGResourcesResponse(resources=[])
 
@@ -2936,8 +3119,18 @@ async def pm_list_tasks(_request: Request, project_id: str):  # FastAPI route pa
 
 
 @app.get("/api/pm/projects/{project_id}/timeline")
-async def pm_project_timeline(project_id: str):
-    """Return sprint + task scheduling data for timeline views."""
+async def pm_project_timeline(
+    project_id: str,
+    request: Request,
+    start: Optional[str] = Query(None, description="Window start (YYYY-MM-DD)"),
+    end: Optional[str] = Query(None, description="Window end (YYYY-MM-DD)"),
+):
+    """
+    Return sprint + task scheduling data for timeline views.
+    
+    Passes the date window and If-None-Match through to the PM Service, so an
+    unchanged timeline is answered with 304 and no body.
+    """
     try:
         from database.connection import get_db_session
         from backend.server.pm_service_client import PMServiceHandler as PMHandler
@@ -2947,8 +3140,18 @@ async def pm_project_timeline(project_id: str):
 
         try:
             handler = PMHandler.from_db_session(db)
-            timeline = await handler.get_project_timeline(project_id)
-            return timeline
+            result = await handler.get_project_timeline(
+                project_id,
+                start=start,
+                end=end,
+                etag=request.headers.get("if-none-match"),
+            )
+            headers = {"Cache-Control": "private, no-cache"}
+            if result.get("etag"):
+                headers["ETag"] = result["etag"]
+            if result.get("not_modified"):
+                return Response(status_code=304, headers=headers)
+            return JSONResponse(content=result["timeline"], headers=headers)
         finally:
             db.close()
     except ValueError as ve:
@@ -3714,10 +3917,10 @@ async def pm_chat_stream(request: Request):
                 try:
                     # Check if this is a Project Management (PM) related query
                     # Use LLM-based detection that works with any language
-                    from backend.graph.nodes import detect_pm_intent_llm
+                    from backend.graph.nodes import adetect_pm_intent
                     
                     user_message_first_line = user_message.strip().split('\n')[0].strip()
-                    has_pm_intent, pm_report_type = detect_pm_intent_llm(user_message_first_line) if user_message_first_line else (False, "general")
+                    has_pm_intent, pm_report_type = await adetect_pm_intent(user_message_first_line) if user_message_first_line else (False, "general")
                     
                     # Determine routing: PM queries go to coordinator → ReAct, non-PM queries go to Galaxy AI Project Manager
                     needs_research = not has_pm_intent
@@ -5104,6 +5307,7 @@ async def save_ai_provider(request: AIProviderAPIKeyRequest):
                 db.add(provider)
                 db.commit()
                 db.refresh(provider)
+            clear_search_provider_cache()
             
             # Mask API key for response
             masked_key = None
@@ -5270,6 +5474,7 @@ async def save_search_provider(request: SearchProviderAPIKeyRequest):
                 db.add(provider)
                 db.commit()
                 db.refresh(provider)
+            clear_search_provider_cache()
             
             # Mask API key for response
             masked_key = None
@@ -5492,6 +5697,7 @@ async def delete_search_provider(provider_id: str):
             provider.is_active = False  # type: ignore
             provider.is_default = False  # type: ignore
             db.commit()
+            clear_search_provider_cache()
             
             return {"success": True, "message": "Search provider deactivated"}
         finally:
@@ -116,6 +116,10 @@ class GeneratePodcastRequest(BaseModel):
 
 class GeneratePPTRequest(BaseModel):
     content: str = Field(..., description="The content of the ppt")
+    background: bool = Field(
+        False,
+        description="Return a job id right away instead of waiting for the file",
+    )
 
 
 class GenerateProseRequest(BaseModel):
@@ -0,0 +1,168 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""
+Application-lifetime LangGraph checkpointer.
+
+The connection pool and saver are created once in the FastAPI lifespan
+(including the ``setup()`` migration check) instead of per chat turn. Each
+request binds the saver to its own shallow copy of the compiled graph, so
+concurrent requests never mutate the shared graph object.
+"""
+
+import logging
+from contextlib import AsyncExitStack
+from typing import TYPE_CHECKING, Any, Optional
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+
+from shared.config.loader import get_bool_env, get_int_env, get_str_env
+
+if TYPE_CHECKING:
+    from psycopg_pool import AsyncConnectionPool
+
+logger = logging.getLogger(__name__)
+
+
+def postgres_connection_kwargs() -> dict[str, Any]:
+    from psycopg.rows import dict_row
+
+    return {
+        "autocommit": True,
+        "row_factory": dict_row,
+        "prepare_threshold": 0,
+    }
+
+
+class GraphCheckpointer:
+    """Owns the checkpoint saver and its connection pool for the app lifetime."""
+
+    def __init__(self, db_url: str, pool_min_size: int = 1, pool_max_size: int = 10):
+        self.db_url = db_url
+        self.pool_min_size = pool_min_size
+        self.pool_max_size = max(pool_max_size, pool_min_size)
+        self.saver: Optional[BaseCheckpointSaver] = None
+        self._pool: Optional["AsyncConnectionPool"] = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+
+    async def start(self) -> None:
+        """Open the pool and create the saver (runs the setup check once)."""
+        # Driver imports are deferred so only the configured backend is loaded
+        if self.db_url.startswith(("postgresql://", "postgres://")):
+            from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+            from psycopg_pool import AsyncConnectionPool
+
+            self._pool = AsyncConnectionPool(
+                self.db_url,
+                min_size=self.pool_min_size,
+                max_size=self.pool_max_size,
+                kwargs=postgres_connection_kwargs(),
+                open=False,
+            )
+            await self._pool.open(wait=True)
+            saver = AsyncPostgresSaver(self._pool)  # type: ignore[arg-type]
+            await saver.setup()
+            self.saver = saver
+            logger.info(
+                f"Postgres checkpointer ready (pool min={self.pool_min_size}, max={self.pool_max_size})"
+            )
+        elif self.db_url.startswith("mongodb://"):
+            from langgraph.checkpoint.mongodb import AsyncMongoDBSaver
+
+            self._exit_stack = AsyncExitStack()
+            self.saver = await self._exit_stack.enter_async_context(
+                AsyncMongoDBSaver.from_conn_string(self.db_url)
+            )
+            logger.info("MongoDB checkpointer ready")
+        else:
+            logger.warning("Unsupported LANGGRAPH_CHECKPOINT_DB_URL scheme, checkpointer disabled")
+
+    async def close(self) -> None:
+        """Close the saver and its pool."""
+        self.saver = None
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+            self._exit_stack = None
+
+    def bind(self, graph: Any, store: Any = None) -> Any:
+        """
+        Return a copy of the compiled graph that uses this saver.
+
+        The copy is shallow (nodes and channels are shared), so it is cheap
+        enough to make per request.
+        """
+        if self.saver is None:
+            return graph
+        update: dict[str, Any] = {"checkpointer": self.saver}
+        if store is not None:
+            update["store"] = store
+        return graph.copy(update=update)
+
+    def get_stats(self) -> dict[str, Any]:
+        stats: dict[str, Any] = {
+            "enabled": self.saver is not None,
+            "backend": type(self.saver).__name__ if self.saver is not None else None,
+        }
+        if self._pool is not None:
+            pool_stats = self._pool.get_stats()
+            stats["pool"] = {
+                "min_size": self.pool_min_size,
+                "max_size": self.pool_max_size,
+                "size": pool_stats.get("pool_size", 0),
+                "available": pool_stats.get("pool_available", 0),
+                "requests_waiting": pool_stats.get("requests_waiting", 0),
+            }
+        return stats
+
+
+_checkpointer: Optional[GraphCheckpointer] = None
+
+
+async def init_graph_checkpointer() -> Optional[GraphCheckpointer]:
+    """
+    Create the app-lifetime checkpointer when LANGGRAPH_CHECKPOINT_SAVER is set.
+
+    Pool sizes come from LANGGRAPH_CHECKPOINT_POOL_MIN_SIZE and
+    LANGGRAPH_CHECKPOINT_POOL_MAX_SIZE. If the database is unreachable the
+    error is logged and chats run without the persistent checkpointer.
+    """
+    global _checkpointer
+    checkpoint_url = get_str_env("LANGGRAPH_CHECKPOINT_DB_URL", "")
+    if not get_bool_env("LANGGRAPH_CHECKPOINT_SAVER", False) or not checkpoint_url:
+        return None
+
+    checkpointer = GraphCheckpointer(
+        checkpoint_url,
+        pool_min_size=get_int_env("LANGGRAPH_CHECKPOINT_POOL_MIN_SIZE", 1),
+        pool_max_size=get_int_env("LANGGRAPH_CHECKPOINT_POOL_MAX_SIZE", 10),
+    )
+    try:
+        await checkpointer.start()
+    except Exception as e:
+        logger.error(f"Failed to start graph checkpointer: {e}")
+        await checkpointer.close()
+        return None
+    _checkpointer = checkpointer
+    return checkpointer
+
+
+def get_graph_checkpointer() -> Optional[GraphCheckpointer]:
+    return _checkpointer
+
+
+def bind_checkpointer(graph: Any, store: Any = None) -> Any:
+    """Bind the app-lifetime checkpointer to a per-request copy of ``graph``."""
+    if _checkpointer is None:
+        return graph
+    return _checkpointer.bind(graph, store)
+
+
+async def close_graph_checkpointer() -> None:
+    """Close the app-lifetime checkpointer, if one was started."""
+    global _checkpointer
+    checkpointer, _checkpointer = _checkpointer, None
+    if checkpointer is not None:
+        await checkpointer.close()
@@ -8,7 +8,9 @@ import logging
 import os
 from typing import Any, Optional
 
+from backend.utils.pm_read_memo import current_pm_read_memo
 from pm_service.client import AsyncPMServiceClient
+from shared.resolution import get_entity_resolver
 
 logger = logging.getLogger(__name__)
 
@@ -97,24 +99,109 @@ class PMServiceHandler:
         instance._client = AsyncPMServiceClient(base_url=pm_service_url)
         return instance
     
+    # ==================== Read memo ====================
+    
+    async def _read(self, method: str, *args, **kwargs) -> Any:
+        """
+        Call a PM Service read, memoized for the current chat turn.
+        
+        Outside of a turn (see ``pm_read_scope``) this is a plain call.
+        """
+        async def call():
+            async with self._client as client:
+                return await getattr(client, method)(*args, **kwargs)
+        
+        memo = current_pm_read_memo()
+        if memo is None:
+            return await call()
+        key = (self._resolver_scope, self.user_id, method, repr(args), repr(sorted(kwargs.items())))
+        return await memo.get_or_load(key, call)
+    
+    async def _write(self, method: str, *args, **kwargs) -> Any:
+        """Call a PM Service write and drop the turn's memoized reads."""
+        try:
+            async with self._client as client:
+                return await getattr(client, method)(*args, **kwargs)
+        finally:
+            memo = current_pm_read_memo()
+            if memo is not None:
+                memo.invalidate()
+    
     # ==================== Projects ====================
     
     async def list_all_projects(self, user_id: Optional[str] = None) -> list[dict[str, Any]]:
         """List all projects from all providers."""
-        async with self._client as client:
-            # Use provided user_id or fall back to authenticated user_id
-            target_user_id = user_id if user_id else self.user_id
-            result = await client.list_projects(user_id=target_user_id)
-        return result.get("items", [])
+        # Use provided user_id or fall back to authenticated user_id
+        target_user_id = user_id if user_id else self.user_id
+        result = await self._read("list_projects", user_id=target_user_id)
+        items = result.get("items", [])
+        get_entity_resolver().prime(
+            "project", items, scope=f"{self._resolver_scope}|{target_user_id or ''}"
+        )
+        return items
     
     async def get_project(self, project_id: str) -> Optional[dict[str, Any]]:
         """Get project by ID."""
-        async with self._client as client:
-            try:
-                return await client.get_project(project_id)
-            except Exception as e:
-                logger.error(f"Failed to get project {project_id}: {e}")
-                return None
+        try:
+            return await self._read("get_project", project_id)
+        except Exception as e:
+            logger.error(f"Failed to get project {project_id}: {e}")
+            return None
+    
+    # ==================== Name Resolution ====================
+    
+    @property
+    def _resolver_scope(self) -> str:
+        """Entity resolver scope: one PM Service deployment."""
+        return str(self._client.base_url)
+    
+    async def resolve_entity(
+        self,
+        kind: str,
+        reference: str,
+        project_id: Optional[str] = None
+    ) -> Optional[dict[str, Any]]:
+        """
+        Resolve a sprint, user, epic or project reference to its entity.
+        
+        Accepts ids (plain or composite), names ("Sprint 6", "Minh"), sprint
+        numbers ("6") and close misspellings. Name maps are cached per
+        project and refreshed from the PM Service when they go stale.
+        
+        Args:
+            kind: "sprint", "user", "epic" or "project"
+            reference: What the user or agent called the entity
+            project_id: Project to resolve in (not used for projects)
+            
+        Returns:
+            Entity dict, or None if nothing matches
+            
+        Raises:
+            AmbiguousEntityError: If several entities match equally well
+        """
+        resolver = get_entity_resolver()
+        if kind == "project":
+            return self._entity_of(await resolver.resolve(
+                "project",
+                reference,
+                self.list_all_projects,
+                scope=f"{self._resolver_scope}|{self.user_id or ''}",
+            ))
+        
+        loaders = {
+            "sprint": lambda: self.list_sprints(project_id=project_id),
+            "user": lambda: self.list_users(project_id),
+            "epic": lambda: self.list_project_epics(project_id),
+        }
+        if kind not in loaders:
+            raise ValueError(f"Unknown entity kind: {kind}")
+        return self._entity_of(await resolver.resolve(
+            kind, reference, loaders[kind], scope=self._resolver_scope, project_id=project_id
+        ))
+    
+    @staticmethod
+    def _entity_of(match) -> Optional[dict[str, Any]]:
+        return match.entity if match else None
     
     # ==================== Tasks ====================
     
@@ -126,19 +213,18 @@ class PMServiceHandler:
         status: Optional[str] = None
     ) -> list[dict[str, Any]]:
         """List tasks in a project."""
-        async with self._client as client:
-            result = await client.list_tasks(
-                project_id=project_id,
-                sprint_id=sprint_id,
-                assignee_id=assignee_id,
-                status=status
-            )
+        result = await self._read(
+            "list_tasks",
+            project_id=project_id,
+            sprint_id=sprint_id,
+            assignee_id=assignee_id,
+            status=status
+        )
         return result.get("items", [])
     
     async def list_my_tasks(self) -> list[dict[str, Any]]:
         """List tasks assigned to current user."""
-        async with self._client as client:
-            result = await client.list_tasks(assignee_id=self.user_id)
+        result = await self._read("list_tasks", assignee_id=self.user_id)
         return result.get("items", [])
     
     async def list_all_tasks(
@@ -148,22 +234,21 @@ class PMServiceHandler:
         sprint_id: Optional[str] = None
     ) -> list[dict[str, Any]]:
         """List all tasks from all providers."""
-        async with self._client as client:
-            result = await client.list_tasks(
-                project_id=project_id,
-                assignee_id=assignee_id,
-                sprint_id=sprint_id
-            )
+        result = await self._read(
+            "list_tasks",
+            project_id=project_id,
+            assignee_id=assignee_id,
+            sprint_id=sprint_id
+        )
         return result.get("items", [])
     
     async def get_task(self, task_id: str) -> Optional[dict[str, Any]]:
         """Get task by ID."""
-        async with self._client as client:
-            try:
-                return await client.get_task(task_id)
-            except Exception as e:
-                logger.error(f"Failed to get task {task_id}: {e}")
-                return None
+        try:
+            return await self._read("get_task", task_id)
+        except Exception as e:
+            logger.error(f"Failed to get task {task_id}: {e}")
+            return None
     
     async def create_project_task(
         self,
@@ -171,18 +256,18 @@ class PMServiceHandler:
         task_data: dict[str, Any]
     ) -> dict[str, Any]:
         """Create a task in a project."""
-        async with self._client as client:
-            return await client.create_task(
-                project_id=project_id,
-                title=task_data.get("title", ""),
-                description=task_data.get("description"),
-                assignee_id=task_data.get("assignee_id"),
-                sprint_id=task_data.get("sprint_id"),
-                story_points=task_data.get("story_points"),
-                priority=task_data.get("priority"),
-                task_type=task_data.get("task_type") or task_data.get("type"),
-                parent_id=task_data.get("parent_id")
-            )
+        return await self._write(
+            "create_task",
+            project_id=project_id,
+            title=task_data.get("title", ""),
+            description=task_data.get("description"),
+            assignee_id=task_data.get("assignee_id"),
+            sprint_id=task_data.get("sprint_id"),
+            story_points=task_data.get("story_points"),
+            priority=task_data.get("priority"),
+            task_type=task_data.get("task_type") or task_data.get("type"),
+            parent_id=task_data.get("parent_id")
+        )
     
     async def update_task(
         self,
@@ -190,12 +275,11 @@ class PMServiceHandler:
         **updates
     ) -> Optional[dict[str, Any]]:
         """Update a task."""
-        async with self._client as client:
-            try:
-                return await client.update_task(task_id, **updates)
-            except Exception as e:
-                logger.error(f"Failed to update task {task_id}: {e}")
-                return None
+        try:
+            return await self._write("update_task", task_id, **updates)
+        except Exception as e:
+            logger.error(f"Failed to update task {task_id}: {e}")
+            return None
     
     async def assign_task_to_user(
         self,
@@ -204,8 +288,7 @@ class PMServiceHandler:
         assignee_id: Optional[str]
     ) -> dict[str, Any]:
         """Assign task to user."""
-        async with self._client as client:
-            return await client.update_task(task_id, assignee_id=assignee_id)
+        return await self._write("update_task", task_id, assignee_id=assignee_id)
     
     async def assign_task_to_sprint(
         self,
@@ -214,8 +297,7 @@ class PMServiceHandler:
         sprint_id: str
     ) -> dict[str, Any]:
         """Assign task to sprint."""
-        async with self._client as client:
-            return await client.update_task(task_id, sprint_id=sprint_id)
+        return await self._write("update_task", task_id, sprint_id=sprint_id)
     
     async def move_task_to_backlog(
         self,
@@ -223,8 +305,7 @@ class PMServiceHandler:
         task_id: str
     ) -> dict[str, Any]:
         """Move task to backlog (remove from sprint)."""
-        async with self._client as client:
-            return await client.update_task(task_id, sprint_id=None)
+        return await self._write("update_task", task_id, sprint_id=None)
     
     async def assign_task_to_epic(
         self,
@@ -233,8 +314,7 @@ class PMServiceHandler:
         epic_id: str
     ) -> dict[str, Any]:
         """Assign task to epic."""
-        async with self._client as client:
-            return await client.update_task(task_id, epic_id=epic_id)
+        return await self._write("update_task", task_id, epic_id=epic_id)
     
     async def remove_task_from_epic(
         self,
@@ -242,8 +322,7 @@ class PMServiceHandler:
         task_id: str
     ) -> dict[str, Any]:
         """Remove task from epic."""
-        async with self._client as client:
-            return await client.update_task(task_id, epic_id=None)
+        return await self._write("update_task", task_id, epic_id=None)
     
     # ==================== Sprints ====================
     
@@ -261,12 +340,12 @@ class PMServiceHandler:
         import time
         start_time = time.time()
         
-        async with self._client as client:
-            result = await client.list_sprints(
-                project_id=project_id,
-                status=sprint_status
-            )
-            
+        result = await self._read(
+            "list_sprints",
+            project_id=project_id,
+            status=sprint_status
+        )
+        
         duration = time.time() - start_time
         logger.info(f"[PMServiceHandler] ⏱️ UPSTREAM list_sprints call took {duration:.2f}s")
         
@@ -285,6 +364,8 @@ class PMServiceHandler:
                 f"[PMServiceHandler] ⚠️ DUPLICATES in PM Service response: "
                 f"{len(sprint_ids)} items, {len(unique_ids)} unique IDs"
             )
+        if project_id and not sprint_status:
+            get_entity_resolver().prime("sprint", items, scope=self._resolver_scope, project_id=project_id)
         return items
     
     async def list_all_sprints(
@@ -306,12 +387,11 @@ class PMServiceHandler:
     
     async def get_sprint(self, sprint_id: str) -> Optional[dict[str, Any]]:
         """Get sprint by ID."""
-        async with self._client as client:
-            try:
-                return await client.get_sprint(sprint_id)
-            except Exception as e:
-                logger.error(f"Failed to get sprint {sprint_id}: {e}")
-                return None
+        try:
+            return await self._read("get_sprint", sprint_id)
+        except Exception as e:
+            logger.error(f"Failed to get sprint {sprint_id}: {e}")
+            return None
     
     # ==================== Epics ====================
     
@@ -320,18 +400,18 @@ class PMServiceHandler:
         project_id: str
     ) -> list[dict[str, Any]]:
         """List epics in a project."""
-        async with self._client as client:
-            result = await client.list_epics(project_id=project_id)
-        return result.get("items", [])
+        result = await self._read("list_epics", project_id=project_id)
+        items = result.get("items", [])
+        get_entity_resolver().prime("epic", items, scope=self._resolver_scope, project_id=project_id)
+        return items
     
     async def get_epic(self, epic_id: str) -> Optional[dict[str, Any]]:
         """Get epic by ID."""
-        async with self._client as client:
-            try:
-                return await client.get_epic(epic_id)
-            except Exception as e:
-                logger.error(f"Failed to get epic {epic_id}: {e}")
-                return None
+        try:
+            return await self._read("get_epic", epic_id)
+        except Exception as e:
+            logger.error(f"Failed to get epic {epic_id}: {e}")
+            return None
     
     async def create_project_epic(
         self,
@@ -339,13 +419,13 @@ class PMServiceHandler:
         epic_data: dict[str, Any]
     ) -> dict[str, Any]:
         """Create an epic in a project."""
-        async with self._client as client:
-            return await client.create_epic(
-                project_id=project_id,
-                name=epic_data.get("name", ""),
-                description=epic_data.get("description"),
-                color=epic_data.get("color")
-            )
+        return await self._write(
+            "create_epic",
+            project_id=project_id,
+            name=epic_data.get("name", ""),
+            description=epic_data.get("description"),
+            color=epic_data.get("color")
+        )
     
     async def update_project_epic(
         self,
@@ -354,8 +434,7 @@ class PMServiceHandler:
         updates: dict[str, Any]
     ) -> dict[str, Any]:
         """Update an epic."""
-        async with self._client as client:
-            return await client.update_epic(epic_id, **updates)
+        return await self._write("update_epic", epic_id, **updates)
     
     async def delete_project_epic(
         self,
@@ -363,13 +442,12 @@ class PMServiceHandler:
         epic_id: str
     ) -> bool:
         """Delete an epic."""
-        async with self._client as client:
-            try:
-                await client.delete_epic(epic_id)
-                return True
-            except Exception as e:
-                logger.error(f"Failed to delete epic {epic_id}: {e}")
-                return False
+        try:
+            await self._write("delete_epic", epic_id)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to delete epic {epic_id}: {e}")
+            return False
     
     # ==================== Users ====================
     
@@ -378,9 +456,10 @@ class PMServiceHandler:
         project_id: str
     ) -> list[dict[str, Any]]:
         """List users in a project."""
-        async with self._client as client:
-            result = await client.list_users(project_id=project_id)
-        return result.get("items", [])
+        result = await self._read("list_users", project_id=project_id)
+        items = result.get("items", [])
+        get_entity_resolver().prime("user", items, scope=self._resolver_scope, project_id=project_id)
+        return items
     
     async def list_users(
         self,
@@ -394,18 +473,18 @@ class PMServiceHandler:
         if project_id:
             return await self.list_project_users(project_id)
         # If no project_id, list all users
-        async with self._client as client:
-            result = await client.list_users()
-        return result.get("items", [])
+        result = await self._read("list_users")
+        items = result.get("items", [])
+        get_entity_resolver().prime("user", items, scope=self._resolver_scope)
+        return items
     
     async def get_user(self, user_id: str) -> Optional[dict[str, Any]]:
         """Get user by ID."""
-        async with self._client as client:
-            try:
-                return await client.get_user(user_id)
-            except Exception as e:
-                logger.error(f"Failed to get user {user_id}: {e}")
-                return None
+        try:
+            return await self._read("get_user", user_id)
+        except Exception as e:
+            logger.error(f"Failed to get user {user_id}: {e}")
+            return None
     
     async def get_user_tasks_summary(
         self,
@@ -478,8 +557,7 @@ class PMServiceHandler:
     
     async def list_providers(self) -> list[dict[str, Any]]:
         """List all providers."""
-        async with self._client as client:
-            result = await client.list_providers()
+        result = await self._read("list_providers")
         return result.get("items", [])
     
     async def sync_provider(
@@ -495,106 +573,45 @@ class PMServiceHandler:
         additional_config: Optional[dict] = None
     ) -> dict[str, Any]:
         """Sync provider configuration to PM Service."""
-        async with self._client as client:
-            return await client.sync_provider(
-                backend_provider_id=backend_provider_id,
-                provider_type=provider_type,
-                name=name,
-                base_url=base_url,
-                api_key=api_key,
-                api_token=api_token,
-                username=username,
-                is_active=is_active,
-                additional_config=additional_config
-            )
+        return await self._write(
+            "sync_provider",
+            backend_provider_id=backend_provider_id,
+            provider_type=provider_type,
+            name=name,
+            base_url=base_url,
+            api_key=api_key,
+            api_token=api_token,
+            username=username,
+            is_active=is_active,
+            additional_config=additional_config
+        )
     
     # ==================== Timeline & Analytics ====================
     
     async def get_project_timeline(
         self,
-        project_id: str
+        project_id: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        etag: Optional[str] = None
     ) -> dict[str, Any]:
-        """Get project timeline data (sprints + tasks) with scheduling info."""
-        raw_sprints = await self.list_project_sprints(project_id)
-        raw_tasks = await self.list_project_tasks(project_id)
-        
-        # Process sprints - add is_scheduled and missing_reason
-        scheduled_sprints = []
-        unscheduled_sprints = []
-        
-        for sprint in raw_sprints:
-            start_date = sprint.get("start_date")
-            end_date = sprint.get("end_date")
-            
-            # Determine scheduling status
-            has_start = bool(start_date)
-            has_end = bool(end_date)
-            is_scheduled = has_start and has_end
-            
-            # Determine missing reason
-            missing_reason = None
-            if not has_start and not has_end:
-                missing_reason = "missing_start_end"
-            elif not has_start:
-                missing_reason = "missing_start"
-            elif not has_end:
-                missing_reason = "missing_end"
-            
-            # Add scheduling info to sprint
-            enriched_sprint = {
-                **sprint,
-                "is_scheduled": is_scheduled,
-                "missing_reason": missing_reason,
-            }
-            
-            if is_scheduled:
-                scheduled_sprints.append(enriched_sprint)
-            else:
-                unscheduled_sprints.append(enriched_sprint)
+        """
+        Get project timeline data (sprints + tasks) with scheduling info.
         
-        # Process tasks - add is_scheduled and missing_reason
-        scheduled_tasks = []
-        unscheduled_tasks = []
+        The PM Service fetches sprints and tasks concurrently and returns only
+        the fields timeline views render, limited to the [start, end] window.
         
-        for task in raw_tasks:
-            start_date = task.get("start_date")
-            due_date = task.get("due_date")
-            
-            # Determine scheduling status
-            has_start = bool(start_date)
-            has_end = bool(due_date)
-            is_scheduled = has_start and has_end
-            
-            # Determine missing reason
-            missing_reason = None
-            if not has_start and not has_end:
-                missing_reason = "missing_start_end"
-            elif not has_start:
-                missing_reason = "missing_start"
-            elif not has_end:
-                missing_reason = "missing_end"
-            
-            # Add scheduling info to task
-            enriched_task = {
-                **task,
-                "is_scheduled": is_scheduled,
-                "missing_reason": missing_reason,
-            }
+        Args:
+            project_id: Project ID
+            start: Window start (YYYY-MM-DD)
+            end: Window end (YYYY-MM-DD)
+            etag: ETag of the timeline the caller already has
             
-            if is_scheduled:
-                scheduled_tasks.append(enriched_task)
-            else:
-                unscheduled_tasks.append(enriched_task)
-        
-        return {
-            "project_id": project_id,
-            "sprints": scheduled_sprints,
-            "tasks": scheduled_tasks,
-            "unscheduled": {
-                "sprints": unscheduled_sprints,
-                "tasks": unscheduled_tasks,
-            }
-        }
+        Returns:
+            {"timeline": ..., "etag": ..., "not_modified": bool}
+        """
+        async with self._client as client:
+            return await client.get_project_timeline(project_id, start=start, end=end, etag=etag)
     
     # ==================== Labels & Statuses ====================
     
@@ -614,11 +631,11 @@ class PMServiceHandler:
         entity_type: str = "task"
     ) -> list[dict[str, Any]]:
         """List available statuses for a project."""
-        async with self._client as client:
-            result = await client.list_statuses(
-                project_id=project_id,
-                entity_type=entity_type
-            )
+        result = await self._read(
+            "list_statuses",
+            project_id=project_id,
+            entity_type=entity_type
+        )
         return result.get("items", [])
     
     async def list_project_priorities(
@@ -626,8 +643,7 @@ class PMServiceHandler:
         project_id: str
     ) -> list[dict[str, Any]]:
         """List available priorities for a project."""
-        async with self._client as client:
-            result = await client.list_priorities(project_id=project_id)
+        result = await self._read("list_priorities", project_id=project_id)
         return result.get("items", [])
     
     # ==================== Worklogs / Time Entries ====================
@@ -646,12 +662,12 @@ class PMServiceHandler:
             user_id: Filter by user ID
             task_id: Filter by task ID
         """
-        async with self._client as client:
-            result = await client.list_time_entries(
-                project_id=project_id,
-                user_id=user_id,
-                task_id=task_id
-            )
+        result = await self._read(
+            "list_time_entries",
+            project_id=project_id,
+            user_id=user_id,
+            task_id=task_id
+        )
         return result.get("items", [])
 
     async def log_worklog(
@@ -672,18 +688,18 @@ class PMServiceHandler:
             comment: Optional comment
             activity_type: Optional activity type
         """
-        async with self._client as client:
-            try:
-                return await client.log_time_entry(
-                    task_id=task_id,
-                    hours=hours,
-                    date=date,
-                    comment=comment,
-                    activity_type=activity_type
-                )
-            except Exception as e:
-                logger.error(f"Failed to log worklog for task {task_id}: {e}")
-                return None
+        try:
+            return await self._write(
+                "log_time_entry",
+                task_id=task_id,
+                hours=hours,
+                date=date,
+                comment=comment,
+                activity_type=activity_type
+            )
+        except Exception as e:
+            logger.error(f"Failed to log worklog for task {task_id}: {e}")
+            return None
 
 
 
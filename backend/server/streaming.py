@@ -10,6 +10,8 @@ Extracted from app.py for better separation of concerns and testability.
 
 import json
 import logging
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
 from typing import Any, AsyncIterator, Optional
 from uuid import uuid4
 
@@ -23,29 +25,177 @@ from backend.utils.log_sanitizer import (
     sanitize_thread_id,
     sanitize_tool_name,
 )
+from backend.utils.streaming_state import current_thread_id
+from shared.config.loader import get_int_env
 
 logger = logging.getLogger(__name__)
 
+# Scope used when a cache is touched outside of an active stream
+_UNSCOPED = "__unscoped__"
+
+# Global bound on entries per cache, across all concurrent streams
+STREAM_CACHE_MAX_ENTRIES = get_int_env("STREAM_CACHE_MAX_ENTRIES", 2048)
+
+
+class StreamScopedCache(MutableMapping):
+    """
+    Message-ID keyed cache whose entries belong to the stream that wrote them.
+
+    Entries are scoped by thread_id (taken from ``current_thread_id`` unless
+    given explicitly), so concurrent chats never see each other's state, and a
+    stream's entries are dropped together by ``clear_scope`` when it ends. A
+    global LRU bound evicts the least recently used entries as a safety net for
+    streams that never release their scope.
+
+    The mapping interface operates on the current stream's scope, so it can be
+    used as a drop-in replacement for a plain ``dict`` keyed by message ID.
+    """
+
+    def __init__(self, name: str, max_entries: int = STREAM_CACHE_MAX_ENTRIES):
+        self.name = name
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[tuple[str, str], Any] = OrderedDict()
+        self._scopes: dict[str, set[str]] = {}
+        self._evictions = 0
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _scope(thread_id: Optional[str] = None) -> str:
+        if thread_id:
+            return sanitize_thread_id(thread_id)
+        return current_thread_id.get() or _UNSCOPED
+
+    def set(self, key: str, value: Any, thread_id: Optional[str] = None) -> None:
+        """Store a value for a message ID in the given (or current) stream."""
+        scope = self._scope(thread_id)
+        entry_key = (scope, key)
+        self._entries[entry_key] = value
+        self._entries.move_to_end(entry_key)
+        self._scopes.setdefault(scope, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            (evicted_scope, evicted_key), _ = self._entries.popitem(last=False)
+            self._forget(evicted_scope, evicted_key)
+            self._evictions += 1
+
+    def lookup(
+        self, key: str, thread_id: Optional[str] = None, default: Any = None
+    ) -> Any:
+        """Return the value for a message ID in the given (or current) stream."""
+        entry_key = (self._scope(thread_id), key)
+        if entry_key not in self._entries:
+            self._misses += 1
+            return default
+        self._hits += 1
+        self._entries.move_to_end(entry_key)
+        return self._entries[entry_key]
+
+    def _forget(self, scope: str, key: str) -> None:
+        keys = self._scopes.get(scope)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._scopes[scope]
+
+    def clear_scope(self, thread_id: Optional[str] = None) -> int:
+        """Drop every entry of one stream. Returns the number of entries removed."""
+        scope = self._scope(thread_id)
+        keys = self._scopes.pop(scope, set())
+        for key in keys:
+            self._entries.pop((scope, key), None)
+        return len(keys)
+
+    def clear_all(self) -> None:
+        """Drop every entry of every stream."""
+        self._entries.clear()
+        self._scopes.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Get size and hit/eviction counters for this cache."""
+        return {
+            "entries": len(self._entries),
+            "streams": len(self._scopes),
+            "max_entries": self.max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+        }
+
+    def __getitem__(self, key: str) -> Any:
+        entry_key = (self._scope(), key)
+        if entry_key not in self._entries:
+            self._misses += 1
+            raise KeyError(key)
+        self._hits += 1
+        self._entries.move_to_end(entry_key)
+        return self._entries[entry_key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        scope = self._scope()
+        del self._entries[(scope, key)]
+        self._forget(scope, key)
+
+    def __contains__(self, key: object) -> bool:
+        return (self._scope(), key) in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._scopes.get(self._scope(), ())))
+
+    def __len__(self) -> int:
+        return len(self._scopes.get(self._scope(), ()))
+
+
+# Registry of every stream-scoped cache, released together when a stream ends
+_stream_caches: dict[str, StreamScopedCache] = {}
+
+
+def get_stream_cache(name: str) -> StreamScopedCache:
+    """Get or create the named stream-scoped cache."""
+    if name not in _stream_caches:
+        _stream_caches[name] = StreamScopedCache(name)
+    return _stream_caches[name]
+
+
+def release_stream_state(thread_id: str) -> int:
+    """Drop the entries of one stream from every stream-scoped cache."""
+    removed = sum(cache.clear_scope(thread_id) for cache in _stream_caches.values())
+    if removed:
+        logger.debug(
+            f"[{sanitize_thread_id(thread_id)}] Released {removed} stream cache entries"
+        )
+    return removed
+
+
+def get_stream_cache_stats() -> dict[str, dict[str, int]]:
+    """Get size counters for every stream-scoped cache."""
+    return {name: cache.stats() for name, cache in _stream_caches.items()}
+
+
 # Cache to store react_thoughts by message ID for AIMessageChunk processing
 # This is needed because AIMessageChunk is streamed before the final AIMessage
-_react_thoughts_cache: dict[str, list] = {}
+_react_thoughts_cache = get_stream_cache("react_thoughts")
 
 
-def clear_thoughts_cache():
-    """Clear the react_thoughts cache."""
-    global _react_thoughts_cache
-    _react_thoughts_cache = {}
+def clear_thoughts_cache(thread_id: Optional[str] = None):
+    """Clear the react_thoughts cache for one stream, or for all streams."""
+    if thread_id:
+        _react_thoughts_cache.clear_scope(thread_id)
+    else:
+        _react_thoughts_cache.clear_all()
 
 
-def cache_thoughts(message_id: str, thoughts: list):
+def cache_thoughts(message_id: str, thoughts: list, thread_id: Optional[str] = None):
     """Cache react_thoughts for a message ID."""
     if message_id and thoughts:
-        _react_thoughts_cache[message_id] = thoughts
+        _react_thoughts_cache.set(message_id, thoughts, thread_id)
 
 
-def get_cached_thoughts(message_id: str) -> Optional[list]:
+def get_cached_thoughts(message_id: str, thread_id: Optional[str] = None) -> Optional[list]:
     """Get cached react_thoughts for a message ID."""
-    return _react_thoughts_cache.get(message_id)
+    return _react_thoughts_cache.lookup(message_id, thread_id)
 
 
 def make_event(event_type: str, data: dict[str, Any]) -> str:
@@ -309,7 +459,7 @@ async def process_message_chunk(
     if agent_name in ["pm_agent", "react_agent"]:
         message_id = event_message.get("id")
         if message_id and "react_thoughts" not in event_message:
-            cached = get_cached_thoughts(message_id)
+            cached = get_cached_thoughts(message_id, thread_id)
             if cached:
                 event_message["react_thoughts"] = cached
                 if isinstance(message_chunk, AIMessageChunk):
@@ -1,35 +1,35 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
-from .crawl import crawl_tool
-from .backend_api import backend_api_call
-from .python_repl import python_repl_tool
-from .retriever import get_retriever_tool
-from .search import get_web_search_tool
-from .tts import VolcengineTTS
-from .pm_tools import get_pm_tools, set_pm_handler
-from .pm_mcp_tools import (
-    configure_pm_mcp_client,
-    get_pm_mcp_tools,
-    get_pm_tools_via_mcp,
-    is_pm_mcp_configured,
-    get_pm_mcp_config,
-    reset_pm_mcp_client,
-)
+import importlib
 
-__all__ = [
-    "crawl_tool",
-    "backend_api_call",
-    "python_repl_tool",
-    "get_web_search_tool",
-    "get_retriever_tool",
-    "VolcengineTTS",
-    "get_pm_tools",
-    "set_pm_handler",
-    "configure_pm_mcp_client",
-    "get_pm_mcp_tools",
-    "get_pm_tools_via_mcp",
-    "is_pm_mcp_configured",
-    "get_pm_mcp_config",
-    "reset_pm_mcp_client",
-]
+# Exported name -> submodule. Tools are imported on first access, so importing
+# one of them (e.g. backend.tools.search) does not also load the RAG providers,
+# MCP adapters and PM tools behind the others.
+_EXPORTS = {
+    "crawl_tool": ".crawl",
+    "backend_api_call": ".backend_api",
+    "python_repl_tool": ".python_repl",
+    "get_web_search_tool": ".search",
+    "get_retriever_tool": ".retriever",
+    "VolcengineTTS": ".tts",
+    "get_pm_tools": ".pm_tools",
+    "set_pm_handler": ".pm_tools",
+    "configure_pm_mcp_client": ".pm_mcp_tools",
+    "get_pm_mcp_tools": ".pm_mcp_tools",
+    "get_pm_tools_via_mcp": ".pm_mcp_tools",
+    "is_pm_mcp_configured": ".pm_mcp_tools",
+    "get_pm_mcp_config": ".pm_mcp_tools",
+    "reset_pm_mcp_client": ".pm_mcp_tools",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -3,9 +3,9 @@
 
 import json
 import logging
-from typing import Annotated
+from typing import Annotated, Optional
 
-from langchain_core.tools import tool
+from langchain_core.tools import StructuredTool
 
 from backend.crawler import Crawler
 
@@ -13,18 +13,76 @@ from .decorators import log_io
 
 logger = logging.getLogger(__name__)
 
+# Characters of markdown returned per crawled page
+_MAX_CONTENT_CHARS = 1000
+
+
+def _crawl_result(url: str, article) -> dict:
+    return {"url": url, "crawled_content": article.to_markdown()[:_MAX_CONTENT_CHARS]}
+
+
+def _failure(e: BaseException) -> str:
+    error_msg = f"Failed to crawl. Error: {repr(e)}"
+    logger.error(error_msg)
+    return error_msg
+
 
-@tool
 @log_io
-def crawl_tool(
+def crawl(
     url: Annotated[str, "The url to crawl."],
+    more_urls: Annotated[Optional[list[str]], "Other urls to crawl in the same call."] = None,
 ) -> str:
     """Use this to crawl a url and get a readable content in markdown format."""
     try:
         crawler = Crawler()
-        article = crawler.crawl(url)
-        return json.dumps({"url": url, "crawled_content": article.to_markdown()[:1000]})
+        if not more_urls:
+            return json.dumps(_crawl_result(url, crawler.crawl(url)))
+        results = []
+        for page_url in dict.fromkeys([url, *more_urls]):
+            try:
+                results.append(_crawl_result(page_url, crawler.crawl(page_url)))
+            except Exception as e:
+                results.append({"url": page_url, "error": _failure(e)})
+        return json.dumps(results)
     except BaseException as e:
-        error_msg = f"Failed to crawl. Error: {repr(e)}"
-        logger.error(error_msg)
-        return error_msg
+        return _failure(e)
+
+
+@log_io
+async def acrawl(
+    url: Annotated[str, "The url to crawl."],
+    more_urls: Annotated[Optional[list[str]], "Other urls to crawl in the same call."] = None,
+) -> str:
+    """Async ``crawl``: several urls are fetched concurrently with per-host limits."""
+    try:
+        crawler = Crawler()
+        if not more_urls:
+            return json.dumps(_crawl_result(url, await crawler.acrawl(url)))
+        urls = list(dict.fromkeys([url, *more_urls]))
+        results = []
+        for page_url, article in zip(urls, await crawler.acrawl_many(urls)):
+            if isinstance(article, Exception):
+                results.append({"url": page_url, "error": _failure(article)})
+                continue
+            if isinstance(article, BaseException):
+                # A cancelled fetch cancels the tool call
+                raise article
+            try:
+                results.append(_crawl_result(page_url, article))
+            except Exception as e:
+                results.append({"url": page_url, "error": _failure(e)})
+        return json.dumps(results)
+    except Exception as e:
+        return _failure(e)
+
+
+crawl_tool = StructuredTool.from_function(
+    func=crawl,
+    coroutine=acrawl,
+    name="crawl_tool",
+    description=(
+        "Use this to crawl a url and get a readable content in markdown format. "
+        "Pass more_urls to crawl several pages at once; the result is then a "
+        "list with one entry per url."
+    ),
+)
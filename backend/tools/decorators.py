@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 import functools
+import inspect
 import logging
 from typing import Any, Callable, Type, TypeVar
 
@@ -14,22 +15,38 @@ def log_io(func: Callable) -> Callable:
     """
     A decorator that logs the input parameters and output of a tool function.
 
+    Coroutine functions are wrapped with a coroutine function.
+
     Args:
         func: The tool function to be decorated
 
     Returns:
         The wrapped function with input/output logging
     """
+    func_name = func.__name__
 
-    @functools.wraps(func)
-    def wrapper(*args: Any, **kwargs: Any) -> Any:
-        # Log input parameters
-        func_name = func.__name__
+    def log_call(args: tuple, kwargs: dict) -> None:
         params = ", ".join(
             [*(str(arg) for arg in args), *(f"{k}={v}" for k, v in kwargs.items())]
         )
         logger.info(f"Tool {func_name} called with parameters: {params}")
 
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            log_call(args, kwargs)
+            result = await func(*args, **kwargs)
+            logger.info(f"Tool {func_name} returned: {result}")
+            return result
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        # Log input parameters
+        log_call(args, kwargs)
+
         # Execute the function
         result = func(*args, **kwargs)
 
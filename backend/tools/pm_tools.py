@@ -10,11 +10,14 @@ project management data (projects, tasks, sprints, epics, etc.).
 import json
 import logging
 import asyncio
+import re
 import datetime
 from typing import Annotated, Optional, List, Dict, Any
 
 from langchain_core.tools import tool
 
+from shared.resolution import AmbiguousEntityError
+
 logger = logging.getLogger(__name__)
 
 # Helper to get timestamp
@@ -61,6 +64,16 @@ def _ensure_pm_handler():
     return _pm_handler
 
 
+# Numeric ids, UUIDs and long hex account ids (JIRA)
+_ID_LIKE_RE = re.compile(r"^(\d+|[0-9a-f]{8}-[0-9a-f]{4}-.*|[0-9a-f]{20,})$", re.IGNORECASE)
+
+
+def _looks_like_name(reference: str) -> bool:
+    """True for references such as "Minh" or "Sprint 4", False for ids."""
+    reference = reference.strip()
+    return ":" not in reference and not _ID_LIKE_RE.match(reference)
+
+
 async def _call_handler_method(method, *args, **kwargs):
     """Helper to call async or sync handler methods"""
     result = method(*args, **kwargs)
@@ -448,33 +461,27 @@ async def list_tasks(
             elif not actual_sprint_id.isdigit():
                 is_ambiguous = True # It's a string like "Sprint 4" (assuming real IDs are numeric strings in OpenProject)
         
-        if is_ambiguous and actual_sprint_id and hasattr(handler, 'list_project_sprints') and actual_project_id:
+        if is_ambiguous and actual_sprint_id and hasattr(handler, 'resolve_entity') and actual_project_id:
+            # Cached name map: "Sprint 4", "sprint-4" or "4" resolve without listing sprints
             try:
-                # Fetch sprints to resolve the name/index
-                # Pass full composite ID - handler extracts what it needs
-                sprints = await handler.list_project_sprints(actual_project_id)
-                
-                resolved_id = None
-                # Strategy 1: Exact Name Match (Case Insensitive)
-                for s in sprints:
-                    if s.get("name") and s.get("name").lower() == actual_sprint_id.lower():
-                        resolved_id = str(s.get("id"))
-                        break
-                
-                # Strategy 2: "Sprint X" Pattern Match (if input is "4", look for "Sprint 4")
-                if not resolved_id and actual_sprint_id.isdigit():
-                    target_name = f"Sprint {actual_sprint_id}"
-                    for s in sprints:
-                        if s.get("name") and s.get("name").lower() == target_name.lower():
-                            resolved_id = str(s.get("id"))
-                            break
-
-                if resolved_id:
-                    actual_sprint_id = resolved_id
-                else:
-                    pass
+                sprint = await handler.resolve_entity("sprint", actual_sprint_id, project_id=actual_project_id)
+                if sprint:
+                    actual_sprint_id = str(sprint.get("id")).rsplit(":", 1)[-1]
+            except AmbiguousEntityError as e:
+                return json.dumps({"success": False, "error": str(e)})
             except Exception as e:
-                pass
+                logger.warning(f"[PM-TOOLS] list_tasks: sprint resolution failed for '{actual_sprint_id}': {e}")
+
+        # Assignee given by name ("Minh") rather than id
+        if assignee_id and _looks_like_name(assignee_id) and hasattr(handler, 'resolve_entity'):
+            try:
+                user = await handler.resolve_entity("user", assignee_id, project_id=actual_project_id)
+                if user:
+                    assignee_id = str(user.get("id"))
+            except AmbiguousEntityError as e:
+                return json.dumps({"success": False, "error": str(e)})
+            except Exception as e:
+                logger.warning(f"[PM-TOOLS] list_tasks: user resolution failed for '{assignee_id}': {e}")
 
         if actual_sprint_id and actual_sprint_id.isdigit() and len(actual_sprint_id) < 3:
              # Heuristic: IDs are usually 3+ digits. Sprint numbers are 1-2 digits.
@@ -1080,7 +1087,7 @@ async def list_users(
 
 @tool
 async def get_user_tasks_summary(
-    user_id: Annotated[str, "The ID of the user to analyze"],
+    user_id: Annotated[str, "The ID or name of the user to analyze"],
     project_id: Annotated[Optional[str], "Optional project ID to filter tasks"] = None
 ) -> str:
     """Get aggregated task summary for a specific user.
@@ -1088,7 +1095,7 @@ async def get_user_tasks_summary(
     Useful for analyzing workload and performance.
     
     Args:
-        user_id: The ID of the user
+        user_id: The ID or name of the user (e.g. "Minh")
         project_id: Optional project ID to limit the analysis
         
     Returns:
@@ -1102,6 +1109,12 @@ async def get_user_tasks_summary(
     try:
         handler = _ensure_pm_handler()
         
+        # Accept a name ("Minh") as well as an id
+        if _looks_like_name(user_id) and hasattr(handler, 'resolve_entity'):
+            user = await handler.resolve_entity("user", user_id, project_id=project_id)
+            if user:
+                user_id = str(user.get("id"))
+        
         # Call handler method (supports sync/async)
         # Fix: Ensure we await the result since this is an async tool
         # Correctly pass the function object, not string
@@ -47,7 +47,15 @@ class RetrieverTool(BaseTool):
         keywords: str,
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
     ) -> list[Document]:
-        return self._run(keywords, run_manager.get_sync())
+        logger.info(
+            f"Retriever tool query: {keywords}", extra={"resources": self.resources}
+        )
+        documents = await self.retriever.aquery_relevant_documents(
+            keywords, self.resources
+        )
+        if not documents:
+            return "No results found from the local knowledge base."
+        return [doc.to_dict() for doc in documents]
 
 
 def get_retriever_tool(resources: List[Resource]) -> RetrieverTool | None:
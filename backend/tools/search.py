@@ -4,6 +4,8 @@
 import logging
 import os
 import json
+import threading
+import time
 from typing import List, Optional, Any
 from langchain.tools import BaseTool
 from langchain.callbacks.manager import CallbackManagerForToolRun
@@ -151,6 +153,8 @@ class ArxivAPIWrapper:
         pass
 
 from shared.config import SELECTED_SEARCH_ENGINE, SearchEngine, load_yaml_config
+from shared.config.loader import get_int_env
+from backend.crawler.web_cache import get_web_cache
 from backend.tools.decorators import create_logged_tool
 from backend.tools.tavily_search.tavily_search_results_with_images import (
     TavilySearchWithImages,
@@ -158,10 +162,130 @@ from backend.tools.tavily_search.tavily_search_results_with_images import (
 
 logger = logging.getLogger(__name__)
 
-# Create logged versions of the search tools
-LoggedTavilySearch = create_logged_tool(TavilySearchWithImages)
-LoggedDuckDuckGoSearch = create_logged_tool(DuckDuckGoSearchResults)
-LoggedBraveSearch = create_logged_tool(BraveSearch)
+SEARCH_NAMESPACE = "search"
+
+# Tool attributes that change what a query returns; API keys are deliberately
+# left out so rotating a key does not invalidate cached results
+_SEARCH_CACHE_PARAMS = (
+    "max_results",
+    "num_results",
+    "include_domains",
+    "exclude_domains",
+    "include_answer",
+    "search_depth",
+    "include_raw_content",
+    "include_images",
+    "include_image_descriptions",
+)
+
+
+def _is_error_result(content: Any) -> bool:
+    if not isinstance(content, str):
+        return False
+    if "ERROR:" in content[:64]:
+        return True
+    try:
+        parsed = json.loads(content)
+    except (TypeError, ValueError):
+        return False
+    return isinstance(parsed, dict) and "error" in parsed
+
+
+class WebCachedSearchMixin:
+    """
+    Serves repeated queries from the persistent web cache.
+
+    Results are keyed by tool class, tool name, query and the parameters in
+    _SEARCH_CACHE_PARAMS, and expire after WEB_CACHE_SEARCH_TTL_SECONDS.
+    Error results are never cached.
+    """
+
+    def _search_cache_identity(self, args: tuple, kwargs: dict) -> Optional[dict]:
+        query = kwargs.get("query", args[0] if args else None)
+        if not isinstance(query, str) or not query.strip():
+            return None
+        params = {name: getattr(self, name) for name in _SEARCH_CACHE_PARAMS if hasattr(self, name)}
+        return {
+            "tool": type(self).__name__,
+            "name": getattr(self, "name", ""),
+            "query": " ".join(query.split()),
+            "params": params,
+        }
+
+    def _load_cached_result(self, identity: Optional[dict]) -> Any:
+        cache = get_web_cache() if identity else None
+        if cache is None:
+            return None
+        try:
+            cached = cache.get_json(
+                SEARCH_NAMESPACE, identity, ttl_seconds=get_int_env("WEB_CACHE_SEARCH_TTL_SECONDS", 3600)
+            )
+        except Exception as e:
+            logger.warning(f"Search cache read failed: {e}")
+            return None
+        if cached is None:
+            return None
+        logger.info(f"Search cache hit for query: {identity['query']}")
+        if "artifact" in cached:
+            return cached["content"], cached["artifact"]
+        return cached["content"]
+
+    def _store_result(self, identity: Optional[dict], result: Any) -> None:
+        cache = get_web_cache() if identity else None
+        if cache is None:
+            return
+        if isinstance(result, tuple) and len(result) == 2:
+            content, artifact = result
+            if not artifact or _is_error_result(content):
+                return
+            entry = {"content": content, "artifact": artifact}
+        elif isinstance(result, str) and not _is_error_result(result):
+            entry = {"content": result}
+        else:
+            return
+        try:
+            cache.set_json(SEARCH_NAMESPACE, identity, entry)
+        except Exception as e:
+            logger.warning(f"Search cache write failed: {e}")
+
+    def _run(self, *args: Any, **kwargs: Any) -> Any:
+        identity = self._search_cache_identity(args, kwargs)
+        cached = self._load_cached_result(identity)
+        if cached is not None:
+            return cached
+        result = super()._run(*args, **kwargs)
+        self._store_result(identity, result)
+        return result
+
+    async def _arun(self, *args: Any, **kwargs: Any) -> Any:
+        if getattr(super()._arun, "__func__", None) is BaseTool._arun:
+            # The default _arun runs _run in an executor, which is already cached
+            return await super()._arun(*args, **kwargs)
+        identity = self._search_cache_identity(args, kwargs)
+        cached = self._load_cached_result(identity)
+        if cached is not None:
+            return cached
+        result = await super()._arun(*args, **kwargs)
+        self._store_result(identity, result)
+        return result
+
+
+def create_cached_search_tool(base_tool_class: Any) -> Any:
+    """Subclass a search tool so its results go through the web cache."""
+
+    class CachedSearchTool(WebCachedSearchMixin, base_tool_class):
+        pass
+
+    CachedSearchTool.__name__ = base_tool_class.__name__
+    CachedSearchTool.__qualname__ = base_tool_class.__qualname__
+    CachedSearchTool.__module__ = base_tool_class.__module__
+    return CachedSearchTool
+
+
+# Create logged, cached versions of the search tools
+LoggedTavilySearch = create_logged_tool(create_cached_search_tool(TavilySearchWithImages))
+LoggedDuckDuckGoSearch = create_logged_tool(create_cached_search_tool(DuckDuckGoSearchResults))
+LoggedBraveSearch = create_logged_tool(create_cached_search_tool(BraveSearch))
 LoggedArxivSearch = create_logged_tool(ArxivQueryRun)
 LoggedSearxSearch = create_logged_tool(SearxSearchRun)
 LoggedWikipediaSearch = create_logged_tool(WikipediaQueryRun)
@@ -173,7 +297,38 @@ def get_search_config():
     return search_config
 
 
+_provider_cache: dict[Optional[str], tuple[float, dict]] = {}
+_provider_cache_lock = threading.Lock()
+
+
 def get_search_provider_from_db(provider_id: Optional[str] = None):
+    """
+    Get search provider configuration, memoized for SEARCH_PROVIDER_CACHE_TTL_SECONDS.
+
+    Tools are rebuilt for every researcher step, so the provider row is only
+    re-read from the database once the TTL has passed or after
+    clear_search_provider_cache() (called when providers are saved).
+    """
+    ttl = get_int_env("SEARCH_PROVIDER_CACHE_TTL_SECONDS", 60)
+    now = time.monotonic()
+    with _provider_cache_lock:
+        cached = _provider_cache.get(provider_id)
+        if cached is not None and now - cached[0] < ttl:
+            return dict(cached[1])
+
+    provider = _load_search_provider_from_db(provider_id)
+    if ttl > 0:
+        with _provider_cache_lock:
+            _provider_cache[provider_id] = (now, provider)
+    return dict(provider)
+
+
+def clear_search_provider_cache() -> None:
+    with _provider_cache_lock:
+        _provider_cache.clear()
+
+
+def _load_search_provider_from_db(provider_id: Optional[str] = None):
     """Get search provider configuration from database"""
     try:
         from database.connection import get_db_session
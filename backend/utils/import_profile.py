@@ -0,0 +1,78 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""
+Startup import profile of the API server.
+
+Imports a module in a fresh interpreter with ``-X importtime`` and reports
+where the time went: the slowest modules by cumulative time (a module plus
+everything it imported first) and the self time per top-level package.
+Used by ``python server.py --profile-imports``.
+"""
+
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+IMPORT_TIME_PREFIX = "import time:"
+
+
+@dataclass
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_import_times(lines: Iterable[str]) -> list[ImportTiming]:
+    """Parse ``-X importtime`` output (stderr) into timings, in output order."""
+    timings = []
+    for line in lines:
+        if not line.startswith(IMPORT_TIME_PREFIX):
+            continue
+        parts = line[len(IMPORT_TIME_PREFIX):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            # The header row
+            continue
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        # Nested imports are indented by two spaces per level after the first space
+        depth = (len(name) - len(stripped) - 1) // 2
+        timings.append(ImportTiming(stripped, int(parts[0]), int(parts[1]), depth))
+    return timings
+
+
+def profile_imports(module: str = "backend.server.app", python: Optional[str] = None) -> list[ImportTiming]:
+    """Import ``module`` in a child interpreter and return its import timings."""
+    result = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        detail = result.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        raise RuntimeError(f"Importing {module} failed: {detail[0]}")
+    return parse_import_times(result.stderr.splitlines())
+
+
+def format_import_report(timings: list[ImportTiming], top: int = 25) -> str:
+    """Render the slowest modules and per-package totals as a text table."""
+    total_us = sum(t.cumulative_us for t in timings if t.depth == 0)
+    lines = [f"Total import time: {total_us / 1e6:.2f}s ({len(timings)} modules)", ""]
+
+    lines.append(f"Slowest {top} modules (cumulative):")
+    lines.append(f"{'cumulative':>12} {'self':>10}  module")
+    for t in sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top]:
+        lines.append(f"{t.cumulative_us / 1e3:>10.1f}ms {t.self_us / 1e3:>8.1f}ms  {'  ' * t.depth}{t.module}")
+
+    packages: dict[str, int] = defaultdict(int)
+    for t in timings:
+        packages[t.module.split(".")[0]] += t.self_us
+    lines.append("")
+    lines.append(f"Slowest {top} packages (self time):")
+    for package, self_us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]:
+        lines.append(f"{self_us / 1e3:>10.1f}ms  {package}")
+    return "\n".join(lines)
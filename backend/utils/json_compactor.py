@@ -0,0 +1,610 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""
+Single-pass, budget-aware compaction of large JSON tool responses.
+
+``json_utils._compress_large_array`` walks task lists several times (counting,
+sorting, de-duplicating samples), serializes the whole result and may then
+re-parse it in ``_truncate_json_safely`` to fit the limit. The compactor here
+computes summary aggregates and picks samples in one pass with bounded memory,
+serializes each kept item exactly once, and stops adding items when the output
+budget is met. Top-level lists are decoded item by item straight from the text
+(``json.scanner``), so decoding stops there too.
+
+With no budget the output matches ``_compress_large_array`` for the shapes PM
+tools return (``{"tasks": [...]}``, ``{"sprints": [...]}``,
+``{"projects": [...]}`` and top-level arrays).
+"""
+
+import heapq
+import json
+import json.scanner
+import logging
+import re
+from typing import Any, Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+_decoder = json.JSONDecoder()
+_scan_once = json.scanner.make_scanner(_decoder)
+# json.dumps builds a new encoder per call when options are passed; items are
+# serialized one by one here, so reuse a single one
+_encoder = json.JSONEncoder(ensure_ascii=False, default=str)
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+HIGH_PRIORITIES = ("high", "critical", "urgent")
+DONE_STATUSES = ("done", "completed", "closed")
+TASK_KEYS = ("status", "priority", "assigned_to", "assignee", "task_id", "title")
+
+TRUNCATION_NOTE = (
+    "Result was truncated to fit token limits. This is a COMPLETE result - "
+    "do NOT retry this tool call."
+)
+
+SPRINT_SEARCH_NOTE = (
+    "✅ ALL sprint IDs and names are preserved. To find a specific sprint "
+    "(e.g., 'Sprint 4'): 1) Search through the 'sprints' array, 2) Look for a "
+    "sprint where the 'name' field contains the number (e.g., '4' or 'Sprint 4'), "
+    "3) Extract the 'id' field from that sprint, 4) Use that 'id' in subsequent "
+    "tool calls."
+)
+
+
+def _skip_ws(text: str, pos: int) -> int:
+    return _WHITESPACE.match(text, pos).end()
+
+
+def _expect(text: str, pos: int, char: str) -> int:
+    pos = _skip_ws(text, pos)
+    if pos >= len(text) or text[pos] != char:
+        raise json.JSONDecodeError(f"Expecting '{char}'", text, pos)
+    return pos + 1
+
+
+class _ArrayReader:
+    """
+    Lazily decodes the items of the JSON array starting at ``text[pos]``.
+
+    Iterating yields one decoded item at a time; ``end`` holds the position
+    just after the closing bracket once the iterator is exhausted.
+    """
+
+    def __init__(self, text: str, pos: int):
+        self.text = text
+        self.end = _expect(text, pos, "[")
+
+    def __iter__(self) -> Iterator[Any]:
+        text = self.text
+        scan, skip_ws = _scan_once, _WHITESPACE.match
+        pos = skip_ws(text, self.end).end()
+        if text.startswith("]", pos):
+            self.end = pos + 1
+            return
+        while True:
+            try:
+                item, pos = scan(text, pos)
+            except StopIteration as err:
+                raise json.JSONDecodeError("Expecting value", text, err.value) from None
+            yield item
+            pos = skip_ws(text, pos).end()
+            char = text[pos:pos + 1]
+            if char == ",":
+                pos = skip_ws(text, pos + 1).end()
+            elif char == "]":
+                self.end = pos + 1
+                return
+            else:
+                raise json.JSONDecodeError("Expecting ',' or ']'", text, pos)
+
+
+def iter_array_items(text: str, pos: int = 0) -> Iterator[Any]:
+    """Lazily decode the items of the JSON array starting at ``text[pos]``."""
+    return iter(_ArrayReader(text, pos))
+
+
+def is_sprint_item(item: Any) -> bool:
+    """Sprints have a status and dates but none of the task fields."""
+    return (
+        isinstance(item, dict)
+        and "id" in item
+        and "name" in item
+        and "status" in item
+        and ("project_id" in item or "start_date" in item or "end_date" in item)
+        and not any(
+            key in item
+            for key in ("priority", "assigned_to", "assignee", "task_id", "title", "description")
+        )
+    )
+
+
+def is_project_item(item: Any) -> bool:
+    """Projects have an id and a name but no status or task fields."""
+    return (
+        isinstance(item, dict)
+        and "id" in item
+        and "name" in item
+        and not any(key in item for key in TASK_KEYS)
+    )
+
+
+def is_task_item(item: Any) -> bool:
+    return isinstance(item, dict) and any(key in item for key in TASK_KEYS)
+
+
+def compact_task(task: Any) -> Any:
+    """Keep id, title, status, assignee, priority and due date of a task."""
+    if not isinstance(task, dict):
+        return task
+    compacted = {}
+    for target, sources in (
+        ("id", ("id", "task_id")),
+        ("title", ("title", "name")),
+        ("status", ("status",)),
+        ("assignee", ("assigned_to", "assignee")),
+        ("priority", ("priority",)),
+        ("due_date", ("due_date", "end_date")),
+    ):
+        for source in sources:
+            if source in task:
+                compacted[target] = task[source]
+                break
+    return compacted
+
+
+def _compact_fields(
+    item: Any,
+    essential_fields: tuple[str, ...],
+    optional_fields: tuple[str, ...],
+    drop_fields: tuple[str, ...] = (),
+) -> Any:
+    """Keep essential fields, shorten optional ones and keep only small scalars otherwise."""
+    if not isinstance(item, dict):
+        return item
+    compacted = {}
+    for field in essential_fields:
+        if field in item:
+            compacted[field] = item[field]
+    for field in optional_fields:
+        if field in item:
+            value = item[field]
+            compacted[field] = value[:30] + "..." if isinstance(value, str) and len(value) > 30 else value
+    for key, value in item.items():
+        if key in essential_fields or key in optional_fields or key in drop_fields:
+            continue
+        if isinstance(value, str):
+            if len(value) <= 50:
+                compacted[key] = value
+        elif isinstance(value, (int, float, bool, type(None))):
+            compacted[key] = value
+    return compacted
+
+
+def compact_project(project: Any) -> Any:
+    """Keep id, name and key of a project; shorten or drop everything else."""
+    return _compact_fields(project, ("id", "name", "key"), ("status", "description"))
+
+
+def compact_sprint(sprint: Any) -> Any:
+    """Keep id, name and status of a sprint; shorten or drop everything else."""
+    return _compact_fields(
+        sprint,
+        ("id", "name", "status"),
+        ("project_id", "start_date", "end_date"),
+        ("goal", "capacity_hours", "planned_hours", "created_at", "updated_at"),
+    )
+
+
+class TaskSummaryAccumulator:
+    """
+    Computes task list statistics and picks representative samples in one pass.
+
+    Only ``max_items`` tasks of each sample pool are retained (the first tasks,
+    the first high priority tasks and a min-heap of the most recently updated
+    tasks), so memory does not grow with the length of the list.
+    """
+
+    def __init__(self, max_items: int):
+        self.max_items = max_items
+        self.total = 0
+        self.status_counts: dict[Any, int] = {}
+        self.priority_counts: dict[Any, int] = {}
+        self.assignee_counts: dict[Any, int] = {}
+        self.total_hours = 0
+        self.completed_hours = 0
+        self.head: list[Any] = []
+        self._high_priority: list[tuple[int, Any]] = []
+        # Entries are (date, -index, index, task) so that, like a stable
+        # descending sort, earlier tasks win ties on the same date
+        self._recent: list[tuple[str, int, int, Any]] = []
+
+    def add(self, task: Any) -> None:
+        index = self.total
+        self.total += 1
+        if len(self.head) < self.max_items:
+            self.head.append(task)
+        if not isinstance(task, dict):
+            return
+
+        status = task.get("status", "unknown")
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+        priority = task.get("priority", "unknown")
+        self.priority_counts[priority] = self.priority_counts.get(priority, 0) + 1
+
+        assignee = task.get("assigned_to") or task.get("assignee") or "unassigned"
+        self.assignee_counts[assignee] = self.assignee_counts.get(assignee, 0) + 1
+
+        hours = task.get("estimated_hours", 0) or 0
+        self.total_hours += hours
+        if status in DONE_STATUSES:
+            self.completed_hours += hours
+
+        if priority in HIGH_PRIORITIES and len(self._high_priority) < self.max_items // 2:
+            self._high_priority.append((index, task))
+
+        updated = task.get("updated_at") or task.get("created_at")
+        if updated and self.max_items > 0:
+            recent = self._recent
+            if len(recent) < self.max_items:
+                heapq.heappush(recent, (str(updated), -index, index, task))
+            # Only a strictly newer date displaces an entry: on equal dates the
+            # earlier task is kept
+            elif str(updated) > recent[0][0]:
+                heapq.heapreplace(recent, (str(updated), -index, index, task))
+
+    def statistics(self) -> dict[str, Any]:
+        return {
+            "_summary_type": "statistics",
+            "total_tasks": self.total,
+            "status_breakdown": self.status_counts,
+            "priority_breakdown": self.priority_counts,
+            "assignee_breakdown": self.assignee_counts,
+            "total_estimated_hours": round(self.total_hours, 1),
+            "completed_hours": round(self.completed_hours, 1),
+            "completion_percentage": round(
+                (self.completed_hours / self.total_hours * 100) if self.total_hours > 0 else 0, 1
+            ),
+        }
+
+    def samples(self) -> list[Any]:
+        """High priority tasks first (up to half), then the most recent, then the first tasks."""
+        sample_count = min(self.max_items, self.total)
+        samples: list[Any] = []
+        seen: set[int] = set()
+
+        def take(entries: list[tuple[int, Any]]) -> None:
+            for index, task in entries:
+                if len(samples) >= sample_count:
+                    return
+                if index not in seen:
+                    seen.add(index)
+                    samples.append(task)
+
+        take(self._high_priority[: sample_count // 2])
+        take([(index, task) for _, _, index, task in sorted(self._recent, reverse=True)])
+        take(list(enumerate(self.head)))
+        return samples
+
+    def summary(self, samples: Optional[list[Any]] = None) -> list[Any]:
+        """Statistics item followed by a samples item, as ``_create_task_summary`` returns."""
+        if not self.total:
+            return []
+        if samples is None:
+            samples = self.samples()
+        items: list[Any] = [self.statistics()]
+        if samples:
+            items.append({
+                "_summary_type": "samples",
+                "_note": f"Showing {len(samples)} representative tasks (high priority and recent)",
+                "_samples": samples,
+            })
+        return items
+
+
+def _dumps(value: Any) -> str:
+    return _encoder.encode(value)
+
+
+class _Raw(str):
+    """Already serialized JSON text, embedded as-is by ``_encode_object``/``_encode_array``."""
+
+
+def _encode(value: Any) -> str:
+    return value if isinstance(value, _Raw) else _dumps(value)
+
+
+def _encode_object(members: dict[str, Any]) -> _Raw:
+    """Serialize one object level like json.dumps, embedding ``_Raw`` values."""
+    return _Raw("{" + ", ".join(f"{_dumps(k)}: {_encode(v)}" for k, v in members.items()) + "}")
+
+
+def _encode_array(items: list[Any]) -> _Raw:
+    """Serialize one array level like json.dumps, embedding ``_Raw`` items."""
+    return _Raw("[" + ", ".join(_encode(item) for item in items) + "]")
+
+
+class _Budget:
+    """Characters that may still be emitted; unlimited when max_length is None."""
+
+    def __init__(self, max_length: Optional[int]):
+        self.remaining = float("inf") if max_length is None else max_length
+
+    def spend(self, size: int) -> None:
+        self.remaining -= size
+
+    def fit(self, items: Iterator[Any], count_rest: bool = True) -> tuple[list[str], int]:
+        """
+        Serialize items while they fit the budget; each item is serialized once.
+
+        Returns (fragments, omitted). With ``count_rest`` unset, iteration stops
+        at the first item that does not fit and ``omitted`` is -1 if any were left.
+        """
+        fragments: list[str] = []
+        for item in items:
+            fragment = _dumps(item)
+            # +2 for the item separator
+            if len(fragment) + 2 > self.remaining:
+                if not count_rest:
+                    return fragments, -1
+                return fragments, 1 + sum(1 for _ in items)
+            self.remaining -= len(fragment) + 2
+            fragments.append(fragment)
+        return fragments, 0
+
+
+def _samples_item(note: str, fragments: list[str]) -> _Raw:
+    return _encode_object({
+        "_summary_type": "samples",
+        "_note": note,
+        "_samples": _Raw("[" + ", ".join(fragments) + "]"),
+    })
+
+
+class _NamedList:
+    """A "tasks", "sprints" or "projects" member, walked once."""
+
+    def __init__(self, key: str, items: list[Any], max_items: int):
+        self.key = key
+        self.first: Any = None
+        self.items: list[Any] = []
+        self.accumulator: Optional[TaskSummaryAccumulator] = None
+
+        items = iter(items)
+        for self.first in items:
+            break
+        else:
+            return
+
+        if key == "tasks":
+            self.accumulator = TaskSummaryAccumulator(max_items)
+            add = self.accumulator.add
+            add(self.first)
+            for item in items:
+                add(item)
+        elif self.matches:
+            compact = compact_sprint if key == "sprints" else compact_project
+            self.items = [compact(self.first)] + [compact(item) for item in items]
+        else:
+            self.items = [self.first] + list(items)
+
+    @property
+    def matches(self) -> bool:
+        """Whether the list has the shape its compaction rule expects."""
+        first = self.first
+        if not isinstance(first, dict) or "id" not in first or "name" not in first:
+            return False
+        return self.key == "projects" or "status" in first
+
+    @property
+    def length(self) -> int:
+        return self.accumulator.total if self.accumulator else len(self.items)
+
+
+def _compact_object(data: dict[str, Any], max_items: int, budget: _Budget) -> _Raw:
+    """Compact a decoded JSON object, walking each named list once."""
+    from backend.utils.json_utils import _compress_large_array
+
+    lists = {
+        key: _NamedList(key, data[key], max_items)
+        for key in ("tasks", "sprints", "projects")
+        if isinstance(data.get(key), list)
+    }
+
+    sprints, projects, tasks = (lists.get(k) for k in ("sprints", "projects", "tasks"))
+    if sprints and sprints.length and sprints.matches:
+        target, extra = sprints, {
+            "_compressed": True,
+            "_compression_method": "sprint_list_preserve_ids",
+            "_note": SPRINT_SEARCH_NOTE,
+        }
+    elif projects and projects.length and projects.matches:
+        target, extra = projects, {
+            "_compressed": True,
+            "_compression_method": "project_list_preserve_ids",
+        }
+    elif tasks and tasks.length > max_items:
+        target, extra = tasks, {
+            "_total_tasks": tasks.length,
+            "_compressed": True,
+            "_compression_method": "intelligent_summary",
+        }
+    else:
+        target, extra = None, {}
+
+    result: dict[str, Any] = {}
+    for key, value in data.items():
+        named = lists.get(key)
+        if named is not None and named is target:
+            # Filled in below with whatever budget the other members leave
+            result[key] = _Raw("[]")
+            continue
+        if named is not None:
+            if named.accumulator is None:
+                value = named.items
+            elif named.length > max_items:
+                value = named.accumulator.summary()
+            else:
+                value = named.accumulator.head
+        if target is None:
+            value = _compress_large_array(value, max_items)
+        result[key] = _Raw(_dumps(value))
+    result.update(extra)
+    if target is None:
+        return _encode_object(result)
+
+    # Everything except the selected list is emitted first; the selected list
+    # gets whatever budget is left
+    result[target.key] = _Raw("[]")
+    # +40 leaves room for the "_omitted_*" count
+    budget.spend(sum(len(k) + len(_encode(v)) + 6 for k, v in result.items()) + 40)
+    if target.accumulator is not None:
+        statistics = _dumps(target.accumulator.statistics())
+        budget.spend(len(statistics) + 150)
+        fragments, omitted = budget.fit(iter(target.accumulator.samples()))
+        items = [_Raw(statistics)]
+        if fragments:
+            note = f"Showing {len(fragments)} representative tasks (high priority and recent)"
+            items.append(_samples_item(note, fragments))
+        result[target.key] = _encode_array(items)
+        logger.info(
+            f"Compacted task list from {target.length} to summary in one pass "
+            f"({len(fragments)} samples)"
+        )
+    else:
+        fragments, omitted = budget.fit(iter(target.items))
+        result[target.key] = _Raw("[" + ", ".join(fragments) + "]")
+        logger.info(
+            f"Compacted {target.key} list in one pass: kept {len(fragments)} "
+            f"of {target.length} items (preserved ids/names)"
+        )
+    if omitted:
+        result[f"_omitted_{target.key}"] = omitted
+    return _encode_object(result)
+
+
+def _compact_list(items: Iterable[Any], max_items: int, budget: _Budget) -> tuple[_Raw, bool]:
+    """
+    Compact a top-level list, consuming ``items`` lazily.
+
+    Returns (json_text, complete); ``complete`` is False when iteration
+    stopped early because the budget was met.
+    """
+    from backend.utils.json_utils import _compress_large_array
+
+    items = iter(items)
+    buffered: list[Any] = []
+    for item in items:
+        buffered.append(item)
+        if len(buffered) > max_items:
+            break
+    else:
+        return _Raw(_dumps([_compress_large_array(item, max_items) for item in buffered])), True
+
+    def all_items() -> Iterator[Any]:
+        yield from buffered
+        yield from items
+
+    first = buffered[0]
+    if is_sprint_item(first):
+        compact, kind = compact_sprint, "sprint"
+    elif is_project_item(first):
+        compact, kind = compact_project, "project"
+    elif is_task_item(first):
+        compact, kind = compact_task, "task"
+    else:
+        return _summarize_array(all_items(), max_items, budget), True
+
+    marker = {"_summary_type": "truncated", "_shown_items": 0, "_note": TRUNCATION_NOTE}
+    # Leave room for the marker reporting that items were left out
+    budget.spend(len(_dumps(marker)) + 12)
+    fragments, omitted = budget.fit((compact(item) for item in all_items()), count_rest=False)
+    if not omitted:
+        return _Raw("[" + ", ".join(fragments) + "]"), True
+
+    marker["_shown_items"] = len(fragments)
+    logger.info(
+        f"Compacted {kind} list in one pass: kept {len(fragments)} items, "
+        f"stopped once the budget was met"
+    )
+    return _Raw("[" + ", ".join(fragments + [_dumps(marker)]) + "]"), False
+
+
+def _summarize_array(items: Iterator[Any], max_items: int, budget: _Budget) -> _Raw:
+    """Type breakdown plus per-type samples of an array of arbitrary values."""
+    type_counts: dict[str, int] = {}
+    samples_by_type: dict[str, list[Any]] = {}
+    total = 0
+    for item in items:
+        total += 1
+        item_type = type(item).__name__
+        type_counts[item_type] = type_counts.get(item_type, 0) + 1
+        type_samples = samples_by_type.setdefault(item_type, [])
+        if len(type_samples) < max_items:
+            type_samples.append(item)
+
+    summary = _dumps({
+        "_summary_type": "array_summary",
+        "total_items": total,
+        "type_breakdown": type_counts,
+        "_note": f"Array contains {total} items across {len(type_counts)} types",
+    })
+    samples: list[Any] = []
+    samples_per_type = max(1, max_items // len(type_counts))
+    for type_samples in samples_by_type.values():
+        samples.extend(type_samples[:samples_per_type])
+        if len(samples) >= max_items:
+            break
+    budget.spend(len(summary) + 100)
+    fragments, _ = budget.fit(iter(samples[:max_items]))
+    items_out = [_Raw(summary)]
+    if fragments:
+        items_out.append(_samples_item(f"Showing {len(fragments)} representative items", fragments))
+    return _encode_array(items_out)
+
+
+def compact_json(content: str, max_length: Optional[int] = None, max_items: int = 20) -> str:
+    """
+    Compact a JSON tool response in a single streaming pass.
+
+    Task lists under a "tasks" key are reduced to statistics plus representative
+    samples, sprint and project lists keep the searchable fields of every item,
+    and long top-level arrays are compacted per item or summarized by type.
+    Items are serialized once, and only while the output fits ``max_length``
+    characters; what was left out is reported in the result instead of
+    cutting the JSON text. A top-level list is decoded lazily and decoding
+    stops as soon as the budget is met.
+
+    Args:
+        content: JSON text of a tool response (object or array)
+        max_length: Output budget in characters, or None for no budget
+        max_items: Maximum number of samples per summarized list
+
+    Returns:
+        Compacted JSON string
+
+    Raises:
+        json.JSONDecodeError: If content is not a JSON object or array
+    """
+    start = _skip_ws(content, 0)
+    budget = _Budget(max_length)
+    if content.startswith("[", start) and max_length is not None:
+        # Stream top-level lists so decoding stops once the budget is met
+        reader = _ArrayReader(content, start)
+        result, complete = _compact_list(reader, max_items, budget)
+        if complete and _skip_ws(content, reader.end) != len(content):
+            raise json.JSONDecodeError("Extra data", content, reader.end)
+    elif content.startswith(("{", "["), start):
+        # Everything has to be read for the statistics anyway, and json.loads
+        # decodes a whole document faster than item by item
+        data = json.loads(content)
+        if isinstance(data, dict):
+            result = _compact_object(data, max_items, budget)
+        else:
+            result, _ = _compact_list(data, max_items, budget)
+    else:
+        raise json.JSONDecodeError("Expecting JSON object or array", content, start)
+
+    if max_length is not None and len(result) > max_length and result.startswith("{") and result != "{}":
+        result = f'{result[:-1]}, "_truncation_note": {_dumps(TRUNCATION_NOTE)}}}'
+    return str(result)
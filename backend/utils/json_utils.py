@@ -8,6 +8,8 @@ from typing import Any
 
 import json_repair
 
+from backend.utils.json_compactor import TaskSummaryAccumulator, compact_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -142,6 +144,9 @@ def _create_task_summary(tasks: list, max_items: int) -> list:
     """
     Create an intelligent summary of tasks by grouping and aggregating data.
     
+    Statistics and samples are computed in a single pass (see
+    ``json_compactor.TaskSummaryAccumulator``).
+    
     Args:
         tasks: List of task dictionaries
         max_items: Maximum number of sample tasks to include
@@ -149,101 +154,10 @@ def _create_task_summary(tasks: list, max_items: int) -> list:
     Returns:
         List containing summary statistics and representative samples
     """
-    if not tasks:
-        return []
-    
-    # Analyze all tasks to create comprehensive summary
-    status_counts = {}
-    priority_counts = {}
-    assignee_counts = {}
-    total_hours = 0
-    completed_hours = 0
-    high_priority_tasks = []
-    recent_tasks = []
-    
+    accumulator = TaskSummaryAccumulator(max_items)
     for task in tasks:
-        if isinstance(task, dict):
-            # Count by status
-            status = task.get("status", "unknown")
-            status_counts[status] = status_counts.get(status, 0) + 1
-            
-            # Count by priority
-            priority = task.get("priority", "unknown")
-            priority_counts[priority] = priority_counts.get(priority, 0) + 1
-            
-            # Count by assignee
-            assignee = task.get("assigned_to") or task.get("assignee") or "unassigned"
-            assignee_counts[assignee] = assignee_counts.get(assignee, 0) + 1
-            
-            # Sum hours
-            hours = task.get("estimated_hours", 0) or 0
-            total_hours += hours
-            if status in ["done", "completed", "closed"]:
-                completed_hours += hours
-            
-            # Collect high priority tasks
-            if priority in ["high", "critical", "urgent"]:
-                high_priority_tasks.append(task)
-            
-            # Collect recent tasks (by updated_at or created_at)
-            if task.get("updated_at") or task.get("created_at"):
-                recent_tasks.append(task)
-    
-    # Sort recent tasks by date (most recent first)
-    recent_tasks.sort(
-        key=lambda t: t.get("updated_at") or t.get("created_at") or "",
-        reverse=True
-    )
-    
-    # Create summary structure
-    summary_items = []
-    
-    # Overall statistics
-    summary_items.append({
-        "_summary_type": "statistics",
-        "total_tasks": len(tasks),
-        "status_breakdown": status_counts,
-        "priority_breakdown": priority_counts,
-        "assignee_breakdown": assignee_counts,
-        "total_estimated_hours": round(total_hours, 1),
-        "completed_hours": round(completed_hours, 1),
-        "completion_percentage": round((completed_hours / total_hours * 100) if total_hours > 0 else 0, 1)
-    })
-    
-    # Representative samples: high priority tasks first, then recent tasks
-    samples = []
-    sample_count = min(max_items, len(tasks))
-    
-    # Add high priority tasks as samples (up to half of max_items)
-    high_priority_samples = min(len(high_priority_tasks), sample_count // 2)
-    samples.extend(high_priority_tasks[:high_priority_samples])
-    
-    # Add recent tasks as samples (fill remaining slots)
-    remaining_slots = sample_count - len(samples)
-    for task in recent_tasks:
-        if len(samples) >= sample_count:
-            break
-        # Avoid duplicates
-        if task not in samples:
-            samples.append(task)
-    
-    # If we still need more samples, add from the beginning
-    if len(samples) < sample_count:
-        for task in tasks:
-            if len(samples) >= sample_count:
-                break
-            if task not in samples:
-                samples.append(task)
-    
-    # Add samples with metadata
-    if samples:
-        summary_items.append({
-            "_summary_type": "samples",
-            "_note": f"Showing {len(samples)} representative tasks (high priority and recent)",
-            "_samples": samples
-        })
-    
-    return summary_items
+        accumulator.add(task)
+    return accumulator.summary()
 
 
 def _compress_project_list(projects: list) -> list:
@@ -612,33 +526,46 @@ def _truncate_json_safely(content: str, max_length: int) -> str:
     return content[:max_length]
 
 
-def sanitize_tool_response(content: str, max_length: int = 40000, compress_arrays: bool = True) -> str:
+def sanitize_tool_response(
+    content: str,
+    max_length: int = 40000,
+    compress_arrays: bool = True,
+    *,
+    compact: bool = False,
+) -> str:
     """
     Sanitize tool response to remove extra tokens and invalid content.
     
-    NOTE: Compression is DISABLED because the system has auto context compression
-    that kicks in at ~90% context usage. This function now only does basic cleanup.
+    NOTE: Compression is DISABLED by default because the system has auto context
+    compression that kicks in at ~90% context usage. PM data is returned intact
+    unless a caller explicitly opts in with ``compact=True``.
     
     This function:
     - Strips whitespace and trailing tokens
     - Extracts valid JSON from content with trailing garbage
     - Cleans up common garbage patterns (control characters)
+    - With ``compact=True``, compacts JSON longer than max_length in a single
+      streaming pass (see ``json_compactor.compact_json``). This is lossy.
+    
+    Non-JSON text is never cut.
     
     Args:
         content: Tool response content
-        max_length: IGNORED - no truncation applied (auto context compression handles this)
-        compress_arrays: IGNORED - no compression applied (auto context compression handles this)
+        max_length: Output budget in characters, only used with ``compact=True``
+        compress_arrays: IGNORED - kept for existing callers; use ``compact``
+        compact: Opt in to lossy compaction of JSON longer than max_length
         
     Returns:
-        Cleaned content string (no compression/truncation)
+        Cleaned content string (no compression/truncation unless compact is set)
     """
     if not content:
         return content
     
     content = content.strip()
+    is_json = content.startswith('{') or content.startswith('[')
     
     # Only extract valid JSON to remove trailing garbage tokens
-    if content.startswith('{') or content.startswith('['):
+    if is_json:
         content = _extract_json_from_content(content)
     
     # Remove common garbage patterns that appear from some models
@@ -650,5 +577,12 @@ def sanitize_tool_response(content: str, max_length: int = 40000, compress_array
     for pattern in garbage_patterns:
         content = re.sub(pattern, '', content)
     
+    if compact and is_json and len(content) > max_length:
+        try:
+            compacted = compact_json(content, max_length=max_length)
+            logger.info(f"Compacted tool response: {len(content):,} → {len(compacted):,} chars (budget={max_length:,})")
+            content = compacted
+        except json.JSONDecodeError:
+            pass
+    
     return content
-
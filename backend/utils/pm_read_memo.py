@@ -0,0 +1,123 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""
+Turn-scoped memo for PM Service reads.
+
+Within one chat turn the coordinator, PM agent, reporter and analytics tools
+often ask the PM Service for the same sprints, tasks, users and projects.
+``pm_read_scope()`` opens a ``PMReadMemo`` for the duration of a turn; while
+it is active ``PMServiceHandler`` answers repeated reads from memory and
+concurrent identical reads share one request. Any write through the handler
+clears the memo, so a turn never reads back data older than its own updates.
+
+The memo lives in a ContextVar, so it follows the turn into the tasks and
+worker threads LangGraph starts for nodes and tools, and concurrent turns
+never share one.
+"""
+
+import copy
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Hashable, Iterator, Optional
+
+from shared.concurrency import SingleFlight
+from shared.config.loader import get_bool_env
+
+logger = logging.getLogger(__name__)
+
+_current_memo: ContextVar[Optional["PMReadMemo"]] = ContextVar("pm_read_memo", default=None)
+
+
+class PMReadMemo:
+    """Read-through results of PM Service reads for one turn."""
+
+    def __init__(self):
+        self._entries: dict[Hashable, Any] = {}
+        self._flights: SingleFlight[Any] = SingleFlight()
+        self._lock = threading.Lock()
+        # Bumped by every write; loads started before a write are not stored
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+        self.invalidations = 0
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the memoized result for ``key``, running ``loader`` on a miss.
+
+        Callers get their own copy, so mutating a result does not change what
+        later readers see. Failed loads are not memoized.
+        """
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                return copy.deepcopy(self._entries[key])
+
+        async def load() -> Any:
+            with self._lock:
+                self.misses += 1
+                generation = self._generation
+            value = await loader()
+            with self._lock:
+                if generation == self._generation:
+                    self._entries[key] = value
+            return value
+
+        value = await self._flights.run(key, load, on_join=self._count_shared)
+        return copy.deepcopy(value)
+
+    def _count_shared(self) -> None:
+        with self._lock:
+            self.shared += 1
+
+    def invalidate(self) -> None:
+        """Forget every memoized read, e.g. after a write."""
+        with self._lock:
+            self._entries.clear()
+            self._flights.clear()
+            self._generation += 1
+            self.invalidations += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Hit counts for the turn; reads joined in flight count as hits."""
+        reads = self.hits + self.shared + self.misses
+        return {
+            "reads": reads,
+            "hits": self.hits,
+            "shared_in_flight": self.shared,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": round((self.hits + self.shared) / reads, 3) if reads else 0.0,
+        }
+
+
+def current_pm_read_memo() -> Optional[PMReadMemo]:
+    """The memo of the running turn, or None outside of one."""
+    return _current_memo.get()
+
+
+@contextmanager
+def pm_read_scope() -> Iterator[Optional[PMReadMemo]]:
+    """
+    Memoize PM reads until the block exits.
+
+    Yields None (and memoizes nothing) when ``PM_READ_MEMO_ENABLED`` is off.
+    A scope nested in another reuses the outer memo.
+    """
+    outer = _current_memo.get()
+    if outer is not None or not get_bool_env("PM_READ_MEMO_ENABLED", True):
+        yield outer
+        return
+
+    memo = PMReadMemo()
+    token = _current_memo.set(memo)
+    try:
+        yield memo
+    finally:
+        _current_memo.reset(token)
+        if memo.hits or memo.shared or memo.misses:
+            logger.info(f"[PM-READ-MEMO] Turn summary: {memo.stats()}")
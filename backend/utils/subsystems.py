@@ -0,0 +1,117 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""
+Lazily constructed subsystems of the API server.
+
+Graphs and heavy clients are registered with a factory instead of being built
+at import time. The first ``get()`` runs the factory (including its imports)
+and keeps the result; concurrent callers wait for that one build. Async
+code uses ``aget()`` so a build never blocks the event loop. After
+startup the server can ``prewarm()`` the registered subsystems in a worker
+thread, so the first request usually finds them ready without making the
+process wait for them before it accepts traffic.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Callable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _Entry:
+    def __init__(self, factory: Callable[[], Any], prewarm: bool):
+        self.factory = factory
+        self.prewarm = prewarm
+        self.value: Any = None
+        self.loaded = False
+        self.build_seconds: Optional[float] = None
+        self.error: Optional[str] = None
+        self.lock = threading.Lock()
+
+
+class SubsystemRegistry:
+    """Builds each registered subsystem once, on first use."""
+
+    def __init__(self):
+        self._entries: dict[str, _Entry] = {}
+
+    def register(self, name: str, factory: Callable[[], Any], prewarm: bool = True) -> None:
+        """
+        Register ``factory`` under ``name``.
+
+        Args:
+            name: Subsystem name used with ``get()``
+            factory: Builds the subsystem; should do its heavy imports itself
+            prewarm: Whether ``prewarm()`` builds it by default
+        """
+        self._entries[name] = _Entry(factory, prewarm)
+
+    def get(self, name: str) -> Any:
+        """Return the subsystem, building it first if needed."""
+        entry = self._entries[name]
+        if entry.loaded:
+            return entry.value
+        with entry.lock:
+            if not entry.loaded:
+                started = time.perf_counter()
+                try:
+                    entry.value = entry.factory()
+                except Exception as e:
+                    # Not cached: the next caller retries the build
+                    entry.error = str(e)
+                    raise
+                entry.build_seconds = time.perf_counter() - started
+                entry.error = None
+                entry.loaded = True
+                logger.info(f"[Subsystems] Built {name} in {entry.build_seconds:.2f}s")
+        return entry.value
+
+    async def aget(self, name: str) -> Any:
+        """``get()`` for async code: a build runs in a worker thread, not on the event loop."""
+        entry = self._entries[name]
+        if entry.loaded:
+            return entry.value
+        return await asyncio.to_thread(self.get, name)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._entries and self._entries[name].loaded
+
+    def reset(self, name: Optional[str] = None) -> None:
+        """Forget built subsystems (all, or just ``name``) so they are rebuilt on next use."""
+        for key in [name] if name is not None else list(self._entries):
+            entry = self._entries[key]
+            with entry.lock:
+                entry.value = None
+                entry.loaded = False
+                entry.build_seconds = None
+
+    def prewarm_sync(self, names: Optional[Iterable[str]] = None) -> None:
+        """Build subsystems one after another; failures are logged, not raised."""
+        if names is None:
+            names = [name for name, entry in self._entries.items() if entry.prewarm]
+        for name in names:
+            try:
+                self.get(name)
+            except Exception as e:
+                logger.warning(f"[Subsystems] Pre-warming {name} failed: {e}")
+
+    async def prewarm(self, names: Optional[Iterable[str]] = None) -> None:
+        """Build subsystems in a worker thread without blocking the event loop."""
+        started = time.perf_counter()
+        await asyncio.to_thread(self.prewarm_sync, list(names) if names is not None else None)
+        logger.info(f"[Subsystems] Pre-warm finished in {time.perf_counter() - started:.2f}s")
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        return {
+            name: {
+                "loaded": entry.loaded,
+                "build_seconds": round(entry.build_seconds, 3) if entry.build_seconds is not None else None,
+                "error": entry.error,
+            }
+            for name, entry in self._entries.items()
+        }
+
@@ -0,0 +1,114 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""
+Run the hot path benchmarks.
+
+Usage:
+    python -m benchmarks [-k FILTER] [--group GROUP] [--rounds 10]
+                         [--output results.json] [--compare [BASELINE]]
+                         [--threshold 0.2] [--save-baseline] [--list]
+"""
+
+import argparse
+import sys
+import traceback
+from pathlib import Path
+
+# Importing the bench modules registers their benchmarks
+from benchmarks import (  # noqa: F401
+    bench_analytics,
+    bench_context,
+    bench_mcp,
+    bench_pm_handler,
+    bench_providers,
+    bench_streaming,
+)
+from benchmarks.harness import (
+    compare,
+    format_comparison,
+    load_report,
+    make_report,
+    print_result,
+    registered,
+    run_case,
+    write_report,
+)
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark PM, analytics, streaming and MCP hot paths",
+    )
+    parser.add_argument("-k", dest="filter", help="Only run cases whose name contains this substring")
+    parser.add_argument("--group", action="append", help="Only run this group (repeatable)")
+    parser.add_argument("--rounds", type=int, default=10, help="Timed rounds per case")
+    parser.add_argument("--output", help="Write results JSON to this path")
+    parser.add_argument(
+        "--compare", nargs="?", const=str(DEFAULT_BASELINE),
+        help="Compare with a baseline results file (default: benchmarks/baseline.json)",
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.2,
+        help="Relative slowdown of the median that counts as a regression",
+    )
+    parser.add_argument("--save-baseline", action="store_true", help=f"Write results to {DEFAULT_BASELINE.name}")
+    parser.add_argument("--list", action="store_true", help="List cases and exit")
+    args = parser.parse_args(argv)
+
+    cases = [
+        (bench, name, kwargs)
+        for bench in registered()
+        if not args.group or bench.group in args.group
+        for name, kwargs in bench.cases()
+        if not args.filter or args.filter in name
+    ]
+    if args.list:
+        for bench, name, _ in cases:
+            print(f"{bench.group:<12} {name}")
+        return 0
+
+    results = []
+    failed = []
+    for bench, name, kwargs in cases:
+        try:
+            result = run_case(bench, name, kwargs, args.rounds)
+        except Exception:
+            print(f"{name:<60} FAILED", flush=True)
+            traceback.print_exc()
+            failed.append(name)
+            continue
+        print_result(result)
+        results.append(result)
+
+    report = make_report(results)
+    if args.output:
+        write_report(report, args.output)
+        print(f"\nResults written to {args.output}")
+    if args.save_baseline:
+        write_report(report, str(DEFAULT_BASELINE))
+        print(f"\nBaseline written to {DEFAULT_BASELINE}")
+
+    status = 1 if failed else 0
+    if args.compare:
+        comparisons = compare(load_report(args.compare), report)
+        if args.filter or args.group:
+            # Cases outside the selection are not missing, just not run
+            ran = {r.name for r in results} | set(failed)
+            comparisons = [c for c in comparisons if c.name in ran]
+        print()
+        print(format_comparison(comparisons, args.threshold))
+        regressed = [c.name for c in comparisons if c.status(args.threshold) == "regressed"]
+        if regressed:
+            print(f"\n{len(regressed)} regression(s) over {args.threshold:.0%}: {', '.join(regressed)}")
+            status = 1
+    if failed:
+        print(f"\n{len(failed)} case(s) failed: {', '.join(failed)}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""Every calculator in backend/analytics/calculators over synthetic sprints."""
+
+from datetime import date, datetime
+
+from benchmarks import data
+from benchmarks.harness import benchmark
+
+START = datetime(2025, 1, 6)
+END = datetime(2025, 5, 6)
+
+
+@benchmark("analytics.burndown", group="analytics", params={"items": [50, 500]})
+def burndown(items):
+    from backend.analytics.calculators.burndown import BurndownCalculator
+
+    sprint = data.sprints(1, items)[0]
+    return lambda: BurndownCalculator.calculate(sprint, "story_points")
+
+
+@benchmark("analytics.velocity", group="analytics", params={"sprints": [6, 24]})
+def velocity(sprints):
+    from backend.analytics.calculators.velocity import VelocityCalculator
+
+    history = data.sprints(sprints, 100)
+    return lambda: VelocityCalculator.calculate(history, "story_points")
+
+
+@benchmark("analytics.sprint_report", group="analytics", params={"items": [50, 500]})
+def sprint_report(items):
+    from backend.analytics.calculators.sprint_report import SprintReportCalculator
+
+    sprint = data.sprints(1, items)[0]
+    return lambda: SprintReportCalculator.calculate(sprint)
+
+
+@benchmark("analytics.capacity", group="analytics", params={"items": [100, 1000]})
+def capacity(items):
+    from backend.analytics.calculators.capacity import CapacityCalculator
+
+    work_items = data.work_items(items)
+    members = [m for m in data.ASSIGNEES if m]
+    return lambda: CapacityCalculator.calculate(work_items, members, date(2025, 1, 6), weeks=12)
+
+
+@benchmark("analytics.cfd", group="analytics", params={"items": [100, 1000]})
+def cfd(items):
+    from backend.analytics.calculators.cfd import calculate_cfd
+
+    work_items = data.analytics_items(items)
+    return lambda: calculate_cfd(work_items, START, END)
+
+
+@benchmark("analytics.cycle_time", group="analytics", params={"items": [100, 1000]})
+def cycle_time(items):
+    from backend.analytics.calculators.cycle_time import calculate_cycle_time
+
+    work_items = data.analytics_items(items)
+    return lambda: calculate_cycle_time(work_items)
+
+
+@benchmark("analytics.issue_trend", group="analytics", params={"items": [100, 1000]})
+def issue_trend(items):
+    from backend.analytics.calculators.issue_trend import calculate_issue_trend
+
+    work_items = data.analytics_items(items)
+    return lambda: calculate_issue_trend(work_items, START, END)
+
+
+@benchmark(
+    "analytics.work_distribution",
+    group="analytics",
+    params={"items": [100, 1000], "dimension": ["assignee", "status"]},
+)
+def work_distribution(items, dimension):
+    from backend.analytics.calculators.work_distribution import calculate_work_distribution
+
+    work_items = data.analytics_items(items)
+    return lambda: calculate_work_distribution(work_items, dimension)
@@ -0,0 +1,38 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""Tool response sanitizing and context accounting on the agent loop."""
+
+from benchmarks import data
+from benchmarks.harness import benchmark
+
+
+@benchmark(
+    "context.sanitize_tool_response",
+    group="context",
+    params={"tasks": [20, 500, 5000], "compact": [False, True]},
+)
+def sanitize_tool_response(tasks, compact):
+    """Cleanup only by default; with ``compact`` large responses are also compacted."""
+    from backend.utils.json_utils import sanitize_tool_response
+
+    content = data.tool_response(tasks)
+    return lambda: sanitize_tool_response(content, max_length=40000, compact=compact)
+
+
+@benchmark("context.count_tokens", group="context", params={"turns": [5, 40]})
+def count_tokens(turns):
+    from backend.utils.context_manager import ContextManager
+
+    manager = ContextManager(token_limit=128000, preserve_prefix_message_count=1)
+    messages = data.chat_messages(turns)
+    return lambda: manager.count_tokens(messages)
+
+
+@benchmark("context.compress_messages", group="context", params={"turns": [5, 40]})
+def compress_messages(turns):
+    from backend.utils.context_manager import ContextManager
+
+    manager = ContextManager(token_limit=32000, preserve_prefix_message_count=1)
+    messages = data.chat_messages(turns)
+    return lambda: manager.compress_messages({"messages": messages})
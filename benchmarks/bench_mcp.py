@@ -0,0 +1,61 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""MCP tool dispatch through the shared tool catalog."""
+
+from types import SimpleNamespace
+from typing import Any
+
+from benchmarks import data
+from benchmarks.harness import benchmark, run_async
+from benchmarks.stubs import pm_service_routes, stub_server
+
+
+@benchmark("mcp.dispatch", group="mcp", params={"tasks": [1, 200]})
+def dispatch(tasks):
+    """
+    Catalog lookup, context binding and response formatting around a tool
+    that returns ``tasks`` in-memory tasks.
+    """
+    from mcp.types import Tool
+
+    from mcp_server.core.tool_catalog import BoundToolFunctions, build_tool_catalog
+    from mcp_server.tools.base import ReadTool
+
+    payload = data.pm_tasks(tasks)
+
+    class EchoTasksTool(ReadTool):
+        async def execute(self, **kwargs: Any) -> dict[str, Any]:
+            return {"tasks": payload, "total": len(payload)}
+
+    def register(server, context, tool_names=None, tool_functions=None):
+        instance = EchoTasksTool(context)
+
+        @server.call_tool()
+        async def echo_tasks(name, arguments=None):
+            return await instance(arguments or {})
+
+        tool_names.append("echo_tasks")
+        tool_functions["echo_tasks"] = echo_tasks
+        server._tool_cache["echo_tasks"] = Tool(name="echo_tasks", description="", inputSchema={"type": "object"})
+        return 1
+
+    catalog = build_tool_catalog([("bench", register)])
+    functions = BoundToolFunctions(catalog.handlers, SimpleNamespace(user_id="bench"))
+    return lambda: functions["echo_tasks"]("echo_tasks", {})
+
+
+@benchmark("mcp.list_tasks", group="mcp", params={"tasks": [100, 2000]})
+def list_tasks(tasks):
+    """The real list_tasks tool, paging through a stub PM Service."""
+    from pm_service.client import AsyncPMServiceClient
+
+    from mcp_server.core.tool_catalog import BoundToolFunctions, build_tool_catalog
+    from mcp_server.tools.tasks.register import register_task_tools
+
+    with stub_server(pm_service_routes(data.pm_tasks(tasks))) as url:
+        client = AsyncPMServiceClient(base_url=url)
+        catalog = build_tool_catalog([("tasks", register_task_tools)])
+        functions = BoundToolFunctions(catalog.handlers, SimpleNamespace(user_id="bench", pm_service=client))
+        yield lambda: functions["list_tasks"]("list_tasks", {"project_id": "prov:478"})
+        run_async(client.__aexit__(None, None, None))
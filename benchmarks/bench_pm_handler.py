@@ -0,0 +1,104 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""PMHandler fan-out over several providers, and the DataBuffer it streams through."""
+
+from contextlib import ExitStack
+from types import SimpleNamespace
+
+from benchmarks import data
+from benchmarks.harness import benchmark
+from benchmarks.stubs import openproject_routes, stub_server
+
+
+def _connection(index: int, url: str) -> SimpleNamespace:
+    """Stand-in for a PMProviderConnection row."""
+    config = {"provider_type": "openproject_v16", "base_url": url, "api_key": "bench"}
+    return SimpleNamespace(
+        id=f"00000000-0000-0000-0000-{index:012d}",
+        name=f"OpenProject {index}",
+        backend_provider_id=None,
+        get_provider_config=lambda: config,
+    )
+
+
+def _handler(connections):
+    from pm_service.handlers import PMHandler
+
+    handler = PMHandler(db_session=None)
+    handler.get_active_providers = lambda: connections
+    return handler
+
+
+@benchmark(
+    "pm_handler.list_tasks",
+    group="pm_handler",
+    params={"providers": [1, 4], "tasks": [500, 2000]},
+)
+def list_tasks(providers, tasks):
+    """Tasks from every active provider, merged through the handler's DataBuffer."""
+    from pm_service.config import settings
+
+    # The search index is fed from listings; keep it out of the measurement
+    index_enabled = settings.entity_index_enabled
+    settings.entity_index_enabled = False
+    routes = openproject_routes([], data.openproject_work_packages(tasks))
+    try:
+        with ExitStack() as stack:
+            urls = [stack.enter_context(stub_server(routes)) for _ in range(providers)]
+            handler = _handler([_connection(i, url) for i, url in enumerate(urls)])
+            expected = providers * tasks
+
+            async def fan_out():
+                # Provider errors are only recorded, so check nothing was dropped
+                result = await handler.list_tasks()
+                if len(result) != expected:
+                    raise RuntimeError(f"Expected {expected} tasks, got {len(result)}: {handler.get_errors()}")
+
+            yield fan_out
+    finally:
+        settings.entity_index_enabled = index_enabled
+
+
+@benchmark(
+    "pm_handler.list_projects",
+    group="pm_handler",
+    params={"providers": [1, 4]},
+)
+def list_projects(providers):
+    """Projects from every active provider, merged through the handler's DataBuffer."""
+    routes = openproject_routes(data.openproject_projects(300), [])
+    with ExitStack() as stack:
+        urls = [stack.enter_context(stub_server(routes)) for _ in range(providers)]
+        handler = _handler([_connection(i, url) for i, url in enumerate(urls)])
+        expected = providers * 300
+
+        async def fan_out():
+            # Provider errors are only recorded, so check nothing was dropped
+            result = await handler.list_projects()
+            if len(result) != expected:
+                raise RuntimeError(f"Expected {expected} projects, got {len(result)}: {handler.get_errors()}")
+
+        yield fan_out
+
+
+@benchmark("pm_handler.data_buffer", group="pm_handler", params={"items": [500, 5000]})
+def data_buffer(items):
+    """Write a task stream to the NDJSON buffer and read it back."""
+    from pm_service.utils.data_buffer import DataBuffer
+
+    tasks = data.pm_tasks(items)
+
+    async def stream():
+        for task in tasks:
+            yield task
+
+    async def round_trip():
+        buffer = DataBuffer(prefix="bench_")
+        try:
+            await buffer.write_items(stream())
+            await buffer.read_all()
+        finally:
+            buffer.cleanup()
+
+    return round_trip
@@ -0,0 +1,61 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""OpenProject and JIRA provider listing and pagination against local stubs."""
+
+import inspect
+from typing import Any
+
+from benchmarks import data
+from benchmarks.harness import benchmark
+from benchmarks.stubs import jira_routes, openproject_routes, stub_server
+
+
+async def collect(result: Any) -> list:
+    """Drain a provider listing, whether it is a coroutine or an async generator."""
+    if inspect.isawaitable(result):
+        result = await result
+    if hasattr(result, "__aiter__"):
+        return [item async for item in result]
+    return list(result)
+
+
+def openproject_provider(url: str):
+    from pm_service.providers.factory import create_pm_provider
+
+    # The explicit version skips the auto-detection round trip
+    return create_pm_provider(provider_type="openproject_v16", base_url=url, api_key="bench")
+
+
+def jira_provider(url: str):
+    from pm_service.providers.factory import create_pm_provider
+
+    return create_pm_provider(provider_type="jira", base_url=url, api_token="bench", username="bench@example.com")
+
+
+@benchmark("providers.openproject.list_projects", group="providers", params={"projects": [50, 1200]})
+def openproject_list_projects(projects):
+    with stub_server(openproject_routes(data.openproject_projects(projects), [])) as url:
+        provider = openproject_provider(url)
+        yield lambda: collect(provider.list_projects())
+
+
+@benchmark("providers.openproject.list_tasks", group="providers", params={"tasks": [100, 2000]})
+def openproject_list_tasks(tasks):
+    with stub_server(openproject_routes([], data.openproject_work_packages(tasks))) as url:
+        provider = openproject_provider(url)
+        yield lambda: collect(provider.list_tasks())
+
+
+@benchmark("providers.jira.list_projects", group="providers", params={"projects": [50, 500]})
+def jira_list_projects(projects):
+    with stub_server(jira_routes(data.jira_projects(projects), [])) as url:
+        provider = jira_provider(url)
+        yield lambda: collect(provider.list_projects())
+
+
+@benchmark("providers.jira.list_tasks", group="providers", params={"tasks": [100, 2000]})
+def jira_list_tasks(tasks):
+    with stub_server(jira_routes([], data.jira_issues(tasks))) as url:
+        provider = jira_provider(url)
+        yield lambda: collect(provider.list_tasks())
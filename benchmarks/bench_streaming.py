@@ -0,0 +1,69 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""SSE event generation in backend/server/streaming.py for one streamed answer."""
+
+import json
+
+from benchmarks import data
+from benchmarks.harness import benchmark
+
+THREAD_ID = "bench-thread"
+METADATA = {"langgraph_node": "reporter", "checkpoint_ns": "reporter:bench"}
+AGENT = ("reporter:bench",)
+
+
+@benchmark("streaming.make_event", group="streaming", params={"payload": ["token", "tool_result"]})
+def make_event(payload):
+    from backend.server.streaming import make_event
+
+    if payload == "token":
+        event = {"thread_id": THREAD_ID, "agent": "reporter", "id": "run--bench",
+                 "role": "assistant", "content": "velocity "}
+    else:
+        event = {"thread_id": THREAD_ID, "agent": "pm_agent", "id": "run--bench", "role": "assistant",
+                 "tool_call_id": "call-1", "content": json.dumps(data.pm_tasks(50))}
+    # make_event drops empty content in place, so each call gets its own copy
+    return lambda: make_event("message_chunk", dict(event))
+
+
+@benchmark("streaming.create_event_stream_message", group="streaming")
+def create_event_stream_message():
+    from backend.server.streaming import create_event_stream_message
+
+    chunk = data.message_chunks(2)[0]
+    return lambda: create_event_stream_message(chunk, METADATA, THREAD_ID, "reporter")
+
+
+@benchmark("streaming.process_tool_call_chunks", group="streaming", params={"chunks": [10, 200]})
+def process_tool_call_chunks(chunks):
+    from backend.server.streaming import process_tool_call_chunks
+
+    arguments = json.dumps({"project_id": "prov:478", "sprint_id": "prov:12", "status": "open"})
+    step = max(1, len(arguments) // chunks)
+    tool_call_chunks = [
+        {
+            "name": "list_tasks" if i == 0 else None,
+            "args": arguments[i * step:(i + 1) * step] if i < chunks - 1 else arguments[i * step:],
+            "id": "call-1" if i == 0 else None,
+            "index": 0,
+            "type": "tool_call_chunk",
+        }
+        for i in range(chunks)
+    ]
+    return lambda: process_tool_call_chunks(tool_call_chunks)
+
+
+@benchmark("streaming.process_message_chunk", group="streaming", params={"tokens": [100, 1000]})
+def process_message_chunk(tokens):
+    """Events for a whole streamed answer, one AIMessageChunk per token."""
+    from backend.server.streaming import process_message_chunk
+
+    chunks = data.message_chunks(tokens)
+
+    async def stream_answer():
+        for chunk in chunks:
+            async for _event in process_message_chunk(chunk, METADATA, THREAD_ID, AGENT):
+                pass
+
+    return stream_answer
@@ -0,0 +1,255 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""
+Seeded synthetic data shaped like real provider and PM Service payloads.
+
+Every generator takes a count and a seed, so a case sees the same data on
+every run and results stay comparable with the baseline.
+"""
+
+import json
+import random
+from datetime import date, datetime, timedelta
+from typing import Any
+
+STATUSES = ["New", "In progress", "In review", "Done", "Closed", "Blocked"]
+PRIORITIES = ["Low", "Normal", "High", "Critical"]
+ASSIGNEES = ["Minh Nguyen", "Alice Tran", "Bob Le", "Chi Pham", "Dung Vo", None]
+WORDS = ["sprint", "velocity", "task", "burndown", "the", "is", "on", "track", "blocked", "review"]
+
+EPOCH = datetime(2025, 1, 6, 9, 0, 0)
+
+
+def _day(rng: random.Random, span: int = 90) -> datetime:
+    return EPOCH + timedelta(days=rng.randint(0, span), hours=rng.randint(0, 8))
+
+
+def openproject_projects(count: int, seed: int = 7) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "_type": "Project",
+            "id": 100 + i,
+            "identifier": f"project-{i}",
+            "name": f"Project {i}",
+            "description": {"format": "markdown", "raw": "Internal project. " * rng.randint(1, 8)},
+            "active": True,
+            "createdAt": _day(rng).isoformat() + "Z",
+            "updatedAt": _day(rng).isoformat() + "Z",
+            "_links": {"self": {"href": f"/api/v3/projects/{100 + i}"}},
+        }
+        for i in range(count)
+    ]
+
+
+def openproject_work_packages(count: int, seed: int = 7) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    packages = []
+    for i in range(count):
+        start = _day(rng)
+        assignee = rng.randint(1, 40)
+        packages.append({
+            "_type": "WorkPackage",
+            "id": 10000 + i,
+            "subject": f"Implement feature {i}: {rng.choice(['API', 'UI', 'DB', 'Auth'])} changes",
+            "description": {"format": "markdown", "raw": "As a user I want it to work. " * rng.randint(1, 10)},
+            "startDate": start.date().isoformat(),
+            "dueDate": (start + timedelta(days=rng.randint(1, 14))).date().isoformat(),
+            "estimatedTime": f"PT{rng.choice([1, 2, 4, 8, 16])}H",
+            "derivedRemainingTime": f"PT{rng.choice([0, 1, 3])}H",
+            "createdAt": start.isoformat() + "Z",
+            "updatedAt": (start + timedelta(days=2)).isoformat() + "Z",
+            "_embedded": {
+                "status": {"name": rng.choice(STATUSES)},
+                "priority": {"name": rng.choice(PRIORITIES)},
+            },
+            "_links": {
+                "self": {"href": f"/api/v3/work_packages/{10000 + i}"},
+                "project": {"href": f"/api/v3/projects/{100 + i % 5}"},
+                "assignee": {"href": f"/api/v3/users/{assignee}", "title": f"User {assignee}"},
+                "version": {"href": f"/api/v3/versions/{i % 12 + 1}"},
+                "parent": {"href": f"/api/v3/work_packages/{9000 + i % 30}"} if i % 3 == 0 else {"href": None},
+            },
+        })
+    return packages
+
+
+def jira_projects(count: int, seed: int = 7) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "id": str(10000 + i),
+            "key": f"PRJ{i}",
+            "name": f"Project {i}",
+            "description": "Team project. " * rng.randint(1, 6),
+            "projectTypeKey": "software",
+        }
+        for i in range(count)
+    ]
+
+
+def jira_issues(count: int, seed: int = 7) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    issues = []
+    for i in range(count):
+        created = _day(rng)
+        issues.append({
+            "id": str(20000 + i),
+            "key": f"PRJ{i % 5}-{i + 1}",
+            "fields": {
+                "summary": f"Issue {i}: {rng.choice(['fix', 'add', 'refactor'])} {rng.choice(WORDS)}",
+                "description": "Steps to reproduce the problem. " * rng.randint(1, 6),
+                "status": {"name": rng.choice(["To Do", "In Progress", "Done"])},
+                "priority": {"name": rng.choice(["Low", "Medium", "High", "Highest"])},
+                "assignee": {"accountId": f"acc-{rng.randint(1, 40)}", "displayName": "Dev"},
+                "project": {"id": str(10000 + i % 5), "key": f"PRJ{i % 5}"},
+                "customfield_10020": [{"id": i % 12 + 1, "name": f"Sprint {i % 12 + 1}"}],
+                "timeoriginalestimate": rng.choice([None, 3600, 14400, 28800]),
+                "timespent": rng.choice([None, 1800, 7200]),
+                "created": created.strftime("%Y-%m-%dT%H:%M:%S.000+0000"),
+                "updated": (created + timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%S.000+0000"),
+                "duedate": (created + timedelta(days=10)).date().isoformat(),
+                "labels": ["backend"] if i % 2 else [],
+            },
+        })
+    return issues
+
+
+def pm_tasks(count: int, seed: int = 7) -> list[dict[str, Any]]:
+    """Tasks in the unified shape the PM Service returns."""
+    rng = random.Random(seed)
+    tasks = []
+    for i in range(count):
+        start = _day(rng)
+        tasks.append({
+            "id": f"prov:{10000 + i}",
+            "title": f"Implement feature {i}",
+            "description": "As a user I want the feature to work end to end. " * rng.randint(1, 12),
+            "status": rng.choice(STATUSES),
+            "priority": rng.choice(PRIORITIES),
+            "assignee_id": f"prov:{rng.randint(1, 40)}",
+            "assigned_to": rng.choice(ASSIGNEES),
+            "project_id": "prov:478",
+            "sprint_id": f"prov:{i % 12 + 1}",
+            "estimated_hours": rng.choice([None, 1, 2, 4, 8, 16]),
+            "start_date": start.date().isoformat(),
+            "due_date": (start + timedelta(days=rng.randint(1, 14))).date().isoformat(),
+            "created_at": start.isoformat(),
+            "updated_at": (start + timedelta(days=2)).isoformat(),
+        })
+    return tasks
+
+
+def analytics_items(count: int, seed: int = 7) -> list[dict[str, Any]]:
+    """Work item dicts with the fields the function-style calculators read."""
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        created = _day(rng, span=60)
+        started = created + timedelta(days=rng.randint(0, 5))
+        done = rng.random() < 0.6
+        completed = started + timedelta(days=rng.randint(1, 20)) if done else None
+        history = [{"date": created.isoformat(), "status": "To Do"},
+                   {"date": started.isoformat(), "status": "In Progress"}]
+        if completed:
+            history.append({"date": (completed - timedelta(days=1)).isoformat(), "status": "In Review"})
+            history.append({"date": completed.isoformat(), "status": "Done"})
+        items.append({
+            "id": f"item-{i}",
+            "title": f"Work item {i}",
+            "type": rng.choice(["story", "bug", "task"]),
+            "status": "done" if done else rng.choice(["todo", "in_progress"]),
+            "priority": rng.choice(["low", "medium", "high", "critical"]),
+            "assignee": rng.choice(ASSIGNEES),
+            "story_points": rng.choice([1, 2, 3, 5, 8]),
+            "estimated_hours": rng.choice([2, 4, 8, 16]),
+            "created_date": created.isoformat(),
+            "start_date": started.isoformat(),
+            "completion_date": completed.isoformat() if completed else None,
+            "status_history": history,
+        })
+    return items
+
+
+def work_items(count: int, seed: int = 7):
+    """``WorkItem`` models for the class-style calculators."""
+    from backend.analytics.models import Priority, TaskStatus, WorkItem, WorkItemType
+
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        created = _day(rng, span=10)
+        status = rng.choice(list(TaskStatus))
+        items.append(WorkItem(
+            id=f"item-{i}",
+            title=f"Work item {i}",
+            type=rng.choice([WorkItemType.STORY, WorkItemType.BUG, WorkItemType.TASK]),
+            status=status,
+            priority=rng.choice(list(Priority)),
+            story_points=rng.choice([1, 2, 3, 5, 8]),
+            estimated_hours=rng.choice([2, 4, 8, 16]),
+            actual_hours=rng.choice([None, 1, 6]),
+            assigned_to=rng.choice(ASSIGNEES),
+            created_at=created,
+            completed_at=created + timedelta(days=rng.randint(1, 9)) if status == TaskStatus.DONE else None,
+            due_date=(created + timedelta(days=rng.randint(1, 60))).date(),
+        ))
+    return items
+
+
+def sprints(count: int, items_per_sprint: int, seed: int = 7):
+    """Consecutive two-week ``SprintData`` with work items."""
+    from backend.analytics.models import SprintData
+
+    result = []
+    for n in range(count):
+        start = date(2025, 1, 6) + timedelta(weeks=2 * n)
+        items = work_items(items_per_sprint, seed=seed + n)
+        result.append(SprintData(
+            id=f"sprint-{n + 1}",
+            name=f"Sprint {n + 1}",
+            project_id="478",
+            start_date=start,
+            end_date=start + timedelta(days=13),
+            status="completed",
+            planned_points=sum(i.story_points or 0 for i in items),
+            completed_points=sum(i.story_points or 0 for i in items if i.completed_at),
+            capacity_hours=400,
+            work_items=items,
+            added_items=items[: items_per_sprint // 10],
+            team_members=[a for a in ASSIGNEES if a],
+        ))
+    return result
+
+
+def tool_response(count: int, seed: int = 7) -> str:
+    """A list_tasks tool result as the agent receives it, with trailing noise."""
+    return json.dumps({"tasks": pm_tasks(count, seed), "total": count}, ensure_ascii=False) + "\n\x00<|end|>"
+
+
+def chat_messages(turns: int, seed: int = 7) -> list:
+    """A PM conversation: system prompt, then user/tool/assistant turns."""
+    from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+    rng = random.Random(seed)
+    messages = [SystemMessage(content="You are a project management assistant. " * 40)]
+    for t in range(turns):
+        messages.append(HumanMessage(content=f"How is sprint {t} going? Any blockers for {rng.choice(ASSIGNEES)}?"))
+        call_id = f"call-{t}"
+        messages.append(AIMessage(content="", tool_calls=[
+            {"name": "list_tasks", "args": {"sprint_id": f"prov:{t}"}, "id": call_id}
+        ]))
+        messages.append(ToolMessage(content=json.dumps(pm_tasks(20, seed + t)), tool_call_id=call_id))
+        messages.append(AIMessage(content=" ".join(rng.choice(WORDS) for _ in range(150))))
+    return messages
+
+
+def message_chunks(count: int, seed: int = 7) -> list:
+    """Token-sized ``AIMessageChunk``s of one streamed answer."""
+    from langchain_core.messages import AIMessageChunk
+
+    rng = random.Random(seed)
+    chunks = [AIMessageChunk(content=rng.choice(WORDS) + " ", id="run--bench") for _ in range(count - 1)]
+    chunks.append(AIMessageChunk(content="", id="run--bench", response_metadata={"finish_reason": "stop"}))
+    return chunks
@@ -0,0 +1,225 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""
+Minimal benchmark harness.
+
+A benchmark is a setup function registered with ``@benchmark``. It receives
+one combination of its parameters and either returns the callable to time or
+yields it (code after the ``yield`` runs as teardown, like a pytest fixture).
+The callable may be sync or async; async ones run on an event loop owned by
+the benchmark, so setup code can create loop-bound clients.
+
+Each case is timed over ``rounds`` rounds after a warm-up call. Cases that
+finish in under ``MIN_ROUND_SECONDS`` are repeated within a round so timer
+resolution does not dominate; results are always reported per call.
+"""
+
+import asyncio
+import inspect
+import itertools
+import json
+import math
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Iterable, Optional
+
+MIN_ROUND_SECONDS = 0.01
+RESULTS_FORMAT_VERSION = 1
+
+
+@dataclass
+class Benchmark:
+    name: str
+    group: str
+    setup: Callable[..., Any]
+    params: dict[str, list[Any]] = field(default_factory=dict)
+
+    def cases(self) -> Iterable[tuple[str, dict[str, Any]]]:
+        """(case name, kwargs) for every combination of the parameters."""
+        if not self.params:
+            yield self.name, {}
+            return
+        keys = list(self.params)
+        for values in itertools.product(*(self.params[k] for k in keys)):
+            kwargs = dict(zip(keys, values))
+            suffix = ",".join(f"{k}={v}" for k, v in kwargs.items())
+            yield f"{self.name}[{suffix}]", kwargs
+
+
+@dataclass
+class CaseResult:
+    name: str
+    group: str
+    params: dict[str, Any]
+    rounds: int
+    calls_per_round: int
+    median_ms: float
+    mean_ms: float
+    min_ms: float
+    max_ms: float
+    stdev_ms: float
+
+
+_REGISTRY: list[Benchmark] = []
+
+
+def benchmark(name: str, group: str, params: Optional[dict[str, list[Any]]] = None):
+    """Register a benchmark setup function."""
+
+    def decorator(setup: Callable[..., Any]) -> Callable[..., Any]:
+        _REGISTRY.append(Benchmark(name=name, group=group, setup=setup, params=params or {}))
+        return setup
+
+    return decorator
+
+
+def registered() -> list[Benchmark]:
+    return list(_REGISTRY)
+
+
+def run_async(awaitable: Any) -> Any:
+    """Run ``awaitable`` on the current benchmark's loop (for setup/teardown)."""
+    return asyncio.get_event_loop().run_until_complete(awaitable)
+
+
+def _time_calls(fn: Callable[[], Any], calls: int, loop: asyncio.AbstractEventLoop) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        result = fn()
+        if inspect.isawaitable(result):
+            loop.run_until_complete(result)
+    return time.perf_counter() - started
+
+
+def run_case(bench: Benchmark, case_name: str, kwargs: dict[str, Any], rounds: int) -> CaseResult:
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    generator = None
+    try:
+        produced = bench.setup(**kwargs)
+        generator = produced if inspect.isgenerator(produced) else None
+        fn = next(generator) if generator else produced
+        # Warm-up, and calibrate how many calls make one round
+        elapsed = _time_calls(fn, 1, loop)
+        calls = max(1, math.ceil(MIN_ROUND_SECONDS / elapsed)) if elapsed < MIN_ROUND_SECONDS else 1
+        timings = [_time_calls(fn, calls, loop) / calls * 1000 for _ in range(rounds)]
+    finally:
+        if generator:
+            # Resume past the yield to run teardown
+            next(generator, None)
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        asyncio.set_event_loop(None)
+        loop.close()
+    return CaseResult(
+        name=case_name,
+        group=bench.group,
+        params=kwargs,
+        rounds=rounds,
+        calls_per_round=calls,
+        median_ms=statistics.median(timings),
+        mean_ms=statistics.fmean(timings),
+        min_ms=min(timings),
+        max_ms=max(timings),
+        stdev_ms=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+    )
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, timeout=5)
+        return result.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def make_report(results: list[CaseResult]) -> dict[str, Any]:
+    """Machine-readable results document."""
+    return {
+        "version": RESULTS_FORMAT_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "commit": _git_commit(),
+        "machine": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+        },
+        "results": {r.name: asdict(r) for r in results},
+    }
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline_ms: Optional[float]
+    current_ms: Optional[float]
+
+    @property
+    def ratio(self) -> Optional[float]:
+        if not self.baseline_ms or self.current_ms is None:
+            return None
+        return self.current_ms / self.baseline_ms
+
+    def status(self, threshold: float) -> str:
+        if self.baseline_ms is None:
+            return "new"
+        if self.current_ms is None:
+            return "missing"
+        if self.ratio is None:
+            # A zero baseline has no ratio; anything slower than it is a regression
+            return "regressed" if self.current_ms > self.baseline_ms else "ok"
+        if self.ratio > 1 + threshold:
+            return "regressed"
+        if self.ratio < 1 / (1 + threshold):
+            return "improved"
+        return "ok"
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> list[Comparison]:
+    """Pair up the median times of two results documents by case name."""
+    base = baseline.get("results", {})
+    cur = current.get("results", {})
+    return [
+        Comparison(
+            name=name,
+            baseline_ms=base[name]["median_ms"] if name in base else None,
+            current_ms=cur[name]["median_ms"] if name in cur else None,
+        )
+        for name in sorted(set(base) | set(cur))
+    ]
+
+
+def format_comparison(comparisons: list[Comparison], threshold: float) -> str:
+    lines = [f"{'benchmark':<60} {'baseline ms':>12} {'current ms':>11} {'ratio':>7}  status"]
+    for c in comparisons:
+        baseline = f"{c.baseline_ms:.3f}" if c.baseline_ms is not None else "-"
+        current = f"{c.current_ms:.3f}" if c.current_ms is not None else "-"
+        ratio = f"{c.ratio:.2f}x" if c.ratio is not None else "-"
+        lines.append(f"{c.name:<60} {baseline:>12} {current:>11} {ratio:>7}  {c.status(threshold)}")
+    return "\n".join(lines)
+
+
+def load_report(path: str) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_report(report: dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def print_result(result: CaseResult) -> None:
+    print(
+        f"{result.name:<60} {result.median_ms:>10.3f} ms  "
+        f"(min {result.min_ms:.3f}, stdev {result.stdev_ms:.3f}, "
+        f"{result.rounds}x{result.calls_per_round})",
+        file=sys.stdout,
+        flush=True,
+    )
@@ -0,0 +1,130 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""
+Local HTTP stand-ins for OpenProject, JIRA and the PM Service.
+
+Each stub serves a fixed synthetic dataset with the paging the clients in
+this repo use, from a thread on 127.0.0.1. Response bodies are encoded once
+per distinct request, so the timings measure the client side (requests,
+paging, parsing), not the stub.
+"""
+
+import json
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Iterator, Optional
+from urllib.parse import parse_qs, urlsplit
+
+# (method, path, query, json body) -> (status, payload)
+Route = Callable[[str, str, dict[str, list[str]], Optional[dict[str, Any]]], tuple[int, Any]]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _serve(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+        cache_key = (self.command, self.path, raw_body)
+        cached = self.server.responses.get(cache_key)
+        if cached is None:
+            split = urlsplit(self.path)
+            body = json.loads(raw_body) if raw_body else None
+            status, payload = self.server.route(self.command, split.path, parse_qs(split.query), body)
+            cached = (status, json.dumps(payload).encode("utf-8"))
+            self.server.responses[cache_key] = cached
+        status, encoded = cached
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    do_GET = do_POST = do_PATCH = do_DELETE = _serve
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@contextmanager
+def stub_server(route: Route) -> Iterator[str]:
+    """Serve ``route`` on an ephemeral port; yields the base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.route = route
+    server.responses = {}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _int(query: dict[str, list[str]], name: str, default: int) -> int:
+    values = query.get(name)
+    return int(values[0]) if values else default
+
+
+def openproject_routes(projects: list[dict], work_packages: list[dict]) -> Route:
+    """
+    OpenProject API v3: projects follow ``nextByOffset`` links, work packages
+    are paged by ``pageSize``/``offset`` (item offset, as the provider sends it).
+    """
+
+    def route(method, path, query, body):
+        page_size = _int(query, "pageSize", 20)
+        offset = _int(query, "offset", 0)
+        if path == "/api/v3/projects":
+            # offset is a 1-based page number for link-based paging
+            page = max(offset, 1)
+            elements = projects[(page - 1) * page_size: page * page_size]
+            links = {}
+            if page * page_size < len(projects):
+                links["nextByOffset"] = {
+                    "href": f"/api/v3/projects?pageSize={page_size}&offset={page + 1}"
+                }
+            return 200, {"count": len(elements), "total": len(projects),
+                         "_embedded": {"elements": elements}, "_links": links}
+        if path.startswith("/api/v3/") and path.endswith("work_packages"):
+            elements = work_packages[offset: offset + page_size]
+            return 200, {"count": len(elements), "total": len(work_packages),
+                         "_embedded": {"elements": elements}}
+        return 404, {"message": f"No stub for {method} {path}"}
+
+    return route
+
+
+def jira_routes(projects: list[dict], issues: list[dict]) -> Route:
+    """JIRA Cloud REST v3: projects by ``startAt``, issues via POST search/jql."""
+
+    def route(method, path, query, body):
+        if path == "/rest/api/3/project":
+            start = _int(query, "startAt", 0)
+            return 200, projects[start: start + _int(query, "maxResults", 50)]
+        if path == "/rest/api/3/search/jql":
+            start = int((body or {}).get("startAt", 0))
+            limit = int((body or {}).get("maxResults", 50))
+            return 200, {"startAt": start, "maxResults": limit, "total": len(issues),
+                         "issues": issues[start: start + limit]}
+        return 404, {"errorMessages": [f"No stub for {method} {path}"]}
+
+    return route
+
+
+def pm_service_routes(tasks: list[dict]) -> Route:
+    """PM Service list endpoints paged by ``limit``/``offset``."""
+
+    def route(method, path, query, body):
+        if path == "/api/v1/tasks":
+            offset = _int(query, "offset", 0)
+            limit = _int(query, "limit", 100)
+            items = tasks[offset: offset + limit]
+            return 200, {"items": items, "total": len(tasks), "returned": len(items),
+                         "offset": offset, "limit": limit}
+        return 404, {"detail": f"No stub for {method} {path}"}
+
+    return route
@@ -249,7 +249,9 @@ async def _handle_process_meeting(context, args: Dict[str, Any]) -> List[Dict[st
     upload_dir = os.getenv("MEETING_UPLOAD_DIR", "/app/uploads")
     agent_config = MeetingAgentConfig(upload_dir=upload_dir)
     provider_mgr = ProviderManager(session)
-    handler = MeetingHandler(config=agent_config, provider_manager=provider_mgr)
+    handler = MeetingHandler(
+        config=agent_config, provider_manager=provider_mgr, pm_service=context.pm_service
+    )
     
     # Get participants from DB
     participants = [p.name for p in meeting.participants]
@@ -288,7 +290,8 @@ async def _handle_process_meeting(context, args: Dict[str, Any]) -> List[Dict[st
                 description=item.description,
                 status=item.status.value if hasattr(item.status, 'value') else str(item.status),
                 assignee_name=item.assignee_name,
-                due_date=item.due_date
+                due_date=item.due_date,
+                pm_task_id=item.pm_task_id,
             )
             session.add(ai)
         
@@ -374,7 +377,9 @@ async def _handle_analyze_transcript(context, args: Dict[str, Any]) -> List[Dict
     upload_dir = os.getenv("MEETING_UPLOAD_DIR", "/app/uploads")
     agent_config = MeetingAgentConfig(upload_dir=upload_dir)
     provider_mgr = ProviderManager(session)
-    handler = MeetingHandler(config=agent_config, provider_manager=provider_mgr)
+    handler = MeetingHandler(
+        config=agent_config, provider_manager=provider_mgr, pm_service=context.pm_service
+    )
 
     handler_context = HandlerContext(project_id=project_id)
     
@@ -492,27 +497,43 @@ async def _handle_create_tasks(context, args: Dict[str, Any]) -> List[Dict[str,
     query = session.query(MeetingActionItem).filter(MeetingActionItem.meeting_id == meeting_id)
     
     if action_item_ids:
-        # We would filter by IDs here
-        pass
+        query = query.filter(MeetingActionItem.id.in_(action_item_ids))
         
-    items = query.all()
+    items = [item for item in query.all() if not item.pm_task_id]
     
     if not items:
             return [{"type": "text", "text": "No action items to convert."}]
 
-    # Mock creating tasks
-    created_count = 0
-    for item in items:
-            task_id = f"task_{uuid.uuid4().hex[:8]}"
-            item.pm_task_id = task_id
-            created_count += 1
+    # One bulk call: PM Service resolves assignee names once and creates concurrently.
+    # assignee_id here is a meeting participant, not a PM user, so only the name is sent.
+    response = await context.pm_service.create_tasks_bulk(
+        project_id=project_id,
+        tasks=[
+            {
+                "title": item.description[:200],
+                "description": f"{item.description}\n\n*Extracted from meeting*",
+                "assignee_name": item.assignee_name,
+                "due_date": item.due_date.date().isoformat() if item.due_date else None,
+            }
+            for item in items
+        ],
+    )
+    
+    failures = []
+    for result in response.get("results", []):
+        item = items[result["index"]]
+        if result.get("success") and result.get("task"):
+            item.pm_task_id = str(result["task"].get("id"))
+        else:
+            failures.append(f"- {item.description[:50]}: {result.get('error')}")
     
     session.commit()
 
-    return [{
-        "type": "text",
-        "text": f"Created {created_count} tasks in project {project_id}.\\n(Note: Task creation is currently mocked, but DB is updated)"
-    }]
+    lines = [f"Created {response.get('created', 0)} of {len(items)} tasks in project {project_id}."]
+    if failures:
+        lines.append("Failed:")
+        lines.extend(failures)
+    return [{"type": "text", "text": "\n".join(lines)}]
 
 
 async def _handle_list_meetings(context, args: Dict[str, Any]) -> List[Dict[str, Any]]:
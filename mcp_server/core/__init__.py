@@ -8,18 +8,21 @@ Components:
 - ProviderManager: Manages PM provider lifecycle and instances
 - AnalyticsManager: Integrates analytics service with providers
 - ToolContext: Shared context for all tools
+- ToolCatalog: Process-wide tool definitions and handlers, built once
 - AuthManager: Handles API key validation and management
 """
 
 from .provider_manager import ProviderManager
 from .analytics_manager import AnalyticsManager
 from .tool_context import ToolContext
+from .tool_catalog import ToolCatalog
 from .auth_manager import AuthManager
 
 __all__ = [
     "ProviderManager",
     "AnalyticsManager",
     "ToolContext",
+    "ToolCatalog",
     "AuthManager",
 ]
 
@@ -0,0 +1,199 @@
+"""
+Tool Catalog
+
+Process-wide table of MCP tool names, definitions and handlers.
+
+Tool modules are registered once, against a ContextProxy instead of a
+concrete ToolContext. User-scoped servers share the catalog and only bind
+their own ToolContext around each tool call, so opening a connection does
+not re-import, re-introspect or re-register any tool module.
+"""
+
+import functools
+import inspect
+import logging
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+from mcp.server import Server
+from mcp.types import Tool
+
+from .tool_context import ContextProxy, ToolContext, bind_tool_context
+
+logger = logging.getLogger(__name__)
+
+ToolModule = tuple[str, Callable[..., int]]
+
+
+@dataclass(frozen=True)
+class ToolCatalog:
+    """Immutable result of registering every tool module once."""
+
+    tool_names: tuple[str, ...]
+    handlers: Mapping[str, Callable]
+    definitions: Mapping[str, Tool]
+    modules: tuple[str, ...]
+    build_time_ms: float = 0.0
+
+    def list_tools(self) -> list[Tool]:
+        """
+        Tools advertised by list_tools.
+
+        Modules that populate the SDK tool cache provide full definitions;
+        if none did, every tool is listed with a permissive schema so it
+        can still be called.
+        """
+        if self.definitions:
+            return list(self.definitions.values())
+        return [
+            Tool(
+                name=name,
+                description=f"Tool: {name}",
+                inputSchema={"type": "object", "properties": {}, "additionalProperties": True},
+            )
+            for name in self.tool_names
+        ]
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "tools": len(self.tool_names),
+            "definitions": len(self.definitions),
+            "modules": len(self.modules),
+            "build_time_ms": round(self.build_time_ms, 2),
+        }
+
+
+def bind_tool_handler(handler: Callable, context: ToolContext) -> Callable:
+    """Wrap a catalog handler so it runs with ``context`` bound."""
+
+    @functools.wraps(handler)
+    async def bound_handler(*args: Any, **kwargs: Any) -> Any:
+        with bind_tool_context(context):
+            return await handler(*args, **kwargs)
+
+    return bound_handler
+
+
+class BoundToolFunctions(Mapping):
+    """
+    Read-only view of the catalog handlers for one server.
+
+    Lookups return the handler bound to that server's ToolContext, so code
+    that calls ``server._tool_functions[name](name, arguments)`` directly
+    keeps working without a per-connection handler table.
+    """
+
+    __slots__ = ("_handlers", "_context")
+
+    def __init__(self, handlers: Mapping[str, Callable], context: ToolContext):
+        self._handlers = handlers
+        self._context = context
+
+    def __getitem__(self, name: str) -> Callable:
+        return bind_tool_handler(self._handlers[name], self._context)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._handlers
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._handlers)
+
+    def __len__(self) -> int:
+        return len(self._handlers)
+
+
+def _register_module(
+    module_name: str,
+    register_func: Callable[..., int],
+    server: Server,
+    context: ContextProxy,
+    config: Any,
+    tool_names: list[str],
+    tool_functions: dict[str, Any],
+) -> int:
+    param_names = list(inspect.signature(register_func).parameters.keys())
+
+    # All tools now use context-based signature
+    if "context" in param_names:
+        # Context-based signature: (server, context, tool_names, tool_functions)
+        # or (server, context, config, tool_names, tool_functions)
+        if "tool_functions" in param_names:
+            return register_func(server, context, tool_names, tool_functions)
+        if "config" in param_names:
+            return register_func(server, context, config, tool_names)
+        return register_func(server, context, tool_names)
+
+    # Legacy signature - should not happen anymore
+    logger.warning(f"[{module_name}] Using legacy signature without context")
+    return register_func(server, context, config, tool_names)
+
+
+def build_tool_catalog(tool_modules: Sequence[ToolModule], config: Any = None) -> ToolCatalog:
+    """
+    Register every tool module once and freeze the result.
+
+    Registration runs against a throwaway MCP server; only the collected
+    names, handlers and tool definitions are kept.
+
+    Args:
+        tool_modules: (module_name, register_func) pairs in registration order
+        config: Server configuration passed to legacy register functions
+
+    Returns:
+        ToolCatalog shared by all servers in the process
+    """
+    started = time.perf_counter()
+    server = Server(getattr(config, "server_name", "pm-mcp-tool-catalog"))
+    context = ContextProxy()
+    tool_names: list[str] = []
+    tool_functions: dict[str, Any] = {}
+    modules: list[str] = []
+
+    for module_name, register_func in tool_modules:
+        try:
+            count = _register_module(
+                module_name, register_func, server, context, config, tool_names, tool_functions
+            )
+        except Exception as e:
+            logger.error(f"Failed to register {module_name} tools: {e}")
+            raise
+        modules.append(module_name)
+        logger.info(f"Registered {count} {module_name} tools")
+
+    catalog = ToolCatalog(
+        tool_names=tuple(tool_names),
+        handlers=MappingProxyType(dict(tool_functions)),
+        definitions=MappingProxyType(dict(server._tool_cache)),
+        modules=tuple(modules),
+        build_time_ms=(time.perf_counter() - started) * 1000,
+    )
+    logger.info(
+        f"Tool catalog built: {len(catalog.tool_names)} tools from "
+        f"{len(catalog.modules)} modules in {catalog.build_time_ms:.1f}ms"
+    )
+    return catalog
+
+
+_catalog: Optional[ToolCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_tool_catalog(tool_modules: Sequence[ToolModule], config: Any = None) -> ToolCatalog:
+    """Return the process-wide catalog, building it on first use."""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = build_tool_catalog(tool_modules, config)
+    return _catalog
+
+
+def reset_tool_catalog() -> None:
+    """Drop the process-wide catalog (tests and hot reload)."""
+    global _catalog
+    with _catalog_lock:
+        _catalog = None
@@ -7,7 +7,9 @@ Provides access to core services and managers.
 
 import logging
 import os
-from typing import Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
 from sqlalchemy.orm import Session
 
 from .provider_manager import ProviderManager
@@ -16,6 +18,11 @@ from pm_service.client import AsyncPMServiceClient
 
 logger = logging.getLogger(__name__)
 
+# ToolContext of the connection whose tool call is currently running
+_current_tool_context: ContextVar[Optional["ToolContext"]] = ContextVar(
+    "current_tool_context", default=None
+)
+
 
 class ToolContext:
     """
@@ -114,3 +121,51 @@ class ToolContext:
         logger.info("[ToolContext] All caches cleared")
 
 
+
+
+class ContextProxy:
+    """
+    Stand-in for a ToolContext inside shared tool instances.
+
+    Tools in the process-wide catalog are built once against this proxy.
+    Attribute access resolves to the ToolContext bound for the current tool
+    call (see bind_tool_context), so one set of tool instances serves every
+    user-scoped server.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(resolve_tool_context(self), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(resolve_tool_context(self), name, value)
+
+    def __repr__(self) -> str:
+        return f"ContextProxy(bound={_current_tool_context.get() is not None})"
+
+
+def resolve_tool_context(context: Any) -> Any:
+    """
+    Return the concrete context behind ``context``.
+
+    Plain contexts are returned unchanged; a ContextProxy resolves to the
+    ToolContext bound for the current call.
+
+    Raises:
+        RuntimeError: If a proxy is used outside a bound tool call
+    """
+    if not isinstance(context, ContextProxy):
+        return context
+    bound = _current_tool_context.get()
+    if bound is None:
+        raise RuntimeError("No ToolContext bound for this tool call")
+    return bound
+
+
+@contextmanager
+def bind_tool_context(context: ToolContext) -> Iterator[ToolContext]:
+    """Bind ``context`` for tools called inside the block."""
+    token = _current_tool_context.set(context)
+    try:
+        yield context
+    finally:
+        _current_tool_context.reset(token)
@@ -5,6 +5,7 @@ Main server class that registers PM tools and handles MCP protocol communication
 """
 
 import logging
+from collections.abc import Mapping
 from typing import Any
 
 from mcp.server import Server
@@ -14,7 +15,8 @@ from sqlalchemy.orm import Session
 
 from .database.connection import get_mcp_db_session, init_mcp_db
 from .config import PMServerConfig
-from .core.tool_context import ToolContext
+from .core.tool_catalog import BoundToolFunctions, get_tool_catalog
+from .core.tool_context import ToolContext, bind_tool_context
 from .tools import (
     register_user_tools,
     register_task_interaction_tools,
@@ -30,6 +32,21 @@ from mcp_meeting_server.tools import register_meeting_tools
 
 logger = logging.getLogger(__name__)
 
+# Tool modules in registration order, registered once per process into the tool catalog
+TOOL_MODULES = [
+    ("provider_config", register_provider_config_tools),  # Provider config tools
+    # ("users", register_user_tools),  # User tools - DISABLED: Using pm_service_users instead
+    ("task_interactions", register_task_interaction_tools),  # Task interactions
+    # Refactored tools
+    ("analytics", register_analytics_tools),  # Analytics tools
+    ("projects", register_project_tools),  # Project tools
+    ("tasks", register_task_tools),  # Task tools
+    ("sprints", register_sprint_tools),  # Sprint tools
+    ("epics", register_epic_tools),  # Epic tools
+    ("pm_service_users", register_pm_service_user_tools),  # PM Service user tools
+    ("meeting_tools", register_meeting_tools),  # Meeting tools
+]
+
 
 class PMMCPServer:
     """
@@ -66,18 +83,23 @@ class PMMCPServer:
         # Tool registry
         self.registered_tools: list[str] = []
         
-        # Track registered tool names for list_tools
-        # This list will be populated as tools are registered
-        self._tool_names: list[str] = []
-        # Store tool function references for direct access (bypassing CallToolRequest routing bug)
-        self._tool_functions: dict[str, Any] = {}
+        # Tool names and handlers from the shared tool catalog (set by _register_all_tools)
+        self._tool_names: tuple[str, ...] = ()
+        # Handlers bound to this server's Tool Context, for direct access (bypassing CallToolRequest routing bug)
+        self._tool_functions: Mapping[str, Any] = {}
         
         logger.info(
             f"PM MCP Server initialized: {self.config.server_name} v{self.config.server_version}"
         )
     
-    def _initialize_tool_context(self) -> None:
-        """Initialize Tool Context with database session and user context."""
+    def _initialize_tool_context(self, count_providers: bool = True) -> None:
+        """
+        Initialize Tool Context with database session and user context.
+        
+        Args:
+            count_providers: Query and log the active provider count. User-scoped
+                             servers skip this so connecting stays a cheap bind.
+        """
         if self.tool_context is not None:
             return
         
@@ -92,6 +114,10 @@ class PMMCPServer:
             user_id=self.user_id
         )
         
+        if not count_providers:
+            logger.debug(f"Tool Context bound for user {self.user_id}")
+            return
+        
         # Get provider count from provider manager
         provider_count = len(self.tool_context.provider_manager.get_active_providers())
         
@@ -101,66 +127,31 @@ class PMMCPServer:
         )
     
     def _register_all_tools(self) -> None:
-        """Register all PM tools with the MCP server."""
+        """
+        Attach the shared tool catalog to this server.
+        
+        Tool modules are registered once per process (see core.tool_catalog);
+        this only installs the routing and list_tools handlers, which bind
+        this server's Tool Context around each call.
+        """
         if self.tool_context is None:
             raise RuntimeError("Tool Context not initialized. Call _initialize_tool_context first.")
         
-        logger.info("Registering PM tools...")
-        
-        # Register tools from each module
-        tool_modules = [
-            ("provider_config", register_provider_config_tools),  # Provider config tools
-            # ("users", register_user_tools),  # User tools - DISABLED: Using pm_service_users instead
-            ("task_interactions", register_task_interaction_tools),  # Task interactions
-            # Refactored tools
-            ("analytics", register_analytics_tools),  # Analytics tools
-            ("projects", register_project_tools),  # Project tools
-            ("tasks", register_task_tools),  # Task tools
-            ("sprints", register_sprint_tools),  # Sprint tools
-            ("epics", register_epic_tools),  # Epic tools
-            ("pm_service_users", register_pm_service_user_tools),  # PM Service user tools
-            ("meeting_tools", register_meeting_tools), # Meeting tools
-        ]
-        
-        for module_name, register_func in tool_modules:
-            try:
-                # Pass tool_names list and tool_functions dict to registration functions
-                # so they can track tool names and store function references
-                import inspect
-                sig = inspect.signature(register_func)
-                param_names = list(sig.parameters.keys())
-                
-                # All tools now use context-based signature
-                if "context" in param_names:
-                    # Context-based signature: (server, context, tool_names, tool_functions)
-                    # or (server, context, config, tool_names, tool_functions)
-                    logger.info(f"[{module_name}] Registering with context")
-                    if "tool_functions" in param_names:
-                        count = register_func(self.server, self.tool_context, self._tool_names, self._tool_functions)
-                    elif "config" in param_names:
-                        count = register_func(self.server, self.tool_context, self.config, self._tool_names)
-                    else:
-                        count = register_func(self.server, self.tool_context, self._tool_names)
-                else:
-                    # Legacy signature - should not happen anymore
-                    logger.warning(f"[{module_name}] Using legacy signature without context")
-                    count = register_func(self.server, self.tool_context, self.config, self._tool_names)
-                self.registered_tools.extend([f"{module_name}.*"])
-                logger.info(f"Registered {count} {module_name} tools")
-            except Exception as e:
-                logger.error(f"Failed to register {module_name} tools: {e}")
-                raise
+        catalog = get_tool_catalog(TOOL_MODULES, self.config)
         
-        logger.info(f"Total tools registered: {len(self.registered_tools)}")
+        self._tool_names = catalog.tool_names
+        self._tool_functions = BoundToolFunctions(catalog.handlers, self.tool_context)
+        self.registered_tools = [f"{module_name}.*" for module_name in catalog.modules]
+        # Seed the SDK cache so call_tool input validation never has to call list_tools
+        self.server._tool_cache.update(catalog.definitions)
         
         # CRITICAL: Create a single routing handler for all tool calls
         # The SDK's call_tool() decorator overwrites the handler each time, so we need
         # a single handler that routes to the correct tool function based on tool_name
-        logger.info("Creating single routing handler for all tool calls...")
-        from mcp.types import CallToolRequest, CallToolResult, TextContent
+        from mcp.types import TextContent
         
-        # Store reference to tool_functions for the routing handler
-        tool_functions = self._tool_functions
+        tool_functions = catalog.handlers
+        tool_context = self.tool_context
         
         @self.server.call_tool()
         async def route_tool_call(tool_name: str, arguments: dict[str, Any]) -> list[TextContent]:
@@ -170,21 +161,20 @@ class PMMCPServer:
             """
             logger.info(f"[ROUTER] Routing tool call: {tool_name}")
             
-            # Get the tool function from our stored functions
+            # Get the tool function from the shared catalog
             if tool_name not in tool_functions:
                 logger.error(f"[ROUTER] Tool '{tool_name}' not found in tool_functions")
-                logger.error(f"[ROUTER] Available tools: {list(tool_functions.keys())[:10]}")
                 return [TextContent(
                     type="text",
                     text=f"Error: Tool '{tool_name}' not found. Available tools: {', '.join(list(tool_functions.keys())[:10])}"
                 )]
             
             tool_func = tool_functions[tool_name]
-            logger.info(f"[ROUTER] Found tool function for '{tool_name}': {tool_func}")
             
             try:
-                # Call the tool function with (tool_name, arguments)
-                result = await tool_func(tool_name, arguments)
+                # Call the tool function with (tool_name, arguments) and this server's context
+                with bind_tool_context(tool_context):
+                    result = await tool_func(tool_name, arguments)
                 logger.info(f"[ROUTER] Tool '{tool_name}' completed successfully")
                 return result
             except Exception as e:
@@ -194,115 +184,27 @@ class PMMCPServer:
                     text=f"Error calling tool '{tool_name}': {str(e)}"
                 )]
         
-        logger.info(f"✅ Routing handler created. {len(tool_functions)} tools available for routing.")
-        
         # CRITICAL: Register list_tools handler so the SDK automatically enables tools capability
         # The MCP SDK (v1.21.2) automatically enables tools capability when @server.list_tools() is registered
-        # The handler below will be detected by the SDK and tools capability will be enabled automatically
-        from mcp.types import Tool
+        from mcp.types import ListToolsResult
         
-        logger.info("Registering list_tools handler...")
-        try:
-            @self.server.list_tools()
-            async def list_all_tools(request=None) -> list[Tool]:
-                """
-                List all registered PM tools.
-                
-                This handler is required for the MCP SDK to automatically enable
-                the tools capability in initialization options.
-                
-                The SDK supports both return types:
-                - list[Tool] (old style) - SDK wraps it in ListToolsResult
-                - ListToolsResult (new style) - SDK uses it directly
-                """
-                logger.info("=" * 80)
-                logger.info("[list_all_tools] Handler called!")
-                logger.info(f"[list_all_tools] Tracked tool names: {len(self._tool_names)}")
-                if self._tool_names:
-                    logger.info(f"[list_all_tools] Tool names (first 10): {self._tool_names[:10]}")
-                logger.info(f"[list_all_tools] Cache size: {len(self.server._tool_cache)}")
-                if hasattr(self.server, '_tool_cache') and self.server._tool_cache:
-                    logger.info(f"[list_all_tools] Cache keys (first 5): {list(self.server._tool_cache.keys())[:5]}")
-                
-                try:
-                    # First try to get tools from cache (if SDK populated it)
-                    tools = list(self.server._tool_cache.values())
-                    logger.info(f"[list_all_tools] Found {len(tools)} tools in cache")
-                    
-                    # If cache is empty, manually build Tool objects from tracked tool names
-                    # The SDK's _get_cached_tool_definition doesn't work because tools aren't in cache
-                    # So we'll build basic Tool objects that allow the tools to be called
-                    if not tools and self._tool_names:
-                        logger.info(f"[list_all_tools] Cache empty, manually building {len(self._tool_names)} Tool objects...")
-                        built_tools = []
-                        
-                        # Try _get_cached_tool_definition first (in case SDK can build them)
-                        for tool_name in self._tool_names:
-                            try:
-                                tool_def = await self.server._get_cached_tool_definition(tool_name)
-                                if tool_def:
-                                    built_tools.append(tool_def)
-                                    logger.debug(f"[list_all_tools] Got tool definition from SDK: {tool_name}")
-                                    continue
-                            except Exception as e:
-                                logger.debug(f"[list_all_tools] SDK couldn't build {tool_name}: {e}")
-                        
-                        # For tools that SDK couldn't build, create basic Tool objects
-                        # These will allow tools to be called even without full schema
-                        remaining_names = [name for name in self._tool_names if name not in [t.name for t in built_tools]]
-                        if remaining_names:
-                            logger.info(f"[list_all_tools] Manually creating {len(remaining_names)} Tool objects...")
-                            for tool_name in remaining_names:
-                                # Create a basic Tool object with generic schema
-                                # The actual tool function will handle validation
-                                tool = Tool(
-                                    name=tool_name,
-                                    description=f"Tool: {tool_name}",
-                                    inputSchema={
-                                        "type": "object",
-                                        "properties": {},
-                                        "additionalProperties": True
-                                    }
-                                )
-                                built_tools.append(tool)
-                                logger.debug(f"[list_all_tools] Created basic Tool object: {tool_name}")
-                        
-                        tools = built_tools
-                        logger.info(f"[list_all_tools] Built {len(tools)} tools total ({len(built_tools) - len(remaining_names)} from SDK, {len(remaining_names)} manual)")
-                    
-                    # If still no tools, return empty list (but log warning)
-                    if not tools:
-                        logger.warning(f"[list_all_tools] Returning 0 tools (cache empty, {len(self._tool_names)} tool names tracked)")
-                    else:
-                        logger.info(f"[list_all_tools] Returning {len(tools)} tools")
-                        logger.debug(f"[list_all_tools] Tool names: {[t.name for t in tools[:5]]}...")  # First 5
-                    
-                    logger.info("=" * 80)
-                    
-                    # Return ListToolsResult explicitly (SDK v1.21.2 expects this)
-                    from mcp.types import ListToolsResult
-                    return ListToolsResult(tools=tools)
-                except Exception as e:
-                    logger.error(f"[list_all_tools] ERROR: {e}", exc_info=True)
-                    logger.error("=" * 80)
-                    # Return empty ListToolsResult on error
-                    from mcp.types import ListToolsResult
-                    return ListToolsResult(tools=[])
+        listed_tools = catalog.list_tools()
+        
+        @self.server.list_tools()
+        async def list_all_tools(request=None) -> ListToolsResult:
+            """
+            List all registered PM tools.
             
-            # Verify handler is actually registered
-            from mcp.types import ListToolsRequest
-            if ListToolsRequest in self.server.request_handlers:
-                handler = self.server.request_handlers[ListToolsRequest]
-                logger.info(f"✅ list_tools handler registered successfully")
-                logger.info(f"   Handler type: {type(handler)}")
-                logger.info(f"   Handler: {handler}")
-            else:
-                logger.error("❌ list_tools handler NOT found in request_handlers!")
-                logger.error(f"   Available handlers: {list(self.server.request_handlers.keys())}")
-                raise RuntimeError("list_tools handler not registered")
-        except Exception as e:
-            logger.error(f"❌ Failed to register list_tools handler: {e}", exc_info=True)
-            raise
+            This handler is required for the MCP SDK to automatically enable
+            the tools capability in initialization options.
+            """
+            logger.debug(f"[list_all_tools] Returning {len(listed_tools)} tools")
+            return ListToolsResult(tools=listed_tools)
+        
+        logger.debug(
+            f"Attached tool catalog: {len(self._tool_names)} tools"
+            + (f" for user {self.user_id}" if self.user_id else "")
+        )
     
     async def run_stdio(self) -> None:
         """
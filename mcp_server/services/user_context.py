@@ -27,6 +27,10 @@ class UserContext:
         This ensures that the server only has access to providers
         where created_by = user_id, providing proper credential isolation.
         
+        Tools come from the process-wide tool catalog, so this only creates
+        the user's Tool Context and binds it; call ``_cleanup()`` on the
+        returned server when the connection closes.
+        
         Args:
             user_id: User UUID string
             config: Server configuration (optional, loads from env if not provided)
@@ -37,7 +41,7 @@ class UserContext:
         if not user_id:
             raise ValueError("user_id is required for user-scoped server")
         
-        logger.info(f"[UserContext] Creating user-scoped MCP server for user: {user_id}")
+        logger.debug(f"[UserContext] Creating user-scoped MCP server for user: {user_id}")
         
         # Use provided config or load from environment
         server_config = config or PMServerConfig.from_env()
@@ -46,9 +50,9 @@ class UserContext:
         mcp_server = PMMCPServer(config=server_config, user_id=user_id)
         
         # Initialize Tool Context with user context
-        mcp_server._initialize_tool_context()
+        mcp_server._initialize_tool_context(count_providers=False)
         
-        # Register tools
+        # Bind the shared tool catalog
         mcp_server._register_all_tools()
         
         logger.info(f"[UserContext] User-scoped MCP server initialized for user: {user_id}")
@@ -5,10 +5,13 @@ Base class for MCP tools that use PM Service client.
 
 import logging
 import os
-from typing import Any, Optional
+import weakref
+from typing import Any
 
 from pm_service.client import AsyncPMServiceClient
 
+from ..core.tool_context import resolve_tool_context
+
 logger = logging.getLogger(__name__)
 
 # PM Service URL - defaults to Docker service name
@@ -30,20 +33,24 @@ class PMServiceTool:
             context: Tool context (for backward compatibility)
         """
         self.context = context
-        self._client: Optional[AsyncPMServiceClient] = None
+        # One client per resolved context: catalog tools are shared by every
+        # user-scoped server, and each user may use a different PM Service URL
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
     
     @property
     def client(self) -> AsyncPMServiceClient:
         """Get PM Service client."""
-        if self._client is None:
+        context = resolve_tool_context(self.context)
+        client = self._clients.get(context) if context is not None else None
+        if client is None:
             # Get PM Service URL from context (required)
-            if self.context and hasattr(self.context, '_pm_service_url'):
+            if context and hasattr(context, '_pm_service_url'):
                 # Use the context's PM Service URL (loaded from provider config)
-                pm_service_url = self.context._pm_service_url
-            elif self.context and hasattr(self.context, 'db'):
+                pm_service_url = context._pm_service_url
+            elif context and hasattr(context, 'db'):
                 # Load from provider configuration if context has database session
                 from pm_service.handlers import PMHandler
-                handler = PMHandler(self.context.db, user_id=getattr(self.context, 'user_id', None))
+                handler = PMHandler(context.db, user_id=getattr(context, 'user_id', None))
                 pm_service_url = handler.get_pm_service_url()
             else:
                 raise ValueError(
@@ -52,8 +59,9 @@ class PMServiceTool:
                     "Please ensure providers are configured with pm_service_url in additional_config."
                 )
             
-            self._client = AsyncPMServiceClient(base_url=pm_service_url, timeout=60.0)
-        return self._client
+            client = AsyncPMServiceClient(base_url=pm_service_url, timeout=60.0)
+            self._clients[context] = client
+        return client
     
     async def execute(self, **kwargs) -> dict[str, Any]:
         """Execute the tool. Override in subclass."""
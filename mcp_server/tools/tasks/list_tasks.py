@@ -6,6 +6,8 @@ Lists tasks from PM providers with filtering options.
 
 from typing import Any
 
+from shared.resolution import get_entity_resolver
+
 from ..base import ReadTool
 from ..decorators import mcp_tool, default_value
 
@@ -81,17 +83,18 @@ class ListTasksTool(ReadTool):
                     provider_id, actual_project_id = self._parse_project_id(project_id)
                     provider = await self.context.provider_manager.get_provider(provider_id)
                     
-                    # Fetch sprints and find matching one by name
-                    sprints = await provider.list_sprints(project_id=actual_project_id)
-                    for sprint in sprints:
-                        sprint_dict = self._to_dict(sprint) if not isinstance(sprint, dict) else sprint
-                        sprint_name = sprint_dict.get("name", "")
-                        # Match if name ends with the number (e.g., "Sprint 6" matches "6")
-                        if sprint_name.lower().endswith(f"sprint {actual_sprint_id}") or sprint_name == f"Sprint {actual_sprint_id}":
-                            resolved_id = str(sprint_dict.get("id", ""))
-                            logger.info(f"[list_tasks] Smart resolution: Resolved sprint '{sprint_name}' (number {actual_sprint_id}) to ID {resolved_id}")
-                            actual_sprint_id = resolved_id
-                            break
+                    # Resolve the number against the cached sprint names
+                    sprint = await get_entity_resolver().resolve(
+                        "sprint",
+                        actual_sprint_id,
+                        lambda: provider.list_sprints(project_id=actual_project_id),
+                        scope=str(provider_id),
+                        project_id=actual_project_id,
+                    )
+                    if sprint is not None:
+                        resolved_id = str(sprint.id)
+                        logger.info(f"[list_tasks] Smart resolution: Resolved sprint '{sprint.name}' (number {actual_sprint_id}) to ID {resolved_id}")
+                        actual_sprint_id = resolved_id
                     else:
                         logger.warning(f"[list_tasks] Smart resolution: Could not find sprint with number {actual_sprint_id}")
                 except Exception as e:
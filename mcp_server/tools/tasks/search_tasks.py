@@ -1,133 +1,156 @@
 """
 Search Tasks Tool
 
-Searches tasks across projects by query.
+Semantic search over tasks (and optionally epics and sprints) through the
+PM Service entity index. When the index is unavailable (disabled, or an
+older PM Service without the search endpoint) it falls back to listing the
+tasks and matching the query as a substring of title or description.
 """
 
+import logging
 from typing import Any
 
+import httpx
+
 from ..base import ReadTool
-from ..decorators import mcp_tool, default_value
+from ..decorators import mcp_tool
+
+logger = logging.getLogger(__name__)
 
 
 @mcp_tool(
     name="search_tasks",
-    description="Search tasks across projects by title or description.",
+    description=(
+        "Find tasks by topic, e.g. 'tasks about payment retries'. "
+        "Matches title and description and returns the best matches with a "
+        "score, so there is no need to list the whole project. Searches all "
+        "projects unless project_id is given. match_type in the result is "
+        "'semantic', 'lexical' (shared words only) or 'substring'. "
+        "Supports filtering by project, sprint, assignee and status."
+    ),
     input_schema={
         "type": "object",
         "properties": {
             "query": {
                 "type": "string",
-                "description": "Search query to match against task title or description"
+                "description": "What the tasks are about"
             },
             "project_id": {
                 "type": "string",
                 "description": "Optional: Filter by project ID"
             },
+            "sprint_id": {
+                "type": "string",
+                "description": "Optional: Filter by sprint ID"
+            },
+            "assignee_id": {
+                "type": "string",
+                "description": "Optional: Filter by assignee user ID"
+            },
             "status": {
                 "type": "string",
                 "description": "Optional: Filter by status"
+            },
+            "entity_types": {
+                "type": "array",
+                "items": {"type": "string", "enum": ["task", "epic", "sprint"]},
+                "description": "Optional: Entity types to search (default: task)"
+            },
+            "top_k": {
+                "type": "integer",
+                "description": "Optional: Max results (default: 10, max: 100)"
             }
         },
         "required": ["query"]
     }
 )
 class SearchTasksTool(ReadTool):
-    """Search tasks by query."""
-    
+    """Semantic task search."""
+
     async def execute(
         self,
         query: str,
         project_id: str | None = None,
+        sprint_id: str | None = None,
+        assignee_id: str | None = None,
         status: str | None = None,
+        entity_types: list[str] | None = None,
+        top_k: int = 10,
         **kwargs
     ) -> dict[str, Any]:
         """
         Search tasks.
-        
+
         Args:
             query: Search query
             project_id: Optional project filter
+            sprint_id: Optional sprint filter
+            assignee_id: Optional assignee filter
             status: Optional status filter
-        
+            entity_types: Entity types to search
+            top_k: Max results
+
         Returns:
-            Matching tasks
+            Matching tasks, best first
         """
+        try:
+            result = await self.context.pm_service.search_tasks(
+                query=query,
+                project_id=project_id,
+                sprint_id=sprint_id,
+                assignee_id=assignee_id,
+                status=status,
+                entity_types=entity_types,
+                top_k=min(max(int(top_k), 1), 100)
+            )
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code not in (404, 503):
+                raise
+            logger.warning(
+                "[search_tasks] Entity search unavailable (%s), falling back to substring match",
+                e.response.status_code,
+            )
+            return await self._substring_search(
+                query, project_id, sprint_id, assignee_id, status
+            )
+        items = result.get("items", [])
+        return {
+            "tasks": items,
+            "total": len(items),
+            "query": query,
+            "match_type": result.get("match_type", "semantic")
+        }
+
+    async def _substring_search(
+        self,
+        query: str,
+        project_id: str | None,
+        sprint_id: str | None,
+        assignee_id: str | None,
+        status: str | None,
+    ) -> dict[str, Any]:
+        """List tasks (across all projects without project_id) and match the query as a substring."""
+        result = await self.context.pm_service.list_tasks(
+            project_id=project_id,
+            sprint_id=sprint_id,
+            assignee_id=assignee_id,
+            status=status
+        )
         query_lower = query.lower()
-        all_tasks = []
-        
-        if project_id:
-            # Search in specific project
-            provider_id, actual_project_id = self._parse_project_id(project_id)
-            provider = await self.context.provider_manager.get_provider(provider_id)
-            provider_conn = self.context.provider_manager.get_provider_by_id(provider_id)
-            
-            tasks = await provider.list_tasks(project_id=actual_project_id)
-            
-            for task in tasks:
-                task_dict = self._to_dict(task)
-                task_dict["provider_id"] = str(provider_conn.id)
-                task_dict["provider_name"] = provider_conn.name
-                all_tasks.append(task_dict)
-        else:
-            # Search across all providers
-            providers = self.context.provider_manager.get_active_providers()
-            
-            for provider_conn in providers:
-                try:
-                    provider = self.context.provider_manager.create_provider_instance(provider_conn)
-                    tasks = await provider.list_tasks()
-                    
-                    for task in tasks:
-                        task_dict = self._to_dict(task)
-                        task_dict["provider_id"] = str(provider_conn.id)
-                        task_dict["provider_name"] = provider_conn.name
-                        all_tasks.append(task_dict)
-                except Exception as e:
-                    self.context.provider_manager.record_error(str(provider_conn.id), e)
-                    continue
-        
-        # Filter by query
         matching_tasks = [
-            t for t in all_tasks
+            t for t in result.get("items", [])
             if query_lower in (t.get("title") or t.get("subject") or "").lower()
             or query_lower in (t.get("description") or "").lower()
         ]
-        
-        # Filter by status
         if status:
             status_lower = status.lower()
             matching_tasks = [
                 t for t in matching_tasks
-                if t.get("status", "").lower() == status_lower
+                if (t.get("status") or "").lower() == status_lower
             ]
-        
         return {
             "tasks": matching_tasks,
             "total": len(matching_tasks),
-            "query": query
+            "query": query,
+            "match_type": "substring"
         }
-    
-    def _parse_project_id(self, project_id: str) -> tuple[str, str]:
-        """Parse composite project ID."""
-        if ":" in project_id:
-            return project_id.split(":", 1)
-        else:
-            providers = self.context.provider_manager.get_active_providers()
-            if not providers:
-                raise ValueError("No active PM providers found")
-            return str(providers[0].id), project_id
-    
-    def _to_dict(self, obj) -> dict:
-        """Convert object to dictionary."""
-        if isinstance(obj, dict):
-            return obj
-        if hasattr(obj, "model_dump"):
-            return obj.model_dump()
-        if hasattr(obj, "dict"):
-            return obj.dict()
-        if hasattr(obj, "__dict__"):
-            return {k: v for k, v in obj.__dict__.items() if not k.startswith("_")}
-        raise TypeError(f"Cannot convert {type(obj).__name__} to dict")
-
-
@@ -136,8 +136,9 @@ def create_sse_app(context: ToolContext, config: PMServerConfig, mcp_server_inst
             require_auth = AuthService.should_require_auth(config)
             user_id = await AuthService.extract_user_id(request, require_auth=require_auth)
             
-            # Create user-scoped MCP server instance
-            if user_id:
+            # Create user-scoped MCP server instance (binds the shared tool catalog)
+            user_scoped = bool(user_id)
+            if user_scoped:
                 mcp_server = UserContext.create_user_scoped_server(user_id, config)
             else:
                 # Fallback to global server (backward compatibility, not recommended)
@@ -290,6 +291,9 @@ def create_sse_app(context: ToolContext, config: PMServerConfig, mcp_server_inst
                     await read_stream_writer.aclose()
                     await read_stream_converted_writer.aclose()
                     await write_stream_reader.aclose()
+                    # Release the user-scoped server's database session
+                    if user_scoped:
+                        mcp_server._cleanup()
             
             # Return EventSourceResponse (from sse_starlette)
             return EventSourceResponse(sse_event_generator())
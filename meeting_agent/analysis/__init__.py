@@ -7,8 +7,21 @@ including summarization, action item extraction, and decision tracking.
 
 from meeting_agent.analysis.summarizer import MeetingSummarizer
 from meeting_agent.analysis.action_extractor import ActionExtractor
+from meeting_agent.analysis.metrics import AnalysisMetrics, StageMetrics
+from meeting_agent.analysis.pipeline import (
+    TranscriptAnalysis,
+    TranscriptAnalyzer,
+    chunk_transcript,
+    merge_chunk_results,
+)
 
 __all__ = [
     'MeetingSummarizer',
     'ActionExtractor',
+    'AnalysisMetrics',
+    'StageMetrics',
+    'TranscriptAnalysis',
+    'TranscriptAnalyzer',
+    'chunk_transcript',
+    'merge_chunk_results',
 ]
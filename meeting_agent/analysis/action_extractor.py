@@ -20,6 +20,7 @@ from meeting_agent.models.action_item import (
     DecisionType,
     FollowUp,
 )
+from meeting_agent.analysis.metrics import StageMetrics, record_usage
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +57,7 @@ class ActionExtractor:
         participant_mapping: Optional[Dict[str, str]] = None,
         project_context: Optional[Dict[str, Any]] = None,
         api_key: Optional[str] = None,
+        metrics: Optional[StageMetrics] = None,
     ) -> tuple[List[ActionItem], List[Decision], List[FollowUp]]:
         """
         Extract action items, decisions, and follow-ups from a meeting.
@@ -64,6 +66,7 @@ class ActionExtractor:
             meeting: The meeting to analyze
             participant_mapping: Optional mapping of names to PM user IDs
             project_context: Optional context about the project
+            metrics: Optional stage metrics to record token usage into
             
         Returns:
             Tuple of (action_items, decisions, follow_ups)
@@ -84,36 +87,53 @@ class ActionExtractor:
         
         # Call LLM
         try:
-            response = await self._call_llm(prompt, api_key)
+            response = await self._call_llm(prompt, api_key, metrics)
             parsed = self._parse_response(response)
-            
-            # Convert to models
-            action_items = self._parse_action_items(
-                parsed.get("action_items", []),
-                meeting.id,
-                participant_mapping,
-            )
-            
-            decisions = []
-            if self.config.extract_decisions:
-                decisions = self._parse_decisions(
-                    parsed.get("decisions", []),
-                    meeting.id,
-                )
-            
-            follow_ups = []
-            if self.config.extract_follow_ups:
-                follow_ups = self._parse_follow_ups(
-                    parsed.get("follow_ups", []),
-                    meeting.id,
-                )
-            
-            return action_items, decisions, follow_ups
+            return self.build_results(parsed, meeting.id, participant_mapping)
             
         except Exception as e:
             logger.exception(f"Action extraction failed: {e}")
             raise
     
+    def build_results(
+        self,
+        parsed: Dict[str, Any],
+        meeting_id: str,
+        participant_mapping: Optional[Dict[str, str]] = None,
+    ) -> tuple[List[ActionItem], List[Decision], List[FollowUp]]:
+        """
+        Convert extracted JSON into models.
+        
+        Args:
+            parsed: Dict with action_items, decisions and follow_ups lists
+            meeting_id: Parent meeting ID
+            participant_mapping: Optional mapping of names to PM user IDs
+            
+        Returns:
+            Tuple of (action_items, decisions, follow_ups)
+        """
+        action_items = self._parse_action_items(
+            parsed.get("action_items", []),
+            meeting_id,
+            participant_mapping,
+        )
+        
+        decisions = []
+        if self.config.extract_decisions:
+            decisions = self._parse_decisions(
+                parsed.get("decisions", []),
+                meeting_id,
+            )
+        
+        follow_ups = []
+        if self.config.extract_follow_ups:
+            follow_ups = self._parse_follow_ups(
+                parsed.get("follow_ups", []),
+                meeting_id,
+            )
+        
+        return action_items, decisions, follow_ups
+    
     def _build_extraction_prompt(
         self,
         meeting: Meeting,
@@ -194,7 +214,12 @@ Return ONLY the JSON, no additional text."""
 
         return prompt
     
-    async def _call_llm(self, prompt: str, api_key: Optional[str] = None) -> str:
+    async def _call_llm(
+        self,
+        prompt: str,
+        api_key: Optional[str] = None,
+        metrics: Optional[StageMetrics] = None,
+    ) -> str:
         """Call the LLM with the prompt"""
         try:
             from openai import AsyncOpenAI
@@ -211,6 +236,7 @@ Return ONLY the JSON, no additional text."""
                 temperature=0.2,
                 max_tokens=3000,
             )
+            record_usage(metrics, response)
             
             return response.choices[0].message.content
             
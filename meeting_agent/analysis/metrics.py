@@ -0,0 +1,81 @@
+"""
+Token usage and latency accounting for meeting analysis.
+
+Each LLM call records its token usage into a StageMetrics object owned by
+the caller, so concurrent analyses never share counters.
+"""
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+
+@dataclass
+class StageMetrics:
+    """Usage and wall time of one analysis stage"""
+    name: str
+    calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency_ms: float = 0.0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def record_usage(self, usage: Any) -> None:
+        """Add the usage block of an OpenAI chat completion (may be None)"""
+        self.calls += 1
+        if usage is None:
+            return
+        self.prompt_tokens += getattr(usage, "prompt_tokens", 0) or 0
+        self.completion_tokens += getattr(usage, "completion_tokens", 0) or 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "latency_ms": round(self.latency_ms, 1),
+        }
+
+
+@dataclass
+class AnalysisMetrics:
+    """Per-stage metrics of one transcript analysis"""
+    stages: Dict[str, StageMetrics] = field(default_factory=dict)
+    chunks: int = 0
+    failed_chunks: List[int] = field(default_factory=list)
+    latency_ms: float = 0.0
+
+    def stage(self, name: str) -> StageMetrics:
+        if name not in self.stages:
+            self.stages[name] = StageMetrics(name=name)
+        return self.stages[name]
+
+    @contextmanager
+    def timed(self, name: str) -> Iterator[StageMetrics]:
+        """Time a stage; the wall time is added to the stage latency"""
+        stage = self.stage(name)
+        started = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage.latency_ms += (time.perf_counter() - started) * 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "chunks": self.chunks,
+            "failed_chunks": list(self.failed_chunks),
+            "latency_ms": round(self.latency_ms, 1),
+            "total_tokens": sum(stage.total_tokens for stage in self.stages.values()),
+            "stages": {name: stage.to_dict() for name, stage in self.stages.items()},
+        }
+
+
+def record_usage(metrics: Optional[StageMetrics], response: Any) -> None:
+    """Record a completion's usage if the caller asked for metrics"""
+    if metrics is not None:
+        metrics.record_usage(getattr(response, "usage", None))
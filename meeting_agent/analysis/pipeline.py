@@ -0,0 +1,573 @@
+"""
+Transcript analysis pipeline.
+
+Runs summarization and action extraction concurrently. Transcripts too
+long for one prompt are split into token-bounded chunks along speaker
+turns, each chunk is analyzed concurrently (map), and the chunk notes are
+merged with de-duplication before a final summary pass (reduce). Token
+usage and latency are reported per stage.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from meeting_agent.models.meeting import Meeting, Transcript
+from meeting_agent.models.action_item import (
+    ActionItem,
+    Decision,
+    FollowUp,
+    MeetingSummary,
+)
+from meeting_agent.analysis.summarizer import MeetingSummarizer
+from meeting_agent.analysis.action_extractor import ActionExtractor
+from meeting_agent.analysis.metrics import AnalysisMetrics, StageMetrics, record_usage
+
+logger = logging.getLogger(__name__)
+
+# Items whose normalized text is at least this similar are treated as duplicates
+DUPLICATE_SIMILARITY = 0.85
+
+# A word swapped between two similar texts must be at least this similar to
+# the original (plural, spelling variant); otherwise the texts name different
+# things, as in "by Monday" / "by Friday" or "Alice" / "Bob"
+_WORD_VARIANT_SIMILARITY = 0.8
+
+# Action items that set any of these differently are never merged
+_ACTION_ITEM_IDENTITY = ("assignee", "due_date", "due_date_text")
+
+_NUMBER = re.compile(r"\d+")
+
+# Ranking used when merging duplicate action items: the highest priority wins
+_PRIORITY_RANK = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+_encoding = None
+_encoding_failed = False
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count tokens with tiktoken's cl100k_base encoding.
+
+    Falls back to a chars/4 estimate when tiktoken or its encoding files
+    are unavailable (e.g. offline).
+    """
+    global _encoding, _encoding_failed
+    if _encoding is None and not _encoding_failed:
+        try:
+            import tiktoken
+            _encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            logger.debug(f"tiktoken unavailable, estimating tokens from length: {e}")
+            _encoding_failed = True
+    if _encoding is not None:
+        return len(_encoding.encode(text, disallowed_special=()))
+    return max(1, len(text) // 4) if text else 0
+
+
+@dataclass
+class TranscriptChunk:
+    """A token-bounded run of consecutive speaker turns"""
+    index: int
+    text: str
+    tokens: int
+    start_time: Optional[float] = None
+    end_time: Optional[float] = None
+
+
+@dataclass
+class _Turn:
+    text: str
+    start_time: Optional[float] = None
+    end_time: Optional[float] = None
+
+
+def _speaker_turns(transcript: Transcript) -> List[_Turn]:
+    """Merge consecutive segments by the same speaker into one turn each"""
+    if not transcript.segments:
+        text = transcript.full_text or ""
+        return [_Turn(line.strip()) for line in text.splitlines() if line.strip()]
+
+    turns: List[_Turn] = []
+    speaker = object()
+    parts: List[str] = []
+    start = end = None
+    for segment in transcript.segments:
+        if segment.speaker != speaker and parts:
+            prefix = f"[{speaker}]: " if speaker else ""
+            turns.append(_Turn(prefix + " ".join(parts), start, end))
+            parts = []
+        if not parts:
+            speaker = segment.speaker
+            start = segment.start_time
+        parts.append(segment.text.strip())
+        end = segment.end_time
+    if parts:
+        prefix = f"[{speaker}]: " if speaker else ""
+        turns.append(_Turn(prefix + " ".join(parts), start, end))
+    return turns
+
+
+def _split_oversized(turn: _Turn, max_tokens: int, counter: Callable[[str], int]) -> List[_Turn]:
+    """Split a turn longer than max_tokens on sentence boundaries"""
+    prefix_match = re.match(r"^\[[^\]]*\]: ", turn.text)
+    prefix = prefix_match.group(0) if prefix_match else ""
+    pieces: List[_Turn] = []
+    current: List[str] = []
+    for sentence in _SENTENCE_END.split(turn.text[len(prefix):]):
+        candidate = " ".join(current + [sentence])
+        if current and counter(prefix + candidate) > max_tokens:
+            pieces.append(_Turn(prefix + " ".join(current), turn.start_time, turn.end_time))
+            current = []
+        current.append(sentence)
+    if current:
+        pieces.append(_Turn(prefix + " ".join(current), turn.start_time, turn.end_time))
+    return pieces
+
+
+def chunk_transcript(
+    transcript: Transcript,
+    max_tokens: int,
+    counter: Callable[[str], int] = count_tokens,
+) -> List[TranscriptChunk]:
+    """
+    Split a transcript into chunks of at most max_tokens, along speaker turns.
+
+    Turns are never split unless a single turn exceeds max_tokens, in which
+    case it is cut on sentence boundaries (a single sentence longer than
+    max_tokens becomes its own chunk).
+
+    Args:
+        transcript: Transcript with segments or full_text
+        max_tokens: Token budget per chunk
+        counter: Token counting function
+
+    Returns:
+        Chunks in transcript order
+    """
+    chunks: List[TranscriptChunk] = []
+    lines: List[str] = []
+    tokens = 0
+    start = end = None
+
+    def flush() -> None:
+        nonlocal lines, tokens, start, end
+        if lines:
+            chunks.append(TranscriptChunk(len(chunks), "\n".join(lines), tokens, start, end))
+        lines, tokens, start, end = [], 0, None, None
+
+    for turn in _speaker_turns(transcript):
+        turn_tokens = counter(turn.text)
+        pieces = [turn] if turn_tokens <= max_tokens else _split_oversized(turn, max_tokens, counter)
+        for piece in pieces:
+            piece_tokens = turn_tokens if piece is turn else counter(piece.text)
+            if lines and tokens + piece_tokens > max_tokens:
+                flush()
+            if not lines:
+                start = piece.start_time
+            lines.append(piece.text)
+            tokens += piece_tokens
+            end = piece.end_time
+    flush()
+    return chunks
+
+
+def _normalize(text: Optional[str]) -> str:
+    return " ".join(re.sub(r"[^\w\s]", " ", (text or "").lower()).split())
+
+
+def _is_duplicate(a: str, b: str) -> bool:
+    if not a or not b:
+        return False
+    if a == b:
+        return True
+    # "release 2.3" and "release 2.4" differ by one character but are different items
+    if _NUMBER.findall(a) != _NUMBER.findall(b):
+        return False
+    if SequenceMatcher(None, a, b).ratio() < DUPLICATE_SIMILARITY:
+        return False
+    a_words, b_words = a.split(), b.split()
+    for tag, i1, i2, j1, j2 in SequenceMatcher(None, a_words, b_words).get_opcodes():
+        if tag != "replace":
+            continue
+        replaced = SequenceMatcher(None, " ".join(a_words[i1:i2]), " ".join(b_words[j1:j2]))
+        if replaced.ratio() < _WORD_VARIANT_SIMILARITY:
+            return False
+    return True
+
+
+def _conflicts(a: Dict[str, Any], b: Dict[str, Any], fields: Tuple[str, ...]) -> bool:
+    """True if the two items set any of ``fields`` to different values"""
+    for name in fields:
+        a_value, b_value = _normalize(str(a.get(name) or "")), _normalize(str(b.get(name) or ""))
+        if a_value and b_value and a_value != b_value:
+            return True
+    return False
+
+
+def _dedupe(
+    items: List[Dict[str, Any]],
+    key: str,
+    merge: Callable[[Dict[str, Any], Dict[str, Any]], None],
+    identity: Tuple[str, ...] = (),
+) -> List[Dict[str, Any]]:
+    """
+    Keep the first of each group of near-identical items, merging the rest into it.
+
+    Items are near-identical when their ``key`` texts are (see ``_is_duplicate``)
+    and they do not set any of the ``identity`` fields differently.
+    """
+    kept: List[Dict[str, Any]] = []
+    kept_keys: List[str] = []
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        normalized = _normalize(item.get(key))
+        match = next(
+            (
+                i for i, existing in enumerate(kept_keys)
+                if _is_duplicate(normalized, existing)
+                and not _conflicts(kept[i], item, identity)
+            ),
+            None,
+        )
+        if match is None:
+            kept.append(dict(item))
+            kept_keys.append(normalized)
+        else:
+            merge(kept[match], item)
+    return kept
+
+
+def _fill_missing(target: Dict[str, Any], other: Dict[str, Any]) -> None:
+    for name, value in other.items():
+        if value and not target.get(name):
+            target[name] = value
+
+
+def _merge_action_item(target: Dict[str, Any], other: Dict[str, Any]) -> None:
+    _fill_missing(target, other)
+    target_rank = _PRIORITY_RANK.get(str(target.get("priority", "")).lower(), -1)
+    other_rank = _PRIORITY_RANK.get(str(other.get("priority", "")).lower(), -1)
+    if other_rank > target_rank:
+        target["priority"] = other["priority"]
+
+
+def _merge_decision(target: Dict[str, Any], other: Dict[str, Any]) -> None:
+    makers = list(target.get("decision_makers") or [])
+    makers += [m for m in other.get("decision_makers") or [] if m not in makers]
+    _fill_missing(target, other)
+    target["decision_makers"] = makers
+
+
+def merge_chunk_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge per-chunk analysis results, de-duplicating repeated items.
+
+    Action items, decisions, follow-ups and key points mentioned in several
+    chunks are kept once; missing fields are filled from the duplicates,
+    action items keep the highest priority and decision makers are unioned.
+    Items that differ in a number or a swapped word, and action items with
+    different assignees or due dates, are kept apart.
+
+    Args:
+        results: Parsed chunk results, in transcript order
+
+    Returns:
+        Dict with key_points, topics, participant_contributions,
+        action_items, decisions and follow_ups
+    """
+    def collect(name: str) -> List[Any]:
+        return [item for result in results for item in result.get(name) or []]
+
+    contributions: Dict[str, List[str]] = {}
+    for result in results:
+        for person, items in (result.get("participant_contributions") or {}).items():
+            contributions.setdefault(person, []).extend(items or [])
+
+    def dedupe_texts(texts: List[Any]) -> List[str]:
+        wrapped = [{"text": t} for t in texts if isinstance(t, str)]
+        return [item["text"] for item in _dedupe(wrapped, "text", lambda a, b: None)]
+
+    return {
+        "key_points": dedupe_texts(collect("key_points")),
+        "topics": dedupe_texts(collect("topics")),
+        "participant_contributions": {
+            person: dedupe_texts(items) for person, items in contributions.items()
+        },
+        "action_items": _dedupe(
+            collect("action_items"), "description", _merge_action_item, _ACTION_ITEM_IDENTITY
+        ),
+        "decisions": _dedupe(collect("decisions"), "summary", _merge_decision),
+        "follow_ups": _dedupe(collect("follow_ups"), "topic", _fill_missing),
+    }
+
+
+@dataclass
+class TranscriptAnalysis:
+    """Result of analyzing one meeting transcript"""
+    summary: MeetingSummary
+    action_items: List[ActionItem] = field(default_factory=list)
+    decisions: List[Decision] = field(default_factory=list)
+    follow_ups: List[FollowUp] = field(default_factory=list)
+    metrics: AnalysisMetrics = field(default_factory=AnalysisMetrics)
+
+
+class TranscriptAnalyzer:
+    """
+    Summarizes a meeting and extracts its action items in one pipeline.
+
+    Transcripts within max_chunk_tokens get one summary and one extraction
+    call, run concurrently. Longer ones are map-reduced: every chunk gets a
+    combined notes-and-items prompt (at most max_concurrency at a time),
+    the notes are merged and de-duplicated, and the summarizer writes the
+    final summary from the merged notes.
+    """
+
+    def __init__(
+        self,
+        summarizer: Optional[MeetingSummarizer] = None,
+        extractor: Optional[ActionExtractor] = None,
+        max_chunk_tokens: int = 6000,
+        max_concurrency: int = 4,
+        token_counter: Callable[[str], int] = count_tokens,
+    ):
+        """
+        Initialize analyzer.
+
+        Args:
+            summarizer: Summarizer used for short transcripts and the reduce step
+            extractor: Extractor used for short transcripts and to build models
+            max_chunk_tokens: Token budget per transcript chunk
+            max_concurrency: Max chunk prompts in flight
+            token_counter: Token counting function
+        """
+        self.summarizer = summarizer or MeetingSummarizer()
+        self.extractor = extractor or ActionExtractor()
+        self.max_chunk_tokens = max_chunk_tokens
+        self.max_concurrency = max(1, max_concurrency)
+        self.count_tokens = token_counter
+
+    async def analyze(
+        self,
+        meeting: Meeting,
+        participant_mapping: Optional[Dict[str, str]] = None,
+        project_context: Optional[Dict[str, Any]] = None,
+        api_key: Optional[str] = None,
+    ) -> TranscriptAnalysis:
+        """
+        Summarize a meeting and extract action items, decisions and follow-ups.
+
+        Args:
+            meeting: The meeting to analyze
+            participant_mapping: Optional mapping of names to PM user IDs
+            project_context: Optional context about the project
+            api_key: Optional OpenAI API key
+
+        Returns:
+            TranscriptAnalysis with the summary (items attached) and metrics
+        """
+        if not meeting.transcript:
+            raise ValueError("Meeting has no transcript")
+
+        metrics = AnalysisMetrics()
+        started = time.perf_counter()
+        chunks = chunk_transcript(meeting.transcript, self.max_chunk_tokens, self.count_tokens)
+        metrics.chunks = len(chunks)
+
+        if len(chunks) <= 1:
+            analysis = await self._analyze_whole(
+                meeting, participant_mapping, project_context, api_key, metrics
+            )
+        else:
+            analysis = await self._analyze_chunked(
+                meeting, chunks, participant_mapping, project_context, api_key, metrics
+            )
+
+        metrics.latency_ms = (time.perf_counter() - started) * 1000
+        analysis.summary.action_items = analysis.action_items
+        analysis.summary.decisions = analysis.decisions
+        analysis.summary.follow_ups = analysis.follow_ups
+        logger.info(
+            f"Analyzed meeting {meeting.id} in {metrics.latency_ms:.0f}ms "
+            f"({metrics.chunks} chunks, {metrics.to_dict()['total_tokens']} tokens)"
+        )
+        return analysis
+
+    async def _analyze_whole(
+        self,
+        meeting: Meeting,
+        participant_mapping: Optional[Dict[str, str]],
+        project_context: Optional[Dict[str, Any]],
+        api_key: Optional[str],
+        metrics: AnalysisMetrics,
+    ) -> TranscriptAnalysis:
+        """Run summary and extraction over the whole transcript concurrently"""
+        async def summarize() -> MeetingSummary:
+            with metrics.timed("summary") as stage:
+                return await self.summarizer.summarize(
+                    meeting, project_context=project_context, api_key=api_key, metrics=stage
+                )
+
+        async def extract():
+            with metrics.timed("extraction") as stage:
+                return await self.extractor.extract(
+                    meeting,
+                    participant_mapping=participant_mapping,
+                    project_context=project_context,
+                    api_key=api_key,
+                    metrics=stage,
+                )
+
+        summary, (action_items, decisions, follow_ups) = await asyncio.gather(
+            summarize(), extract()
+        )
+        return TranscriptAnalysis(summary, action_items, decisions, follow_ups, metrics)
+
+    async def _analyze_chunked(
+        self,
+        meeting: Meeting,
+        chunks: List[TranscriptChunk],
+        participant_mapping: Optional[Dict[str, str]],
+        project_context: Optional[Dict[str, Any]],
+        api_key: Optional[str],
+        metrics: AnalysisMetrics,
+    ) -> TranscriptAnalysis:
+        """Map chunks concurrently, then merge and summarize the notes"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def analyze_chunk(chunk: TranscriptChunk) -> Dict[str, Any]:
+            async with semaphore:
+                prompt = self._build_chunk_prompt(meeting, chunk, len(chunks))
+                response = await self._call_llm(prompt, api_key, metrics.stage("map"))
+                return self.extractor._parse_response(response)
+
+        with metrics.timed("map"):
+            results = await asyncio.gather(
+                *(analyze_chunk(chunk) for chunk in chunks), return_exceptions=True
+            )
+
+        notes = []
+        failed = []
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Analysis of chunk {chunk.index} failed: {result}")
+                failed.append(chunk.index)
+            else:
+                notes.append(result)
+        if not notes:
+            raise RuntimeError(f"Analysis failed for all {len(chunks)} transcript chunks")
+        metrics.failed_chunks = failed
+
+        with metrics.timed("merge"):
+            merged = merge_chunk_results(notes)
+            action_items, decisions, follow_ups = self.extractor.build_results(
+                merged, meeting.id, participant_mapping
+            )
+
+        with metrics.timed("reduce") as stage:
+            summary = await self.summarizer.summarize_notes(
+                meeting,
+                {
+                    "key_points": merged["key_points"],
+                    "topics": merged["topics"],
+                    "participant_contributions": merged["participant_contributions"],
+                    "decisions": [d.get("summary") for d in merged["decisions"]],
+                },
+                project_context=project_context,
+                api_key=api_key,
+                metrics=stage,
+            )
+
+        return TranscriptAnalysis(summary, action_items, decisions, follow_ups, metrics)
+
+    def _build_chunk_prompt(self, meeting: Meeting, chunk: TranscriptChunk, total: int) -> str:
+        """Build the combined notes-and-items prompt for one chunk"""
+        participants = ", ".join([p.name for p in meeting.participants]) if meeting.participants else "Unknown"
+
+        prompt = f"""The following is part {chunk.index + 1} of {total} of a meeting transcript. Take notes on this part only.
+
+## Meeting Information
+- Title: {meeting.title}
+- Participants: {participants}
+
+## Transcript (part {chunk.index + 1} of {total})
+{chunk.text}
+
+## Instructions
+Return your notes in this JSON format:
+
+```json
+{{
+    "key_points": ["Key point discussed in this part"],
+    "topics": ["Topic"],
+    "participant_contributions": {{
+        "Participant Name": ["Their key contribution"]
+    }},
+    "action_items": [
+        {{
+            "description": "Clear description of what needs to be done",
+            "assignee": "Person's name or null if unassigned",
+            "due_date": "YYYY-MM-DD or null",
+            "due_date_text": "Original text like 'by Friday' or 'next week'",
+            "priority": "high|medium|low",
+            "context": "Brief context why this is needed",
+            "source_quote": "Exact quote from transcript"
+        }}
+    ],
+    "decisions": [
+        {{
+            "summary": "What was decided",
+            "type": "approval|rejection|direction|agreement|deferral",
+            "decision_makers": ["Name1", "Name2"],
+            "source_quote": "Exact quote"
+        }}
+    ],
+    "follow_ups": [
+        {{
+            "topic": "What needs follow-up",
+            "reason": "Why it needs follow-up",
+            "suggested_timing": "When to follow up"
+        }}
+    ]
+}}
+```
+
+Only include items with clear evidence in this part of the transcript.
+Return ONLY the JSON, no additional text."""
+
+        return prompt
+
+    async def _call_llm(
+        self,
+        prompt: str,
+        api_key: Optional[str] = None,
+        metrics: Optional[StageMetrics] = None,
+    ) -> str:
+        """Call the LLM with a chunk prompt"""
+        try:
+            from openai import AsyncOpenAI
+
+            client = AsyncOpenAI(api_key=api_key)
+
+            response = await client.chat.completions.create(
+                model=self.extractor.config.model,
+                messages=[
+                    {"role": "system", "content": "You are a meeting analysis expert. Take structured notes on transcript excerpts."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.2,
+                max_tokens=2000,
+            )
+            record_usage(metrics, response)
+
+            return response.choices[0].message.content
+
+        except ImportError:
+            raise ImportError("OpenAI library not installed. Run: pip install openai")
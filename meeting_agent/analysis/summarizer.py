@@ -12,6 +12,7 @@ from dataclasses import dataclass
 
 from meeting_agent.models.meeting import Meeting, Transcript
 from meeting_agent.models.action_item import MeetingSummary
+from meeting_agent.analysis.metrics import StageMetrics, record_usage
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +50,7 @@ class MeetingSummarizer:
         existing_summary: Optional[MeetingSummary] = None,
         project_context: Optional[Dict[str, Any]] = None,
         api_key: Optional[str] = None,
+        metrics: Optional[StageMetrics] = None,
     ) -> MeetingSummary:
         """
         Generate a summary for a meeting.
@@ -57,6 +59,7 @@ class MeetingSummarizer:
             meeting: The meeting to summarize
             existing_summary: Optional existing summary to update
             project_context: Optional context about the project
+            metrics: Optional stage metrics to record token usage into
             
         Returns:
             MeetingSummary with analysis
@@ -71,29 +74,66 @@ class MeetingSummarizer:
         
         # Call LLM
         try:
-            response = await self._call_llm(prompt, api_key)
-            parsed = self._parse_response(response)
+            response = await self._call_llm(prompt, api_key, metrics)
+            return self._build_summary(meeting, self._parse_response(response), existing_summary)
             
-            summary = MeetingSummary(
-                meeting_id=meeting.id,
-                executive_summary=parsed.get("summary", ""),
-                key_points=parsed.get("key_points", []),
-                topics=parsed.get("topics", []),
-                participant_contributions=parsed.get("participant_contributions", {}),
-                overall_sentiment=parsed.get("sentiment"),
-                model_used=self.config.model,
-                # Action items and decisions will be filled by other analyzers
-                action_items=existing_summary.action_items if existing_summary else [],
-                decisions=existing_summary.decisions if existing_summary else [],
-                follow_ups=existing_summary.follow_ups if existing_summary else [],
-            )
+        except Exception as e:
+            logger.exception(f"Summarization failed: {e}")
+            raise
+    
+    async def summarize_notes(
+        self,
+        meeting: Meeting,
+        notes: Dict[str, Any],
+        project_context: Optional[Dict[str, Any]] = None,
+        api_key: Optional[str] = None,
+        metrics: Optional[StageMetrics] = None,
+    ) -> MeetingSummary:
+        """
+        Summarize a meeting from notes merged across transcript chunks.
+        
+        Used as the reduce step for transcripts too long for one prompt.
+        
+        Args:
+            meeting: The meeting being summarized
+            notes: Merged chunk notes with key_points, topics and participant_contributions
+            project_context: Optional context about the project
+            metrics: Optional stage metrics to record token usage into
             
-            return summary
+        Returns:
+            MeetingSummary with analysis
+        """
+        prompt = self._build_reduce_prompt(meeting, notes, project_context)
+        
+        try:
+            response = await self._call_llm(prompt, api_key, metrics)
+            return self._build_summary(meeting, self._parse_response(response))
             
         except Exception as e:
             logger.exception(f"Summarization failed: {e}")
             raise
     
+    def _build_summary(
+        self,
+        meeting: Meeting,
+        parsed: Dict[str, Any],
+        existing_summary: Optional[MeetingSummary] = None,
+    ) -> MeetingSummary:
+        """Build a MeetingSummary from the parsed LLM response"""
+        return MeetingSummary(
+            meeting_id=meeting.id,
+            executive_summary=parsed.get("summary", ""),
+            key_points=parsed.get("key_points", []),
+            topics=parsed.get("topics", []),
+            participant_contributions=parsed.get("participant_contributions", {}),
+            overall_sentiment=parsed.get("sentiment"),
+            model_used=self.config.model,
+            # Action items and decisions will be filled by other analyzers
+            action_items=existing_summary.action_items if existing_summary else [],
+            decisions=existing_summary.decisions if existing_summary else [],
+            follow_ups=existing_summary.follow_ups if existing_summary else [],
+        )
+    
     def _build_summary_prompt(
         self,
         meeting: Meeting,
@@ -157,7 +197,59 @@ Return ONLY the JSON, no additional text."""
 
         return prompt
     
-    async def _call_llm(self, prompt: str, api_key: Optional[str] = None) -> str:
+    def _build_reduce_prompt(
+        self,
+        meeting: Meeting,
+        notes: Dict[str, Any],
+        project_context: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Build the prompt that summarizes merged chunk notes"""
+        participants = ", ".join([p.name for p in meeting.participants]) if meeting.participants else "Unknown"
+        project_info = ""
+        if project_context:
+            project_info = f"""
+## Project Context
+- Project: {project_context.get('name', 'Unknown')}
+- Description: {project_context.get('description', '')}
+"""
+        
+        prompt = f"""The following notes were taken on consecutive parts of one meeting. Combine them into a single summary of the whole meeting.
+
+## Meeting Information
+- Title: {meeting.title}
+- Participants: {participants}
+- Duration: {meeting.duration_minutes or 'Unknown'} minutes
+{project_info}
+## Notes
+```json
+{json.dumps(notes, ensure_ascii=False, indent=2)}
+```
+
+## Instructions
+Merge overlapping points, keep the most important ones, and provide your analysis in the following JSON format:
+
+```json
+{{
+    "summary": "A 2-3 sentence executive summary of the meeting",
+    "key_points": ["... (up to {self.config.max_key_points} points)"],
+    "topics": ["... (up to {self.config.max_topics} topics)"],
+    "participant_contributions": {{
+        "Participant Name": ["Their key contribution 1", "Their key contribution 2"]
+    }},
+    "sentiment": "positive|neutral|negative"
+}}
+```
+
+Return ONLY the JSON, no additional text."""
+
+        return prompt
+    
+    async def _call_llm(
+        self,
+        prompt: str,
+        api_key: Optional[str] = None,
+        metrics: Optional[StageMetrics] = None,
+    ) -> str:
         """Call the LLM with the prompt"""
         try:
             from openai import AsyncOpenAI
@@ -174,6 +266,7 @@ Return ONLY the JSON, no additional text."""
                 temperature=0.3,
                 max_tokens=2000,
             )
+            record_usage(metrics, response)
             
             return response.choices[0].message.content
             
@@ -6,11 +6,14 @@ including format conversion, audio analysis, and preparation
 for transcription.
 """
 
-from meeting_agent.audio.processor import AudioProcessor
-from meeting_agent.audio.transcriber import Transcriber, TranscriptionResult
+from meeting_agent.audio.processor import AudioChunk, AudioProcessor, AudioSplitError
+from meeting_agent.audio.transcriber import Transcriber, TranscriptionResult, stitch_chunk_transcripts
 
 __all__ = [
+    'AudioChunk',
     'AudioProcessor',
+    'AudioSplitError',
     'Transcriber',
     'TranscriptionResult',
+    'stitch_chunk_transcripts',
 ]
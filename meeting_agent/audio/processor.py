@@ -5,10 +5,14 @@ Handles audio file processing, format conversion, and
 preparation for transcription.
 """
 
+import asyncio
+import csv
+import json
 import os
 import logging
+import subprocess
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -26,6 +30,22 @@ class AudioInfo:
     bitrate: Optional[int] = None
 
 
+@dataclass
+class AudioChunk:
+    """A piece of a split recording and where it starts in the original"""
+    index: int
+    path: str
+    start_seconds: float = 0.0
+
+
+class AudioSplitError(RuntimeError):
+    """Splitting stopped before the end of the recording"""
+
+    def __init__(self, message: str, chunks_emitted: int):
+        super().__init__(message)
+        self.chunks_emitted = chunks_emitted
+
+
 class AudioProcessor:
     """
     Processes audio files for transcription.
@@ -73,79 +93,130 @@ class AudioProcessor:
         
         return True, None
     
+    @staticmethod
+    def _probe_command(path: Path) -> List[str]:
+        return [
+            "ffprobe",
+            "-v", "quiet",
+            "-print_format", "json",
+            "-show_format",
+            "-show_streams",
+            str(path)
+        ]
+
+    @staticmethod
+    def _build_audio_info(path: Path, probe_output: Optional[str]) -> AudioInfo:
+        """Build AudioInfo from ffprobe JSON, or basic info if probing failed"""
+        ext = path.suffix.lower().lstrip(".")
+        file_size = path.stat().st_size
+
+        if probe_output:
+            data = json.loads(probe_output)
+            format_info = data.get("format", {})
+            streams = data.get("streams", [])
+
+            # Find audio stream
+            audio_stream = next(
+                (s for s in streams if s.get("codec_type") == "audio"),
+                {}
+            )
+
+            return AudioInfo(
+                path=str(path),
+                format=ext,
+                duration_seconds=float(format_info.get("duration", 0)),
+                sample_rate=int(audio_stream.get("sample_rate", 44100)),
+                channels=int(audio_stream.get("channels", 2)),
+                file_size_bytes=file_size,
+                bitrate=int(format_info.get("bit_rate", 0)) if format_info.get("bit_rate") else None,
+            )
+
+        # Fall back to basic info
+        return AudioInfo(
+            path=str(path),
+            format=ext,
+            duration_seconds=0,  # Unknown without ffprobe
+            sample_rate=44100,   # Assume standard
+            channels=2,          # Assume stereo
+            file_size_bytes=file_size,
+        )
+
     def get_audio_info(self, file_path: str) -> Optional[AudioInfo]:
         """
         Get information about an audio file.
-        
+
         Uses ffprobe if available, otherwise falls back to basic info.
-        
+        Blocks while ffprobe runs; async code should use aget_audio_info.
+
         Args:
             file_path: Path to the audio file
-            
+
         Returns:
             AudioInfo or None if failed
         """
         path = Path(file_path)
-        
+
         if not path.exists():
             return None
-        
-        ext = path.suffix.lower().lstrip(".")
-        file_size = path.stat().st_size
-        
+
         # Try to use ffprobe for detailed info
         try:
-            import subprocess
-            import json
-            
             result = subprocess.run(
-                [
-                    "ffprobe",
-                    "-v", "quiet",
-                    "-print_format", "json",
-                    "-show_format",
-                    "-show_streams",
-                    str(path)
-                ],
+                self._probe_command(path),
                 capture_output=True,
                 text=True,
                 timeout=30
             )
-            
             if result.returncode == 0:
-                data = json.loads(result.stdout)
-                format_info = data.get("format", {})
-                streams = data.get("streams", [])
-                
-                # Find audio stream
-                audio_stream = next(
-                    (s for s in streams if s.get("codec_type") == "audio"),
-                    {}
-                )
-                
-                return AudioInfo(
-                    path=str(path),
-                    format=ext,
-                    duration_seconds=float(format_info.get("duration", 0)),
-                    sample_rate=int(audio_stream.get("sample_rate", 44100)),
-                    channels=int(audio_stream.get("channels", 2)),
-                    file_size_bytes=file_size,
-                    bitrate=int(format_info.get("bit_rate", 0)) if format_info.get("bit_rate") else None,
-                )
-                
+                return self._build_audio_info(path, result.stdout)
         except Exception as e:
             logger.warning(f"ffprobe failed, using basic info: {e}")
-        
-        # Fall back to basic info
-        return AudioInfo(
-            path=str(path),
-            format=ext,
-            duration_seconds=0,  # Unknown without ffprobe
-            sample_rate=44100,   # Assume standard
-            channels=2,          # Assume stereo
-            file_size_bytes=file_size,
+
+        return self._build_audio_info(path, None)
+
+    async def aget_audio_info(self, file_path: str) -> Optional[AudioInfo]:
+        """Async get_audio_info; ffprobe runs without blocking the event loop"""
+        path = Path(file_path)
+
+        if not path.exists():
+            return None
+
+        try:
+            result = await self._run_command(self._probe_command(path), timeout=30)
+            if result.returncode == 0:
+                return self._build_audio_info(path, result.stdout)
+        except Exception as e:
+            logger.warning(f"ffprobe failed, using basic info: {e}")
+
+        return self._build_audio_info(path, None)
+
+    @staticmethod
+    async def _run_command(cmd: Sequence[str], timeout: float) -> subprocess.CompletedProcess:
+        """
+        Run a command as an asyncio subprocess.
+
+        Behaves like subprocess.run(capture_output=True, text=True, timeout=...):
+        the process is killed and TimeoutExpired raised on timeout, and a
+        missing binary raises FileNotFoundError.
+        """
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-    
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise subprocess.TimeoutExpired(list(cmd), timeout)
+        return subprocess.CompletedProcess(
+            list(cmd),
+            process.returncode,
+            stdout.decode(errors="replace"),
+            stderr.decode(errors="replace"),
+        )
+
     async def prepare_for_transcription(
         self,
         file_path: str,
@@ -181,8 +252,6 @@ class AudioProcessor:
         # 32k-64k bitrate is usually sufficient for speech to text
         
         try:
-            import subprocess
-            
             # Use fixed bitrate 64k instead of q:a 2 (which can be large)
             common_args = [
                 "-ar", str(target_sample_rate),
@@ -199,12 +268,7 @@ class AudioProcessor:
                 str(output_path)
             ]
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=600 # Increase timeout to 10 min
-            )
+            result = await self._run_command(cmd, timeout=600)  # Increase timeout to 10 min
             
             if result.returncode != 0:
                 logger.warning(f"Standard ffmpeg conversion failed: {result.stderr}")
@@ -220,12 +284,7 @@ class AudioProcessor:
                     str(output_path)
                 ]
                 
-                result_recovery = subprocess.run(
-                    cmd_recovery,
-                    capture_output=True,
-                    text=True,
-                    timeout=600
-                )
+                result_recovery = await self._run_command(cmd_recovery, timeout=600)
                 
                 if result_recovery.returncode != 0:
                     logger.warning(f"Recovery (Tier 2) failed: {result_recovery.stderr}")
@@ -243,7 +302,7 @@ class AudioProcessor:
                             "-acodec", "copy", # Stream copy
                             str(temp_aac)
                         ]
-                        subprocess.run(cmd_extract, capture_output=True, text=True, timeout=300)
+                        await self._run_command(cmd_extract, timeout=300)
                         
                         if temp_aac.exists() and temp_aac.stat().st_size > 0:
                             logger.info("Tier 3 extraction successful, re-encoding to target...")
@@ -256,7 +315,7 @@ class AudioProcessor:
                                 str(output_path)
                             ]
                             # If this fails, it falls through to Tier 4
-                            result_final = subprocess.run(cmd_final, capture_output=True, text=True, timeout=300)
+                            result_final = await self._run_command(cmd_final, timeout=300)
                             
                             # Cleanup temp
                             try: temp_aac.unlink()
@@ -281,7 +340,7 @@ class AudioProcessor:
                             "-c:a", "copy",
                             str(temp_aac_raw)
                         ]
-                        result_force = subprocess.run(cmd_force, capture_output=True, text=True, timeout=300)
+                        result_force = await self._run_command(cmd_force, timeout=300)
                         
                         if result_force.returncode == 0 and temp_aac_raw.exists() and temp_aac_raw.stat().st_size > 0:
                             logger.info("Tier 4 successful, wrapping in M4A container...")
@@ -296,7 +355,7 @@ class AudioProcessor:
                                 "-bsf:a", "aac_adtstoasc", # Critical for AAC -> MP4
                                 str(safe_m4a)
                             ]
-                            result_wrap = subprocess.run(cmd_wrap, capture_output=True, text=True, timeout=300)
+                            result_wrap = await self._run_command(cmd_wrap, timeout=300)
                             
                             try: temp_aac_raw.unlink()
                             except: pass
@@ -341,65 +400,147 @@ class AudioProcessor:
                 raise ValueError(f"Processing failed: {e}. File ({original_size/1024/1024:.2f}MB) exceeds limit.")
             return str(path)
     
-    def split_audio(
+    @staticmethod
+    def _parse_segment_entry(line: bytes) -> Optional[Tuple[str, float]]:
+        """Parse one segment muxer CSV list entry: filename,start,end"""
+        text = line.decode(errors="replace").strip()
+        if not text:
+            return None
+        try:
+            row = next(csv.reader([text]))
+            return row[0], float(row[1])
+        except (StopIteration, IndexError, ValueError):
+            logger.warning(f"Unexpected segment list entry: {text}")
+            return None
+
+    async def stream_chunks(
+        self,
+        file_path: str,
+        chunk_duration_seconds: int = 600,  # 10 minutes
+        segment_timeout_seconds: float = 300,
+    ) -> AsyncIterator[AudioChunk]:
+        """
+        Split audio with one ffmpeg segment-muxer run, yielding chunks as they are cut.
+
+        ffmpeg writes the segment list to stdout each time a segment is
+        closed, so callers can start transcribing chunk 1 while later chunks
+        are still being written. Start offsets are read from the segment
+        list, so they match the actual cut points: stream copy cuts on packet
+        boundaries, not exactly every chunk_duration_seconds.
+
+        If ffmpeg is unavailable or produces no segments, the whole file is
+        yielded as a single chunk. If ffmpeg fails or stalls after some
+        segments were yielded, AudioSplitError is raised so the rest of the
+        recording is not silently dropped.
+
+        Args:
+            file_path: Path to audio file
+            chunk_duration_seconds: Target duration per chunk
+            segment_timeout_seconds: Max wait for the next segment
+
+        Yields:
+            AudioChunk for each segment, in order
+
+        Raises:
+            AudioSplitError: ffmpeg failed or stalled after yielding chunks
+        """
+        path = Path(file_path)
+        pattern = self.work_dir / f"{path.stem}_chunk%03d{path.suffix}"
+        cmd = [
+            "ffmpeg",
+            "-y",
+            "-hide_banner",
+            "-loglevel", "error",
+            "-i", str(path),
+            "-map", "0:a",
+            "-c", "copy",
+            "-f", "segment",
+            "-segment_time", str(chunk_duration_seconds),
+            "-reset_timestamps", "1",
+            "-segment_list", "pipe:1",
+            "-segment_list_type", "csv",
+            str(pattern),
+        ]
+
+        emitted = 0
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError:
+            logger.warning("ffmpeg not found, transcribing the file without splitting")
+            yield AudioChunk(index=0, path=str(path), start_seconds=0.0)
+            return
+
+        # Drain stderr concurrently so a chatty ffmpeg cannot block on a full pipe
+        stderr_task = asyncio.create_task(process.stderr.read())
+        try:
+            while True:
+                line = await asyncio.wait_for(process.stdout.readline(), segment_timeout_seconds)
+                if not line:
+                    break
+                entry = self._parse_segment_entry(line)
+                if entry is None:
+                    continue
+                name, start_seconds = entry
+                yield AudioChunk(index=emitted, path=str(self.work_dir / name), start_seconds=start_seconds)
+                emitted += 1
+
+            returncode = await process.wait()
+            stderr = (await stderr_task).decode(errors="replace")
+            if returncode != 0:
+                message = f"Audio splitting failed after {emitted} chunks: {stderr.strip()}"
+                logger.error(message)
+                if emitted:
+                    raise AudioSplitError(message, emitted)
+        except asyncio.TimeoutError:
+            message = f"Audio splitting stalled after {emitted} chunks"
+            logger.error(f"{message}, stopping ffmpeg")
+            if emitted:
+                raise AudioSplitError(message, emitted)
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            if not stderr_task.done():
+                stderr_task.cancel()
+
+        if emitted == 0:
+            yield AudioChunk(index=0, path=str(path), start_seconds=0.0)
+
+    async def split_audio(
         self,
         file_path: str,
         chunk_duration_seconds: int = 600,  # 10 minutes
     ) -> list[str]:
         """
         Split audio into chunks for processing.
-        
+
         Useful for very long recordings that exceed API limits.
-        
+        Use stream_chunks to start work on early chunks sooner.
+
         Args:
             file_path: Path to audio file
             chunk_duration_seconds: Max duration per chunk
-            
+
         Returns:
             List of paths to chunk files
         """
-        info = self.get_audio_info(file_path)
+        info = await self.aget_audio_info(file_path)
         if not info:
             return [file_path]
-        
+
         # If short enough, no splitting needed
-        if info.duration_seconds <= chunk_duration_seconds:
+        if 0 < info.duration_seconds <= chunk_duration_seconds:
             return [file_path]
-        
-        # Calculate number of chunks
-        num_chunks = int(info.duration_seconds / chunk_duration_seconds) + 1
-        
-        chunks = []
-        path = Path(file_path)
-        
-        try:
-            import subprocess
-            
-            for i in range(num_chunks):
-                start = i * chunk_duration_seconds
-                chunk_path = self.work_dir / f"{path.stem}_chunk{i:03d}{path.suffix}"
-                
-                cmd = [
-                    "ffmpeg",
-                    "-y",
-                    "-i", str(path),
-                    "-ss", str(start),
-                    "-t", str(chunk_duration_seconds),
-                    "-c", "copy",
-                    str(chunk_path)
-                ]
-                
-                result = subprocess.run(cmd, capture_output=True, timeout=120)
-                
-                if result.returncode == 0 and chunk_path.exists():
-                    chunks.append(str(chunk_path))
-            
-            return chunks if chunks else [file_path]
-            
-        except Exception as e:
-            logger.error(f"Audio splitting failed: {e}")
-            return [file_path]
-    
+
+        return [
+            chunk.path
+            async for chunk in self.stream_chunks(file_path, chunk_duration_seconds)
+        ]
+
     def cleanup(self) -> None:
         """Clean up temporary files"""
         import shutil
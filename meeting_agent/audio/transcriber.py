@@ -5,12 +5,19 @@ Supports multiple transcription providers including
 OpenAI Whisper, Deepgram, and AssemblyAI.
 """
 
+import asyncio
+import atexit
 import logging
+import multiprocessing
+import os
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterable, Iterable, List, Optional, Dict, Any, Sequence, Tuple, Union
 
+from meeting_agent.audio.processor import AudioChunk, AudioSplitError
 from meeting_agent.config import TranscriptionProvider
 from meeting_agent.models.meeting import Transcript, TranscriptSegment
 
@@ -166,22 +173,107 @@ class WhisperTranscriber(BaseTranscriber):
         return segments
 
 
+# Whisper model loaded once per worker process by _init_whisper_worker
+_worker_model = None
+
+
+def _init_whisper_worker(model_size: str, torch_threads: int) -> None:
+    """Process pool initializer: split the cores between workers and load the model"""
+    global _worker_model
+    try:
+        import torch
+        torch.set_num_threads(torch_threads)
+    except ImportError:
+        pass
+    import whisper
+    _worker_model = whisper.load_model(model_size)
+
+
+def _compact_whisper_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the fields we use, so results are cheap to send between processes"""
+    return {
+        "text": result.get("text", ""),
+        "language": result.get("language"),
+        "segments": [
+            {"text": seg["text"], "start": seg["start"], "end": seg["end"]}
+            for seg in result.get("segments", [])
+        ],
+    }
+
+
+def _transcribe_in_worker(audio_path: str, language: Optional[str]) -> Dict[str, Any]:
+    result = _worker_model.transcribe(audio_path, language=language, verbose=False)
+    return _compact_whisper_result(result)
+
+
+_whisper_pools: Dict[Tuple[str, int], ProcessPoolExecutor] = {}
+_whisper_pools_lock = threading.Lock()
+
+
+def _get_whisper_pool(model_size: str, max_workers: int) -> ProcessPoolExecutor:
+    """
+    Shared process pool per (model size, worker count).
+
+    Handlers are created per request, so pools live at module level and
+    each worker keeps its model loaded between meetings.
+    """
+    key = (model_size, max_workers)
+    with _whisper_pools_lock:
+        pool = _whisper_pools.get(key)
+        if pool is None:
+            torch_threads = max(1, (os.cpu_count() or 1) // max_workers)
+            pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                # torch does not survive fork() reliably
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_whisper_worker,
+                initargs=(model_size, torch_threads),
+            )
+            _whisper_pools[key] = pool
+        return pool
+
+
+def shutdown_whisper_pools() -> None:
+    """Stop all local Whisper worker processes"""
+    with _whisper_pools_lock:
+        pools = list(_whisper_pools.values())
+        _whisper_pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(shutdown_whisper_pools)
+
+
+def _default_whisper_workers() -> int:
+    configured = os.getenv("WHISPER_LOCAL_WORKERS")
+    if configured:
+        return max(0, int(configured))
+    return max(1, min(4, (os.cpu_count() or 1) // 2))
+
+
 class LocalWhisperTranscriber(BaseTranscriber):
     """
     Local Whisper model transcriber.
     
     Runs Whisper locally for privacy-sensitive transcription.
     Requires the whisper package to be installed.
+
+    Whisper is CPU-bound, so transcription runs in a process pool
+    (one model per worker) and chunks of one meeting use several cores.
+    With max_workers=0 the model runs in a thread of this process.
     """
     
-    def __init__(self, model_size: str = "base"):
+    def __init__(self, model_size: str = "base", max_workers: Optional[int] = None):
         """
         Initialize local Whisper.
         
         Args:
             model_size: Model size (tiny, base, small, medium, large)
+            max_workers: Worker processes (WHISPER_LOCAL_WORKERS, default half the cores up to 4)
         """
         self.model_size = model_size
+        self.max_workers = _default_whisper_workers() if max_workers is None else max_workers
         self._model = None
     
     def _load_model(self):
@@ -194,6 +286,19 @@ class LocalWhisperTranscriber(BaseTranscriber):
                 raise ImportError("whisper not installed. Run: pip install openai-whisper")
         return self._model
     
+    async def _run_whisper(self, audio_path: str, language: Optional[str]) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        if self.max_workers > 0:
+            pool = _get_whisper_pool(self.model_size, self.max_workers)
+            return await loop.run_in_executor(pool, _transcribe_in_worker, audio_path, language)
+
+        model = self._load_model()
+        result = await loop.run_in_executor(
+            None,
+            lambda: model.transcribe(audio_path, language=language, verbose=False),
+        )
+        return _compact_whisper_result(result)
+    
     async def transcribe(
         self,
         audio_path: str,
@@ -202,20 +307,7 @@ class LocalWhisperTranscriber(BaseTranscriber):
     ) -> TranscriptionResult:
         """Transcribe using local Whisper model"""
         try:
-            import asyncio
-            
-            model = self._load_model()
-            
-            # Run in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: model.transcribe(
-                    audio_path,
-                    language=language,
-                    verbose=False,
-                )
-            )
+            result = await self._run_whisper(audio_path, language)
             
             # Parse result
             segments = []
@@ -229,7 +321,7 @@ class LocalWhisperTranscriber(BaseTranscriber):
             
             transcript = Transcript(
                 meeting_id="",
-                language=result.get("language", language or "en"),
+                language=result.get("language") or language or "en",
                 segments=segments,
                 full_text=result.get("text", ""),
                 word_count=len(result.get("text", "").split()),
@@ -254,6 +346,44 @@ class LocalWhisperTranscriber(BaseTranscriber):
             )
 
 
+def stitch_chunk_transcripts(parts: Sequence[Tuple[AudioChunk, Transcript]]) -> Transcript:
+    """
+    Merge per-chunk transcripts into one transcript of the whole recording.
+
+    Segment times are shifted by each chunk's start offset and segments are
+    renumbered in order, so timestamps refer to the original recording.
+    """
+    segments: List[TranscriptSegment] = []
+    texts: List[str] = []
+    language = None
+    duration = 0.0
+
+    for chunk, transcript in sorted(parts, key=lambda part: part[0].index):
+        offset = chunk.start_seconds
+        for seg in transcript.segments:
+            segments.append(seg.model_copy(update={
+                "id": f"seg_{len(segments)}",
+                "start_time": seg.start_time + offset,
+                "end_time": seg.end_time + offset,
+            }))
+        text = transcript.full_text or " ".join(seg.text for seg in transcript.segments)
+        if text.strip():
+            texts.append(text.strip())
+        language = language or transcript.language
+        chunk_end = offset + (transcript.duration_seconds or (transcript.segments[-1].end_time if transcript.segments else 0))
+        duration = max(duration, chunk_end)
+
+    full_text = "\n\n".join(texts)
+    return Transcript(
+        meeting_id="",
+        language=language or "en",
+        segments=segments,
+        full_text=full_text,
+        word_count=len(full_text.split()),
+        duration_seconds=duration,
+    )
+
+
 class Transcriber:
     """
     Main transcriber class that wraps different providers.
@@ -315,3 +445,114 @@ class Transcriber:
             )
         
         return await self._transcriber.transcribe(audio_path, language, **kwargs)
+    
+    async def transcribe_chunks(
+        self,
+        chunks: Union[Iterable[AudioChunk], AsyncIterable[AudioChunk]],
+        language: Optional[str] = None,
+        max_concurrency: int = 4,
+        max_attempts: int = 3,
+        retry_delay_seconds: float = 1.0,
+    ) -> TranscriptionResult:
+        """
+        Transcribe the chunks of a split recording concurrently.
+
+        ``chunks`` may be an async iterable (AudioProcessor.stream_chunks), in
+        which case each chunk starts transcribing as soon as it is produced.
+        At most ``max_concurrency`` chunks are in flight. A failed chunk is
+        retried with exponential backoff up to ``max_attempts`` times; chunks
+        that still fail are left out of the stitched transcript and listed in
+        ``raw_response["failed_chunks"]`` instead of failing the recording.
+        If the chunk source raises AudioSplitError, the chunks already
+        produced are still transcribed, but the result is unsuccessful and
+        ``raw_response["incomplete"]`` is set, with the partial transcript
+        attached.
+        
+        Args:
+            chunks: Chunks with their start offsets in the original recording
+            language: Language code or None for auto-detect
+            max_concurrency: Max chunks transcribed at once
+            max_attempts: Attempts per chunk, including the first
+            retry_delay_seconds: Delay before the first retry, doubled each time
+            
+        Returns:
+            TranscriptionResult with the stitched transcript; unsuccessful if
+            every chunk failed or the recording could not be fully split
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        attempts_used: Dict[int, int] = {}
+
+        async def run(chunk: AudioChunk) -> Tuple[AudioChunk, TranscriptionResult]:
+            result = TranscriptionResult(success=False, error="not attempted")
+            for attempt in range(1, max_attempts + 1):
+                attempts_used[chunk.index] = attempt
+                async with semaphore:
+                    try:
+                        result = await self.transcribe(chunk.path, language=language)
+                    except Exception as e:
+                        result = TranscriptionResult(success=False, error=str(e))
+                if result.success and result.transcript is not None:
+                    return chunk, result
+                logger.warning(
+                    f"Chunk {chunk.index + 1} attempt {attempt}/{max_attempts} failed: {result.error}"
+                )
+                if attempt < max_attempts:
+                    await asyncio.sleep(retry_delay_seconds * 2 ** (attempt - 1))
+            return chunk, result
+
+        tasks: List[asyncio.Task] = []
+        split_error: Optional[AudioSplitError] = None
+        try:
+            if isinstance(chunks, AsyncIterable):
+                try:
+                    async for chunk in chunks:
+                        tasks.append(asyncio.create_task(run(chunk)))
+                except AudioSplitError as e:
+                    split_error = e
+            else:
+                tasks = [asyncio.create_task(run(chunk)) for chunk in chunks]
+            outcomes = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        total = len(outcomes)
+
+        succeeded = [(chunk, result.transcript) for chunk, result in outcomes if result.success]
+        failed = {chunk.index: result.error for chunk, result in outcomes if not result.success}
+        raw_response = {
+            "chunks": total,
+            "failed_chunks": sorted(failed),
+            "errors": {str(index): error for index, error in sorted(failed.items())},
+            "attempts": {str(index): attempts_used[index] for index in sorted(attempts_used)},
+        }
+
+        if split_error is not None:
+            raw_response["incomplete"] = True
+            transcript = stitch_chunk_transcripts(succeeded) if succeeded else None
+            return TranscriptionResult(
+                success=False,
+                transcript=transcript,
+                error=f"Recording only partially transcribed: {split_error}",
+                raw_response=raw_response,
+                duration_seconds=transcript.duration_seconds if transcript else 0,
+                language=transcript.language if transcript else "en",
+            )
+
+        if not succeeded:
+            first_error = next(iter(failed.values()), "no audio chunks")
+            return TranscriptionResult(
+                success=False,
+                error=f"All {total} chunks failed to transcribe: {first_error}",
+                raw_response=raw_response,
+            )
+
+        transcript = stitch_chunk_transcripts(succeeded)
+        return TranscriptionResult(
+            success=True,
+            transcript=transcript,
+            error=f"{len(failed)} of {total} chunks failed" if failed else None,
+            raw_response=raw_response,
+            duration_seconds=transcript.duration_seconds,
+            language=transcript.language,
+        )
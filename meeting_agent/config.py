@@ -44,11 +44,16 @@ class MeetingAgentConfig:
     transcription_provider: TranscriptionProvider = TranscriptionProvider.WHISPER
     whisper_model: str = "whisper-1"  # OpenAI model
     whisper_language: Optional[str] = None  # Auto-detect if None
+    transcription_chunk_seconds: int = 600  # Long recordings are split into chunks this long
+    transcription_concurrency: int = 4  # Chunks transcribed at once
+    transcription_max_attempts: int = 3  # Attempts per chunk before it is skipped
     
     # Analysis
     summarization_model: str = "gpt-4"
     action_extraction_model: str = "gpt-4"
     max_transcript_tokens: int = 100000
+    analysis_chunk_tokens: int = 6000  # Longer transcripts are map-reduced in chunks this large
+    analysis_concurrency: int = 4  # Chunk prompts in flight at once
     
     # PM Integration
     default_pm_provider_id: Optional[str] = None
@@ -76,8 +81,13 @@ class MeetingAgentConfig:
             ),
             whisper_model=os.getenv("WHISPER_MODEL", "whisper-1"),
             whisper_language=os.getenv("WHISPER_LANGUAGE"),
+            transcription_chunk_seconds=int(os.getenv("MEETING_TRANSCRIPTION_CHUNK_SECONDS", "600")),
+            transcription_concurrency=int(os.getenv("MEETING_TRANSCRIPTION_CONCURRENCY", "4")),
+            transcription_max_attempts=int(os.getenv("MEETING_TRANSCRIPTION_MAX_ATTEMPTS", "3")),
             summarization_model=os.getenv("MEETING_SUMMARY_MODEL", "gpt-4"),
             action_extraction_model=os.getenv("MEETING_ACTION_MODEL", "gpt-4"),
+            analysis_chunk_tokens=int(os.getenv("MEETING_ANALYSIS_CHUNK_TOKENS", "6000")),
+            analysis_concurrency=int(os.getenv("MEETING_ANALYSIS_CONCURRENCY", "4")),
             default_pm_provider_id=os.getenv("DEFAULT_PM_PROVIDER_ID"),
             default_project_id=os.getenv("DEFAULT_PROJECT_ID"),
             auto_create_tasks=os.getenv("MEETING_AUTO_CREATE_TASKS", "false").lower() == "true",
@@ -23,7 +23,7 @@ from meeting_agent.models import (
     ActionItem,
 )
 from meeting_agent.audio import AudioProcessor, Transcriber, TranscriptionResult
-from meeting_agent.analysis import MeetingSummarizer, ActionExtractor
+from meeting_agent.analysis import MeetingSummarizer, ActionExtractor, TranscriptAnalyzer
 from meeting_agent.database import MeetingRepository
 from meeting_agent.integrations import MeetingPMIntegration
 
@@ -48,6 +48,7 @@ class MeetingHandler(BaseHandler[MeetingSummary]):
         pm_handler: Optional[Any] = None,  # BasePMHandler
         database_url: Optional[str] = None,
         provider_manager: Optional[Any] = None,
+        pm_service: Optional[Any] = None,  # AsyncPMServiceClient
     ):
         """
         Initialize meeting handler.
@@ -57,9 +58,12 @@ class MeetingHandler(BaseHandler[MeetingSummary]):
             pm_handler: Optional PM handler for task creation
             database_url: Database URL for persistence
             provider_manager: Optional ProviderManager for fetching AI keys
+            pm_service: Optional PM Service client; tasks are then created with
+                one call to its bulk endpoint instead of through pm_handler
         """
         self.config = config or MeetingAgentConfig()
         self.pm_handler = pm_handler
+        self.pm_service = pm_service
         self.provider_manager = provider_manager
         
         # Initialize components
@@ -70,6 +74,12 @@ class MeetingHandler(BaseHandler[MeetingSummary]):
         )
         self.summarizer = MeetingSummarizer()
         self.action_extractor = ActionExtractor()
+        self.analyzer = TranscriptAnalyzer(
+            self.summarizer,
+            self.action_extractor,
+            max_chunk_tokens=self.config.analysis_chunk_tokens,
+            max_concurrency=self.config.analysis_concurrency,
+        )
         
         # Database persistence
         db_url = database_url or "sqlite:///./data/meetings.db"
@@ -124,7 +134,7 @@ class MeetingHandler(BaseHandler[MeetingSummary]):
             if not valid:
                 return HandlerResult.failure(f"Invalid audio file: {error}")
             
-            audio_info = self.audio_processor.get_audio_info(audio_path)
+            audio_info = await self.audio_processor.aget_audio_info(audio_path)
             if audio_info:
                 meeting.metadata.file_size_bytes = audio_info.file_size_bytes
                 meeting.metadata.audio_format = audio_info.format
@@ -173,67 +183,58 @@ class MeetingHandler(BaseHandler[MeetingSummary]):
             
             if file_size > limit_bytes:
                 logger.info(f"File size ({file_size/1024/1024:.2f}MB) exceeds limit, splitting into chunks...")
-                chunks = self.audio_processor.split_audio(prepared_path)
-                logger.info(f"Split into {len(chunks)} chunks")
+                chunk_paths: List[str] = []
                 
-                full_text_parts = []
-                all_segments = []
+                async def produced_chunks():
+                    # Chunks are transcribed while ffmpeg is still cutting later ones
+                    async for chunk in self.audio_processor.stream_chunks(
+                        prepared_path,
+                        chunk_duration_seconds=self.config.transcription_chunk_seconds,
+                    ):
+                        chunk_paths.append(chunk.path)
+                        yield chunk
                 
-                for i, chunk_path in enumerate(chunks):
-                    logger.info(f"Transcribing chunk {i+1}/{len(chunks)}: {chunk_path}")
-                    chunk_result = await self.transcriber.transcribe(
-                        chunk_path,
+                try:
+                    transcription_result = await self.transcriber.transcribe_chunks(
+                        produced_chunks(),
                         language=self.config.whisper_language,
+                        max_concurrency=self.config.transcription_concurrency,
+                        max_attempts=self.config.transcription_max_attempts,
                     )
-                    
-                    if not chunk_result.success:
-                        logger.error(f"Chunk {i+1} failed: {chunk_result.error}")
-                        # Continue with what we have? Or fail?
-                        # Let's fail for now to ensure quality
-                        return HandlerResult.failure(f"Transcription failed on chunk {i+1}: {chunk_result.error}")
-                        
-                    if chunk_result.transcript:
-                        full_text_parts.append(chunk_result.transcript.full_text)
-                        # Adjust segment timestamps? For now simple append
-                        all_segments.extend(chunk_result.transcript.segments)
-                
-                # Merge transcripts
-                merged_text = "\n\n".join(full_text_parts)
-                # Recalculate word count
-                word_count = len(merged_text.split())
+                finally:
+                    # Cleanup chunks (the input itself is yielded if it could not be split)
+                    for chunk_path in chunk_paths:
+                        if chunk_path != prepared_path:
+                            Path(chunk_path).unlink(missing_ok=True)
+                logger.info(f"Transcribed {len(chunk_paths)} chunks")
                 
-                # Create merged transcript object
-                meeting.transcript = Transcript(
-                    meeting_id=meeting.id,
-                    full_text=merged_text,
-                    word_count=word_count,
-                    segments=all_segments
-                )
-                
-                # Cleanup chunks
-                try:
-                    for c in chunks:
-                        Path(c).unlink(missing_ok=True)
-                except:
-                    pass
-                    
+                failed_chunks = transcription_result.raw_response.get("failed_chunks", [])
+                if transcription_result.success and failed_chunks:
+                    logger.warning(
+                        f"Meeting {meeting.id}: {len(failed_chunks)} of {len(chunk_paths)} chunks "
+                        f"could not be transcribed: {failed_chunks}"
+                    )
+                    meeting.metadata.custom["failed_chunks"] = failed_chunks
             else:
                 # Single file transcription
                 transcription_result = await self.transcriber.transcribe(
                     prepared_path,
                     language=self.config.whisper_language,
                 )
-                
-                if not transcription_result.success:
-                    meeting.status = MeetingStatus.FAILED
-                    meeting.error_message = transcription_result.error
-                    return HandlerResult.failure(
-                        f"Transcription failed: {transcription_result.error}"
-                    )
-                
-                # Attach transcript to meeting
-                meeting.transcript = transcription_result.transcript
-                meeting.transcript.meeting_id = meeting.id
+            
+            if not transcription_result.success:
+                # A recording that could not be fully split is failed rather
+                # than analyzed from the chunks that happened to be cut
+                meeting.status = MeetingStatus.FAILED
+                meeting.error_message = transcription_result.error
+                return HandlerResult.failure(
+                    f"Transcription failed: {transcription_result.error}",
+                    incomplete=transcription_result.raw_response.get("incomplete", False),
+                )
+            
+            # Attach transcript to meeting
+            meeting.transcript = transcription_result.transcript
+            meeting.transcript.meeting_id = meeting.id
             
             # Fetch project context
             project_context = {}
@@ -252,38 +253,19 @@ class MeetingHandler(BaseHandler[MeetingSummary]):
             logger.info(f"Analyzing meeting: {meeting.id}")
             meeting.status = MeetingStatus.ANALYZING
             
-            # Pass API key to analysis tools via config or direct argument?
-            # Looking at Summarizer/ActionExtractor, they use config or env.
-            # We need to update them to accept key in method or init.
-            # For now, let's assume we can inject it into their config if they expose it, 
-            # OR we pass it in invoke. But the signature doesn't support it yet.
-            # We will update Summarizer/Extractor signature separately.
-            # For now, let's just stick to the plan of injecting to config logic if possible.
-            # Actually, simpler to pass it to the methods.
-            
-            # Get summary
-            summary = await self.summarizer.summarize(
-                meeting, 
-                project_context=project_context,
-                api_key=api_key
-            )
-            
-            # Extract action items
-            action_items, decisions, follow_ups = await self.action_extractor.extract(
+            # Summary and extraction run concurrently; long transcripts are map-reduced
+            analysis = await self.analyzer.analyze(
                 meeting,
                 participant_mapping=self._build_participant_mapping(meeting),
                 project_context=project_context,
                 api_key=api_key
             )
-            
-            # Add to summary
-            summary.action_items = action_items
-            summary.decisions = decisions
-            summary.follow_ups = follow_ups
+            summary = analysis.summary
+            action_items, decisions = analysis.action_items, analysis.decisions
             
             # Step 4: Create PM tasks if configured
             created_tasks = []
-            if self.pm_handler and meeting.project_id and action_items:
+            if (self.pm_service or self.pm_handler) and meeting.project_id and action_items:
                 logger.info(f"Creating {len(action_items)} tasks in PM system")
                 
                 if self.config.auto_create_tasks:
@@ -312,6 +294,8 @@ class MeetingHandler(BaseHandler[MeetingSummary]):
                 meeting_id=meeting.id,
                 tasks_created=len(created_tasks),
                 duration_minutes=meeting.duration_minutes,
+                failed_chunks=meeting.metadata.custom.get("failed_chunks", []),
+                analysis=analysis.metrics.to_dict(),
             )
             
         except Exception as e:
@@ -350,15 +334,18 @@ class MeetingHandler(BaseHandler[MeetingSummary]):
         action_items: List[ActionItem],
     ) -> List[Any]:
         """Create tasks in PM system from action items"""
+        if self.pm_service:
+            return await self._create_pm_tasks_bulk(project_id, action_items)
+        
         if not self.pm_handler:
             return []
         
+        bulk = await self.pm_handler.create_tasks_bulk(
+            context, project_id, [item.to_pm_task_data() for item in action_items]
+        )
+        
         created = []
-        for item in action_items:
-            task_data = item.to_pm_task_data()
-            result = await self.pm_handler.create_task(
-                context, project_id, task_data
-            )
+        for item, result in zip(action_items, bulk.metadata.get("results", [])):
             if result.is_success and result.data:
                 item.pm_task_id = result.data.id
                 item.pm_task_url = getattr(result.data, 'url', None)
@@ -366,6 +353,41 @@ class MeetingHandler(BaseHandler[MeetingSummary]):
         
         return created
     
+    async def _create_pm_tasks_bulk(
+        self,
+        project_id: str,
+        action_items: List[ActionItem],
+    ) -> List[Dict[str, Any]]:
+        """Create tasks with one POST /tasks/bulk to PM Service"""
+        tasks = []
+        for item in action_items:
+            task_data = item.to_pm_task_data()
+            task_data.pop("metadata", None)
+            if not task_data.get("assignee_id"):
+                # PM Service resolves names against the project's users
+                task_data["assignee_name"] = item.assignee_name
+            tasks.append(task_data)
+        
+        try:
+            response = await self.pm_service.create_tasks_bulk(project_id=project_id, tasks=tasks)
+        except Exception as e:
+            logger.warning(f"Bulk task creation failed: {e}")
+            return []
+        
+        created = []
+        for result in response.get("results", []):
+            task = result.get("task")
+            if not result.get("success") or not task:
+                logger.warning(f"Failed to create task for action item {result['index']}: "
+                               f"{result.get('error')}")
+                continue
+            item = action_items[result["index"]]
+            item.pm_task_id = str(task.get("id"))
+            item.pm_task_url = task.get("url")
+            created.append(task)
+        
+        return created
+    
     async def process_from_text(
         self,
         context: HandlerContext,
@@ -406,22 +428,15 @@ class MeetingHandler(BaseHandler[MeetingSummary]):
                     project_context = ctx_result.data
 
             # Analyze
-            summary = await self.summarizer.summarize(meeting, project_context=project_context)
-            action_items, decisions, follow_ups = await self.action_extractor.extract(
-                meeting,
-                project_context=project_context
-            )
-            
-            summary.action_items = action_items
-            summary.decisions = decisions
-            summary.follow_ups = follow_ups
+            analysis = await self.analyzer.analyze(meeting, project_context=project_context)
             
             meeting.status = MeetingStatus.COMPLETED
             
             return HandlerResult.success(
-                summary,
-                message=f"Analyzed transcript with {len(action_items)} action items",
+                analysis.summary,
+                message=f"Analyzed transcript with {len(analysis.action_items)} action items",
                 meeting_id=meeting.id,
+                analysis=analysis.metrics.to_dict(),
             )
             
         except Exception as e:
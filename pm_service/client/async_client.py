@@ -304,6 +304,50 @@ class AsyncPMServiceClient:
         
         return await self._paginate_all("/api/v1/tasks", params=params)
     
+    async def search_tasks(
+        self,
+        query: str,
+        project_id: Optional[str] = None,
+        sprint_id: Optional[str] = None,
+        assignee_id: Optional[str] = None,
+        status: Optional[str] = None,
+        entity_types: Optional[list[str]] = None,
+        top_k: int = 10,
+        min_score: Optional[float] = None
+    ) -> dict[str, Any]:
+        """
+        Semantic search over tasks (and optionally epics and sprints).
+        
+        Args:
+            query: Natural-language query
+            project_id: Filter by project ID
+            sprint_id: Filter by sprint ID
+            assignee_id: Filter by assignee ID
+            status: Filter by status
+            entity_types: Entity types to search (task, epic, sprint); tasks by default
+            top_k: Max results
+            min_score: Drop matches below this score (default: the service's)
+            
+        Returns:
+            Search response with matching items, best first, each with a score,
+            and ``match_type`` ("semantic", or "lexical" without an embedding model)
+        """
+        params: dict[str, Any] = {"q": query, "top_k": top_k}
+        if project_id:
+            params["project_id"] = project_id
+        if sprint_id:
+            params["sprint_id"] = sprint_id
+        if assignee_id:
+            params["assignee_id"] = assignee_id
+        if status:
+            params["status"] = status
+        if entity_types:
+            params["entity_types"] = ",".join(entity_types)
+        if min_score is not None:
+            params["min_score"] = min_score
+        
+        return await self._request("GET", "/api/v1/tasks/search", params=params)
+    
     async def get_task(self, task_id: str) -> dict[str, Any]:
         """
         Get task by ID.
@@ -366,6 +410,31 @@ class AsyncPMServiceClient:
         
         return await self._request("POST", "/api/v1/tasks", json=data)
     
+    async def create_tasks_bulk(
+        self,
+        project_id: str,
+        tasks: list[dict[str, Any]],
+        max_concurrency: int = 8
+    ) -> dict[str, Any]:
+        """
+        Create several tasks in one project.
+        
+        Args:
+            project_id: Project ID (composite format)
+            tasks: Task fields per item (title, description, assignee_id or
+                assignee_name, sprint_id, priority, parent_id, due_date)
+            max_concurrency: Max creates in flight at the provider
+            
+        Returns:
+            Per-item results plus created/failed counts
+        """
+        data = {
+            "project_id": project_id,
+            "tasks": tasks,
+            "max_concurrency": max_concurrency
+        }
+        return await self._request("POST", "/api/v1/tasks/bulk", json=data)
+    
     async def update_task(
         self,
         task_id: str,
@@ -735,6 +804,46 @@ class AsyncPMServiceClient:
         """
         return await self._request("GET", f"/api/v1/projects/{project_id}/priorities")
 
+    # ==================== Timeline ====================
+
+    async def get_project_timeline(
+        self,
+        project_id: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        etag: Optional[str] = None
+    ) -> dict[str, Any]:
+        """
+        Get timeline data (sprints + tasks) for a project.
+
+        Args:
+            project_id: Project ID
+            start: Window start (YYYY-MM-DD)
+            end: Window end (YYYY-MM-DD)
+            etag: ETag of a timeline the caller already has
+
+        Returns:
+            {"timeline": ..., "etag": ..., "not_modified": bool}; when the
+            PM Service answers 304, "timeline" is None and the caller's copy
+            is still current
+        """
+        params = {}
+        if start:
+            params["start"] = start
+        if end:
+            params["end"] = end
+        headers = {"If-None-Match": etag} if etag else None
+
+        response = await self._get_client().get(
+            f"/api/v1/projects/{project_id}/timeline",
+            params=params,
+            headers=headers
+        )
+        if response.status_code == 304:
+            return {"timeline": None, "etag": response.headers.get("etag", etag), "not_modified": True}
+        response.raise_for_status()
+        return {"timeline": response.json(), "etag": response.headers.get("etag"), "not_modified": False}
+
     # ==================== Time Entries ====================
 
     async def list_time_entries(
@@ -119,6 +119,31 @@ class PMServiceClient:
             )
         )
     
+    def search_tasks(
+        self,
+        query: str,
+        project_id: Optional[str] = None,
+        sprint_id: Optional[str] = None,
+        assignee_id: Optional[str] = None,
+        status: Optional[str] = None,
+        entity_types: Optional[list[str]] = None,
+        top_k: int = 10,
+        min_score: Optional[float] = None
+    ) -> dict[str, Any]:
+        """Semantic search over tasks."""
+        return self._run_async(
+            self._async_client.search_tasks(
+                query=query,
+                project_id=project_id,
+                sprint_id=sprint_id,
+                assignee_id=assignee_id,
+                status=status,
+                entity_types=entity_types,
+                top_k=top_k,
+                min_score=min_score
+            )
+        )
+    
     def get_task(self, task_id: str) -> dict[str, Any]:
         """Get task by ID."""
         return self._run_async(self._async_client.get_task(task_id))
@@ -150,6 +175,21 @@ class PMServiceClient:
             )
         )
     
+    def create_tasks_bulk(
+        self,
+        project_id: str,
+        tasks: list[dict[str, Any]],
+        max_concurrency: int = 8
+    ) -> dict[str, Any]:
+        """Create several tasks in one project."""
+        return self._run_async(
+            self._async_client.create_tasks_bulk(
+                project_id=project_id,
+                tasks=tasks,
+                max_concurrency=max_concurrency
+            )
+        )
+    
     def update_task(
         self,
         task_id: str,
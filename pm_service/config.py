@@ -34,6 +34,19 @@ class Settings(BaseSettings):
     redis_url: str | None = None
     cache_ttl: int = 300  # 5 minutes
     
+    # Entity search index (semantic search over tasks, epics, sprints)
+    entity_index_enabled: bool = True
+    entity_index_backend: str = "local"  # local | pgvector
+    entity_index_path: str = ".cache/pm_entity_index"
+    entity_index_dims: int = 384
+    # auto: openai when an embedding API key is set, otherwise the lexical hash fallback
+    entity_index_embedder: str = "auto"  # auto | openai | hash
+    entity_index_embedding_model: str = "text-embedding-3-small"
+    entity_index_embedding_base_url: str = "https://api.openai.com/v1"  # any OpenAI-compatible API
+    entity_index_embedding_api_key: str | None = None
+    entity_index_embedding_send_dimensions: bool = True  # off for models without a dimensions option
+    entity_index_min_score: float | None = None  # None: the embedder's default
+    
     class Config:
         env_prefix = "PM_SERVICE_"
         env_file = ".env"
@@ -4,6 +4,7 @@ Unified PM Handler for PM Service.
 This is the single source of truth for PM provider interactions.
 """
 
+import asyncio
 import logging
 from datetime import date
 from typing import Any, Optional
@@ -236,8 +237,13 @@ class PMHandler:
                 logger.info(f"[PM-DEBUG][{run_id}] Streaming projects from {provider_conn.name} (ID: {provider_conn.id})...")
                 start = time.time()
                 
-                # Get the iterator (might be list or async iterator)
-                raw_result = provider.list_projects(user_id=actual_user_id)
+                # Get the iterator (might be list or async iterator). Only
+                # OpenProject filters by member; other providers take no user_id,
+                # so it is passed only when a filter was requested.
+                if actual_user_id:
+                    raw_result = provider.list_projects(user_id=actual_user_id)
+                else:
+                    raw_result = provider.list_projects()
                 
                 # Define enrichment generator
                 async def enriched_iterator():
@@ -348,6 +354,7 @@ class PMHandler:
         logger.info(f"[PM-DEBUG][{run_id}] list_tasks START: project_id={project_id}, sprint_id={sprint_id}, dates={start_date}/{end_date}")
 
         tasks = []
+        errors_before = len(self._errors)
         
         # Parse project_id if provided
         provider_id_from_project = None
@@ -468,9 +475,91 @@ class PMHandler:
         tasks = await buffer.read_all()
         buffer.cleanup()
 
+        # An unfiltered listing is the full set for its scope, so entities
+        # missing from it can be dropped from the search index
+        complete_for = None
+        if not (sprint_id or assignee_id or status or start_date or end_date) and len(self._errors) == errors_before:
+            if project_id:
+                complete_for = {"project_id": project_id}
+            elif provider_id:
+                complete_for = {"provider_id": provider_id}
+        await self._index_entities("task", tasks, complete_for)
+
         logger.info(f"[PM-DEBUG][{run_id}] list_tasks END: Total tasks={len(tasks)}")
         return tasks
     
+    async def search_entities(
+        self,
+        query: str,
+        entity_types: Optional[list[str]] = None,
+        project_id: Optional[str] = None,
+        sprint_id: Optional[str] = None,
+        assignee_id: Optional[str] = None,
+        status: Optional[str] = None,
+        provider_id: Optional[str] = None,
+        top_k: int = 10,
+        min_score: Optional[float] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Semantic search over tasks, epics and sprints.
+        
+        The index is fed by the list_* methods. When nothing in the searched
+        scope is indexed yet, it is listed first so the first search does not
+        come back empty: the project when one is given, otherwise the tasks of
+        every active provider (or of ``provider_id``) that has none indexed.
+        
+        Raises:
+            RuntimeError: If entity search is disabled or the embedder fails
+        """
+        from pm_service.search import get_entity_index
+        
+        index = get_entity_index()
+        if index is None:
+            raise RuntimeError("Entity search is disabled")
+        
+        entity_types = entity_types or ["task"]
+        if project_id:
+            listers = {"task": self.list_tasks, "epic": self.list_epics, "sprint": self.list_sprints}
+            for entity_type in entity_types:
+                indexed = await asyncio.to_thread(
+                    index.has_entities, entity_types=[entity_type], project_id=project_id
+                )
+                if not indexed:
+                    await listers[entity_type](project_id=project_id)
+        elif "task" in entity_types:
+            # Cross-project search: warm each provider whose tasks were never listed
+            if provider_id:
+                provider_ids = [provider_id]
+            else:
+                provider_ids = [str(conn.id) for conn in self.get_active_providers()]
+            for p_id in provider_ids:
+                indexed = await asyncio.to_thread(
+                    index.has_entities, entity_types=["task"], provider_id=p_id
+                )
+                if not indexed:
+                    try:
+                        await self.list_tasks(provider_id=p_id)
+                    except Exception as e:
+                        # Already recorded by list_tasks; one unreachable provider
+                        # must not fail the search
+                        logger.warning(f"Could not warm entity index for provider {p_id}: {e}")
+        
+        try:
+            return await asyncio.to_thread(
+                index.search,
+                query,
+                top_k=top_k,
+                entity_types=entity_types,
+                project_id=project_id,
+                sprint_id=sprint_id,
+                assignee_id=assignee_id,
+                status=status,
+                provider_id=provider_id,
+                min_score=min_score,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Entity search failed: {e}") from e
+    
     async def get_task(self, task_id: str) -> Optional[dict[str, Any]]:
         """Get task by ID. Returns task with composite ID (provider:shortId) for multi-provider safety."""
         provider_id, actual_id = self._parse_composite_id(task_id)
@@ -557,7 +646,95 @@ class PMHandler:
             return task_dict
         
         return None
-    
+
+    async def create_tasks_bulk(
+        self,
+        project_id: str,
+        tasks: list[dict[str, Any]],
+        max_concurrency: int = 8
+    ) -> list[dict[str, Any]]:
+        """
+        Create several tasks in one project.
+
+        Assignee names are resolved against the project's users once for the
+        whole batch, then the provider creates the tasks concurrently. Returns
+        one result per input task, in input order.
+        """
+        from ..utils.data_buffer import ensure_async_iterator
+
+        provider_id, actual_project_id = self._parse_composite_id(project_id)
+
+        if not provider_id:
+            raise ValueError("project_id must include provider_id (format: provider_id:project_id)")
+
+        provider_conn = self.get_provider_by_id(provider_id)
+        if not provider_conn:
+            raise ValueError(f"Provider {provider_id} not found")
+
+        provider = self.create_provider_instance(provider_conn)
+
+        users_by_name: dict[str, str] = {}
+        if any(t.get("assignee_name") and not t.get("assignee_id") for t in tasks):
+            try:
+                async for user in ensure_async_iterator(
+                    provider.list_users(project_id=actual_project_id)
+                ):
+                    if user.id and user.name:
+                        users_by_name.setdefault(user.name.lower(), str(user.id))
+            except Exception as e:
+                logger.warning(f"Failed to load users for assignee mapping: {e}")
+
+        pm_tasks = []
+        for task_data in tasks:
+            assignee_id = task_data.get("assignee_id")
+            if assignee_id:
+                _, assignee_id = self._parse_composite_id(assignee_id)
+            elif task_data.get("assignee_name"):
+                assignee_id = users_by_name.get(task_data["assignee_name"].lower())
+
+            sprint_id = task_data.get("sprint_id")
+            if sprint_id:
+                _, sprint_id = self._parse_composite_id(sprint_id)
+
+            parent_id = task_data.get("parent_id")
+            if parent_id:
+                _, parent_id = self._parse_composite_id(parent_id)
+
+            pm_tasks.append(PMTask(
+                title=task_data["title"],
+                description=task_data.get("description"),
+                priority=task_data.get("priority"),
+                project_id=actual_project_id,
+                parent_task_id=parent_id,
+                assignee_id=assignee_id,
+                sprint_id=sprint_id,
+                due_date=task_data.get("due_date"),
+            ))
+
+        outcomes = await provider.create_tasks(pm_tasks, max_concurrency=max_concurrency)
+
+        provider_id_prefix = (
+            str(provider_conn.backend_provider_id)
+            if hasattr(provider_conn, 'backend_provider_id') and provider_conn.backend_provider_id
+            else str(provider_conn.id)
+        )
+        results = []
+        for index, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(f"Bulk create item {index} failed: {outcome}")
+                results.append({"index": index, "success": False, "error": str(outcome)})
+                continue
+
+            task_dict = self._to_dict(outcome)
+            original_id = str(task_dict.get("id", ""))
+            if ":" not in original_id:
+                task_dict["id"] = f"{provider_id_prefix}:{original_id}"
+            task_dict["provider_id"] = str(provider_conn.id)
+            task_dict["provider_name"] = provider_conn.name
+            results.append({"index": index, "success": True, "task": task_dict})
+
+        return results
+
     async def update_task(
         self,
         task_id: str,
@@ -609,6 +786,7 @@ class PMHandler:
         logger.info(f"[PM-DEBUG][{run_id}] list_sprints START: project_id={project_id}")
         
         buffer = DataBuffer(prefix="sprints_")
+        errors_before = len(self._errors)
         
         provider_id_arg = provider_id
         actual_project_id = None
@@ -670,6 +848,8 @@ class PMHandler:
                 
         sprints = await buffer.read_all()
         buffer.cleanup()
+        complete = project_id and not state and len(self._errors) == errors_before
+        await self._index_entities("sprint", sprints, {"project_id": project_id} if complete else None)
         logger.info(f"[PM-DEBUG][{run_id}] list_sprints END: Total sprints={len(sprints)}")
         return sprints
     
@@ -844,6 +1024,7 @@ class PMHandler:
         logger.info(f"[PM-DEBUG][{run_id}] list_epics START: project_id={project_id}")
         
         buffer = DataBuffer(prefix="epics_")
+        errors_before = len(self._errors)
         
         provider_id_from_project = None
         actual_project_id = None
@@ -899,6 +1080,8 @@ class PMHandler:
                 
         epics = await buffer.read_all()
         buffer.cleanup()
+        complete = project_id and len(self._errors) == errors_before
+        await self._index_entities("epic", epics, {"project_id": project_id} if complete else None)
         logger.info(f"[PM-DEBUG][{run_id}] list_epics END: Total epics={len(epics)}")
         return epics
     
@@ -1007,9 +1190,48 @@ class PMHandler:
             raise ValueError(f"Provider {provider_conn.provider_type} does not support epic deletion")
         
         return await provider.delete_epic(actual_id)
-    
+
+    # ==================== Timeline ====================
+
+    async def get_project_timeline(
+        self,
+        project_id: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None
+    ) -> dict[str, Any]:
+        """
+        Sprints and tasks of a project, trimmed for timeline views.
+
+        Sprints and tasks are fetched concurrently. Scheduled items outside
+        [start, end] are left out; see ``build_timeline``.
+        """
+        from ..utils.timeline import build_timeline
+
+        sprints, tasks = await asyncio.gather(
+            self.list_sprints(project_id=project_id),
+            self.list_tasks(project_id=project_id),
+        )
+        return build_timeline(project_id, sprints, tasks, start=start, end=end)
+
     # ==================== Helper Methods ====================
     
+    async def _index_entities(
+        self,
+        entity_type: str,
+        entities: list[dict[str, Any]],
+        complete_for: Optional[dict[str, Any]] = None
+    ) -> None:
+        """Feed listed entities to the search index. Never fails the listing."""
+        from pm_service.search import get_entity_index
+        
+        index = get_entity_index()
+        if index is None or (not entities and complete_for is None):
+            return
+        try:
+            await asyncio.to_thread(index.index_entities, entity_type, entities, complete_for)
+        except Exception as e:
+            logger.warning(f"Failed to index {entity_type}s for search: {e}")
+    
     def _parse_composite_id(self, composite_id: str) -> tuple[Optional[str], str]:
         """Parse composite ID (provider_id:actual_id) into parts."""
         if ":" in composite_id:
@@ -39,6 +39,25 @@ class CreateTaskRequest(BaseModel):
     parent_id: Optional[str] = None
 
 
+class BulkTaskItem(BaseModel):
+    """One task in a bulk create request."""
+    title: str
+    description: Optional[str] = None
+    assignee_id: Optional[str] = None
+    assignee_name: Optional[str] = None
+    sprint_id: Optional[str] = None
+    priority: Optional[str] = None
+    parent_id: Optional[str] = None
+    due_date: Optional[date] = None
+
+
+class BulkCreateTasksRequest(BaseModel):
+    """Request for creating several tasks in one project."""
+    project_id: str
+    tasks: list[BulkTaskItem] = Field(..., min_length=1, max_length=200)
+    max_concurrency: int = Field(default=8, ge=1, le=32)
+
+
 class UpdateTaskRequest(BaseModel):
     """Request for updating a task."""
     title: Optional[str] = None
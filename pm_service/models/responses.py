@@ -111,6 +111,30 @@ class ListResponse(BaseModel):
     limit: int = 100
 
 
+class EntitySearchResponse(BaseModel):
+    """Semantic search results, best match first."""
+    query: str
+    items: list[dict[str, Any]]
+    total: int
+    # "lexical" when the index runs on the hash fallback embedder
+    match_type: str = "semantic"
+
+
+class BulkTaskResult(BaseModel):
+    """Outcome of one item in a bulk task create."""
+    index: int
+    success: bool
+    task: Optional[dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+class BulkCreateTasksResponse(BaseModel):
+    """Per-item results of a bulk task create."""
+    results: list[BulkTaskResult]
+    created: int
+    failed: int
+
+
 class SprintReportResponse(BaseModel):
     """Sprint report response."""
     sprint_id: str
@@ -3,9 +3,13 @@ Base PM Provider interface
 
 Defines the common interface that all PM providers must implement.
 """
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any, AsyncIterator
+from typing import List, Optional, Dict, Any, AsyncIterator, Callable, Union
 from datetime import date
+
+import requests
+
 from .models import (
     PMUser, PMProject, PMTask, PMSprint, PMEpic, PMComponent, PMLabel,
     PMProviderConfig, PMStatus, PMPriority, PMStatusTransition
@@ -173,19 +177,69 @@ class BasePMProvider(ABC):
     
     # ==================== Optional Advanced Features ====================
     
+    async def create_tasks(
+        self, tasks: List[PMTask], max_concurrency: int = 8
+    ) -> List[Union[PMTask, Exception]]:
+        """
+        Create several tasks, at most max_concurrency at a time.
+        
+        Returns one entry per input task, in input order: the created task,
+        or the exception its creation raised. Providers with a native batch
+        endpoint, or whose create_task blocks the event loop, should
+        override this.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def create(task: PMTask) -> PMTask:
+            async with semaphore:
+                return await self.create_task(task)
+        
+        return list(await asyncio.gather(
+            *(create(task) for task in tasks), return_exceptions=True
+        ))
+    
+    async def _create_tasks_in_threads(
+        self,
+        tasks: List[PMTask],
+        post: Callable[[PMTask, requests.Session], PMTask],
+        headers: Dict[str, str],
+        max_concurrency: int = 8,
+    ) -> List[Union[PMTask, Exception]]:
+        """
+        create_tasks for providers with a blocking HTTP client and no batch endpoint.
+        
+        Each post(task, session) call runs in a worker thread, at most
+        max_concurrency at a time, over one keep-alive session sized to match.
+        """
+        max_concurrency = max(1, max_concurrency)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        with requests.Session() as session:
+            session.headers.update(headers)
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=max_concurrency)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            
+            async def create(task: PMTask) -> PMTask:
+                async with semaphore:
+                    return await asyncio.to_thread(post, task, session)
+            
+            return list(await asyncio.gather(
+                *(create(task) for task in tasks), return_exceptions=True
+            ))
+    
     async def bulk_create_tasks(self, tasks: List[PMTask]) -> List[PMTask]:
         """
-        Bulk create tasks (optional, can be implemented for performance)
-        Default implementation falls back to sequential create_task calls
+        Bulk create tasks, returning only the ones that were created
+        Failures are logged and skipped; use create_tasks for per-task results
         """
         results = []
-        for task in tasks:
-            try:
-                created = await self.create_task(task)
-                results.append(created)
-            except Exception as e:
+        for task, created in zip(tasks, await self.create_tasks(tasks)):
+            if isinstance(created, Exception):
                 # Log error and continue with remaining tasks
-                print(f"Failed to create task {task.title}: {e}")
+                print(f"Failed to create task {task.title}: {created}")
+            else:
+                results.append(created)
         return results
     
     async def search_tasks(self, query: str, project_id: Optional[str] = None) -> List[PMTask]:
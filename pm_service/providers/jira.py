@@ -1550,6 +1550,110 @@ class JIRAProvider(BasePMProvider):
             )
             return None
     
+    async def get_time_entries(
+        self,
+        task_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        project_id: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Get worklogs, optionally filtered by issue, author, project or date range.
+        
+        Without ``task_id`` the issues with matching worklogs are found with
+        JQL first. Yields the raw JIRA worklog dictionaries with the issue key
+        added as ``issueKey``.
+        
+        Args:
+            task_id: Filter by issue key or ID
+            user_id: Filter by author account ID
+            project_id: Filter by project key (or composite ``provider:key``)
+            start_date: Filter by start date (YYYY-MM-DD)
+            end_date: Filter by end date (YYYY-MM-DD)
+        """
+        if task_id:
+            issue_keys = [task_id]
+        else:
+            issue_keys = self._find_worklog_issues(user_id, project_id, start_date, end_date)
+        
+        for issue_key in issue_keys:
+            for worklog in self._list_issue_worklogs(issue_key):
+                started = (worklog.get("started") or "")[:10]
+                author = worklog.get("author") or {}
+                if user_id and user_id not in (author.get("accountId"), author.get("emailAddress")):
+                    continue
+                if start_date and started < start_date:
+                    continue
+                if end_date and started > end_date:
+                    continue
+                yield {**worklog, "issueKey": issue_key}
+    
+    def _find_worklog_issues(
+        self,
+        user_id: Optional[str],
+        project_id: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+    ) -> List[str]:
+        """Keys of the issues that have worklogs matching the filters."""
+        jql_parts = []
+        if project_id:
+            project_key = project_id.split(":", 1)[1] if ":" in project_id else project_id
+            jql_parts.append(f'project = "{project_key}"')
+        if user_id:
+            jql_parts.append(f'worklogAuthor = "{user_id}"')
+        if start_date:
+            jql_parts.append(f'worklogDate >= "{start_date}"')
+        if end_date:
+            jql_parts.append(f'worklogDate <= "{end_date}"')
+        if not jql_parts:
+            # Every issue with time logged
+            jql_parts.append("timespent > 0")
+        
+        url = f"{self.base_url}/rest/api/3/search/jql"
+        body: Dict[str, Any] = {"jql": " AND ".join(jql_parts), "maxResults": 500, "fields": ["key"]}
+        keys: List[str] = []
+        try:
+            while True:
+                response = requests.post(url, headers=self.headers, json=body, timeout=30)
+                response.raise_for_status()
+                data = response.json()
+                keys.extend(issue["key"] for issue in data.get("issues", []))
+                next_page = data.get("nextPageToken")
+                if not next_page or len(keys) > 50000:
+                    break
+                body["nextPageToken"] = next_page
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error searching issues with worklogs: {e}")
+            raise ValueError(f"Failed to fetch time entries: {str(e)}")
+        return keys
+    
+    def _list_issue_worklogs(self, issue_key: str) -> List[Dict[str, Any]]:
+        """All worklogs of one issue, following startAt pagination."""
+        url = f"{self.base_url}/rest/api/3/issue/{issue_key}/worklog"
+        worklogs: List[Dict[str, Any]] = []
+        start_at = 0
+        try:
+            while True:
+                response = requests.get(
+                    url,
+                    headers=self.headers,
+                    params={"startAt": start_at, "maxResults": 1000},
+                    timeout=30
+                )
+                response.raise_for_status()
+                data = response.json()
+                page = data.get("worklogs", [])
+                worklogs.extend(page)
+                start_at += len(page)
+                if not page or start_at >= data.get("total", 0):
+                    break
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error fetching worklogs of {issue_key}: {e}")
+            raise ValueError(f"Failed to fetch time entries: {str(e)}")
+        return worklogs
+    
     async def health_check(self) -> bool:
         """Check if JIRA connection is healthy"""
         try:
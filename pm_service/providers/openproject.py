@@ -6,7 +6,7 @@ to manage projects, work packages (tasks), and sprints.
 """
 import base64
 import requests
-from typing import List, Optional, Dict, Any, AsyncIterator
+from typing import List, Optional, Dict, Any, AsyncIterator, Union
 from datetime import datetime, date
 
 from .base import BasePMProvider
@@ -66,9 +66,10 @@ class OpenProjectProvider(BasePMProvider):
     
     # ==================== Project Operations ====================
     
-    async def list_projects(self) -> AsyncIterator[PMProject]:
+    async def list_projects(self, user_id: Optional[str] = None) -> AsyncIterator[PMProject]:
         """List all projects from OpenProject (handles pagination)"""
         import logging
+        import json as json_lib
         logger = logging.getLogger(__name__)
         
         url = f"{self.base_url}/api/v3/projects"
@@ -76,6 +77,9 @@ class OpenProjectProvider(BasePMProvider):
         
         # Use maximum page size for efficiency (OpenProject API supports up to 500 per page)
         params = {"pageSize": 500}
+        if user_id:
+            # Only projects the user is a member of
+            params["filters"] = json_lib.dumps([{"member": {"operator": "=", "values": [str(user_id)]}}])
         request_url = url
         
         logger.info(f"OpenProject: Fetching projects from {url} with pageSize=500")
@@ -332,7 +336,29 @@ class OpenProjectProvider(BasePMProvider):
     
     async def create_task(self, task: PMTask) -> PMTask:
         """Create a new work package"""
-        url = f"{self.base_url}/api/v3/work_packages"
+        return self._post_work_package(self._work_package_payload(task))
+    
+    async def create_tasks(
+        self, tasks: List[PMTask], max_concurrency: int = 8
+    ) -> List[Union[PMTask, Exception]]:
+        """
+        Create work packages concurrently.
+        
+        OpenProject has no batch create endpoint, so each work package is
+        POSTed from a worker thread; awaiting create_task in a loop would
+        block on every request in turn.
+        """
+        return await self._create_tasks_in_threads(
+            tasks,
+            lambda task, session: self._post_work_package(
+                self._work_package_payload(task), session
+            ),
+            self.headers,
+            max_concurrency,
+        )
+    
+    def _work_package_payload(self, task: PMTask) -> Dict[str, Any]:
+        """Build the work package create payload for a task"""
         payload: Dict[str, Any] = {
             "_links": {
                 "type": {
@@ -362,7 +388,17 @@ class OpenProjectProvider(BasePMProvider):
                 "href": f"/api/v3/statuses/{task.status}"
             }
         
-        response = requests.post(url, headers=self.headers, json=payload)
+        return payload
+    
+    def _post_work_package(
+        self, payload: Dict[str, Any], session: Optional[requests.Session] = None
+    ) -> PMTask:
+        """POST a work package payload and parse the created work package"""
+        url = f"{self.base_url}/api/v3/work_packages"
+        if session is None:
+            response = requests.post(url, headers=self.headers, json=payload)
+        else:
+            response = session.post(url, json=payload)
         response.raise_for_status()
         return self._parse_task(response.json())
     
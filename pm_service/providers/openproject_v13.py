@@ -487,7 +487,29 @@ class OpenProjectV13Provider(BasePMProvider):
     
     async def create_task(self, task: PMTask) -> PMTask:
         """Create a new work package"""
-        url = f"{self.base_url}/api/v3/work_packages"
+        return self._post_work_package(self._work_package_payload(task))
+    
+    async def create_tasks(
+        self, tasks: List[PMTask], max_concurrency: int = 8
+    ) -> List[Union[PMTask, Exception]]:
+        """
+        Create work packages concurrently.
+        
+        OpenProject has no batch create endpoint, so each work package is
+        POSTed from a worker thread; awaiting create_task in a loop would
+        block on every request in turn.
+        """
+        return await self._create_tasks_in_threads(
+            tasks,
+            lambda task, session: self._post_work_package(
+                self._work_package_payload(task), session
+            ),
+            self.headers,
+            max_concurrency,
+        )
+    
+    def _work_package_payload(self, task: PMTask) -> Dict[str, Any]:
+        """Build the work package create payload for a task"""
         payload: Dict[str, Any] = {
             "_links": {
                 "type": {
@@ -517,7 +539,17 @@ class OpenProjectV13Provider(BasePMProvider):
                 "href": f"/api/v3/statuses/{task.status}"
             }
         
-        response = requests.post(url, headers=self.headers, json=payload)
+        return payload
+    
+    def _post_work_package(
+        self, payload: Dict[str, Any], session: Optional[requests.Session] = None
+    ) -> PMTask:
+        """POST a work package payload and parse the created work package"""
+        url = f"{self.base_url}/api/v3/work_packages"
+        if session is None:
+            response = requests.post(url, headers=self.headers, json=payload)
+        else:
+            response = session.post(url, json=payload)
         response.raise_for_status()
         return self._parse_task(response.json())
     
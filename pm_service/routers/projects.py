@@ -4,14 +4,17 @@ API endpoints for project operations.
 """
 
 import logging
+from datetime import date
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy.orm import Session
 
 from pm_service.database import get_db_session
 from pm_service.handlers import PMHandler
 from pm_service.models.responses import ProjectResponse, ListResponse
+from pm_service.utils.timeline import etag_matches, timeline_etag
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +71,37 @@ async def get_project(
     return project
 
 
+@router.get("/{project_id}/timeline")
+async def get_project_timeline(
+    project_id: str,
+    start: Optional[date] = Query(None, description="Window start (YYYY-MM-DD)"),
+    end: Optional[date] = Query(None, description="Window end (YYYY-MM-DD)"),
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db_session)
+):
+    """
+    Sprints and tasks shaped for timeline views.
+    
+    Scheduled items are limited to the [start, end] window when given, and
+    only the fields the timeline renders are returned. Responses carry an
+    ETag; a request whose If-None-Match still matches gets 304 Not Modified.
+    """
+    if start and end and start > end:
+        raise HTTPException(status_code=400, detail="start must not be after end")
+    
+    handler = PMHandler(db)
+    try:
+        timeline = await handler.get_project_timeline(project_id, start=start, end=end)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    etag = timeline_etag(timeline)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=timeline, headers=headers)
+
+
 @router.get("/{project_id}/statuses", response_model=ListResponse)
 async def list_project_statuses(
     project_id: str,
@@ -15,6 +15,7 @@ from pm_service.database.models import PMProviderConnection
 from pm_service.handlers import PMHandler
 from pm_service.models.requests import ProviderSyncRequest
 from pm_service.models.responses import ProviderResponse, ListResponse
+from pm_service.search import get_entity_index
 
 router = APIRouter(prefix="/providers", tags=["providers"])
 
@@ -148,5 +149,9 @@ async def delete_provider(
     db.delete(provider)
     db.commit()
     
+    index = get_entity_index()
+    if index is not None:
+        index.remove_provider(provider_id)
+    
     return {"status": "deleted", "provider_id": provider_id}
 
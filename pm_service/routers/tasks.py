@@ -11,8 +11,14 @@ from sqlalchemy.orm import Session
 
 from pm_service.database import get_db_session
 from pm_service.handlers import PMHandler
-from pm_service.models.requests import CreateTaskRequest, UpdateTaskRequest
-from pm_service.models.responses import TaskResponse, ListResponse
+from pm_service.models.requests import BulkCreateTasksRequest, CreateTaskRequest, UpdateTaskRequest
+from pm_service.models.responses import (
+    BulkCreateTasksResponse,
+    EntitySearchResponse,
+    ListResponse,
+    TaskResponse,
+)
+from pm_service.search.entity_index import ENTITY_TYPES, get_entity_index
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +82,63 @@ async def list_tasks(
     )
 
 
+@router.get("/search", response_model=EntitySearchResponse)
+async def search_tasks(
+    q: str = Query(..., min_length=1, description="Natural-language query"),
+    project_id: Optional[str] = Query(None, description="Filter by project ID"),
+    sprint_id: Optional[str] = Query(None, description="Filter by sprint ID"),
+    assignee_id: Optional[str] = Query(None, description="Filter by assignee ID"),
+    status: Optional[str] = Query(None, description="Filter by status"),
+    provider_id: Optional[str] = Query(None, description="Filter by provider ID"),
+    entity_types: str = Query("task", description="Comma-separated: task, epic, sprint"),
+    top_k: int = Query(10, ge=1, le=100, description="Max results"),
+    min_score: Optional[float] = Query(
+        None, ge=0.0, le=1.0, description="Drop matches below this score (default: the embedder's)"
+    ),
+    db: Session = Depends(get_db_session)
+):
+    """
+    Search tasks (and optionally epics and sprints) by title and description.
+    
+    With an embedding model configured (PM_SERVICE_ENTITY_INDEX_EMBEDDER)
+    matching is by meaning, so "payment retries" also finds "Retry failed
+    card charges". Without one, the index falls back to a lexical hash
+    embedder that only matches shared words; ``match_type`` in the response
+    says which is in use. Matches below ``min_score`` are not returned.
+    """
+    types = [t.strip().lower() for t in entity_types.split(",") if t.strip()]
+    unknown = [t for t in types if t not in ENTITY_TYPES]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown entity types: {', '.join(unknown)}")
+    
+    handler = PMHandler(db)
+    
+    try:
+        items = await handler.search_entities(
+            query=q,
+            entity_types=types,
+            project_id=project_id,
+            sprint_id=sprint_id,
+            assignee_id=assignee_id,
+            status=status,
+            provider_id=provider_id,
+            top_k=top_k,
+            min_score=min_score,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    
+    index = get_entity_index()
+    return EntitySearchResponse(
+        query=q,
+        items=items,
+        total=len(items),
+        match_type="lexical" if index is not None and index.lexical else "semantic",
+    )
+
+
 @router.get("/{task_id}")
 async def get_task(
     task_id: str,
@@ -121,6 +184,36 @@ async def create_task(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/bulk", response_model=BulkCreateTasksResponse)
+async def create_tasks_bulk(
+    request: BulkCreateTasksRequest,
+    db: Session = Depends(get_db_session)
+):
+    """
+    Create several tasks in one project.
+    
+    Tasks are created concurrently and each item reports its own outcome,
+    so one failed create does not fail the batch.
+    """
+    handler = PMHandler(db)
+    
+    try:
+        results = await handler.create_tasks_bulk(
+            project_id=request.project_id,
+            tasks=[task.model_dump() for task in request.tasks],
+            max_concurrency=request.max_concurrency
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    created = sum(1 for result in results if result["success"])
+    return BulkCreateTasksResponse(
+        results=results,
+        created=created,
+        failed=len(results) - created
+    )
+
+
 @router.put("/{task_id}")
 async def update_task(
     task_id: str,
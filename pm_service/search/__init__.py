@@ -0,0 +1,13 @@
+# PM Service Search
+from .embeddings import HashEmbedder, OpenAIEmbedder, create_embedder, hash_embed
+from .entity_index import EntityIndex, get_entity_index, reset_entity_index
+
+__all__ = [
+    "EntityIndex",
+    "HashEmbedder",
+    "OpenAIEmbedder",
+    "create_embedder",
+    "get_entity_index",
+    "hash_embed",
+    "reset_entity_index",
+]
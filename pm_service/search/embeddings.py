@@ -0,0 +1,126 @@
+# PM Service - Text Embedders
+"""
+Text embedders for the entity index and other nearest-neighbour lookups.
+
+- ``openai``: any OpenAI-compatible ``/embeddings`` endpoint (OpenAI, Azure
+  OpenAI gateways, Ollama, vLLM, LM Studio...). This is what makes search
+  semantic: "payment retries" finds "Retry failed card charges".
+- ``hash``: a hashed bag of words and character trigrams. LEXICAL FALLBACK
+  ONLY. It needs no model or API, but it matches shared words and spellings,
+  not meaning: "payment retries" ranks "Payment page redesign" above "Retry
+  failed card charges".
+
+Embedders are callables from a list of texts to an L2-normalised
+``(len(texts), dims)`` float32 matrix, with a ``name`` that identifies the
+vector space and a ``min_score`` below which matches are treated as noise.
+"""
+
+import logging
+from typing import Optional
+
+import numpy as np
+
+from shared.search import hash_embed
+
+logger = logging.getLogger(__name__)
+
+
+class HashEmbedder:
+    """Lexical fallback embedder (see module docstring); runs locally in microseconds."""
+
+    lexical = True
+    # Unrelated texts score below ~0.2, texts sharing a word above ~0.35
+    min_score = 0.2
+
+    def __init__(self, dims: int):
+        self.dims = dims
+        self.name = f"hash-{dims}"
+
+    def __call__(self, texts: list[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dims), dtype=np.float32)
+        return np.stack([hash_embed(t, self.dims) for t in texts])
+
+
+class OpenAIEmbedder:
+    """Embeddings from an OpenAI-compatible ``POST {base_url}/embeddings`` endpoint."""
+
+    lexical = False
+    # Cosine similarity of unrelated texts is typically 0.1-0.25 with these models
+    min_score = 0.3
+    batch_size = 128
+
+    def __init__(
+        self,
+        model: str,
+        dims: int,
+        base_url: str = "https://api.openai.com/v1",
+        api_key: Optional[str] = None,
+        timeout: float = 30.0,
+        send_dimensions: bool = True,
+        transport=None,
+    ):
+        import httpx
+
+        self.model = model
+        self.dims = dims
+        self.name = f"openai:{model}-{dims}"
+        self.send_dimensions = send_dimensions
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        self._client = httpx.Client(
+            base_url=base_url.rstrip("/"), headers=headers, timeout=timeout, transport=transport
+        )
+
+    def __call__(self, texts: list[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dims), dtype=np.float32)
+        for start in range(0, len(texts), self.batch_size):
+            batch = [t or " " for t in texts[start:start + self.batch_size]]
+            body = {"model": self.model, "input": batch}
+            if self.send_dimensions:
+                body["dimensions"] = self.dims
+            response = self._client.post("/embeddings", json=body)
+            response.raise_for_status()
+            data = sorted(response.json()["data"], key=lambda item: item["index"])
+            for item in data:
+                embedding = np.asarray(item["embedding"], dtype=np.float32)
+                if embedding.shape != (self.dims,):
+                    raise ValueError(
+                        f"Embedding model {self.model} returned {embedding.shape[0]} dimensions, "
+                        f"expected {self.dims}; set PM_SERVICE_ENTITY_INDEX_DIMS to match"
+                    )
+                norm = np.linalg.norm(embedding)
+                vectors[start + item["index"]] = embedding / norm if norm else embedding
+        return vectors
+
+    def close(self) -> None:
+        self._client.close()
+
+
+def create_embedder(
+    kind: str,
+    dims: int,
+    model: Optional[str] = None,
+    base_url: Optional[str] = None,
+    api_key: Optional[str] = None,
+    send_dimensions: bool = True,
+):
+    """
+    Build the embedder named by ``kind`` (``openai`` or ``hash``).
+
+    Raises:
+        ValueError: If ``kind`` is unknown or ``openai`` has no model
+    """
+    kind = (kind or "hash").lower()
+    if kind == "hash":
+        return HashEmbedder(dims)
+    if kind == "openai":
+        if not model:
+            raise ValueError("The openai embedder needs an embedding model name")
+        return OpenAIEmbedder(
+            model,
+            dims,
+            base_url=base_url or "https://api.openai.com/v1",
+            api_key=api_key,
+            send_dimensions=send_dimensions,
+        )
+    raise ValueError(f"Unknown embedder: {kind} (expected openai or hash)")
@@ -0,0 +1,611 @@
+# PM Service - Entity Index
+"""
+Semantic search index over PM entities (tasks, epics, sprints).
+
+Entities are embedded from their title/name and description whenever the
+handler lists them, so the index follows what providers return without a
+separate crawl. Unchanged entities are detected by content hash and are not
+re-embedded.
+
+Two stores are available:
+- ``local``: an in-process matrix persisted to a ``.npy``/``.json`` pair,
+  searched exactly. Meant for development and single-instance deployments.
+- ``pgvector``: a table in the PM Service database with an HNSW index.
+  Requires the ``vector`` extension.
+
+Embeddings come from the embedder configured with
+``PM_SERVICE_ENTITY_INDEX_EMBEDDER`` (see ``embeddings``). Search is only
+semantic with a real embedding model; the hashed word/trigram embedder is a
+lexical fallback for deployments without one. Matches scoring below the
+embedder's ``min_score`` are dropped, so unrelated entities are not returned.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+import numpy as np
+
+from .embeddings import HashEmbedder, create_embedder
+
+logger = logging.getLogger(__name__)
+
+ENTITY_TYPES = ("task", "epic", "sprint")
+
+_SNIPPET_CHARS = 300
+
+# Fields copied from the entity into search results
+_RESULT_FIELDS = (
+    "id",
+    "title",
+    "name",
+    "status",
+    "priority",
+    "project_id",
+    "sprint_id",
+    "epic_id",
+    "assignee_id",
+    "assignee_name",
+    "start_date",
+    "end_date",
+    "due_date",
+    "provider_id",
+    "provider_name",
+)
+
+
+def entity_text(entity: dict[str, Any]) -> str:
+    """Text that represents an entity for embedding."""
+    parts = [
+        entity.get("title") or entity.get("name") or "",
+        entity.get("description") or entity.get("goal") or "",
+    ]
+    return "\n".join(str(part) for part in parts if part)
+
+
+def _split_ref(value: Any) -> tuple[Optional[str], str]:
+    """Split a composite reference (provider:id) the way PMHandler does."""
+    value = str(value)
+    if ":" in value:
+        provider, key = value.split(":", 1)
+        return provider, key
+    return None, value
+
+
+def _ref_key(value: Any) -> Optional[str]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, dict):
+        value = value.get("id")
+        if value is None:
+            return None
+    return _split_ref(value)[1]
+
+
+def _entity_row(entity_type: str, entity: dict[str, Any], embedder: str = "") -> dict[str, Any]:
+    """Filterable metadata plus the result payload for one entity."""
+    prefix, _ = _split_ref(entity.get("id", ""))
+    description = str(entity.get("description") or entity.get("goal") or "")
+    payload = {
+        field: entity[field]
+        for field in _RESULT_FIELDS
+        if entity.get(field) is not None
+    }
+    payload["entity_type"] = entity_type
+    if description:
+        payload["description"] = description[:_SNIPPET_CHARS]
+    text = entity_text(entity)
+    return {
+        "id": str(entity.get("id", "")),
+        "entity_type": entity_type,
+        "provider_id": str(entity.get("provider_id") or ""),
+        "provider_prefix": prefix or "",
+        "project_key": _ref_key(entity.get("project_id")),
+        "status": str(entity["status"]).lower() if entity.get("status") else None,
+        "sprint_key": _ref_key(entity.get("sprint_id")),
+        "assignee_key": _ref_key(entity.get("assignee_id")),
+        # Switching embedders changes the hash, so entities are re-embedded
+        "hash": hashlib.sha1(f"{embedder}\n{text}".encode("utf-8")).hexdigest(),
+        "text": text,
+        "payload": payload,
+    }
+
+
+def _ref_matches(row: dict[str, Any], key_field: str, value: str) -> bool:
+    provider, key = _split_ref(value)
+    if row.get(key_field) != key:
+        return False
+    return provider is None or provider in (row["provider_id"], row["provider_prefix"])
+
+
+def _row_matches(row: dict[str, Any], filters: dict[str, Any]) -> bool:
+    entity_types = filters.get("entity_types")
+    if entity_types and row["entity_type"] not in entity_types:
+        return False
+    provider_id = filters.get("provider_id")
+    if provider_id and provider_id not in (row["provider_id"], row["provider_prefix"]):
+        return False
+    status = filters.get("status")
+    if status and row.get("status") != status.lower():
+        return False
+    for key_field, name in (
+        ("project_key", "project_id"),
+        ("sprint_key", "sprint_id"),
+        ("assignee_key", "assignee_id"),
+    ):
+        value = filters.get(name)
+        if value and not _ref_matches(row, key_field, value):
+            return False
+    return True
+
+
+class LocalVectorStore:
+    """
+    Exact cosine search over an in-memory matrix, persisted to disk.
+
+    Rows are kept contiguous (deletes move the last row into the gap), so a
+    search is one matrix-vector product over the rows that pass the filters.
+    """
+
+    def __init__(self, path: Optional[str], dims: int):
+        self.path = Path(path) if path else None
+        self.dims = dims
+        self._rows: list[dict[str, Any]] = []
+        self._positions: dict[str, int] = {}
+        self._vectors = np.zeros((0, dims), dtype=np.float32)
+        self._lock = threading.Lock()
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _files(self) -> tuple[Path, Path]:
+        return self.path.with_suffix(".npy"), self.path.with_suffix(".json")
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        vectors_path, rows_path = self._files()
+        if not (vectors_path.exists() and rows_path.exists()):
+            return
+        try:
+            rows = json.loads(rows_path.read_text(encoding="utf-8"))
+            vectors = np.load(vectors_path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable entity index {self.path}: {e}")
+            return
+        if vectors.shape != (len(rows), self.dims):
+            logger.warning(f"Ignoring entity index {self.path}: built with other dimensions")
+            return
+        self._rows = rows
+        self._vectors = vectors.astype(np.float32)
+        self._positions = {row["id"]: i for i, row in enumerate(rows)}
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            rows = json.dumps(self._rows, ensure_ascii=False, default=str)
+            vectors = self._vectors[: len(self._rows)].copy()
+        vectors_path, rows_path = self._files()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        suffix = f".{os.getpid()}.tmp"
+        tmp_vectors = vectors_path.with_name(vectors_path.name + suffix)
+        tmp_rows = rows_path.with_name(rows_path.name + suffix)
+        with open(tmp_vectors, "wb") as f:
+            np.save(f, vectors)
+        tmp_rows.write_text(rows, encoding="utf-8")
+        os.replace(tmp_vectors, vectors_path)
+        os.replace(tmp_rows, rows_path)
+
+    def hashes(self, ids: Iterable[str]) -> dict[str, str]:
+        with self._lock:
+            return {
+                i: self._rows[self._positions[i]]["hash"]
+                for i in ids
+                if i in self._positions
+            }
+
+    def ids_matching(self, filters: dict[str, Any]) -> list[str]:
+        with self._lock:
+            return [row["id"] for row in self._rows if _row_matches(row, filters)]
+
+    def upsert(self, rows: list[dict[str, Any]], vectors: np.ndarray) -> None:
+        with self._lock:
+            needed = len(self._rows) + len(rows)
+            if needed > len(self._vectors):
+                grown = np.zeros((max(needed, 2 * len(self._vectors), 64), self.dims), dtype=np.float32)
+                grown[: len(self._rows)] = self._vectors[: len(self._rows)]
+                self._vectors = grown
+            for row, vector in zip(rows, vectors):
+                position = self._positions.get(row["id"])
+                if position is None:
+                    position = len(self._rows)
+                    self._positions[row["id"]] = position
+                    self._rows.append(row)
+                else:
+                    self._rows[position] = row
+                self._vectors[position] = vector
+
+    def delete(self, ids: Iterable[str]) -> None:
+        with self._lock:
+            for entity_id in ids:
+                position = self._positions.pop(entity_id, None)
+                if position is None:
+                    continue
+                last = len(self._rows) - 1
+                if position != last:
+                    moved = self._rows[last]
+                    self._rows[position] = moved
+                    self._vectors[position] = self._vectors[last]
+                    self._positions[moved["id"]] = position
+                self._rows.pop()
+
+    def search(
+        self, vector: np.ndarray, top_k: int, filters: dict[str, Any]
+    ) -> list[tuple[dict[str, Any], float]]:
+        with self._lock:
+            count = len(self._rows)
+            if not count:
+                return []
+            if any(filters.values()):
+                candidates = np.fromiter(
+                    (i for i, row in enumerate(self._rows) if _row_matches(row, filters)),
+                    dtype=np.int64,
+                )
+            else:
+                candidates = np.arange(count)
+            if not len(candidates):
+                return []
+            scores = self._vectors[candidates] @ vector
+            k = min(top_k, len(candidates))
+            best = np.argpartition(-scores, k - 1)[:k]
+            best = best[np.argsort(-scores[best])]
+            return [(self._rows[candidates[i]]["payload"], float(scores[i])) for i in best]
+
+
+class PgVectorStore:
+    """
+    Entity vectors in Postgres with pgvector, searched through an HNSW index.
+
+    The HNSW scan returns its ``hnsw.ef_search`` nearest candidates and the
+    filters are applied to those, so a selective filter can return fewer than
+    ``top_k`` results even when enough entities match. Filtered searches raise
+    ``ef_search`` to ``FILTERED_EF_SEARCH`` to make that less likely.
+    """
+
+    TABLE = "pm_entity_embeddings"
+    # Candidates scanned for filtered searches (pgvector default 40, max 1000)
+    FILTERED_EF_SEARCH = 400
+
+    def __init__(self, engine: Any, dims: int):
+        from sqlalchemy import text
+
+        self._text = text
+        self.engine = engine
+        self.dims = dims
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+            conn.execute(text(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.TABLE} (
+                    id TEXT PRIMARY KEY,
+                    entity_type TEXT NOT NULL,
+                    provider_id TEXT,
+                    provider_prefix TEXT,
+                    project_key TEXT,
+                    status TEXT,
+                    sprint_key TEXT,
+                    assignee_key TEXT,
+                    hash TEXT NOT NULL,
+                    payload JSONB NOT NULL,
+                    embedding vector({dims}) NOT NULL
+                )
+                """
+            ))
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS {self.TABLE}_hnsw ON {self.TABLE} "
+                "USING hnsw (embedding vector_cosine_ops)"
+            ))
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS {self.TABLE}_project "
+                f"ON {self.TABLE} (entity_type, project_key)"
+            ))
+
+    def __len__(self) -> int:
+        with self.engine.connect() as conn:
+            return conn.execute(self._text(f"SELECT count(*) FROM {self.TABLE}")).scalar()
+
+    def save(self) -> None:
+        """Rows are written on upsert."""
+
+    @staticmethod
+    def _vector_literal(vector: np.ndarray) -> str:
+        return "[" + ",".join(f"{float(v):.6g}" for v in vector) + "]"
+
+    def _where(self, filters: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+        clauses, params = [], {}
+        if filters.get("entity_types"):
+            clauses.append("entity_type = ANY(:entity_types)")
+            params["entity_types"] = list(filters["entity_types"])
+        if filters.get("provider_id"):
+            clauses.append("(provider_id = :provider_id OR provider_prefix = :provider_id)")
+            params["provider_id"] = filters["provider_id"]
+        if filters.get("status"):
+            clauses.append("status = :status")
+            params["status"] = filters["status"].lower()
+        for column, name in (
+            ("project_key", "project_id"),
+            ("sprint_key", "sprint_id"),
+            ("assignee_key", "assignee_id"),
+        ):
+            if not filters.get(name):
+                continue
+            provider, key = _split_ref(filters[name])
+            clauses.append(f"{column} = :{name}")
+            params[name] = key
+            if provider is not None:
+                clauses.append(
+                    f"(provider_id = :{name}_provider OR provider_prefix = :{name}_provider)"
+                )
+                params[f"{name}_provider"] = provider
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def hashes(self, ids: Iterable[str]) -> dict[str, str]:
+        ids = list(ids)
+        if not ids:
+            return {}
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                self._text(f"SELECT id, hash FROM {self.TABLE} WHERE id = ANY(:ids)"),
+                {"ids": ids},
+            )
+            return {row.id: row.hash for row in rows}
+
+    def ids_matching(self, filters: dict[str, Any]) -> list[str]:
+        where, params = self._where(filters)
+        with self.engine.connect() as conn:
+            return [row.id for row in conn.execute(
+                self._text(f"SELECT id FROM {self.TABLE}{where}"), params
+            )]
+
+    def upsert(self, rows: list[dict[str, Any]], vectors: np.ndarray) -> None:
+        statement = self._text(
+            f"""
+            INSERT INTO {self.TABLE} (id, entity_type, provider_id, provider_prefix,
+                project_key, status, sprint_key, assignee_key, hash, payload, embedding)
+            VALUES (:id, :entity_type, :provider_id, :provider_prefix, :project_key,
+                :status, :sprint_key, :assignee_key, :hash, CAST(:payload AS JSONB),
+                CAST(:embedding AS vector))
+            ON CONFLICT (id) DO UPDATE SET
+                entity_type = EXCLUDED.entity_type, provider_id = EXCLUDED.provider_id,
+                provider_prefix = EXCLUDED.provider_prefix, project_key = EXCLUDED.project_key,
+                status = EXCLUDED.status, sprint_key = EXCLUDED.sprint_key,
+                assignee_key = EXCLUDED.assignee_key, hash = EXCLUDED.hash,
+                payload = EXCLUDED.payload, embedding = EXCLUDED.embedding
+            """
+        )
+        params = [
+            {
+                **{k: v for k, v in row.items() if k != "text"},
+                "payload": json.dumps(row["payload"], ensure_ascii=False, default=str),
+                "embedding": self._vector_literal(vector),
+            }
+            for row, vector in zip(rows, vectors)
+        ]
+        with self.engine.begin() as conn:
+            conn.execute(statement, params)
+
+    def delete(self, ids: Iterable[str]) -> None:
+        ids = list(ids)
+        if not ids:
+            return
+        with self.engine.begin() as conn:
+            conn.execute(self._text(f"DELETE FROM {self.TABLE} WHERE id = ANY(:ids)"), {"ids": ids})
+
+    def search(
+        self, vector: np.ndarray, top_k: int, filters: dict[str, Any]
+    ) -> list[tuple[dict[str, Any], float]]:
+        where, params = self._where(filters)
+        params.update({"query": self._vector_literal(vector), "top_k": top_k})
+        statement = self._text(
+            f"SELECT payload, 1 - (embedding <=> CAST(:query AS vector)) AS score "
+            f"FROM {self.TABLE}{where} "
+            f"ORDER BY embedding <=> CAST(:query AS vector) LIMIT :top_k"
+        )
+        with self.engine.begin() as conn:
+            if where:
+                ef_search = min(1000, max(self.FILTERED_EF_SEARCH, top_k))
+                conn.execute(self._text(f"SET LOCAL hnsw.ef_search = {ef_search}"))
+            return [(row.payload, float(row.score)) for row in conn.execute(statement, params)]
+
+
+class EntityIndex:
+    """Keeps a vector store in step with listed entities and answers searches."""
+
+    def __init__(
+        self,
+        store: Any,
+        embed: Optional[Callable[[list[str]], np.ndarray]] = None,
+        min_score: Optional[float] = None,
+    ):
+        """
+        Args:
+            store: ``LocalVectorStore`` or ``PgVectorStore``.
+            embed: Embedder (see ``embeddings``); the lexical hash fallback by default.
+            min_score: Drop matches below this score; the embedder's ``min_score``
+                by default, 0 for plain callables.
+        """
+        self.store = store
+        self._embed = embed or HashEmbedder(store.dims)
+        self.embedder_name = getattr(self._embed, "name", "custom")
+        self.lexical = bool(getattr(self._embed, "lexical", False))
+        self.min_score = min_score if min_score is not None else getattr(self._embed, "min_score", 0.0)
+
+    def index_entities(
+        self,
+        entity_type: str,
+        entities: list[dict[str, Any]],
+        complete_for: Optional[dict[str, Any]] = None,
+    ) -> int:
+        """
+        Add or refresh entities of one type; returns how many were embedded.
+
+        Args:
+            entity_type: ``task``, ``epic`` or ``sprint``.
+            entities: Entity dicts as returned by ``PMHandler`` (composite ids).
+            complete_for: Filters for which ``entities`` is the full set, e.g.
+                ``{"project_id": ...}`` for an unfiltered project listing.
+                Indexed entities in that scope that are missing are removed.
+        """
+        rows = [_entity_row(entity_type, e, self.embedder_name) for e in entities if e.get("id")]
+        known = self.store.hashes(row["id"] for row in rows)
+        changed = [row for row in rows if known.get(row["id"]) != row["hash"]]
+        if changed:
+            self.store.upsert(changed, self._embed([row["text"] for row in changed]))
+
+        removed: list[str] = []
+        if complete_for is not None:
+            listed = {row["id"] for row in rows}
+            scope = {**complete_for, "entity_types": [entity_type]}
+            removed = [i for i in self.store.ids_matching(scope) if i not in listed]
+            self.store.delete(removed)
+
+        if changed or removed:
+            self.store.save()
+            logger.info(
+                f"Entity index: {len(changed)} {entity_type}(s) embedded, "
+                f"{len(removed)} removed, {len(self.store)} indexed"
+            )
+        return len(changed)
+
+    def has_entities(self, **filters: Any) -> bool:
+        return bool(self.store.ids_matching(filters))
+
+    def remove_provider(self, provider_id: str) -> int:
+        ids = self.store.ids_matching({"provider_id": provider_id})
+        if ids:
+            self.store.delete(ids)
+            self.store.save()
+        return len(ids)
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 10,
+        entity_types: Optional[list[str]] = None,
+        project_id: Optional[str] = None,
+        sprint_id: Optional[str] = None,
+        assignee_id: Optional[str] = None,
+        status: Optional[str] = None,
+        provider_id: Optional[str] = None,
+        min_score: Optional[float] = None,
+    ) -> list[dict[str, Any]]:
+        """Top-k entities most similar to ``query`` that pass the filters and ``min_score``."""
+        vector = self._embed([query])[0]
+        if not vector.any():
+            return []
+        threshold = self.min_score if min_score is None else min_score
+        filters = {
+            "entity_types": entity_types,
+            "project_id": project_id,
+            "sprint_id": sprint_id,
+            "assignee_id": assignee_id,
+            "status": status,
+            "provider_id": provider_id,
+        }
+        return [
+            {**payload, "score": round(score, 4)}
+            for payload, score in self.store.search(vector, top_k, filters)
+            if score >= threshold
+        ]
+
+
+# Backoff before retrying a failed index initialization, doubled per failure
+INIT_RETRY_MIN_SECONDS = 30.0
+INIT_RETRY_MAX_SECONDS = 600.0
+
+_index: Optional[EntityIndex] = None
+_index_lock = threading.Lock()
+_init_retry_at = 0.0
+_init_backoff = 0.0
+
+
+def _embedder_from_settings(settings: Any):
+    """Embedder named by the settings; ``auto`` uses the model API when a key is set."""
+    kind = settings.entity_index_embedder.lower()
+    if kind == "auto":
+        kind = "openai" if settings.entity_index_embedding_api_key else "hash"
+    if kind == "hash":
+        logger.warning(
+            "Entity index uses the lexical hash embedder: search matches words, not meaning. "
+            "Set PM_SERVICE_ENTITY_INDEX_EMBEDDING_API_KEY (or _EMBEDDER=openai with an "
+            "OpenAI-compatible _EMBEDDING_BASE_URL) for semantic search."
+        )
+    return create_embedder(
+        kind,
+        settings.entity_index_dims,
+        model=settings.entity_index_embedding_model,
+        base_url=settings.entity_index_embedding_base_url,
+        api_key=settings.entity_index_embedding_api_key,
+        send_dimensions=settings.entity_index_embedding_send_dimensions,
+    )
+
+
+def get_entity_index() -> Optional[EntityIndex]:
+    """
+    Process-wide entity index, or None when disabled or unavailable.
+
+    If the store or embedder cannot be set up (e.g. pgvector unreachable),
+    search is unavailable until a retry succeeds; retries are spaced by an
+    exponential backoff (see ``INIT_RETRY_*``).
+    """
+    global _index, _init_retry_at, _init_backoff
+    from pm_service.config import settings
+
+    if not settings.entity_index_enabled:
+        return None
+    if _index is not None:
+        return _index
+    if time.monotonic() < _init_retry_at:
+        return None
+    with _index_lock:
+        if _index is None and time.monotonic() >= _init_retry_at:
+            backend = settings.entity_index_backend.lower()
+            try:
+                embedder = _embedder_from_settings(settings)
+                if backend == "pgvector":
+                    from pm_service.database.connection import engine
+
+                    store = PgVectorStore(engine, settings.entity_index_dims)
+                else:
+                    # One file pair per embedder: vectors of different models do not mix
+                    path = settings.entity_index_path
+                    if path and not isinstance(embedder, HashEmbedder):
+                        path = f"{path}-{re.sub(r'[^A-Za-z0-9_.-]+', '_', embedder.name)}"
+                    store = LocalVectorStore(path, settings.entity_index_dims)
+            except Exception as e:
+                _init_backoff = min(
+                    INIT_RETRY_MAX_SECONDS, max(INIT_RETRY_MIN_SECONDS, _init_backoff * 2)
+                )
+                _init_retry_at = time.monotonic() + _init_backoff
+                logger.error(
+                    f"Entity index ({backend}) unavailable, retrying in {_init_backoff:.0f}s: {e}"
+                )
+                return None
+            _index = EntityIndex(store, embed=embedder, min_score=settings.entity_index_min_score)
+            _init_retry_at = _init_backoff = 0.0
+    return _index
+
+
+def reset_entity_index() -> None:
+    global _index, _init_retry_at, _init_backoff
+    with _index_lock:
+        _index = None
+        _init_retry_at = _init_backoff = 0.0
@@ -0,0 +1,126 @@
+# PM Service - Timeline assembly
+"""
+Shape sprints and tasks into the payload used by timeline (Gantt) views.
+
+Only the fields the views render are kept, scheduled items can be limited to
+a date window, and ``timeline_etag`` gives a stable validator so clients can
+revalidate with If-None-Match instead of downloading an unchanged timeline.
+"""
+
+import hashlib
+import json
+from datetime import date
+from typing import Any, Optional
+
+SPRINT_FIELDS = (
+    "id", "name", "status", "goal", "start_date", "end_date", "duration_days",
+)
+
+TASK_FIELDS = (
+    "id", "title", "status", "priority", "progress", "estimated_hours",
+    "start_date", "due_date", "duration_days", "parent_id", "epic_id",
+    "sprint_id", "sprint_name", "sprint_start_date", "sprint_end_date",
+    "assignee_id", "assignee_name", "assigned_to",
+)
+
+
+def _day(value: Any) -> Optional[str]:
+    """YYYY-MM-DD of an ISO date or datetime, or None."""
+    if not value:
+        return None
+    if isinstance(value, date):
+        return value.isoformat()[:10]
+    return str(value)[:10]
+
+
+def _missing_reason(start: Optional[str], end: Optional[str]) -> Optional[str]:
+    if not start and not end:
+        return "missing_start_end"
+    if not start:
+        return "missing_start"
+    if not end:
+        return "missing_end"
+    return None
+
+
+def _in_window(start: str, end: str, window_start: Optional[str], window_end: Optional[str]) -> bool:
+    return (window_end is None or start <= window_end) and (window_start is None or end >= window_start)
+
+
+def _trim(item: dict[str, Any], fields: tuple[str, ...]) -> dict[str, Any]:
+    return {field: item[field] for field in fields if item.get(field) is not None}
+
+
+def build_timeline(
+    project_id: str,
+    sprints: list[dict[str, Any]],
+    tasks: list[dict[str, Any]],
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> dict[str, Any]:
+    """
+    Build the timeline payload for a project.
+
+    Scheduled sprints and tasks (both dates set) are kept only if they
+    overlap [start, end]; unscheduled ones are always returned, since they
+    are listed beside the chart rather than placed on it. Tasks missing
+    sprint details get them from the sprint list.
+    """
+    window_start, window_end = _day(start), _day(end)
+    sprints_by_id = {str(s.get("id")): s for s in sprints}
+
+    timeline: dict[str, Any] = {
+        "project_id": project_id,
+        "window": {"start": window_start, "end": window_end},
+        "sprints": [],
+        "tasks": [],
+        "unscheduled": {"sprints": [], "tasks": []},
+    }
+
+    for sprint in sprints:
+        sprint_start, sprint_end = _day(sprint.get("start_date")), _day(sprint.get("end_date"))
+        entry = _trim(sprint, SPRINT_FIELDS)
+        entry["is_scheduled"] = bool(sprint_start and sprint_end)
+        entry["missing_reason"] = _missing_reason(sprint_start, sprint_end)
+        if not entry["is_scheduled"]:
+            timeline["unscheduled"]["sprints"].append(entry)
+        elif _in_window(sprint_start, sprint_end, window_start, window_end):
+            timeline["sprints"].append(entry)
+
+    for task in tasks:
+        task_start, task_end = _day(task.get("start_date")), _day(task.get("due_date"))
+        entry = _trim(task, TASK_FIELDS)
+        sprint = sprints_by_id.get(str(task.get("sprint_id")))
+        if sprint is not None:
+            entry.setdefault("sprint_name", sprint.get("name"))
+            entry.setdefault("sprint_start_date", sprint.get("start_date"))
+            entry.setdefault("sprint_end_date", sprint.get("end_date"))
+        entry["is_scheduled"] = bool(task_start and task_end)
+        entry["missing_reason"] = _missing_reason(task_start, task_end)
+        if not entry["is_scheduled"]:
+            timeline["unscheduled"]["tasks"].append(entry)
+        elif _in_window(task_start, task_end, window_start, window_end):
+            timeline["tasks"].append(entry)
+
+    return timeline
+
+
+def timeline_etag(timeline: dict[str, Any]) -> str:
+    """Strong ETag over the serialized timeline."""
+    body = json.dumps(timeline, sort_keys=True, default=str, separators=(",", ":"))
+    return '"' + hashlib.sha256(body.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header value covers ``etag`` (weak comparison)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
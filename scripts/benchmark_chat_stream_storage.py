@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark for chat stream storage size per thread.
+
+Simulates threads of increasing length, each turn streaming token chunks the
+way make_event emits them, and reports how many bytes each storage layout
+writes over the whole thread:
+
+- rewrite:  the previous layout, one JSON array per thread rewritten on
+            every completion (cost grows quadratically with thread length)
+- append:   one row per event in chat_stream_events
+- compact:  the same with CHAT_STREAM_COMPACT, token chunks collapsed into
+            one event per message
+
+Usage:
+    python scripts/benchmark_chat_stream_storage.py [--turns 5 20 80] [--chunks 120]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.graph.checkpoint import compact_stream_events  # noqa: E402
+
+WORDS = ["sprint", "velocity", "task", "burndown", "the", "is", "on", "track", "blocked", "review"]
+
+
+def make_event(event_type: str, data: dict) -> str:
+    return f"event: {event_type}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def make_turn(thread_id: str, turn: int, chunks: int, rng: random.Random) -> list[str]:
+    base = {
+        "thread_id": thread_id,
+        "agent": "pm_agent",
+        "role": "assistant",
+        "checkpoint_ns": f"pm_agent:{turn}",
+        "langgraph_node": "pm_agent",
+        "langgraph_path": ["__pregel_pull", "pm_agent"],
+        "langgraph_step": turn,
+    }
+    events = [make_event("tool_calls", {**base, "id": f"tool-{turn}", "tool_calls": [
+        {"name": "list_tasks", "args": {"project_id": "478"}, "id": f"call-{turn}"}
+    ]})]
+    events.append(make_event("tool_call_result", {
+        **base, "id": f"result-{turn}", "tool_call_id": f"call-{turn}",
+        "content": json.dumps([{"id": i, "title": f"Task {i}"} for i in range(20)]),
+    }))
+    for i in range(chunks):
+        events.append(make_event("message_chunk", {
+            **base, "id": f"run--{turn}", "content": rng.choice(WORDS) + " ",
+        }))
+    events.append(make_event("message_chunk", {
+        **base, "id": f"run--{turn}", "finish_reason": "stop",
+    }))
+    return events
+
+
+def simulate(turns: int, chunks: int, seed: int) -> dict[str, float]:
+    rng = random.Random(seed)
+    stored: list[str] = []
+    rewrite_bytes = append_bytes = compact_bytes = compact_events = 0
+    compact_seconds = 0.0
+
+    for turn in range(turns):
+        events = make_turn("bench", turn, chunks, rng)
+        stored.extend(events)
+        # Previous layout: the whole array is serialized and written again
+        rewrite_bytes += len(json.dumps(stored).encode("utf-8"))
+        append_bytes += sum(len(e.encode("utf-8")) for e in events)
+
+        start = time.perf_counter()
+        compacted = compact_stream_events(events)
+        compact_seconds += time.perf_counter() - start
+        compact_bytes += sum(len(e.encode("utf-8")) for e in compacted)
+        compact_events += len(compacted)
+
+    return {
+        "events": len(stored),
+        "compact_events": compact_events,
+        "rewrite": rewrite_bytes,
+        "append": append_bytes,
+        "compact": compact_bytes,
+        "compact_ms": compact_seconds * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--turns", type=int, nargs="+", default=[5, 20, 80])
+    parser.add_argument("--chunks", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(
+        f"{'turns':>6} {'events':>8} {'compact ev':>11} {'rewrite bytes':>14} "
+        f"{'append bytes':>13} {'compact bytes':>14} {'compact ms':>11}"
+    )
+    for turns in args.turns:
+        result = simulate(turns, args.chunks, args.seed)
+        print(
+            f"{turns:>6} {result['events']:>8,} {result['compact_events']:>11,} "
+            f"{result['rewrite']:>14,} {result['append']:>13,} {result['compact']:>14,} "
+            f"{result['compact_ms']:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
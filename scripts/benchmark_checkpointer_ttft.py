@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark for time-to-first-event of a chat turn with a Postgres checkpointer.
+
+Compares the previous per-request setup (new AsyncConnectionPool, new
+AsyncPostgresSaver and setup() on every chat turn, assigned onto the shared
+graph) with the app-lifetime GraphCheckpointer bound per request. A small
+graph stands in for the agent workflow so that only checkpointer overhead is
+measured.
+
+Usage:
+    python scripts/benchmark_checkpointer_ttft.py --db-url postgresql://localhost:5432/postgres
+    (or set LANGGRAPH_CHECKPOINT_DB_URL)
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import TypedDict
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from langgraph.checkpoint.memory import MemorySaver  # noqa: E402
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver  # noqa: E402
+from langgraph.graph import END, START, StateGraph  # noqa: E402
+from psycopg_pool import AsyncConnectionPool  # noqa: E402
+
+from backend.server.checkpointer import GraphCheckpointer, postgres_connection_kwargs  # noqa: E402
+
+
+class State(TypedDict):
+    messages: list
+
+
+def build_graph():
+    def respond(state: State) -> dict:
+        return {"messages": state["messages"] + ["token"]}
+
+    builder = StateGraph(State)
+    builder.add_node("respond", respond)
+    builder.add_edge(START, "respond")
+    builder.add_edge("respond", END)
+    return builder.compile(checkpointer=MemorySaver())
+
+
+async def first_event_ms(graph, started: float) -> float:
+    config = {"configurable": {"thread_id": str(uuid4())}}
+    async for _ in graph.astream({"messages": ["hi"]}, config, stream_mode="updates"):
+        return (time.perf_counter() - started) * 1000
+    return (time.perf_counter() - started) * 1000
+
+
+async def per_request_turn(graph, db_url: str) -> float:
+    started = time.perf_counter()
+    async with AsyncConnectionPool(db_url, kwargs=postgres_connection_kwargs()) as pool:
+        saver = AsyncPostgresSaver(pool)  # type: ignore[arg-type]
+        await saver.setup()
+        graph.checkpointer = saver
+        return await first_event_ms(graph, started)
+
+
+async def lifetime_turn(graph, checkpointer: GraphCheckpointer) -> float:
+    started = time.perf_counter()
+    return await first_event_ms(checkpointer.bind(graph), started)
+
+
+def describe(label: str, timings: list[float]) -> None:
+    timings = sorted(timings)
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(f"{label:<28} median {statistics.median(timings):8.2f} ms   p95 {p95:8.2f} ms")
+
+
+async def run(db_url: str, requests: int, concurrency: int) -> None:
+    graph = build_graph()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(coro):
+        async with semaphore:
+            return await coro
+
+    # The previous path mutates the shared graph, so it can only run serially safely
+    before = [await per_request_turn(graph, db_url) for _ in range(requests)]
+    describe("per-request pool + setup()", before)
+
+    checkpointer = GraphCheckpointer(db_url, pool_min_size=2, pool_max_size=max(concurrency, 2))
+    await checkpointer.start()
+    try:
+        after = await asyncio.gather(*(limited(lifetime_turn(graph, checkpointer)) for _ in range(requests)))
+        describe(f"app-lifetime pool (x{concurrency})", list(after))
+    finally:
+        await checkpointer.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db-url", default=os.getenv("LANGGRAPH_CHECKPOINT_DB_URL", ""))
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=1)
+    args = parser.parse_args()
+
+    if not args.db_url.startswith(("postgresql://", "postgres://")):
+        parser.error("a Postgres URL is required (--db-url or LANGGRAPH_CHECKPOINT_DB_URL)")
+    asyncio.run(run(args.db_url, args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
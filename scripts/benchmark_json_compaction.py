@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark for tool response compaction.
+
+Compares the previous path (json.loads → _compress_large_array → json.dumps →
+truncate) with the single-pass compactor behind sanitize_tool_response(compact=True), over
+task, sprint and project lists shaped like real PM provider responses.
+
+Usage:
+    python scripts/benchmark_json_compaction.py [--repeat 20] [--max-length 40000]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.utils.json_compactor import compact_json  # noqa: E402
+from backend.utils.json_utils import _compress_large_array, _truncate_json_safely  # noqa: E402
+
+STATUSES = ["New", "In progress", "Review", "done", "closed", "Blocked"]
+PRIORITIES = ["low", "normal", "high", "critical", "urgent"]
+ASSIGNEES = ["Minh Nguyen", "Alice Tran", "Bob Le", "Chi Pham", None]
+
+
+def make_task(i: int, rng: random.Random) -> dict:
+    day = rng.randint(1, 28)
+    return {
+        "id": f"478:{10000 + i}",
+        "title": f"Implement feature {i}: {rng.choice(['API', 'UI', 'DB', 'Auth'])} changes",
+        "description": "As a user I want the feature to work end to end. " * rng.randint(2, 12),
+        "status": rng.choice(STATUSES),
+        "priority": rng.choice(PRIORITIES),
+        "assigned_to": rng.choice(ASSIGNEES),
+        "project_id": "478",
+        "sprint_id": f"sprint-{i % 12}",
+        "estimated_hours": rng.choice([None, 1, 2, 4, 8, 16]),
+        "spent_hours": rng.choice([0, 1.5, 3]),
+        "start_date": f"2025-02-{day:02d}",
+        "due_date": f"2025-03-{day:02d}",
+        "created_at": f"2025-01-{day:02d}T09:00:00Z",
+        "updated_at": f"2025-03-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:00:00Z",
+        "custom_fields": {"story_points": rng.choice([1, 2, 3, 5, 8]), "component": "backend"},
+    }
+
+
+def make_payloads(rng: random.Random) -> dict[str, str]:
+    payloads = {}
+    for count in (100, 1000, 10000):
+        tasks = [make_task(i, rng) for i in range(count)]
+        payloads[f"tasks_object_{count}"] = json.dumps({"tasks": tasks, "total": count})
+        payloads[f"tasks_array_{count}"] = json.dumps(tasks)
+    payloads["sprints_object_200"] = json.dumps({
+        "sprints": [
+            {
+                "id": f"sprint-{i}",
+                "name": f"Sprint {i}",
+                "status": rng.choice(["active", "closed", "future"]),
+                "project_id": "478",
+                "start_date": "2025-01-01",
+                "end_date": "2025-01-14",
+                "goal": "Ship the next increment of the platform. " * 5,
+            }
+            for i in range(200)
+        ]
+    })
+    payloads["projects_object_500"] = json.dumps({
+        "projects": [
+            {"id": f"p:{i}", "name": f"Project {i}", "description": "Internal project. " * 10}
+            for i in range(500)
+        ],
+        "count": 500,
+    })
+    return payloads
+
+
+def previous_path(content: str, max_length: int) -> str:
+    compressed = json.dumps(_compress_large_array(json.loads(content)), ensure_ascii=False)
+    if len(compressed) > max_length:
+        compressed = _truncate_json_safely(compressed, max_length)
+    return compressed
+
+
+def time_ms(func, content: str, max_length: int, repeat: int) -> tuple[float, int]:
+    timings = []
+    output = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = func(content, max_length)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), len(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--max-length", type=int, default=40000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    payloads = make_payloads(random.Random(args.seed))
+    print(f"{'payload':<22} {'input':>10} {'previous ms':>12} {'single-pass ms':>15} {'speedup':>8} {'out prev':>9} {'out new':>8}")
+    for name, content in payloads.items():
+        prev_ms, prev_len = time_ms(previous_path, content, args.max_length, args.repeat)
+        new_ms, new_len = time_ms(
+            lambda c, m: compact_json(c, max_length=m), content, args.max_length, args.repeat
+        )
+        print(
+            f"{name:<22} {len(content):>10,} {prev_ms:>12.2f} {new_ms:>15.2f} "
+            f"{prev_ms / new_ms:>7.1f}x {prev_len:>9,} {new_len:>8,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Bulk-ingest a directory of markdown files into the configured Milvus collection.
+
+Uses the MILVUS_* settings from the environment (.env). Files already listed in
+the ingest manifest with the same content hash are skipped, so the command can
+be re-run after an interruption and only finishes what is missing.
+
+Usage:
+    python scripts/utils/ingest_milvus.py DIRECTORY [--pattern "*.md"] [--source documents]
+        [--batch-size 64] [--workers 4] [--no-recursive] [--force]
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from dotenv import load_dotenv  # noqa: E402
+
+load_dotenv()
+
+from backend.rag.milvus import MilvusRetriever  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("directory")
+    parser.add_argument("--pattern", default="*.md")
+    parser.add_argument("--source", default="documents")
+    parser.add_argument("--batch-size", type=int)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--no-recursive", action="store_true")
+    parser.add_argument("--force", action="store_true", help="ignore the manifest")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    retriever = MilvusRetriever()
+    if args.batch_size:
+        retriever.ingest_batch_size = args.batch_size
+    if args.workers:
+        retriever.ingest_workers = args.workers
+
+    stats = retriever.ingest_directory(
+        args.directory,
+        pattern=args.pattern,
+        recursive=not args.no_recursive,
+        source=args.source,
+        force=args.force,
+    )
+    retriever.close()
+
+    print(
+        f"files: {stats.files_seen} seen, {stats.files_ingested} ingested, "
+        f"{stats.files_skipped} skipped, {len(stats.failed_files)} failed; "
+        f"{stats.chunks_written} chunks in {stats.batches} batches, {stats.seconds:.1f}s"
+    )
+    for path in stats.failed_files:
+        print(f"  failed: {path}")
+    return 1 if stats.failed_files else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -86,9 +86,26 @@ if __name__ == "__main__":
         choices=["debug", "info", "warning", "error", "critical"],
         help="Log level (default: info)",
     )
+    parser.add_argument(
+        "--profile-imports",
+        action="store_true",
+        help="Print the import time per module of the API server and exit",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=25,
+        help="Number of modules and packages to list with --profile-imports (default: 25)",
+    )
 
     args = parser.parse_args()
 
+    if args.profile_imports:
+        from backend.utils.import_profile import format_import_report, profile_imports
+
+        print(format_import_report(profile_imports("backend.server.app"), top=args.profile_top))
+        sys.exit(0)
+
     # Determine reload setting
     reload = False
     if args.reload:
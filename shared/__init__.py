@@ -10,6 +10,8 @@ Shared modules include:
 - analytics: Chart and metrics models, calculators, adapters
 - config: Shared configuration models
 - database: Shared database models and utilities
+- resolution: Name-to-id resolution for PM entities
+- search: Local text embeddings
 """
 
 from shared.analytics import (
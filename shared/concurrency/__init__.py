@@ -0,0 +1,11 @@
+"""
+Shared Concurrency Package
+
+Asyncio helpers shared by the backend, PM tools and MCP servers.
+"""
+
+from shared.concurrency.single_flight import SingleFlight
+
+__all__ = [
+    'SingleFlight',
+]
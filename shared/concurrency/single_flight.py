@@ -0,0 +1,83 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""
+Single-flight loads: concurrent callers of the same key share one run.
+
+The first caller for a key runs the load; callers on the same event loop that
+arrive while it is in flight wait for its result instead of starting their
+own. If the load fails, every waiter gets the error. If the caller running it
+is cancelled, the waiters were not, so they fall through and run the load
+themselves rather than inheriting the cancellation.
+"""
+
+import asyncio
+import threading
+from typing import Awaitable, Callable, Generic, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _LoadCancelled(Exception):
+    """Set on a shared load whose runner was cancelled."""
+
+
+class SingleFlight(Generic[T]):
+    """In-flight loads by key, safe to share between threads and event loops."""
+
+    def __init__(self):
+        self._pending: dict[Hashable, asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+    async def run(
+        self,
+        key: Hashable,
+        load: Callable[[], Awaitable[T]],
+        on_join: Optional[Callable[[], None]] = None,
+    ) -> T:
+        """
+        Return the result of ``load``, sharing a run already in flight for ``key``.
+
+        ``on_join`` is called whenever this caller joins another caller's run.
+        Loads in flight on another event loop are not joined.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                pending = self._pending.get(key)
+                if pending is None or pending.get_loop() is not loop:
+                    future = loop.create_future()
+                    self._pending[key] = future
+                    break
+            if on_join is not None:
+                on_join()
+            try:
+                return await asyncio.shield(pending)
+            except _LoadCancelled:
+                continue
+
+        try:
+            value = await load()
+        except asyncio.CancelledError:
+            self._fail(future, _LoadCancelled())
+            raise
+        except Exception as e:
+            self._fail(future, e)
+            raise
+        finally:
+            with self._lock:
+                if self._pending.get(key) is future:
+                    del self._pending[key]
+        future.set_result(value)
+        return value
+
+    def clear(self) -> None:
+        """Stop sharing the loads in flight; later callers start new ones."""
+        with self._lock:
+            self._pending.clear()
+
+    @staticmethod
+    def _fail(future: asyncio.Future, error: BaseException) -> None:
+        future.set_exception(error)
+        # Nobody else may be waiting; keep the loop from warning about it
+        future.exception()
@@ -5,6 +5,7 @@ Provides common PM operations that can be used by both PM Agent
 and Meeting Notes Agent (when creating tasks from meetings).
 """
 
+import asyncio
 from abc import abstractmethod
 from typing import Any, Dict, List, Optional
 
@@ -64,23 +65,34 @@ class BasePMHandler(BaseHandler[Dict[str, Any]]):
         context: HandlerContext,
         project_id: str,
         tasks_data: List[Dict[str, Any]],
+        max_concurrency: int = 8,
     ) -> HandlerResult[List[PMTask]]:
         """
         Create multiple tasks at once.
         
+        Tasks are created concurrently, at most max_concurrency at a time.
+        
         Args:
             context: Handler context
             project_id: Target project ID
             tasks_data: List of task details
+            max_concurrency: Max creates in flight
             
         Returns:
-            HandlerResult with list of created tasks
+            HandlerResult with list of created tasks; metadata["results"]
+            holds the per-item HandlerResult in input order
         """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def create(task_data: Dict[str, Any]) -> HandlerResult[PMTask]:
+            async with semaphore:
+                return await self.create_task(context, project_id, task_data)
+        
+        results = await asyncio.gather(*(create(task_data) for task_data in tasks_data))
         created_tasks = []
         errors = []
         
-        for task_data in tasks_data:
-            result = await self.create_task(context, project_id, task_data)
+        for result in results:
             if result.is_success and result.data:
                 created_tasks.append(result.data)
             else:
@@ -90,17 +102,20 @@ class BasePMHandler(BaseHandler[Dict[str, Any]]):
             return HandlerResult.failure(
                 f"Failed to create all tasks",
                 errors=errors,
+                results=results,
             )
         elif errors:
             return HandlerResult.partial(
                 created_tasks,
                 warnings=errors,
                 message=f"Created {len(created_tasks)} of {len(tasks_data)} tasks",
+                results=results,
             )
         else:
             return HandlerResult.success(
                 created_tasks,
                 message=f"Created {len(created_tasks)} tasks",
+                results=results,
             )
     
     async def assign_task(
@@ -0,0 +1,24 @@
+"""
+Shared Resolution Package
+
+Name-to-id resolution for PM entities, shared by PM tools, analytics
+adapters and MCP tools.
+"""
+
+from shared.resolution.entity_resolver import (
+    AmbiguousEntityError,
+    EntityResolver,
+    NameIndex,
+    ResolvedEntity,
+    get_entity_resolver,
+    reset_entity_resolver,
+)
+
+__all__ = [
+    'AmbiguousEntityError',
+    'EntityResolver',
+    'NameIndex',
+    'ResolvedEntity',
+    'get_entity_resolver',
+    'reset_entity_resolver',
+]
@@ -0,0 +1,395 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""
+Name resolution for PM entities (sprints, users, epics, projects).
+
+Agents and tools receive references such as "Sprint 6", "6", "minh" or a
+composite id, and need the provider id. ``EntityResolver`` keeps one
+``NameIndex`` per (scope, kind, project) built from a provider listing, so a
+reference resolves with dictionary lookups instead of listing and scanning
+on every call. Indexes expire after ``ENTITY_RESOLVER_TTL_SECONDS``, and a
+reference that matches nothing reloads the index once it is older than
+``ENTITY_RESOLVER_MISS_REFRESH_SECONDS`` (e.g. a sprint created a minute ago).
+Callers that list entities anyway can ``prime`` the resolver with the result.
+
+Lookups try, in order: id, exact normalized name, number ("6" for "Sprint 6"),
+whole tokens ("minh" for "Nguyen Van Minh"), substring, then trigram
+similarity. The first tier with matches wins; several matches in it make the
+reference ambiguous.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+from shared.concurrency import SingleFlight
+from shared.config.loader import get_int_env
+
+logger = logging.getLogger(__name__)
+
+ENTITY_KINDS = ("sprint", "user", "epic", "project")
+
+FUZZY_MIN_SIMILARITY = 0.4
+# Fuzzy matches this close to the best one are reported as ambiguous
+FUZZY_TIE_MARGIN = 0.05
+
+_SEPARATORS_RE = re.compile(r"[\s\-_./]+")
+_NUMBER_RE = re.compile(r"\d+")
+
+# Fields that name an entity, per kind, in priority order
+_NAME_FIELDS = {
+    "sprint": ("name",),
+    "user": ("name", "username", "email", "login"),
+    "epic": ("name", "title"),
+    "project": ("name", "key", "identifier"),
+}
+
+
+class AmbiguousEntityError(ValueError):
+    """A reference matched several entities equally well."""
+
+    def __init__(self, kind: str, reference: str, candidates: list["ResolvedEntity"]):
+        self.kind = kind
+        self.reference = reference
+        self.candidates = candidates
+        listed = ", ".join(f"'{c.name}' (ID: {c.id})" for c in candidates[:10])
+        super().__init__(f"Ambiguous {kind} reference '{reference}' matches: {listed}")
+
+
+@dataclass
+class ResolvedEntity:
+    """One match for a reference."""
+
+    id: str
+    name: str
+    entity: Any
+    match: str
+    score: float = 1.0
+
+
+def normalize_name(value: Any) -> str:
+    """Lowercase, and treat dashes, underscores, dots and runs of spaces alike."""
+    return _SEPARATORS_RE.sub(" ", str(value or "").lower()).strip()
+
+
+def _field(entity: Any, name: str) -> Any:
+    if isinstance(entity, dict):
+        return entity.get(name)
+    return getattr(entity, name, None)
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _id_key(value: Any) -> str:
+    """Provider-local part of an id: "uuid:478:613" and "613" both give "613"."""
+    return str(value).rsplit(":", 1)[-1]
+
+
+class NameIndex:
+    """Lookup tables over the names of one kind of entity in one project."""
+
+    def __init__(self, kind: str, entities: Iterable[Any]):
+        self.kind = kind
+        self.entries: list[tuple[str, str, Any]] = []
+        self._by_id: dict[str, list[int]] = defaultdict(list)
+        self._by_name: dict[str, list[int]] = defaultdict(list)
+        self._by_number: dict[str, list[int]] = defaultdict(list)
+        self._by_token: dict[str, set[int]] = defaultdict(set)
+        self._by_trigram: dict[str, set[int]] = defaultdict(set)
+        self._names: list[list[str]] = []
+
+        for entity in entities:
+            entity_id = _field(entity, "id")
+            if entity_id in (None, ""):
+                continue
+            names = self._names_of(entity)
+            position = len(self.entries)
+            self.entries.append((str(entity_id), names[0] if names else str(entity_id), entity))
+            self._names.append([normalize_name(n) for n in names])
+
+            self._by_id[str(entity_id)].append(position)
+            if _id_key(entity_id) != str(entity_id):
+                self._by_id[_id_key(entity_id)].append(position)
+            for normalized in self._names[position]:
+                self._by_name[normalized].append(position)
+                for token in normalized.split():
+                    self._by_token[token].add(position)
+                for trigram in _trigrams(normalized):
+                    self._by_trigram[trigram].add(position)
+            if self._names[position]:
+                number = _NUMBER_RE.search(self._names[position][0])
+                if number:
+                    self._by_number[number.group().lstrip("0") or "0"].append(position)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _names_of(self, entity: Any) -> list[str]:
+        names = []
+        for field in _NAME_FIELDS.get(self.kind, ("name",)):
+            value = _field(entity, field)
+            if not value:
+                continue
+            value = str(value)
+            names.append(value)
+            if field == "email" and "@" in value:
+                names.append(value.split("@", 1)[0])
+        return list(dict.fromkeys(names))
+
+    def _matches(self, positions: Iterable[int], match: str, score: float = 1.0) -> list[ResolvedEntity]:
+        return [
+            ResolvedEntity(id=self.entries[p][0], name=self.entries[p][1], entity=self.entries[p][2], match=match, score=score)
+            for p in dict.fromkeys(positions)
+        ]
+
+    def lookup(self, reference: str) -> list[ResolvedEntity]:
+        """All matches of the most specific tier that has any, best first."""
+        reference = str(reference or "").strip()
+        if not reference:
+            return []
+
+        positions = self._by_id.get(reference) or self._by_id.get(_id_key(reference))
+        if positions:
+            return self._matches(positions, "id")
+
+        normalized = normalize_name(reference)
+        positions = self._by_name.get(normalized)
+        if positions:
+            return self._matches(positions, "exact")
+
+        # "6", "sprint 6" or "s6" for "Sprint 6"; only when the reference is
+        # nothing but a number and optional words that all the names share
+        number = _NUMBER_RE.search(normalized)
+        if number and self._by_number:
+            positions = self._by_number.get(number.group().lstrip("0") or "0", [])
+            words = [t for t in _NUMBER_RE.sub(" ", normalized).split()]
+            positions = [
+                p for p in positions
+                if all(any(w in name for name in self._names[p]) for w in words)
+            ]
+            if positions:
+                return self._matches(positions, "number")
+
+        tokens = normalized.split()
+        candidates = set.intersection(*(self._by_token.get(t, set()) for t in tokens)) if tokens else set()
+        if candidates:
+            return self._matches(sorted(candidates), "token")
+
+        positions = [
+            p for p, names in enumerate(self._names)
+            if any(normalized in name for name in names)
+        ]
+        if positions:
+            return self._matches(positions, "partial")
+
+        return self._fuzzy(normalized)
+
+    def _fuzzy(self, normalized: str) -> list[ResolvedEntity]:
+        query = _trigrams(normalized)
+        # Only entities sharing a trigram with the query are scored
+        shared: set[int] = set()
+        for trigram in query:
+            shared.update(self._by_trigram.get(trigram, ()))
+        # "Sprint 7" is a typo of "Sprnt 7", never of "Sprint 4"
+        numbers = {n.lstrip("0") or "0" for n in _NUMBER_RE.findall(normalized)}
+        scored = []
+        for position in shared:
+            if numbers and not numbers <= {
+                n.lstrip("0") or "0" for name in self._names[position] for n in _NUMBER_RE.findall(name)
+            }:
+                continue
+            best = 0.0
+            for name in self._names[position]:
+                trigrams = _trigrams(name)
+                best = max(best, len(query & trigrams) / len(query | trigrams))
+            if best >= FUZZY_MIN_SIMILARITY:
+                scored.append((best, position))
+        if not scored:
+            return []
+        scored.sort(reverse=True)
+        top = scored[0][0]
+        return [
+            match
+            for score, position in scored
+            if score >= top - FUZZY_TIE_MARGIN
+            for match in self._matches([position], "fuzzy", round(score, 3))
+        ]
+
+
+Loader = Callable[[], Awaitable[Iterable[Any]]]
+
+
+class EntityResolver:
+    """
+    Cache of ``NameIndex`` objects keyed by (scope, kind, project).
+
+    ``scope`` separates backends that could reuse project ids, e.g. a PM
+    Service URL or a provider id.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[int] = None,
+        miss_refresh_seconds: Optional[int] = None,
+        max_indexes: Optional[int] = None,
+    ):
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None else get_int_env("ENTITY_RESOLVER_TTL_SECONDS", 300)
+        )
+        self.miss_refresh_seconds = (
+            miss_refresh_seconds
+            if miss_refresh_seconds is not None
+            else get_int_env("ENTITY_RESOLVER_MISS_REFRESH_SECONDS", 30)
+        )
+        self.max_indexes = max_indexes or get_int_env("ENTITY_RESOLVER_MAX_INDEXES", 256)
+        self._indexes: "OrderedDict[tuple[str, str, str], tuple[NameIndex, float]]" = OrderedDict()
+        self._loading: SingleFlight[NameIndex] = SingleFlight()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "loads": 0, "miss_refreshes": 0}
+
+    @staticmethod
+    def _key(kind: str, scope: str, project_id: Optional[str]) -> tuple[str, str, str]:
+        return (scope or "", kind, str(project_id or ""))
+
+    def _get(self, key: tuple[str, str, str]) -> Optional[tuple[NameIndex, float]]:
+        with self._lock:
+            cached = self._indexes.get(key)
+            if cached is None:
+                return None
+            if time.monotonic() - cached[1] > self.ttl_seconds:
+                del self._indexes[key]
+                return None
+            self._indexes.move_to_end(key)
+            return cached
+
+    def prime(
+        self,
+        kind: str,
+        entities: Iterable[Any],
+        scope: str = "",
+        project_id: Optional[str] = None,
+    ) -> NameIndex:
+        """Replace the index for (scope, kind, project) with a fresh listing."""
+        index = NameIndex(kind, entities)
+        key = self._key(kind, scope, project_id)
+        with self._lock:
+            self._indexes[key] = (index, time.monotonic())
+            self._indexes.move_to_end(key)
+            while len(self._indexes) > self.max_indexes:
+                self._indexes.popitem(last=False)
+        return index
+
+    def invalidate(
+        self,
+        kind: Optional[str] = None,
+        scope: Optional[str] = None,
+        project_id: Optional[str] = None,
+    ) -> None:
+        """Drop matching indexes; with no arguments, drop everything."""
+        with self._lock:
+            for key in list(self._indexes):
+                if scope is not None and key[0] != scope:
+                    continue
+                if kind is not None and key[1] != kind:
+                    continue
+                if project_id is not None and key[2] != str(project_id):
+                    continue
+                del self._indexes[key]
+
+    async def _load(self, kind: str, key: tuple[str, str, str], loader: Loader) -> NameIndex:
+        """Run ``loader`` once for concurrent callers of the same key."""
+
+        async def load() -> NameIndex:
+            entities = await loader()
+            index = self.prime(kind, entities or [], scope=key[0], project_id=key[2] or None)
+            self.stats["loads"] += 1
+            return index
+
+        return await self._loading.run(key, load)
+
+    async def get_index(
+        self,
+        kind: str,
+        loader: Loader,
+        scope: str = "",
+        project_id: Optional[str] = None,
+    ) -> NameIndex:
+        """The cached index for (scope, kind, project), loading it if needed."""
+        key = self._key(kind, scope, project_id)
+        cached = self._get(key)
+        if cached is not None:
+            return cached[0]
+        return await self._load(kind, key, loader)
+
+    async def lookup(
+        self,
+        kind: str,
+        reference: str,
+        loader: Loader,
+        scope: str = "",
+        project_id: Optional[str] = None,
+    ) -> list[ResolvedEntity]:
+        """All best-tier matches for ``reference``, loading the index if needed."""
+        key = self._key(kind, scope, project_id)
+        cached = self._get(key)
+        if cached is None:
+            index = await self._load(kind, key, loader)
+            return index.lookup(reference)
+
+        index, loaded_at = cached
+        matches = index.lookup(reference)
+        if matches:
+            self.stats["hits"] += 1
+            return matches
+        if time.monotonic() - loaded_at < self.miss_refresh_seconds:
+            return []
+        self.stats["miss_refreshes"] += 1
+        index = await self._load(kind, key, loader)
+        return index.lookup(reference)
+
+    async def resolve(
+        self,
+        kind: str,
+        reference: str,
+        loader: Loader,
+        scope: str = "",
+        project_id: Optional[str] = None,
+    ) -> Optional[ResolvedEntity]:
+        """
+        The single entity ``reference`` names, or None if nothing matches.
+
+        Raises:
+            AmbiguousEntityError: If several entities match equally well
+        """
+        matches = await self.lookup(kind, reference, loader, scope=scope, project_id=project_id)
+        if len(matches) > 1:
+            raise AmbiguousEntityError(kind, reference, matches)
+        return matches[0] if matches else None
+
+
+_resolver: Optional[EntityResolver] = None
+_resolver_lock = threading.Lock()
+
+
+def get_entity_resolver() -> EntityResolver:
+    """Process-wide resolver shared by PM tools, analytics and MCP tools."""
+    global _resolver
+    if _resolver is None:
+        with _resolver_lock:
+            if _resolver is None:
+                _resolver = EntityResolver()
+    return _resolver
+
+
+def reset_entity_resolver() -> None:
+    global _resolver
+    with _resolver_lock:
+        _resolver = None
@@ -0,0 +1,12 @@
+"""
+Shared Search Package
+
+Local text embeddings shared by the PM Service entity index and the backend
+intent router.
+"""
+
+from shared.search.hash_embedding import hash_embed
+
+__all__ = [
+    'hash_embed',
+]
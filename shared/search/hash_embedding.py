@@ -0,0 +1,30 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""
+Hashed bag-of-words and character trigram embeddings.
+
+They need no model or API and work for any language, but they match shared
+words and spellings, not meaning.
+"""
+
+import re
+import zlib
+
+import numpy as np
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def hash_embed(text: str, dims: int) -> np.ndarray:
+    """Embed ``text`` as an L2-normalised hashed bag of words and character trigrams."""
+    vector = np.zeros(dims, dtype=np.float32)
+    normalized = " ".join(_WORD_RE.findall(text.lower()))
+    if not normalized:
+        return vector
+    for word in normalized.split():
+        vector[zlib.crc32(word.encode()) % dims] += 2.0
+    padded = f" {normalized} "
+    for i in range(len(padded) - 2):
+        vector[zlib.crc32(padded[i:i + 3].encode()) % dims] += 1.0
+    return vector / np.linalg.norm(vector)
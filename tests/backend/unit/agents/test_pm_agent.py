@@ -0,0 +1,133 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.tools import tool
+
+from backend.agents import pm_agent
+from backend.agents.pm_agent import LLMDrivenPMAgent
+
+
+class ScriptedLLM:
+    """Returns the scripted responses in order and records each call."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def bind_tools(self, tools, tool_choice=None):
+        return self
+
+    async def ainvoke(self, messages):
+        self.calls.append(list(messages))
+        return self.responses.pop(0)
+
+
+def _tool_calls(*names):
+    return AIMessage(
+        content="",
+        tool_calls=[{"id": f"call_{i}", "name": name, "args": {"project_id": "478"}} for i, name in enumerate(names)],
+    )
+
+
+@tool
+async def get_sprint(project_id: str) -> str:
+    """Get sprint velocity."""
+    await asyncio.sleep(0.2)
+    return '{"sprint": {"name": "Sprint 5"}}'
+
+
+@tool
+async def list_tasks(project_id: str) -> str:
+    """List overdue tasks."""
+    await asyncio.sleep(0.2)
+    return '{"tasks": []}'
+
+
+@tool
+async def broken_tool(project_id: str) -> str:
+    """Always fails."""
+    raise RuntimeError("provider down")
+
+
+@pytest.fixture(autouse=True)
+def optimizer():
+    global_optimizer = MagicMock()
+    global_optimizer.assemble_context.side_effect = lambda **kwargs: kwargs["history"]
+    global_optimizer.optimize_tool_result = AsyncMock(side_effect=lambda name, result, query: result)
+    with patch.object(pm_agent, "GlobalContextOptimizer", return_value=global_optimizer):
+        yield global_optimizer
+
+
+def _agent(llm, tools, max_steps=5):
+    return LLMDrivenPMAgent(llm=llm, tools=tools, project_id="uuid:478", max_steps=max_steps)
+
+
+class TestLLMDrivenPMAgent:
+    @pytest.mark.asyncio
+    async def test_independent_tool_calls_run_concurrently(self):
+        llm = ScriptedLLM([
+            AIMessage(content="plan"),
+            _tool_calls("get_sprint", "list_tasks"),
+            AIMessage(content="final answer"),
+        ])
+        agent = _agent(llm, [get_sprint, list_tasks])
+
+        started = time.perf_counter()
+        result = await agent.run("compare sprint velocity and list overdue tasks")
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.35
+        assert result.final_answer == "final answer"
+        assert result.llm_round_trips == 3
+        assert result.tool_batches == 1
+        assert len(result.tool_calls) == 2
+        assert result.wall_time_ms > 0
+
+    @pytest.mark.asyncio
+    async def test_batch_is_added_to_conversation_with_canonical_project_id(self):
+        llm = ScriptedLLM([
+            AIMessage(content="plan"),
+            _tool_calls("get_sprint", "list_tasks"),
+            AIMessage(content="done"),
+        ])
+        await _agent(llm, [get_sprint, list_tasks]).run("q")
+
+        follow_up = llm.calls[-1]
+        ai_message = next(m for m in follow_up if isinstance(m, AIMessage) and m.tool_calls)
+        assert [c["args"]["project_id"] for c in ai_message.tool_calls] == ["uuid:478", "uuid:478"]
+        tool_messages = [m for m in follow_up if isinstance(m, ToolMessage)]
+        assert [m.tool_call_id for m in tool_messages] == ["call_0", "call_1"]
+
+    @pytest.mark.asyncio
+    async def test_max_steps_counts_batches_and_ends_with_answer(self):
+        llm = ScriptedLLM([
+            AIMessage(content="plan"),
+            _tool_calls("get_sprint", "list_tasks"),
+            _tool_calls("list_tasks"),
+            AIMessage(content="summary from collected data"),
+        ])
+        result = await _agent(llm, [get_sprint, list_tasks], max_steps=2).run("q")
+
+        assert result.tool_batches == 2
+        assert len(result.tool_calls) == 3
+        assert result.final_answer == "summary from collected data"
+        assert result.llm_round_trips == 4
+
+    @pytest.mark.asyncio
+    async def test_failing_tool_does_not_cancel_the_batch(self):
+        llm = ScriptedLLM([
+            AIMessage(content="plan"),
+            _tool_calls("broken_tool", "list_tasks"),
+            AIMessage(content="partial answer"),
+        ])
+        result = await _agent(llm, [broken_tool, list_tasks]).run("q")
+
+        assert result.final_answer == "partial answer"
+        assert "provider down" in result.tool_results[0]
+        assert result.tool_results[1] == '{"tasks": []}'
@@ -0,0 +1,149 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.agents import pm_context_optimizer
+from backend.agents.pm_context_optimizer import (
+    CRITICAL_FIELDS,
+    FieldSelectionCache,
+    PMToolContextOptimizer,
+    classify_query,
+    get_optimizer_metrics,
+    reset_optimizer_metrics,
+)
+
+
+def _task_payload(count: int = 30) -> dict:
+    return {
+        "tasks": [
+            {
+                "id": f"p:{i}",
+                "title": f"Task {i}",
+                "status": "open",
+                "description": "Long description " * 20,
+                "assignee_id": "u1",
+                "assignee_name": "Minh",
+                "story_points": 3,
+                "estimated_hours": 4.0,
+                "due_date": "2025-01-01",
+                "priority": "high",
+                "project_id": "p:1",
+                "sprint_id": "s1",
+            }
+            for i in range(count)
+        ],
+        "total": count,
+    }
+
+
+@pytest.fixture
+def optimizer():
+    llm = MagicMock()
+    llm.ainvoke = AsyncMock(return_value=MagicMock(content='["id", "title", "assignee_name"]'))
+    with patch.object(pm_context_optimizer, "get_llm_by_type", return_value=llm):
+        opt = PMToolContextOptimizer()
+    opt.field_cache = FieldSelectionCache()
+    reset_optimizer_metrics()
+    return opt
+
+
+class TestClassifyQuery:
+    def test_equivalent_queries_share_a_class(self):
+        assert classify_query("Who is assigned to these tasks?") == classify_query(
+            "show me the assignee of each task"
+        )
+
+    def test_multiple_classes_are_sorted(self):
+        assert classify_query("Which overdue tasks does Minh own?") == "assignment+schedule"
+
+    def test_unknown_query_is_general(self):
+        assert classify_query("list them") == "general"
+
+
+class TestFieldSelectionCache:
+    def test_lru_eviction(self):
+        cache = FieldSelectionCache(max_entries=2)
+        cache.put("a", "general", ["id"])
+        cache.put("b", "general", ["id"])
+        assert cache.get("a", "general") == ["id"]
+        cache.put("c", "general", ["id"])
+        assert cache.get("b", "general") is None
+        assert len(cache) == 2
+
+
+class TestPMToolContextOptimizer:
+    @pytest.mark.asyncio
+    async def test_small_results_are_returned_unchanged(self, optimizer):
+        assert await optimizer.optimize("q", "list_tasks", '{"tasks": []}') == '{"tasks": []}'
+        assert get_optimizer_metrics()["skipped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_declared_schema_projects_without_llm(self, optimizer):
+        raw = json.dumps(_task_payload())
+        result = await optimizer.optimize("who is working on what?", "list_tasks", raw)
+
+        data = json.loads(result)
+        task = data["tasks"][0]
+        assert data["total"] == 30
+        assert task["assignee_name"] == "Minh"
+        assert "description" not in task
+        assert "estimated_hours" not in task
+        optimizer.llm.ainvoke.assert_not_called()
+
+        metrics = get_optimizer_metrics()
+        assert metrics["schema_projections"] == 1
+        assert metrics["estimated_tokens_saved"] > 0
+        assert "schema" in metrics["latency_ms"]
+
+    def test_schema_fields_always_include_critical_fields(self):
+        schema = {"fields": ["title"], "query_fields": {"general": ["due_date"]}}
+
+        fields = PMToolContextOptimizer._fields_from_schema(schema, "general")
+
+        assert CRITICAL_FIELDS <= set(fields)
+        assert "due_date" in fields
+
+    @pytest.mark.asyncio
+    async def test_schema_projection_keeps_critical_fields(self, optimizer):
+        payload = _task_payload()
+        for task in payload["tasks"]:
+            task["_links"] = {"self": {"href": f"/api/v3/work_packages/{task['id']}"}}
+            task["custom_fields"] = {"points": 3}
+        result = await optimizer.optimize("list them", "list_tasks", json.dumps(payload))
+
+        task = json.loads(result)["tasks"][0]
+        assert "_links" in task
+        assert task["custom_fields"] == {"points": 3}
+
+    @pytest.mark.asyncio
+    async def test_detail_queries_keep_descriptions(self, optimizer):
+        raw = json.dumps(_task_payload())
+        result = await optimizer.optimize("describe these tasks", "list_tasks", raw)
+        assert "description" in json.loads(result)["tasks"][0]
+
+    @pytest.mark.asyncio
+    async def test_field_selection_llm_runs_only_on_cache_miss(self, optimizer):
+        raw = json.dumps({"issues": _task_payload()["tasks"]})
+
+        first = await optimizer.optimize("who owns these?", "sprint_task_report", raw)
+        second = await optimizer.optimize("show the assignee", "sprint_task_report", raw)
+
+        assert first == second
+        assert optimizer.llm.ainvoke.await_count == 1
+        metrics = get_optimizer_metrics()
+        assert metrics["cache_misses"] == 1
+        assert metrics["cache_hits"] == 1
+        assert metrics["llm_field_selections"] == 1
+
+    @pytest.mark.asyncio
+    async def test_different_query_class_is_a_cache_miss(self, optimizer):
+        raw = json.dumps({"issues": _task_payload()["tasks"]})
+
+        await optimizer.optimize("who owns these?", "sprint_task_report", raw)
+        await optimizer.optimize("what is overdue?", "sprint_task_report", raw)
+
+        assert optimizer.llm.ainvoke.await_count == 2
@@ -1,7 +1,11 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import asyncio
+import json
 import os
+import threading
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import mongomock
@@ -76,10 +80,8 @@ def test_process_stream_partial_buffer_postgres(monkeypatch):
     )
     result = manager.process_stream_message("t1", "hello", finish_reason="partial")
     assert result is True
-    # Verify the chunk was stored in the in-memory store
-    items = manager.store.search(("messages", "t1"), limit=10)
-    values = [it.dict()["value"] for it in items]
-    assert "hello" in values
+    # Verify the chunk was stored in the in-memory buffer
+    assert manager.get_buffered_messages("t1") == ["hello"]
 
 
 def test_process_stream_partial_buffer_mongo():
@@ -95,10 +97,8 @@ def test_process_stream_partial_buffer_mongo():
         )
         result = manager.process_stream_message("t2", "hello", finish_reason="partial")
         assert result is True
-        # Verify the chunk was stored in the in-memory store
-        items = manager.store.search(("messages", "t2"), limit=10)
-        values = [it.dict()["value"] for it in items]
-        assert "hello" in values
+        # Verify the chunk was stored in the in-memory buffer
+        assert manager.get_buffered_messages("t2") == ["hello"]
 
 
 @pytest.mark.skipif(
@@ -139,16 +139,16 @@ def test_persist_postgresql_called_with_aggregated_chunks():
     assert (
         manager.process_stream_message("thd3", " World", finish_reason="stop") is True
     )
+    assert manager.flush(timeout=5) is True
 
-    # Verify the messages were aggregated correctly
+    # Verify the chunks were appended as ordered events
     with manager.postgres_conn.cursor() as cursor:
-        # Check if conversation already exists
         cursor.execute(
-            "SELECT messages FROM chat_streams WHERE thread_id = %s", ("thd3",)
+            "SELECT seq, event FROM chat_stream_events WHERE thread_id = %s ORDER BY seq",
+            ("thd3",),
         )
-        existing_record = cursor.fetchone()
-        assert existing_record is not None
-        assert existing_record["messages"] == ["Hello", " World"]
+        rows = cursor.fetchall()
+        assert [row["event"] for row in rows][-2:] == ["Hello", " World"]
 
 
 def test_persist_not_attempted_when_saver_disabled():
@@ -179,18 +179,22 @@ def test_persist_mongodb_local_db():
         assert result is True
 
         # Verify data was persisted in mock
-        collection = manager.mongo_db.chat_streams
-        doc = collection.find_one({"thread_id": thread_id})
-        assert doc is not None
-        assert doc["messages"] == messages
+        assert list(manager.iter_thread_events(thread_id)) == messages
 
         # Simulate a message with existing thread
         result = manager._persist_to_mongodb(thread_id, ["Another message."])
         assert result is True
 
-        # Verify update worked
-        doc = collection.find_one({"thread_id": thread_id})
-        assert doc["messages"] == ["Another message."]
+        # Verify the new messages were appended to the existing conversation
+        assert list(manager.iter_thread_events(thread_id)) == [
+            "This is a test message.",
+            "Another message.",
+        ]
+        seqs = [
+            doc["seq"]
+            for doc in manager.mongo_db.chat_stream_events.find({"thread_id": thread_id})
+        ]
+        assert sorted(seqs) == [0, 1]
 
 
 @pytest.mark.skipif(
@@ -210,12 +214,10 @@ def test_persist_mongodb_called_with_aggregated_chunks():
     assert (
         manager.process_stream_message("thd5", " World", finish_reason="stop") is True
     )
+    assert manager.flush(timeout=5) is True
 
-    # Verify the messages were aggregated correctly
-    collection = manager.mongo_db.chat_streams
-    existing_record = collection.find_one({"thread_id": "thd5"})
-    assert existing_record is not None
-    assert existing_record["messages"] == ["Hello", " World"]
+    # Verify the chunks were appended as ordered events
+    assert list(manager.iter_thread_events("thd5"))[-2:] == ["Hello", " World"]
 
 
 def test_invalid_inputs_return_false(monkeypatch):
@@ -274,12 +276,13 @@ def test_process_stream_with_interrupt_finish_reason():
             )
             is True
         )
+        assert manager.flush(timeout=5) is True
 
         # Verify persistence occurred
-        collection = manager.mongo_db.chat_streams
-        doc = collection.find_one({"thread_id": "int_test"})
-        assert doc is not None
-        assert doc["messages"] == ["Interrupted", " message"]
+        assert list(manager.iter_thread_events("int_test")) == [
+            "Interrupted",
+            " message",
+        ]
 
 
 def test_postgresql_connection_failure(monkeypatch):
@@ -319,49 +322,36 @@ def test_mongodb_ping_failure(monkeypatch):
     assert getattr(manager, "mongo_db", None) is None
 
 
-def test_store_namespace_consistency():
-    """Test that store namespace is consistently used across methods."""
+def test_buffer_accumulates_chunks_per_thread():
+    """Chunks should be appended to the thread's buffer in arrival order."""
     manager = checkpoint.ChatStreamManager(checkpoint_saver=False)
 
-    # Process a partial message
     assert (
         manager.process_stream_message("ns_test", "chunk1", finish_reason="partial")
         is True
     )
+    assert manager.get_buffered_messages("ns_test") == ["chunk1"]
 
-    # Verify cursor is stored correctly
-    cursor = manager.store.get(("messages", "ns_test"), "cursor")
-    assert cursor is not None
-    assert cursor.value["index"] == 0
-
-    # Add another chunk
     assert (
         manager.process_stream_message("ns_test", "chunk2", finish_reason="partial")
         is True
     )
+    assert manager.get_buffered_messages("ns_test") == ["chunk1", "chunk2"]
 
-    # Verify cursor is incremented
-    cursor = manager.store.get(("messages", "ns_test"), "cursor")
-    assert cursor.value["index"] == 1
-
-
-def test_cursor_initialization_edge_cases():
-    """Test cursor handling edge cases."""
-    manager = checkpoint.ChatStreamManager(checkpoint_saver=False)
 
-    # Manually set a cursor with missing index
-    namespace = ("messages", "edge_test")
-    manager.store.put(namespace, "cursor", {})  # Missing 'index' key
+def test_buffer_freed_when_conversation_completes():
+    """The thread's buffer should be released once the stream finishes."""
+    with patch("backend.graph.checkpoint.MongoClient") as mock_mongo_client:
+        mock_mongo_client.return_value = mongomock.MongoClient()
+        manager = checkpoint.ChatStreamManager(checkpoint_saver=True, db_uri=MONGO_URL)
 
-    # Should handle missing index gracefully
-    result = manager.process_stream_message(
-        "edge_test", "test", finish_reason="partial"
-    )
-    assert result is True
+        manager.process_stream_message("free_test", "a", finish_reason="partial")
+        assert manager.get_stats()["buffered_threads"] == 1
 
-    # Should default to 0 and increment to 1
-    cursor = manager.store.get(namespace, "cursor")
-    assert cursor.value["index"] == 1
+        manager.process_stream_message("free_test", "b", finish_reason="stop")
+        assert manager.get_buffered_messages("free_test") == []
+        assert manager.get_stats()["buffered_threads"] == 0
+        assert manager.flush(timeout=5) is True
 
 
 def test_multiple_threads_isolation():
@@ -383,19 +373,8 @@ def test_multiple_threads_isolation():
     )
 
     # Verify isolation
-    thread1_items = manager.store.search(("messages", "thread1"), limit=10)
-    thread2_items = manager.store.search(("messages", "thread2"), limit=10)
-
-    thread1_values = [
-        item.dict()["value"]
-        for item in thread1_items
-        if isinstance(item.dict()["value"], str)
-    ]
-    thread2_values = [
-        item.dict()["value"]
-        for item in thread2_items
-        if isinstance(item.dict()["value"], str)
-    ]
+    thread1_values = manager.get_buffered_messages("thread1")
+    thread2_values = manager.get_buffered_messages("thread2")
 
     assert "msg1" in thread1_values
     assert "msg3" in thread1_values
@@ -417,35 +396,31 @@ def test_mongodb_insert_and_update_paths():
         assert manager._persist_to_mongodb("th1", ["message1"]) is True
 
         # Verify insert worked
-        collection = manager.mongo_db.chat_streams
-        doc = collection.find_one({"thread_id": "th1"})
-        assert doc is not None
-        assert doc["messages"] == ["message1"]
+        assert list(manager.iter_thread_events("th1")) == ["message1"]
 
-        # Update success (existing thread)
+        # Append success (existing thread)
         assert manager._persist_to_mongodb("th1", ["message2"]) is True
 
-        # Verify update worked
-        doc = collection.find_one({"thread_id": "th1"})
-        assert doc["messages"] == ["message2"]
+        # Verify the event was appended after the existing one
+        assert list(manager.iter_thread_events("th1")) == ["message1", "message2"]
 
         # Test error case by mocking collection methods
-        original_find_one = collection.find_one
-        collection.find_one = MagicMock(side_effect=RuntimeError("Database error"))
+        collection = manager.mongo_db.chat_stream_events
+        original_insert_many = collection.insert_many
+        collection.insert_many = MagicMock(side_effect=RuntimeError("Database error"))
 
         assert manager._persist_to_mongodb("th2", ["message"]) is False
 
         # Restore original method
-        collection.find_one = original_find_one
+        collection.insert_many = original_insert_many
 
 
-def test_postgresql_insert_update_and_error_paths():
-    """Exercise PostgreSQL update, insert, and error/rollback branches."""
-    calls = {"executed": []}
+def test_postgresql_append_and_error_paths():
+    """Exercise the PostgreSQL batch append and its error/rollback branch."""
 
     class FakeCursor:
-        def __init__(self, mode):
-            self.mode = mode
+        def __init__(self, conn):
+            self.conn = conn
             self.rowcount = 0
 
         def __enter__(self):
@@ -455,54 +430,265 @@ def test_postgresql_insert_update_and_error_paths():
             return False
 
         def execute(self, sql, params=None):
-            calls["executed"].append(sql.strip().split()[0])
-            if "SELECT" in sql:
-                if self.mode == "update":
-                    self._fetch = {"id": "x"}
-                elif self.mode == "error":
-                    raise RuntimeError("sql error")
-                else:
-                    self._fetch = None
-            else:
-                # UPDATE or INSERT
-                self.rowcount = 1
-
-        def fetchone(self):
-            return getattr(self, "_fetch", None)
+            self.conn.statements.append(sql)
+
+        def fetchall(self):
+            return [
+                {"thread_id": thread_id, "max_seq": seq}
+                for thread_id, seq in self.conn.max_seq.items()
+            ]
+
+        def executemany(self, sql, params_seq):
+            if self.conn.fail:
+                raise RuntimeError("sql error")
+            self.conn.statements.append(sql)
+            self.conn.rows.extend(params_seq)
+            self.rowcount = len(params_seq)
 
     class FakeConn:
-        def __init__(self, mode):
-            self.mode = mode
-            self.commit_called = False
+        def __init__(self, fail=False, max_seq=None):
+            self.fail = fail
+            self.max_seq = max_seq or {}
+            self.statements = []
+            self.rows = []
+            self.commits = 0
             self.rollback_called = False
 
         def cursor(self):
-            return FakeCursor(self.mode)
+            return FakeCursor(self)
 
         def commit(self):
-            self.commit_called = True
+            self.commits += 1
 
         def rollback(self):
             self.rollback_called = True
 
     manager = checkpoint.ChatStreamManager(checkpoint_saver=True, db_uri=POSTGRES_URL)
 
-    # Update path
-    manager.postgres_conn = FakeConn("update")
+    # Single conversation append
+    manager.postgres_conn = FakeConn()
     assert manager._persist_to_postgresql("t", ["m"]) is True
-    assert manager.postgres_conn.commit_called is True
+    assert manager.postgres_conn.commits == 1
+    assert "INSERT INTO chat_stream_events" in manager.postgres_conn.statements[-1]
+    assert [row[:3] for row in manager.postgres_conn.rows] == [("t", 0, "m")]
 
-    # Insert path
-    manager.postgres_conn = FakeConn("insert")
-    assert manager._persist_to_postgresql("t", ["m"]) is True
-    assert manager.postgres_conn.commit_called is True
+    # Several conversations are appended with one statement and one commit,
+    # continuing after the last stored seq of each thread
+    manager.postgres_conn = FakeConn(max_seq={"b": 4})
+    assert (
+        manager._persist_batch_to_postgresql({"a": ["1"], "b": ["2", "3"]}) is True
+    )
+    assert manager.postgres_conn.commits == 1
+    assert [row[:3] for row in manager.postgres_conn.rows] == [
+        ("a", 0, "1"),
+        ("b", 5, "2"),
+        ("b", 6, "3"),
+    ]
 
     # Error path with rollback
-    manager.postgres_conn = FakeConn("error")
+    manager.postgres_conn = FakeConn(fail=True)
     assert manager._persist_to_postgresql("t", ["m"]) is False
     assert manager.postgres_conn.rollback_called is True
 
 
+def test_postgresql_seq_conflict_retries_each_thread():
+    """A primary key conflict in a batch retries each thread with a fresh seq."""
+
+    class FakeCursor:
+        def __init__(self, conn):
+            self.conn = conn
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def execute(self, sql, params=None):
+            self.conn.queried = params[0]
+
+        def fetchall(self):
+            return [
+                {"thread_id": t, "max_seq": self.conn.max_seq[t]}
+                for t in self.conn.queried
+                if t in self.conn.max_seq
+            ]
+
+        def executemany(self, sql, params_seq):
+            self.conn.attempts += 1
+            if self.conn.attempts == 1:
+                # Another writer appended to "b" after MAX(seq) was read
+                self.conn.max_seq["b"] = 0
+                raise checkpoint.psycopg.errors.UniqueViolation("duplicate key")
+            self.conn.rows.extend(params_seq)
+
+    class FakeConn:
+        def __init__(self):
+            self.max_seq = {}
+            self.queried = []
+            self.attempts = 0
+            self.rows = []
+            self.rollbacks = 0
+
+        def cursor(self):
+            return FakeCursor(self)
+
+        def commit(self):
+            pass
+
+        def rollback(self):
+            self.rollbacks += 1
+
+    manager = checkpoint.ChatStreamManager(checkpoint_saver=True, db_uri=POSTGRES_URL)
+    manager.postgres_conn = FakeConn()
+
+    assert manager._persist_batch_to_postgresql({"a": ["1"], "b": ["2", "3"]}) is True
+    assert manager.postgres_conn.rollbacks == 1
+    assert [row[:3] for row in manager.postgres_conn.rows] == [
+        ("a", 0, "1"),
+        ("b", 1, "2"),
+        ("b", 2, "3"),
+    ]
+
+
+def test_mongodb_seq_conflict_retries_each_thread():
+    """A unique index conflict in a batch retries the rest of each thread with a fresh seq."""
+
+    class RacingCollection:
+        """Another writer appends to "b" right after its last seq is read."""
+
+        def __init__(self, collection):
+            self.collection = collection
+            self.raced = False
+
+        def find_one(self, query, **kwargs):
+            last = self.collection.find_one(query, **kwargs)
+            if query["thread_id"] == "b" and not self.raced:
+                self.raced = True
+                self.collection.insert_one({"thread_id": "b", "seq": 0, "event": "other"})
+            return last
+
+        def insert_many(self, documents, ordered=True):
+            return self.collection.insert_many(documents, ordered=ordered)
+
+    collection = mongomock.MongoClient().db.chat_stream_events
+    collection.create_index([("thread_id", 1), ("seq", 1)], unique=True)
+    manager = checkpoint.ChatStreamManager(checkpoint_saver=True, db_uri=POSTGRES_URL)
+    manager.mongo_db = SimpleNamespace(chat_stream_events=RacingCollection(collection))
+
+    assert manager._persist_batch_to_mongodb({"a": ["1"], "b": ["2", "3"], "c": ["4"]}) is True
+    assert [
+        (doc["thread_id"], doc["seq"], doc["event"])
+        for doc in collection.find({}, sort=[("thread_id", 1), ("seq", 1)])
+    ] == [
+        ("a", 0, "1"),
+        ("b", 0, "other"),
+        ("b", 1, "2"),
+        ("b", 2, "3"),
+        ("c", 0, "4"),
+    ]
+
+
+def test_persist_batch_merges_chunks_of_same_thread():
+    """A batch should write each thread once, keeping chunks in order."""
+    manager = checkpoint.ChatStreamManager(checkpoint_saver=False)
+    written = {}
+
+    def fake_batch(conversations):
+        written.update(conversations)
+        return True
+
+    manager.postgres_conn = object()
+    manager._persist_batch_to_postgresql = fake_batch
+
+    assert manager._persist_batch([("t1", ["a"]), ("t2", ["b"]), ("t1", ["c"])])
+    assert written == {"t1": ["a", "c"], "t2": ["b"]}
+    stats = manager.get_stats()
+    assert stats["batches_flushed"] == 1
+    assert stats["conversations_flushed"] == 2
+
+
+def test_background_writer_persists_and_reports_stats():
+    """Completed conversations are written by the writer thread, not inline."""
+    with patch("backend.graph.checkpoint.MongoClient") as mock_mongo_client:
+        mock_mongo_client.return_value = mongomock.MongoClient()
+        manager = checkpoint.ChatStreamManager(checkpoint_saver=True, db_uri=MONGO_URL)
+
+        for i in range(3):
+            thread_id = f"bg_{i}"
+            manager.process_stream_message(thread_id, "hi", finish_reason="partial")
+            manager.process_stream_message(thread_id, "bye", finish_reason="stop")
+
+        assert manager.flush(timeout=5) is True
+        for i in range(3):
+            assert list(manager.iter_thread_events(f"bg_{i}")) == ["hi", "bye"]
+
+        stats = manager.get_stats()
+        assert stats["chunks_processed"] == 6
+        assert stats["conversations_enqueued"] == 3
+        assert stats["conversations_flushed"] == 3
+        assert stats["pending_conversations"] == 0
+        assert stats["chunk_latency_avg_ms"] >= 0.0
+        manager.close()
+        assert not manager._writer.is_alive()
+
+
+def test_full_write_queue_falls_back_to_inline_persist():
+    """When the write queue stays full, the conversation is persisted inline."""
+    manager = checkpoint.ChatStreamManager(
+        checkpoint_saver=True,
+        db_uri=POSTGRES_URL,
+        max_pending=1,
+        enqueue_timeout=0.01,
+    )
+    written = []
+    manager.postgres_conn = object()
+    manager._persist_batch_to_postgresql = lambda conv: written.append(conv) or True
+    # Occupy the only queue slot without a running writer
+    manager._ensure_writer = lambda: None
+    manager._queue.put(("other", ["x"]))
+
+    assert manager.process_stream_message("t", "m", finish_reason="stop") is True
+    assert written == [{"t": ["m"]}]
+    assert manager.get_stats()["inline_flushes"] == 1
+
+
+def test_full_write_queue_does_not_block_the_event_loop():
+    """On an event loop, a full queue hands the conversation to the overflow thread."""
+    manager = checkpoint.ChatStreamManager(
+        checkpoint_saver=True,
+        db_uri=POSTGRES_URL,
+        max_pending=1,
+        enqueue_timeout=0.05,
+    )
+    written = []
+    persist_threads = []
+
+    def persist(conversations):
+        persist_threads.append(threading.current_thread().name)
+        written.append(conversations)
+        return True
+
+    manager.postgres_conn = object()
+    manager._persist_batch_to_postgresql = persist
+    manager._ensure_writer = lambda: None
+    manager._queue.put(("other", ["x"]))
+
+    async def stream():
+        started = asyncio.get_running_loop().time()
+        assert manager.process_stream_message("t", "m", finish_reason="stop") is True
+        return asyncio.get_running_loop().time() - started
+
+    assert asyncio.run(stream()) < 0.05
+    # The slot never frees up, so the overflow thread falls back to an inline write
+    manager._overflow.shutdown(wait=True)
+    assert written == [{"t": ["m"]}]
+    assert persist_threads[0].startswith("chat-stream-overflow")
+    stats = manager.get_stats()
+    assert stats["overflow_handoffs"] == 1
+    assert stats["inline_flushes"] == 1
+
+
 def test_create_chat_streams_table_success_and_error():
     """Ensure table creation commits on success and rolls back on failure."""
 
@@ -674,3 +860,103 @@ def test_chat_stream_message_wrapper(monkeypatch):
     called["args"] = None
     assert checkpoint.chat_stream_message("tid", "msg", "stop") is False
     assert called["args"] is None
+
+
+def _chunk(message_id, content, finish_reason=None, **extra):
+    data = {"thread_id": "t", "id": message_id, "role": "assistant", "content": content}
+    if finish_reason:
+        data["finish_reason"] = finish_reason
+    data.update(extra)
+    return f"event: message_chunk\ndata: {json.dumps(data)}\n\n"
+
+
+def _event_data(event):
+    return json.loads(event.split("data: ", 1)[1])
+
+
+def test_compact_stream_events_collapses_token_chunks():
+    """Chunks of one message merge into its first slot; other events are kept."""
+    tool_event = 'event: tool_calls\ndata: {"id": "m1", "tool_calls": []}\n\n'
+    events = [
+        _chunk("m1", "Hel", reasoning_content="th"),
+        _chunk("m2", "Other"),
+        _chunk("m1", "lo", reasoning_content="ink"),
+        tool_event,
+        _chunk("m1", "!", finish_reason="stop"),
+    ]
+
+    compacted = checkpoint.compact_stream_events(events)
+
+    assert len(compacted) == 3
+    first = _event_data(compacted[0])
+    assert first["content"] == "Hello!"
+    assert first["reasoning_content"] == "think"
+    assert first["finish_reason"] == "stop"
+    assert _event_data(compacted[1])["content"] == "Other"
+    assert compacted[2] == tool_event
+    assert checkpoint.compact_stream_events(["not an sse event"]) == ["not an sse event"]
+
+
+def test_iter_thread_events_pages_in_order_then_buffered():
+    """Replay reads persisted events page by page, then unfinished chunks."""
+    with patch("backend.graph.checkpoint.MongoClient") as mock_mongo_client:
+        mock_mongo_client.return_value = mongomock.MongoClient()
+        manager = checkpoint.ChatStreamManager(checkpoint_saver=True, db_uri=MONGO_URL)
+
+        for turn in range(5):
+            assert manager._persist_to_mongodb("long", [f"e{turn}a", f"e{turn}b"])
+        manager.process_stream_message("long", "pending", finish_reason="partial")
+
+        replay = list(manager.iter_thread_events("long", page_size=3))
+
+    assert replay == [f"e{i}{s}" for i in range(5) for s in "ab"] + ["pending"]
+
+
+def test_iter_thread_events_falls_back_to_legacy_array():
+    """Threads stored in the old chat_streams format are still replayed."""
+    with patch("backend.graph.checkpoint.MongoClient") as mock_mongo_client:
+        mock_mongo_client.return_value = mongomock.MongoClient()
+        manager = checkpoint.ChatStreamManager(checkpoint_saver=True, db_uri=MONGO_URL)
+        manager.mongo_db.chat_streams.insert_one(
+            {"thread_id": "old", "messages": ["a", "b"]}
+        )
+
+        assert list(manager.iter_thread_events("old")) == ["a", "b"]
+
+
+def test_iter_thread_events_replays_legacy_array_before_new_events():
+    """A legacy thread that gained new events replays the old array first."""
+    with patch("backend.graph.checkpoint.MongoClient") as mock_mongo_client:
+        mock_mongo_client.return_value = mongomock.MongoClient()
+        manager = checkpoint.ChatStreamManager(checkpoint_saver=True, db_uri=MONGO_URL)
+        manager.mongo_db.chat_streams.insert_one(
+            {"thread_id": "old", "messages": ["a", "b"]}
+        )
+        assert manager._persist_to_mongodb("old", ["c", "d"])
+        manager.process_stream_message("old", "pending", finish_reason="partial")
+
+        assert list(manager.iter_thread_events("old", page_size=1)) == [
+            "a", "b", "c", "d", "pending"
+        ]
+
+
+def test_compact_manager_stores_fewer_bytes():
+    """With compaction on, a streamed answer is stored as one event."""
+    chunks = [_chunk("m1", f"token{i} ") for i in range(50)]
+    chunks.append(_chunk("m1", "", finish_reason="stop"))
+
+    stats = {}
+    for compact in (False, True):
+        with patch("backend.graph.checkpoint.MongoClient") as mock_mongo_client:
+            mock_mongo_client.return_value = mongomock.MongoClient()
+            manager = checkpoint.ChatStreamManager(
+                checkpoint_saver=True, db_uri=MONGO_URL, compact=compact
+            )
+            assert manager._persist_batch([("c", chunks)]) is True
+            stats[compact] = manager.get_thread_storage_stats("c")
+            replay = list(manager.iter_thread_events("c"))
+
+    assert stats[False]["events"] == 51
+    assert stats[True]["events"] == 1
+    assert stats[True]["bytes"] < stats[False]["bytes"] / 10
+    assert _event_data(replay[0])["content"] == "".join(f"token{i} " for i in range(50))
@@ -0,0 +1,145 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.conversation import intent_router
+from backend.conversation.intent_router import (
+    IntentRouter,
+    LocalIntentClassifier,
+    SemanticIntentCache,
+    get_intent_router,
+    train_intent_routers,
+)
+from backend.graph import nodes
+
+EXAMPLES = [
+    ("list all tasks", "list_tasks", 1.0),
+    ("show me the tasks", "list_tasks", 1.0),
+    ("list tasks for project 478", "list_tasks", 1.0),
+    ("list sprints", "list_sprints", 1.0),
+    ("show all sprints", "list_sprints", 1.0),
+    ("create a new project", "create_project", 1.0),
+    ("i want to create a project", "create_project", 1.0),
+    ("research kubernetes best practices", "research_topic", 1.0),
+    ("tell me about quantum computing", "research_topic", 1.0),
+]
+
+
+@pytest.fixture(autouse=True)
+def fresh_routers():
+    intent_router.reset_intent_routers()
+    yield
+    intent_router.reset_intent_routers()
+
+
+class TestSemanticIntentCache:
+    def test_exact_and_paraphrase_hits(self):
+        cache = SemanticIntentCache(max_entries=8, similarity_threshold=0.85)
+        cache.put("What is the project health", "PM_HEALTH")
+
+        assert cache.get("what is the   project health") == ("PM_HEALTH", 1.0)
+        label, similarity = cache.get("what's the project health?")
+        assert label == "PM_HEALTH" and 0.85 <= similarity < 1.0
+        assert cache.get("list sprints") is None
+        assert cache.get_stats()["exact_hits"] == 1
+        assert cache.get_stats()["semantic_hits"] == 1
+
+    def test_paraphrase_with_different_negation_misses(self):
+        # Low enough that every pair below is similar; only negation tells them apart
+        cache = SemanticIntentCache(max_entries=8, similarity_threshold=0.8)
+        cache.put("show my open tasks", "PM_LIST")
+        cache.put("do not create the sprint", "NOT_PM")
+
+        assert cache.get("don't show my open tasks") is None
+        assert cache.get("never show my open tasks") is None
+        assert cache.get("show my open tasks!")[0] == "PM_LIST"
+        assert cache.get("create the sprint") is None
+        assert cache.get("do not create the sprint!")[0] == "NOT_PM"
+
+    def test_bounded_lru_eviction(self):
+        cache = SemanticIntentCache(max_entries=2)
+        cache.put("list tasks", "PM_LIST")
+        cache.put("project health", "PM_HEALTH")
+        cache.get("list tasks")
+        cache.put("hello there", "NOT_PM")
+
+        assert len(cache) == 2
+        assert cache.get("project health") is None
+        assert cache.get("list tasks") == ("PM_LIST", 1.0)
+
+
+class TestLocalIntentClassifier:
+    def test_predicts_nearest_centroid(self):
+        classifier = LocalIntentClassifier().fit(EXAMPLES)
+        label, similarity, margin = classifier.predict("show sprints")
+        assert label == "list_sprints"
+        assert similarity > 0.6 and margin > 0.1
+
+    def test_single_label_is_not_trained(self):
+        classifier = LocalIntentClassifier().fit([("list tasks", "list_tasks", 1.0)])
+        assert not classifier.is_trained
+        assert classifier.predict("list tasks") is None
+
+
+class TestIntentRouter:
+    @pytest.mark.asyncio
+    async def test_paths_and_stats(self):
+        classifier = LocalIntentClassifier().fit(EXAMPLES)
+        router = IntentRouter("test", classifier=classifier)
+        llm = AsyncMock(return_value="research_topic")
+
+        local = await router.route("show sprints", llm, fallback="unknown")
+        first = await router.route("what is the weather in hanoi", llm, fallback="unknown")
+        cached = await router.route("What is the weather in Hanoi?", llm, fallback="unknown")
+
+        assert (local.path, local.label) == ("local", "list_sprints")
+        assert (first.path, cached.path) == ("llm", "cache")
+        assert cached.label == "research_topic"
+        llm.assert_awaited_once()
+        paths = router.get_stats()["paths"]
+        assert {name: stats["count"] for name, stats in paths.items()} == {"local": 1, "llm": 1, "cache": 1}
+
+    @pytest.mark.asyncio
+    async def test_llm_failure_returns_fallback_uncached(self):
+        router = IntentRouter("test")
+        decision = await router.route("list tasks", AsyncMock(return_value=None), fallback="PM_GENERAL")
+        assert (decision.label, decision.path) == ("PM_GENERAL", "fallback")
+        assert len(router.cache) == 0
+
+    def test_short_messages_skip_fast_paths(self):
+        router = IntentRouter("test", min_words=3)
+        llm = MagicMock(return_value="help")
+        router.route_sync("yes", llm, fallback="unknown")
+        router.route_sync("yes", llm, fallback="unknown")
+        assert llm.call_count == 2
+
+    def test_escalation_router_skips_fast_paths_for_short_messages(self):
+        assert get_intent_router("escalation").min_words >= 3
+        assert get_intent_router("flow_intent").min_words >= 3
+
+    def test_train_maps_flow_intents_to_pm_labels(self):
+        train_intent_routers(EXAMPLES)
+        pm_classifier = get_intent_router("pm_intent").classifier
+        assert pm_classifier.labels == ["NOT_PM", "PM_GENERAL", "PM_LIST"]
+        assert get_intent_router("flow_intent").classifier.is_trained
+
+
+class TestDetectPmIntent:
+    @pytest.mark.asyncio
+    async def test_async_detection_uses_ainvoke_and_cache(self):
+        llm = MagicMock()
+        llm.ainvoke = AsyncMock(return_value=MagicMock(content="PM_SPRINT"))
+        with patch.object(nodes, "get_llm_by_type", return_value=llm):
+            assert await nodes.adetect_pm_intent("analyze sprint 5 velocity") == (True, "sprint")
+            assert await nodes.adetect_pm_intent("Analyze sprint 5 velocity") == (True, "sprint")
+        llm.ainvoke.assert_awaited_once()
+        llm.invoke.assert_not_called()
+
+    def test_sync_detection_falls_back_to_general_pm(self):
+        llm = MagicMock()
+        llm.invoke.side_effect = RuntimeError("llm down")
+        with patch.object(nodes, "get_llm_by_type", return_value=llm):
+            assert nodes.detect_pm_intent_llm("weekly report please") == (True, "general")
@@ -0,0 +1,139 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+import pytest
+
+from backend.crawler import Article, Crawler, WebCache
+
+
+class _JinaStub:
+    """Local stand-in for the Jina reader that tracks per-host concurrency."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.requests = Counter()
+        self.in_flight = Counter()
+        self.max_in_flight = Counter()
+        self.max_total = 0
+        self._lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                url = body["url"]
+                host = urlparse(url).netloc
+                with stub._lock:
+                    stub.requests[url] += 1
+                    stub.in_flight[host] += 1
+                    stub.max_in_flight[host] = max(stub.max_in_flight[host], stub.in_flight[host])
+                    stub.max_total = max(stub.max_total, sum(stub.in_flight.values()))
+                time.sleep(stub.delay)
+                with stub._lock:
+                    stub.in_flight[host] -= 1
+
+                if "missing" in url:
+                    self.send_response(404)
+                    payload = b"not found"
+                else:
+                    self.send_response(200)
+                    payload = f"<html><title>{url}</title><body>{url}</body></html>".encode()
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class _TitleExtractor:
+    calls = 0
+
+    def extract_article(self, html):
+        _TitleExtractor.calls += 1
+        title = html.split("<title>")[1].split("</title>")[0]
+        return Article(title=title, html_content=f"<p>{title}</p>")
+
+
+@pytest.fixture
+def jina_stub(monkeypatch):
+    _TitleExtractor.calls = 0
+    monkeypatch.setattr("backend.crawler.crawler.ReadabilityExtractor", _TitleExtractor)
+    with _JinaStub() as stub:
+        monkeypatch.setenv("JINA_READER_URL", stub.url)
+        monkeypatch.setenv("JINA_API_KEY", "test")
+        yield stub
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = WebCache(tmp_path / "web_cache.sqlite3")
+    yield cache
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_acrawl_many_limits_per_host(jina_stub, cache):
+    urls = [f"http://a.test/{i}" for i in range(6)] + [f"http://b.test/{i}" for i in range(6)]
+    crawler = Crawler(cache=cache, max_concurrency=8, per_host_limit=2)
+
+    results = await crawler.acrawl_many(urls)
+
+    assert [r.title for r in results] == urls
+    assert [r.url for r in results] == urls
+    assert jina_stub.max_in_flight["a.test"] == 2
+    assert jina_stub.max_in_flight["b.test"] == 2
+    assert jina_stub.max_total == 4
+
+
+@pytest.mark.asyncio
+async def test_acrawl_many_dedupes_and_returns_errors(jina_stub, cache):
+    crawler = Crawler(cache=cache)
+    urls = ["http://a.test/page", "http://a.test/missing", "http://a.test/page"]
+
+    results = await crawler.acrawl_many(urls)
+
+    assert results[0].title == results[2].title == "http://a.test/page"
+    assert isinstance(results[1], ValueError) and "status 404" in str(results[1])
+    assert jina_stub.requests["http://a.test/page"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_articles_skip_fetch_and_extraction(jina_stub, cache):
+    await Crawler(cache=cache).acrawl("http://a.test/page")
+    article = Crawler(cache=cache).crawl("http://a.test/page#section")
+
+    assert article.title == "http://a.test/page"
+    assert article.url == "http://a.test/page#section"
+    assert jina_stub.requests["http://a.test/page"] == 1
+    assert _TitleExtractor.calls == 1
+    assert cache.get_stats()["namespaces"]["article"]["hits"] == 1
+
+
+def test_use_cache_false_always_fetches(jina_stub, cache):
+    crawler = Crawler(cache=cache, use_cache=False)
+    crawler.crawl("http://a.test/page")
+    crawler.crawl("http://a.test/page")
+
+    assert jina_stub.requests["http://a.test/page"] == 2
+    assert len(cache) == 0
@@ -0,0 +1,79 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import json
+import time
+
+import pytest
+
+from backend.crawler import web_cache
+from backend.crawler.web_cache import WebCache, cache_key
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = WebCache(tmp_path / "web_cache.sqlite3", ttl_seconds=60, max_bytes=1000)
+    yield cache
+    cache.close()
+
+
+def test_cache_key_is_content_addressed():
+    assert cache_key("search", {"q": "a", "n": 1}) == cache_key("search", {"n": 1, "q": "a"})
+    assert cache_key("search", "a") != cache_key("article", "a")
+
+
+def test_round_trip_and_stats(cache):
+    assert cache.get_json("article", "http://x") is None
+    cache.set_json("article", "http://x", {"title": "T"})
+
+    assert cache.get_json("article", "http://x") == {"title": "T"}
+    stats = cache.get_stats()
+    assert stats["namespaces"]["article"] == {"hits": 1, "misses": 1, "expired": 0, "writes": 1}
+    assert stats["hit_rate"] == 0.5
+
+
+def test_entries_expire(cache):
+    cache.set("search", "q", "result")
+    assert cache.get("search", "q", ttl_seconds=0) is None
+    assert cache.get("search", "q") is None
+    assert cache.get_stats()["namespaces"]["search"]["expired"] == 1
+    assert len(cache) == 0
+
+
+def test_size_cap_evicts_least_recently_used(cache):
+    cache.set("article", "a", "x" * 400)
+    time.sleep(0.01)
+    cache.set("article", "b", "x" * 400)
+    time.sleep(0.01)
+    cache.get("article", "a")
+    cache.set("article", "c", "x" * 400)
+
+    assert cache.get("article", "b") is None
+    assert cache.get("article", "a") is not None
+    assert cache.get_stats()["evictions"] == 1
+    assert cache.get_stats()["bytes"] <= 1000
+
+
+def test_persists_across_instances(tmp_path):
+    path = tmp_path / "shared.sqlite3"
+    first = WebCache(path)
+    first.set("article", "http://x", json.dumps({"title": "T"}))
+    first.close()
+
+    second = WebCache(path)
+    assert second.get_json("article", "http://x") == {"title": "T"}
+    assert second.get_stats()["bytes"] > 0
+    second.close()
+
+
+def test_singleton_respects_enabled_flag(monkeypatch, tmp_path):
+    monkeypatch.setenv("WEB_CACHE_PATH", str(tmp_path / "singleton.sqlite3"))
+    web_cache.reset_web_cache()
+    try:
+        monkeypatch.setenv("WEB_CACHE_ENABLED", "false")
+        assert web_cache.get_web_cache() is None
+        monkeypatch.setenv("WEB_CACHE_ENABLED", "true")
+        assert web_cache.get_web_cache() is web_cache.get_web_cache()
+        assert web_cache.get_web_cache_stats()["initialized"] is True
+    finally:
+        web_cache.reset_web_cache()
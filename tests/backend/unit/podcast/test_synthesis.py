@@ -0,0 +1,176 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import base64
+import random
+import threading
+import time
+
+import pytest
+
+from backend.crawler import WebCache
+from backend.crawler.web_cache import get_web_cache, reset_web_cache
+from backend.podcast.synthesis import (
+    FEMALE_VOICE,
+    MALE_VOICE,
+    LineSynthesizer,
+    get_tts_cache,
+    reset_tts_cache,
+)
+from backend.podcast.types import ScriptLine
+
+
+class _FakeTTSBackend:
+    """Local TTS stand-in: echoes voice and text back as audio after a jittered delay."""
+
+    def __init__(self, delay: float = 0.02, fail_on: str | None = None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def client(self, voice_type: str):
+        backend = self
+
+        class Client:
+            def text_to_speech(self, text, speed_ratio=1.0):
+                with backend._lock:
+                    backend.calls.append((voice_type, text))
+                    backend.in_flight += 1
+                    backend.max_in_flight = max(backend.max_in_flight, backend.in_flight)
+                time.sleep(backend.delay * random.uniform(0.5, 1.5))
+                with backend._lock:
+                    backend.in_flight -= 1
+                if text == backend.fail_on:
+                    return {"success": False, "error": "boom", "audio_data": None}
+                audio = f"{voice_type}|{text};".encode()
+                return {"success": True, "audio_data": base64.b64encode(audio).decode()}
+
+        return Client()
+
+
+def _lines(count: int) -> list[ScriptLine]:
+    return [
+        ScriptLine(speaker="male" if i % 2 == 0 else "female", paragraph=f"line {i}")
+        for i in range(count)
+    ]
+
+
+def _expected(lines: list[ScriptLine]) -> bytes:
+    return b"".join(
+        f"{MALE_VOICE if line.speaker == 'male' else FEMALE_VOICE}|{line.paragraph};".encode()
+        for line in lines
+    )
+
+
+@pytest.fixture
+def cache():
+    cache = WebCache(":memory:")
+    yield cache
+    cache.close()
+
+
+def test_iter_audio_preserves_order_with_bounded_concurrency(cache):
+    backend = _FakeTTSBackend()
+    lines = _lines(20)
+    synthesizer = LineSynthesizer(tts_factory=backend.client, cache=cache, max_concurrency=4)
+
+    audio = b"".join(synthesizer.iter_audio(lines))
+
+    assert audio == _expected(lines)
+    assert 1 < backend.max_in_flight <= 4
+
+
+def test_cached_lines_skip_the_backend(cache):
+    backend = _FakeTTSBackend()
+    lines = _lines(6)
+    list(LineSynthesizer(tts_factory=backend.client, cache=cache).iter_audio(lines))
+    first_run_calls = len(backend.calls)
+
+    changed = lines[:5] + [ScriptLine(speaker="female", paragraph="new line")]
+    audio = b"".join(
+        LineSynthesizer(tts_factory=backend.client, cache=cache).iter_audio(changed)
+    )
+
+    assert first_run_calls == 6
+    assert backend.calls[6:] == [(FEMALE_VOICE, "new line")]
+    assert audio == _expected(changed)
+
+
+def test_cache_key_includes_voice_and_speed(cache):
+    backend = _FakeTTSBackend()
+    line = ScriptLine(speaker="male", paragraph="hello")
+    LineSynthesizer(tts_factory=backend.client, cache=cache).synthesize(line)
+    LineSynthesizer(tts_factory=backend.client, cache=cache, speed_ratio=1.2).synthesize(line)
+    LineSynthesizer(tts_factory=backend.client, cache=cache).synthesize(
+        ScriptLine(speaker="female", paragraph="hello")
+    )
+
+    assert len(backend.calls) == 3
+
+
+def test_failed_lines_are_skipped_and_not_cached(cache):
+    backend = _FakeTTSBackend(fail_on="line 2")
+    lines = _lines(4)
+    synthesizer = LineSynthesizer(tts_factory=backend.client, cache=cache)
+
+    audio = b"".join(synthesizer.iter_audio(lines))
+    list(synthesizer.iter_audio(lines))
+
+    assert audio == _expected([lines[0], lines[1], lines[3]])
+    assert backend.calls.count((FEMALE_VOICE, "line 1")) == 1
+    assert backend.calls.count((MALE_VOICE, "line 2")) == 2
+
+
+def test_aiter_audio_streams_in_order(cache):
+    backend = _FakeTTSBackend()
+    lines = _lines(12)
+    synthesizer = LineSynthesizer(tts_factory=backend.client, cache=cache, max_concurrency=6)
+
+    async def collect():
+        return [segment async for segment in synthesizer.aiter_audio(lines)]
+
+    segments = asyncio.run(collect())
+
+    assert len(segments) == 12
+    assert b"".join(segments) == _expected(lines)
+
+
+def test_client_errors_propagate(cache):
+    def factory(voice_type):
+        raise Exception("VOLCENGINE_TTS_APPID is not set")
+
+    synthesizer = LineSynthesizer(tts_factory=factory, cache=cache)
+
+    with pytest.raises(Exception, match="VOLCENGINE_TTS_APPID"):
+        list(synthesizer.iter_audio(_lines(2)))
+
+
+def test_default_cache_is_separate_from_the_web_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("WEB_CACHE_ENABLED", "true")
+    monkeypatch.setenv("PODCAST_TTS_CACHE_ENABLED", "true")
+    monkeypatch.setenv("WEB_CACHE_PATH", str(tmp_path / "web.sqlite3"))
+    monkeypatch.setenv("PODCAST_TTS_CACHE_PATH", str(tmp_path / "tts.sqlite3"))
+    monkeypatch.setenv("PODCAST_TTS_CACHE_MAX_MB", "3")
+    reset_web_cache()
+    reset_tts_cache()
+    try:
+        synthesizer = LineSynthesizer(tts_factory=_FakeTTSBackend().client)
+        synthesizer.synthesize(ScriptLine(speaker="male", paragraph="hello"))
+
+        assert synthesizer.cache is get_tts_cache()
+        assert synthesizer.cache is not get_web_cache()
+        assert synthesizer.cache.max_bytes == 3 * 1024 * 1024
+        assert len(get_web_cache()) == 0 and len(synthesizer.cache) == 1
+    finally:
+        reset_tts_cache()
+        reset_web_cache()
+
+
+def test_tts_cache_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("PODCAST_TTS_CACHE_ENABLED", "false")
+
+    assert LineSynthesizer(tts_factory=_FakeTTSBackend().client).cache is None
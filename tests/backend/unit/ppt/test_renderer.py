@@ -0,0 +1,174 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+from backend.ppt.jobs import DONE, FAILED, RENDERING, PPTJobManager
+from backend.ppt.renderer import MarpRenderer, RenderError
+
+# Stands in for the marp CLI: `fake_marp.py <src> -o <out>` copies the source to
+# the output, sleeping first and failing when the deck asks it to.
+FAKE_MARP = """
+import os, shutil, sys, time
+src, out = sys.argv[1], sys.argv[3]
+text = open(src, encoding="utf-8").read()
+with open(os.environ["FAKE_MARP_LOG"], "a") as log:
+    log.write(os.path.dirname(src) + "\\n")
+time.sleep(0.1)
+if "FAIL" in text:
+    sys.stderr.write("boom")
+    sys.exit(1)
+shutil.copy(src, out)
+"""
+
+
+@pytest.fixture
+def renderer(tmp_path, monkeypatch):
+    script = tmp_path / "fake_marp.py"
+    script.write_text(FAKE_MARP)
+    log = tmp_path / "calls.log"
+    log.write_text("")
+    monkeypatch.setenv("FAKE_MARP_LOG", str(log))
+    r = MarpRenderer(
+        cache_dir=str(tmp_path / "cache"),
+        max_concurrency=2,
+        timeout_seconds=30,
+        cache_max_entries=2,
+        command=(sys.executable, str(script)),
+    )
+    r.calls = lambda: log.read_text().split()
+    return r
+
+
+class TestMarpRenderer:
+    @pytest.mark.asyncio
+    async def test_renders_into_cache_and_reuses(self, renderer):
+        path = await renderer.render("# deck")
+        again = await renderer.render("# deck")
+
+        assert path == again
+        assert open(path, encoding="utf-8").read() == "# deck"
+        assert renderer.cached_path("# deck") == path
+        assert len(renderer.calls()) == 1
+        assert renderer.stats["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_render(self, renderer):
+        paths = await asyncio.gather(*(renderer.render("# same") for _ in range(5)))
+
+        assert len(set(paths)) == 1
+        assert len(renderer.calls()) == 1
+        assert renderer.stats["shared"] == 4
+
+    @pytest.mark.asyncio
+    async def test_failure_raises_and_cleans_up(self, renderer):
+        with pytest.raises(RenderError, match="boom"):
+            await renderer.render("FAIL")
+
+        assert renderer.cached_path("FAIL") is None
+        # The work directory is removed even when marp fails
+        assert not any(os.path.exists(d) for d in renderer.calls())
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, renderer):
+        first = await renderer.render("# one")
+        await renderer.render("# two")
+        os.utime(first, (0, 0))
+        await renderer.render("# three")
+
+        assert not os.path.exists(first)
+        assert len(os.listdir(renderer.cache_dir)) == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_cli(self, tmp_path):
+        r = MarpRenderer(cache_dir=str(tmp_path), command=("no-such-marp-binary",))
+
+        with pytest.raises(RenderError, match="not found"):
+            await r.render("# deck")
+
+
+async def _collect(events):
+    return [event async for event in events]
+
+
+class TestPPTJobManager:
+    @pytest.mark.asyncio
+    async def test_job_streams_progress_until_done(self):
+        async def runner(content, progress):
+            await asyncio.sleep(0.01)
+            progress(RENDERING)
+            await asyncio.sleep(0.01)
+            return f"/decks/{content}.pptx"
+
+        manager = PPTJobManager(runner=runner, ttl_seconds=60, max_jobs=4)
+        job = manager.submit("q3")
+
+        statuses = [event["status"] async for event in job.iter_events()]
+
+        assert statuses == ["queued", "composing", "rendering", DONE]
+        assert manager.get(job.id).file_path == "/decks/q3.pptx"
+
+    @pytest.mark.asyncio
+    async def test_failed_job_records_error(self):
+        async def runner(content, progress):
+            raise RenderError("marp exited with code 1")
+
+        manager = PPTJobManager(runner=runner, ttl_seconds=60, max_jobs=4)
+        job = manager.submit("x")
+        events = [event async for event in job.iter_events()]
+
+        assert events[-1]["status"] == FAILED
+        assert job.error == "marp exited with code 1"
+        assert job.to_dict()["status"] == FAILED
+
+    @pytest.mark.asyncio
+    async def test_cancelled_job_fails_and_ends_event_streams(self):
+        started = asyncio.Event()
+
+        async def runner(content, progress):
+            started.set()
+            await asyncio.sleep(60)
+
+        manager = PPTJobManager(runner=runner, ttl_seconds=60, max_jobs=4)
+        job = manager.submit("x")
+        await started.wait()
+        events = asyncio.create_task(_collect(job.iter_events()))
+        for task in list(manager._tasks):
+            task.cancel()
+
+        statuses = [event["status"] for event in await asyncio.wait_for(events, 1)]
+
+        assert statuses[-1] == FAILED
+        assert job.finished and "cancelled" in job.error
+
+    @pytest.mark.asyncio
+    async def test_submit_uses_the_given_runner(self):
+        async def default(content, progress):
+            raise AssertionError("default runner used")
+
+        async def runner(content, progress):
+            return f"/decks/{content}.pptx"
+
+        manager = PPTJobManager(runner=default, ttl_seconds=60, max_jobs=4)
+        job = manager.submit("q3", runner=runner)
+        [event async for event in job.iter_events()]
+
+        assert job.file_path == "/decks/q3.pptx"
+
+    @pytest.mark.asyncio
+    async def test_keeps_at_most_max_jobs(self):
+        async def runner(content, progress):
+            return content
+
+        manager = PPTJobManager(runner=runner, ttl_seconds=60, max_jobs=2)
+        jobs = []
+        for i in range(4):
+            jobs.append(manager.submit(str(i)))
+            await asyncio.sleep(0.01)
+
+        assert manager.get(jobs[0].id) is None
+        assert manager.get(jobs[-1].id) is not None
@@ -152,3 +152,51 @@ def test_list_resources_error(mock_get, monkeypatch):
     mock_get.return_value = mock_response
     with pytest.raises(Exception):
         provider.list_resources()
+
+
+@pytest.mark.asyncio
+async def test_aquery_relevant_documents_queries_datasets_concurrently(monkeypatch):
+    import asyncio
+
+    import httpx
+
+    import backend.rag.dify as dify
+    from backend.rag.retriever import Chunk, Document, clear_retriever_caches
+
+    monkeypatch.setattr(dify, "Document", Document)
+    monkeypatch.setattr(dify, "Chunk", Chunk)
+    monkeypatch.setenv("DIFY_API_URL", "http://api")
+    monkeypatch.setenv("DIFY_API_KEY", "key")
+    clear_retriever_caches()
+    in_flight = {"now": 0, "max": 0}
+
+    async def handler(request):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.05)
+        in_flight["now"] -= 1
+        dataset_id = request.url.path.split("/")[2]
+        if dataset_id == "broken":
+            return httpx.Response(500, text="boom")
+        record = {
+            "segment": {
+                "content": f"chunk from {dataset_id}",
+                "document": {"id": "shared-doc", "name": "Shared"},
+            },
+            "score": 0.9 if dataset_id == "a" else 0.6,
+        }
+        return httpx.Response(200, json={"records": [record]})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(dify, "async_http_client", lambda: client)
+    provider = DifyProvider()
+    resources = [DummyResource(f"rag://dataset/{d}") for d in ("a", "b", "broken")]
+
+    docs = await provider.aquery_relevant_documents("query", resources)
+    await provider.aquery_relevant_documents("query", resources)  # cached
+
+    assert in_flight["max"] == 3
+    assert len(docs) == 1 and docs[0].id == "shared-doc"
+    assert [c.content for c in docs[0].chunks] == ["chunk from a", "chunk from b"]
+    await client.aclose()
+    clear_retriever_caches()
@@ -43,8 +43,9 @@ class DummyEmbedding:
 
 
 @pytest.fixture(autouse=True)
-def patch_embeddings(monkeypatch):
+def patch_embeddings(monkeypatch, tmp_path):
     # Prevent network / external API usage during __init__
+    monkeypatch.setenv("MILVUS_INGEST_MANIFEST", str(tmp_path / "manifest.json"))
     monkeypatch.setenv("MILVUS_EMBEDDING_PROVIDER", "openai")
     monkeypatch.setenv("MILVUS_EMBEDDING_MODEL", "text-embedding-ada-002")
     monkeypatch.setenv("MILVUS_COLLECTION", "documents")
@@ -335,23 +336,17 @@ def test_query_relevant_documents_lite_success(monkeypatch):
 
     # Provide deterministic embedding output
     retriever.embedding_model.embed_query = lambda text: [0.1, 0.2, 0.3]  # type: ignore
+    captured = {}
 
     class DummyMilvusLite:
         def search(
-            self, collection_name, data, anns_field, param, limit, output_fields
+            self, collection_name, data, anns_field, param, limit, output_fields, filter
         ):  # noqa: D401
-            # Simulate two result entries
+            captured["filter"] = filter
+            captured["limit"] = limit
+            # Milvus applies the filter, so only d2 comes back
             return [
                 [
-                    {
-                        "entity": {
-                            retriever.id_field: "d1",
-                            retriever.content_field: "c1",
-                            retriever.title_field: "T1",
-                            retriever.url_field: "u1",
-                        },
-                        "distance": 0.9,
-                    },
                     {
                         "entity": {
                             retriever.id_field: "d2",
@@ -365,11 +360,12 @@ def test_query_relevant_documents_lite_success(monkeypatch):
             ]
 
     retriever.client = DummyMilvusLite()
-    # Filter for only d2 via resource list
     docs = retriever.query_relevant_documents(
         "question", resources=[Resource(uri="milvus://d2", title="", description="")]
     )
     assert len(docs) == 1 and docs[0].id == "d2" and docs[0].chunks[0].similarity == 0.8
+    assert captured["filter"] == 'url in ["milvus://d2"] or id in ["d2"]'
+    assert captured["limit"] == retriever.top_k
 
 
 def test_query_relevant_documents_remote_success(monkeypatch):
@@ -377,6 +373,7 @@ def test_query_relevant_documents_remote_success(monkeypatch):
     _patch_init(monkeypatch)
     retriever = MilvusProvider()
     retriever.embedding_model.embed_query = lambda text: [0.1, 0.2, 0.3]  # type: ignore
+    captured = {}
 
     class DocObj:
         def __init__(self, content: str, meta: dict):  # noqa: D401
@@ -384,7 +381,8 @@ def test_query_relevant_documents_remote_success(monkeypatch):
             self.metadata = meta
 
     class RemoteClient:
-        def similarity_search_with_score(self, query, k):  # noqa: D401
+        def similarity_search_with_score_by_vector(self, embedding, k, expr):  # noqa: D401
+            captured.update(embedding=embedding, k=k, expr=expr)
             return [
                 (
                     DocObj(
@@ -397,25 +395,150 @@ def test_query_relevant_documents_remote_success(monkeypatch):
                     ),
                     0.7,
                 ),
-                (
-                    DocObj(
-                        "c2",
-                        {
-                            retriever.id_field: "d2",
-                            retriever.title_field: "T2",
-                            retriever.url_field: "u2",
-                        },
-                    ),
-                    0.6,
-                ),
             ]
 
     retriever.client = RemoteClient()
-    # Filter to only d1
     docs = retriever.query_relevant_documents(
         "q", resources=[Resource(uri="milvus://d1", title="", description="")]
     )
     assert len(docs) == 1 and docs[0].id == "d1" and docs[0].chunks[0].similarity == 0.7
+    assert captured["embedding"] == [0.1, 0.2, 0.3]
+    assert captured["expr"] == 'url in ["milvus://d1"] or id in ["d1"]'
+
+    # No resources: unfiltered search
+    retriever.query_relevant_documents("q")
+    assert captured["expr"] is None
+
+
+def test_build_resource_filter_quotes_and_dedups(monkeypatch):
+    _patch_init(monkeypatch)
+    retriever = MilvusProvider()
+    expr = retriever._build_resource_filter(
+        [
+            Resource(uri="milvus://documents/a.md", title="", description=""),
+            Resource(uri="milvus://documents/a.md", title="", description=""),
+            Resource(uri='milvus://we"ird\\id', title="", description=""),
+        ]
+    )
+    assert expr == (
+        'url in ["milvus://documents/a.md", "milvus://we\\"ird\\\\id"] '
+        'or id in ["documents/a.md", "a.md", "we\\"ird\\\\id"]'
+    )
+    assert retriever._build_resource_filter([]) == ""
+
+
+def test_query_embedding_cache_reuses_and_evicts(monkeypatch):
+    monkeypatch.setenv("MILVUS_QUERY_EMBEDDING_CACHE_SIZE", "2")
+    _patch_init(monkeypatch)
+    retriever = MilvusProvider()
+    calls = []
+
+    def embed(text):
+        calls.append(text)
+        return [float(len(calls))]
+
+    retriever.embedding_model.embed_query = embed  # type: ignore
+    assert retriever._get_query_embedding("a") == [1.0]
+    assert retriever._get_query_embedding(" a ") == [1.0]
+    retriever._get_query_embedding("b")
+    retriever._get_query_embedding("c")  # evicts "a"
+    retriever._get_query_embedding("a")
+    assert calls == ["a", "b", "c", "a"]
+
+
+def test_reciprocal_rank_fusion_orders_by_combined_rank():
+    def hit(doc_id):
+        return {"entity": {"id": doc_id}, "distance": 0.0}
+
+    dense = [hit("a"), hit("b"), hit("c")]
+    sparse = [hit("b"), hit("d")]
+    fused = milvus_mod.reciprocal_rank_fusion([dense, sparse], "id")
+    assert [h["entity"]["id"] for h in fused] == ["b", "a", "d", "c"]
+    assert fused[0]["distance"] == pytest.approx(1 / 62 + 1 / 61)
+
+
+def test_query_relevant_documents_hybrid_fuses_channels(monkeypatch):
+    monkeypatch.setenv("MILVUS_HYBRID_SEARCH", "true")
+    monkeypatch.setenv("MILVUS_TOP_K", "2")
+    _patch_init(monkeypatch)
+    retriever = MilvusProvider()
+    calls = []
+
+    def hit(doc_id):
+        return {"entity": {retriever.id_field: doc_id, retriever.content_field: doc_id}}
+
+    class DummyMilvusLite:
+        def search(self, **kwargs):
+            calls.append(kwargs)
+            if kwargs["anns_field"] == retriever.sparse_field:
+                return [[hit("lexical"), hit("both")]]
+            return [[hit("dense"), hit("both")]]
+
+    retriever.client = DummyMilvusLite()
+    docs = retriever.query_relevant_documents("sprint 42 burndown")
+    assert [d.id for d in docs] == ["both", "dense"]
+    assert calls[1]["data"] == ["sprint 42 burndown"]
+    assert all(c["limit"] == 2 * retriever.hybrid_candidate_factor for c in calls)
+
+
+def test_query_relevant_documents_hybrid_falls_back_to_dense(monkeypatch):
+    monkeypatch.setenv("MILVUS_HYBRID_SEARCH", "true")
+    monkeypatch.setenv("MILVUS_TOP_K", "1")
+    _patch_init(monkeypatch)
+    retriever = MilvusProvider()
+
+    class DummyMilvusLite:
+        def search(self, **kwargs):
+            if kwargs["anns_field"] == retriever.sparse_field:
+                raise RuntimeError("field sparse not exist")
+            return [
+                [
+                    {"entity": {retriever.id_field: "d1"}, "distance": 0.9},
+                    {"entity": {retriever.id_field: "d2"}, "distance": 0.5},
+                ]
+            ]
+
+    retriever.client = DummyMilvusLite()
+    docs = retriever.query_relevant_documents("q")
+    assert [d.id for d in docs] == ["d1"]
+    assert retriever.hybrid_search is True
+    assert retriever._bm25_backoff == milvus_mod.BM25_RETRY_MIN_SECONDS
+
+
+def test_hybrid_search_retries_bm25_after_backoff(monkeypatch):
+    monkeypatch.setenv("MILVUS_HYBRID_SEARCH", "true")
+    monkeypatch.setenv("MILVUS_TOP_K", "1")
+    _patch_init(monkeypatch)
+    retriever = MilvusProvider()
+    now = [1000.0]
+    monkeypatch.setattr(milvus_mod.time, "monotonic", lambda: now[0])
+    sparse_calls = []
+    failures = [RuntimeError("timeout"), RuntimeError("timeout")]
+
+    class DummyMilvusLite:
+        def search(self, **kwargs):
+            if kwargs["anns_field"] == retriever.sparse_field:
+                sparse_calls.append(now[0])
+                if failures:
+                    raise failures.pop(0)
+                return [[{"entity": {retriever.id_field: "d1"}}]]
+            return [[{"entity": {retriever.id_field: "d1"}}]]
+
+    retriever.client = DummyMilvusLite()
+
+    def search():
+        return retriever._search_lite("q", [0.1], "")
+
+    search()  # fails, backs off 30s
+    now[0] += 10
+    search()  # within backoff: dense only
+    now[0] += 25
+    search()  # retried, fails again, backs off 60s
+    assert retriever._bm25_backoff == 2 * milvus_mod.BM25_RETRY_MIN_SECONDS
+    now[0] += 61
+    search()  # retried and succeeds
+    assert sparse_calls == [1000.0, 1035.0, 1096.0]
+    assert retriever._bm25_backoff == 0.0
 
 
 def test_get_embedding_dimension_explicit(monkeypatch):
@@ -472,28 +595,83 @@ def test_ensure_collection_exists_remote(monkeypatch):
     retriever._ensure_collection_exists()
 
 
-def test_get_existing_document_ids_lite(monkeypatch):
+def test_find_existing_chunk_ids_lite(monkeypatch):
     _patch_init(monkeypatch)
     retriever = MilvusProvider()
+    captured = {}
 
     class DummyMilvusLite:
-        def query(self, collection_name, filter, output_fields, limit):  # noqa: D401
+        def query(self, collection_name, filter, output_fields):  # noqa: D401
+            captured["filter"] = filter
             return [
-                {retriever.id_field: "a"},
-                {retriever.id_field: "b"},
+                {retriever.id_field: "doc_chunk_1"},
+                {retriever.id_field: "doc_chunk_0"},
                 {"other": "ignored"},
             ]
 
     retriever.client = DummyMilvusLite()
-    assert retriever._get_existing_document_ids() == {"a", "b"}
+    assert retriever._find_existing_chunk_ids("doc") == ["doc_chunk_0", "doc_chunk_1"]
+    assert captured["filter"] == 'id == "doc" or id like "doc_chunk_%"'
+
+
+class DummyLangchainMilvus:
+    """LangChain Milvus stand-in keeping rows in memory, keyed by the id metadata field."""
 
+    def __init__(self, id_field):
+        self.id_field = id_field
+        self.rows = []
+        self.col = self
 
-def test_get_existing_document_ids_remote(monkeypatch):
+    def query(self, expr, output_fields):
+        return [row for row in self.rows if self._matches(row, expr)]
+
+    def delete(self, ids=None, expr=None):
+        self.rows = [row for row in self.rows if not self._matches(row, expr)]
+
+    def add_texts(self, texts, metadatas, ids=None):
+        for text, metadata, pk in zip(texts, metadatas, ids or [None] * len(texts)):
+            self.rows.append({"pk": pk, "text": text, **metadata})
+
+    def _matches(self, row, expr):
+        value = row[self.id_field]
+        if " in [" in expr:
+            return f'"{value}"' in expr
+        doc_id = expr.split('"')[1]
+        return value == doc_id or value.startswith(doc_id + "_chunk_")
+
+
+def test_find_existing_chunk_ids_remote(monkeypatch):
     _patch_init(monkeypatch)
     monkeypatch.setenv("MILVUS_URI", "http://x")
     retriever = MilvusProvider()
+    retriever.client = DummyLangchainMilvus(retriever.id_field)
+    retriever.client.rows = [
+        {retriever.id_field: "doc_chunk_1"},
+        {retriever.id_field: "doc_chunk_0"},
+        {retriever.id_field: "other"},
+    ]
+    assert retriever._find_existing_chunk_ids("doc") == ["doc_chunk_0", "doc_chunk_1"]
+
     retriever.client = object()
-    assert retriever._get_existing_document_ids() == set()
+    assert retriever._find_existing_chunk_ids("doc") == []
+
+
+def test_insert_document_chunks_remote_replaces_rows(monkeypatch):
+    _patch_init(monkeypatch)
+    monkeypatch.setenv("MILVUS_URI", "http://x")
+    retriever = MilvusProvider()
+    client = DummyLangchainMilvus(retriever.id_field)
+    retriever.client = client
+
+    def chunk(chunk_id, content):
+        return {"id": chunk_id, "content": content, "title": "T", "url": "u", "metadata": {}}
+
+    retriever._insert_document_chunks([chunk("d_chunk_0", "a"), chunk("d_chunk_1", "b")])
+    retriever._insert_document_chunks([chunk("d_chunk_0", "a2"), chunk("d_chunk_1", "b2")])
+    assert [(r["pk"], r["text"]) for r in client.rows] == [("d_chunk_0", "a2"), ("d_chunk_1", "b2")]
+
+    retriever._delete_chunks(["d_chunk_1"])
+    assert [r["pk"] for r in client.rows] == ["d_chunk_0"]
 
 
 def test_insert_document_chunk_lite_and_error(monkeypatch):
@@ -810,13 +988,28 @@ def test_load_example_files_directory_missing(monkeypatch):
     called = {"insert": 0}
     monkeypatch.setattr(
         retriever,
-        "_insert_document_chunk",
-        lambda **kwargs: (_ for _ in ()).throw(AssertionError("should not insert")),
+        "_insert_document_chunks",
+        lambda chunks: (_ for _ in ()).throw(AssertionError("should not insert")),
     )
     retriever._load_example_files()
     assert called["insert"] == 0  # sanity (no insertion attempted)
 
 
+class RecordingMilvusLite:
+    """Milvus Lite stand-in recording upserts; ``existing`` ids are pre-stored."""
+
+    def __init__(self, id_field, existing=()):
+        self.id_field = id_field
+        self.existing = set(existing)
+        self.upserts = []
+
+    def query(self, collection_name, filter, output_fields):  # noqa: D401
+        return [{self.id_field: i} for i in sorted(self.existing) if f'"{i}"' in filter]
+
+    def upsert(self, collection_name, data):  # noqa: D401
+        self.upserts.append(data)
+
+
 def test_load_example_files_loads_and_skips_existing(
     monkeypatch, temp_load_skip_examples_dir
 ):
@@ -836,35 +1029,27 @@ def test_load_example_files_loads_and_skips_existing(
     doc_id_file1 = retriever._generate_doc_id(file1)
     doc_id_file2 = retriever._generate_doc_id(file2)
 
-    # Existing docs contains file1 so it is skipped
-    monkeypatch.setattr(retriever, "_get_existing_document_ids", lambda: {doc_id_file1})
+    # The collection already holds file1 so it is skipped
+    client = RecordingMilvusLite(retriever.id_field, existing={doc_id_file1})
+    retriever.client = client
     # Force two chunks for any file to test suffix logic
     monkeypatch.setattr(retriever, "_split_content", lambda content: ["part1", "part2"])
 
-    calls = []
-
-    def record_insert(doc_id, content, title, url, metadata):
-        calls.append(
-            {
-                "doc_id": doc_id,
-                "content": content,
-                "title": title,
-                "url": url,
-                "metadata": metadata,
-            }
-        )
-
-    monkeypatch.setattr(retriever, "_insert_document_chunk", record_insert)
-
     retriever._load_example_files()
 
-    # Only file2 processed -> two chunk inserts
-    assert len(calls) == 2
+    # Only file2 processed -> one batch with two chunks
+    assert len(client.upserts) == 1
+    rows = client.upserts[0]
     expected_ids = {f"{doc_id_file2}_chunk_0", f"{doc_id_file2}_chunk_1"}
-    assert {c["doc_id"] for c in calls} == expected_ids
-    assert all(c["metadata"]["file"] == "file2.md" for c in calls)
-    assert all(c["metadata"]["source"] == "examples" for c in calls)
-    assert all(c["title"] == "Title Two" for c in calls)
+    assert {r[retriever.id_field] for r in rows} == expected_ids
+    assert all(r["file"] == "file2.md" for r in rows)
+    assert all(r["source"] == "examples" for r in rows)
+    assert all(r[retriever.title_field] == "Title Two" for r in rows)
+    assert all(r[retriever.vector_field] == [0.1, 0.2, 0.3] for r in rows)
+
+    # Both files are in the manifest now; a second load writes nothing
+    retriever._load_example_files()
+    assert len(client.upserts) == 1
 
 
 def test_load_example_files_single_chunk_no_suffix(
@@ -884,24 +1069,17 @@ def test_load_example_files_single_chunk_no_suffix(
 
     base_doc_id = retriever._generate_doc_id(file_single)
 
-    monkeypatch.setattr(retriever, "_get_existing_document_ids", lambda: set())
+    client = RecordingMilvusLite(retriever.id_field)
+    retriever.client = client
     monkeypatch.setattr(retriever, "_split_content", lambda content: ["onlychunk"])
 
-    captured = {}
-
-    def capture(doc_id, content, title, url, metadata):
-        captured["doc_id"] = doc_id
-        captured["title"] = title
-        captured["metadata"] = metadata
-
-    monkeypatch.setattr(retriever, "_insert_document_chunk", capture)
-
     retriever._load_example_files()
 
-    assert captured["doc_id"] == base_doc_id  # no _chunk_ suffix
-    assert captured["title"] == "Single Title"
-    assert captured["metadata"]["file"] == "single.md"
-    assert captured["metadata"]["source"] == "examples"
+    row = client.upserts[0][0]
+    assert row[retriever.id_field] == base_doc_id  # no _chunk_ suffix
+    assert row[retriever.title_field] == "Single Title"
+    assert row["file"] == "single.md"
+    assert row["source"] == "examples"
 
 
 # Clean up test database file after tests
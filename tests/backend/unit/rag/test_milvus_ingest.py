@@ -0,0 +1,204 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import hashlib
+import json
+import os
+import threading
+
+import pytest
+
+import backend.rag.milvus as milvus_mod
+from backend.rag.milvus import MilvusProvider
+from backend.rag.milvus_ingest import IngestManifest, MilvusIngestor
+
+
+class FakeEmbedder:
+    """Deterministic local embedder; counts API-sized calls."""
+
+    def __init__(self, **kwargs):
+        self.document_calls = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _vector(text):
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        return [b / 255.0 for b in digest[:8]]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+    def embed_documents(self, texts):
+        with self._lock:
+            self.document_calls.append(len(texts))
+        return [self._vector(t) for t in texts]
+
+
+class InMemoryMilvus:
+    """Just enough of MilvusClient for ingestion: upsert, delete, id lookups."""
+
+    def __init__(self, id_field, fail_on_call=None):
+        self.id_field = id_field
+        self.rows = {}
+        self.upsert_calls = 0
+        self.fail_on_call = fail_on_call
+        self._lock = threading.Lock()
+
+    def upsert(self, collection_name, data):
+        with self._lock:
+            self.upsert_calls += 1
+            if self.upsert_calls == self.fail_on_call:
+                raise RuntimeError("connection reset")
+            for row in data:
+                self.rows[row[self.id_field]] = row
+
+    def delete(self, collection_name, ids):
+        for i in ids:
+            self.rows.pop(i, None)
+
+    def query(self, collection_name, filter, output_fields):
+        return [{self.id_field: i} for i in self.rows if f'"{i}"' in filter]
+
+
+@pytest.fixture
+def retriever(monkeypatch, tmp_path):
+    monkeypatch.setenv("MILVUS_EMBEDDING_PROVIDER", "openai")
+    monkeypatch.setenv("MILVUS_URI", str(tmp_path / "milvus.db"))
+    monkeypatch.setenv("MILVUS_COLLECTION", "documents")
+    monkeypatch.setenv("MILVUS_EMBEDDING_DIM", "8")
+    monkeypatch.setenv("MILVUS_CHUNK_SIZE", "60")
+    monkeypatch.setenv("MILVUS_INGEST_MANIFEST", str(tmp_path / "manifest.json"))
+    monkeypatch.setattr(milvus_mod, "OpenAIEmbeddings", FakeEmbedder)
+    retriever = MilvusProvider()
+    retriever.client = InMemoryMilvus(retriever.id_field)
+    yield retriever
+    retriever.client = None
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    root = tmp_path / "corpus"
+    (root / "team").mkdir(parents=True)
+    for i in range(6):
+        paragraphs = "\n\n".join(f"Paragraph {p} of file {i} " + "x" * 30 for p in range(3))
+        target = root / ("team" if i % 2 else "") / f"doc{i}.md"
+        target.write_text(f"# Doc {i}\n\n{paragraphs}", encoding="utf-8")
+    return root
+
+
+def _ingest(retriever, corpus, **kwargs):
+    options = {"batch_size": 4, "workers": 1}
+    options.update(kwargs)
+    return MilvusIngestor(retriever, **options).ingest_directory(
+        corpus, recursive=True, source="documents"
+    )
+
+
+def test_batches_embeddings_and_writes(retriever, corpus):
+    stats = _ingest(retriever, corpus)
+
+    assert stats.files_seen == 6 and stats.files_ingested == 6
+    assert stats.chunks_written == len(retriever.client.rows) == 24
+    assert stats.batches == retriever.client.upsert_calls == 6
+    assert retriever.embedding_model.document_calls == [4] * 6
+    row = retriever.client.rows[next(iter(retriever.client.rows))]
+    assert row["source"] == "documents"
+    assert row[retriever.url_field].startswith("milvus://documents/")
+    nested = [r for r in retriever.client.rows.values() if r["file"] == "team/doc1.md"]
+    assert nested and nested[0][retriever.url_field] == "milvus://documents/team/doc1.md"
+
+
+def test_unchanged_files_are_skipped_even_if_touched(retriever, corpus):
+    _ingest(retriever, corpus)
+    calls = retriever.client.upsert_calls
+    for path in corpus.rglob("*.md"):
+        os.utime(path, (1, 1))
+
+    stats = _ingest(retriever, corpus)
+
+    assert stats.files_skipped == 6 and stats.files_ingested == 0
+    assert retriever.client.upsert_calls == calls
+
+
+def test_changed_file_replaces_its_chunks(retriever, corpus):
+    _ingest(retriever, corpus)
+    target = corpus / "doc0.md"
+    old_ids = {i for i, r in retriever.client.rows.items() if r["file"] == "doc0.md"}
+    target.write_text("# Doc 0\n\nShort now.", encoding="utf-8")
+    os.utime(target, (2, 2))
+
+    stats = _ingest(retriever, corpus)
+
+    new_ids = {i for i, r in retriever.client.rows.items() if r["file"] == "doc0.md"}
+    assert stats.files_ingested == 1 and stats.files_skipped == 5
+    assert len(new_ids) == 1 and not (new_ids & old_ids)
+
+
+def test_interrupted_load_resumes(retriever, corpus):
+    retriever.client.fail_on_call = 2
+    first = _ingest(retriever, corpus)
+
+    assert first.failed_files
+    with open(retriever.ingest_manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    partial = [k for k, e in manifest["files"].items() if e["status"] == "partial"]
+    assert sorted(partial) == sorted(first.failed_files)
+
+    retriever.client.fail_on_call = None
+    second = _ingest(retriever, corpus)
+
+    assert second.files_ingested == len(first.failed_files)
+    assert second.files_skipped == 6 - len(first.failed_files)
+    assert len(retriever.client.rows) == 24
+
+
+def test_workers_write_the_same_rows(retriever, corpus):
+    stats = _ingest(retriever, corpus, workers=4, batch_size=2)
+
+    assert stats.files_ingested == 6 and not stats.failed_files
+    assert len(retriever.client.rows) == 24
+    assert retriever.client.upsert_calls == 12
+
+
+def test_manifest_from_another_collection_is_ignored(tmp_path):
+    path = tmp_path / "manifest.json"
+    manifest = IngestManifest(str(path), "documents", "./a.db")
+    manifest.put("/x.md", hash="h", status="done")
+    manifest.save()
+
+    assert IngestManifest(str(path), "documents", "./a.db").get("/x.md")["hash"] == "h"
+    assert IngestManifest(str(path), "other", "./a.db").get("/x.md") is None
+
+
+def test_force_reingests_everything(retriever, corpus):
+    _ingest(retriever, corpus)
+    calls = retriever.client.upsert_calls
+
+    stats = MilvusIngestor(retriever, batch_size=4).ingest_directory(
+        corpus, recursive=True, source="documents", force=True
+    )
+
+    assert stats.files_ingested == 6
+    assert retriever.client.upsert_calls == calls * 2
+
+
+def test_milvus_lite_round_trip(retriever, corpus):
+    pytest.importorskip("milvus_lite")
+    retriever.client = None
+    retriever._connect()
+    try:
+        stats = _ingest(retriever, corpus)
+        assert stats.chunks_written == 24
+
+        stored = retriever.client.query(
+            collection_name=retriever.collection_name,
+            filter="source == 'documents'",
+            output_fields=[retriever.id_field],
+            limit=100,
+        )
+        assert len(stored) == 24
+        first_id = sorted(r[retriever.id_field] for r in stored)[0]
+        doc_id = first_id.rsplit("_chunk_", 1)[0]
+        assert len(retriever._find_existing_chunk_ids(doc_id)) == 4
+    finally:
+        retriever.close()
@@ -163,3 +163,45 @@ def test_list_resources_error(mock_get, monkeypatch):
     mock_get.return_value = mock_response
     with pytest.raises(Exception):
         provider.list_resources()
+
+
+@pytest.mark.asyncio
+async def test_aquery_relevant_documents_uses_async_client(monkeypatch):
+    import httpx
+
+    import backend.rag.ragflow as ragflow
+    from backend.rag.retriever import clear_retriever_caches
+
+    monkeypatch.setenv("RAGFLOW_API_URL", "http://api")
+    monkeypatch.setenv("RAGFLOW_API_KEY", "key")
+    clear_retriever_caches()
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "data": {
+                    "doc_aggs": [{"doc_id": "doc456", "doc_name": "Doc Title"}],
+                    "chunks": [
+                        {"document_id": "doc456", "content": "chunk", "similarity": 0.9}
+                    ],
+                }
+            },
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(ragflow, "async_http_client", lambda: client)
+    provider = RAGFlowProvider()
+    resources = [DummyResource("rag://dataset/1#doc456"), DummyResource("rag://dataset/2")]
+
+    docs = await provider.aquery_relevant_documents("query", resources)
+
+    assert len(requests_seen) == 1
+    assert requests_seen[0].headers["Authorization"] == "Bearer key"
+    body = requests_seen[0].read()
+    assert b'"dataset_ids": ["1", "2"]' in body or b'"dataset_ids":["1","2"]' in body
+    assert docs[0].id == "doc456" and docs[0].chunks[0].similarity == 0.9
+    await client.aclose()
+    clear_retriever_caches()
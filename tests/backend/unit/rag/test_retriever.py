@@ -1,9 +1,41 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import asyncio
+
 import pytest
 
-from backend.rag.retriever import Chunk, Document, Resource, Retriever
+from backend.rag.retriever import (
+    Chunk,
+    Document,
+    Resource,
+    Retriever,
+    clear_retriever_caches,
+    credential_fingerprint,
+    gather_resources,
+    merge_documents,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    clear_retriever_caches()
+    yield
+    clear_retriever_caches()
+
+
+class CountingRetriever(Retriever):
+    def __init__(self):
+        self.queries = []
+        self.listings = []
+
+    def list_resources(self, query=None):
+        self.listings.append(query)
+        return [Resource(uri="rag://dataset/1", title="one")]
+
+    def query_relevant_documents(self, query, resources=[]):
+        self.queries.append((query, [r.uri for r in resources]))
+        return [Document(id="d", chunks=[Chunk(content=query, similarity=1.0)])]
 
 
 def test_chunk_init():
@@ -71,3 +103,126 @@ def test_retriever_abstract_methods():
 def test_retriever_cannot_instantiate():
     with pytest.raises(TypeError):
         Retriever()
+
+
+def test_merge_documents_dedups_and_orders():
+    a = [
+        Document(id="x", title="X", chunks=[Chunk("same", 0.4), Chunk("x-only", 0.3)]),
+        Document(id="y", chunks=[Chunk("y", 0.5)]),
+    ]
+    b = [
+        Document(id="x", url="http://x", chunks=[Chunk("same", 0.9)]),
+        Document(id="z", chunks=[Chunk("z", 0.2)]),
+    ]
+
+    merged = merge_documents([a, b])
+
+    assert [d.id for d in merged] == ["x", "y", "z"]
+    x = merged[0]
+    assert x.title == "X" and x.url == "http://x"
+    assert [(c.content, c.similarity) for c in x.chunks] == [("same", 0.9), ("x-only", 0.3)]
+    # Inputs are not mutated
+    assert a[0].chunks[0].similarity == 0.4
+
+
+@pytest.mark.asyncio
+async def test_aquery_is_cached_per_query_and_resources(monkeypatch):
+    monkeypatch.setenv("RAG_QUERY_CACHE_TTL_SECONDS", "60")
+    retriever = CountingRetriever()
+    r1 = Resource(uri="rag://dataset/1", title="one")
+    r2 = Resource(uri="rag://dataset/2", title="two")
+
+    await retriever.aquery_relevant_documents("q", [r1, r2])
+    await retriever.aquery_relevant_documents("q", [r2, r1])
+    await retriever.aquery_relevant_documents("q", [r1])
+    await retriever.aquery_relevant_documents("other", [r1])
+
+    assert len(retriever.queries) == 3
+
+
+@pytest.mark.asyncio
+async def test_aquery_without_resources(monkeypatch):
+    monkeypatch.setenv("RAG_QUERY_CACHE_TTL_SECONDS", "60")
+    retriever = CountingRetriever()
+
+    await retriever.aquery_relevant_documents("q")
+    await retriever.aquery_relevant_documents("q")
+
+    assert retriever.queries == [("q", [])]
+
+
+def test_credential_fingerprint_separates_keys_without_exposing_them():
+    assert credential_fingerprint("key-a") == credential_fingerprint("key-a")
+    assert credential_fingerprint("key-a") != credential_fingerprint("key-b")
+    assert credential_fingerprint("ak", "sk") != credential_fingerprint("ak", "other")
+    assert "key-a" not in credential_fingerprint("key-a")
+
+
+def test_ragflow_cache_identity_depends_on_api_key(monkeypatch):
+    from backend.rag.ragflow import RAGFlowProvider
+
+    monkeypatch.setenv("RAGFLOW_API_URL", "http://api")
+    monkeypatch.setenv("RAGFLOW_API_KEY", "key-a")
+    first = RAGFlowProvider().cache_identity()
+    monkeypatch.setenv("RAGFLOW_API_KEY", "key-b")
+    second = RAGFlowProvider().cache_identity()
+
+    assert first != second
+    assert "key-a" not in first
+
+
+@pytest.mark.asyncio
+async def test_aquery_cache_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("RAG_QUERY_CACHE_TTL_SECONDS", "0")
+    retriever = CountingRetriever()
+
+    await retriever.aquery_relevant_documents("q", [])
+    await retriever.aquery_relevant_documents("q", [])
+
+    assert len(retriever.queries) == 2
+
+
+@pytest.mark.asyncio
+async def test_aquery_times_out(monkeypatch):
+    monkeypatch.setenv("RAG_QUERY_TIMEOUT_SECONDS", "1")
+    retriever = CountingRetriever()
+
+    async def hang(query, resources):
+        await asyncio.sleep(5)
+
+    retriever._aquery_relevant_documents = hang
+
+    with pytest.raises(asyncio.TimeoutError):
+        await retriever.aquery_relevant_documents("q", [])
+
+
+@pytest.mark.asyncio
+async def test_alist_resources_is_cached(monkeypatch):
+    monkeypatch.setenv("RAG_RESOURCES_CACHE_TTL_SECONDS", "300")
+    retriever = CountingRetriever()
+
+    first = await retriever.alist_resources("data")
+    second = await retriever.alist_resources("data")
+    await retriever.alist_resources(None)
+
+    assert first == second
+    assert retriever.listings == ["data", None]
+
+
+@pytest.mark.asyncio
+async def test_gather_resources_drops_failures_and_slow_resources(monkeypatch):
+    monkeypatch.setenv("RAG_RESOURCE_TIMEOUT_SECONDS", "1")
+
+    async def ok(value):
+        return value
+
+    async def fail():
+        raise RuntimeError("dataset gone")
+
+    async def slow():
+        await asyncio.sleep(5)
+
+    assert await gather_resources([ok(1), fail(), slow(), ok(2)], "test") == [1, 2]
+
+    with pytest.raises(RuntimeError, match="dataset gone"):
+        await gather_resources([fail()], "test")
@@ -3,7 +3,7 @@
 
 import base64
 import os
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import AsyncMock, MagicMock, mock_open, patch
 
 import pytest
 from fastapi import HTTPException
@@ -12,7 +12,7 @@ from langchain_core.messages import AIMessageChunk, ToolMessage
 from langgraph.types import Command
 
 from shared.config.report_style import ReportStyle
-from backend.server.app import _astream_workflow_generator, _make_event, app
+from backend.server.app import _astream_workflow_generator, _make_event, _run_ppt_job, app
 
 
 @pytest.fixture
@@ -223,11 +223,16 @@ class TestTTSEndpoint:
 
 
 class TestPodcastEndpoint:
-    @patch("backend.server.app.build_podcast_graph")
-    def test_generate_podcast_success(self, mock_build_graph, client):
-        mock_workflow = MagicMock()
-        mock_build_graph.return_value = mock_workflow
-        mock_workflow.invoke.return_value = {"output": b"fake_audio_data"}
+    @patch("backend.server.app.LineSynthesizer")
+    @patch("backend.server.app.script_writer_node")
+    def test_generate_podcast_success(self, mock_script_writer, mock_synth_class, client):
+        mock_script_writer.return_value = {"script": MagicMock(lines=["l1", "l2"])}
+
+        async def fake_segments(lines):
+            for segment in (b"fake_", b"audio_data"):
+                yield segment
+
+        mock_synth_class.return_value.aiter_audio.side_effect = fake_segments
 
         request_data = {"content": "Test content for podcast"}
 
@@ -237,9 +242,9 @@ class TestPodcastEndpoint:
         assert response.headers["content-type"] == "audio/mp3"
         assert response.content == b"fake_audio_data"
 
-    @patch("backend.server.app.build_podcast_graph")
-    def test_generate_podcast_error(self, mock_build_graph, client):
-        mock_build_graph.side_effect = Exception("Podcast generation failed")
+    @patch("backend.server.app.script_writer_node")
+    def test_generate_podcast_error(self, mock_script_writer, client):
+        mock_script_writer.side_effect = Exception("Podcast generation failed")
 
         request_data = {"content": "Test content"}
 
@@ -248,6 +253,23 @@ class TestPodcastEndpoint:
         assert response.status_code == 500
         assert response.json()["detail"] == "Internal Server Error"
 
+    @patch("backend.server.app.LineSynthesizer")
+    @patch("backend.server.app.script_writer_node")
+    def test_generate_podcast_tts_error_before_stream(
+        self, mock_script_writer, mock_synth_class, client
+    ):
+        mock_script_writer.return_value = {"script": MagicMock(lines=["l1"])}
+
+        async def failing_segments(lines):
+            raise Exception("VOLCENGINE_TTS_APPID is not set")
+            yield b""
+
+        mock_synth_class.return_value.aiter_audio.side_effect = failing_segments
+
+        response = client.post("/api/podcast/generate", json={"content": "Test"})
+
+        assert response.status_code == 500
+
 
 class TestPPTEndpoint:
     @patch("backend.server.app.build_ppt_graph")
@@ -255,9 +277,9 @@ class TestPPTEndpoint:
     def test_generate_ppt_success(self, mock_file, mock_build_graph, client):
         mock_workflow = MagicMock()
         mock_build_graph.return_value = mock_workflow
-        mock_workflow.invoke.return_value = {
-            "generated_file_path": "/fake/path/test.pptx"
-        }
+        mock_workflow.ainvoke = AsyncMock(
+            return_value={"generated_file_path": "/fake/path/test.pptx"}
+        )
 
         request_data = {"content": "Test content for PPT"}
 
@@ -281,6 +303,28 @@ class TestPPTEndpoint:
         assert response.status_code == 500
         assert response.json()["detail"] == "Internal Server Error"
 
+    @patch("backend.server.app.get_ppt_job_manager")
+    def test_generate_ppt_background_returns_job(self, mock_get_manager, client):
+        job = MagicMock(id="abc")
+        job.to_dict.return_value = {"job_id": "abc", "status": "queued"}
+        mock_get_manager.return_value.submit.return_value = job
+
+        response = client.post(
+            "/api/ppt/generate", json={"content": "Test", "background": True}
+        )
+
+        assert response.status_code == 202
+        body = response.json()
+        assert body["status"] == "queued"
+        assert body["file_url"] == "/api/ppt/jobs/abc/file"
+        mock_get_manager.return_value.submit.assert_called_once_with(
+            "Test", runner=_run_ppt_job
+        )
+
+    def test_ppt_job_unknown(self, client):
+        assert client.get("/api/ppt/jobs/missing").status_code == 404
+        assert client.get("/api/ppt/jobs/missing/file").status_code == 404
+
 
 class TestEnhancePromptEndpoint:
     @patch("backend.server.app.build_prompt_enhancer_graph")
@@ -434,19 +478,22 @@ class TestRAGEndpoints:
     @patch("backend.server.app.build_retriever")
     def test_rag_resources_with_retriever(self, mock_build_retriever, client):
         mock_retriever = MagicMock()
-        mock_retriever.list_resources.return_value = [
-            {
-                "uri": "test_uri",
-                "title": "Test Resource",
-                "description": "Test Description",
-            }
-        ]
+        mock_retriever.alist_resources = AsyncMock(
+            return_value=[
+                {
+                    "uri": "test_uri",
+                    "title": "Test Resource",
+                    "description": "Test Description",
+                }
+            ]
+        )
         mock_build_retriever.return_value = mock_retriever
 
         response = client.get("/api/rag/resources?query=test")
 
         assert response.status_code == 200
         assert len(response.json()["resources"]) == 1
+        mock_retriever.alist_resources.assert_awaited_once_with("test")
 
     @patch("backend.server.app.build_retriever")
     def test_rag_resources_without_retriever(self, mock_build_retriever, client):
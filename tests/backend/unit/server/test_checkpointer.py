@@ -0,0 +1,113 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""
+Unit tests for the application-lifetime graph checkpointer.
+"""
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, StateGraph
+from langgraph.store.memory import InMemoryStore
+from typing_extensions import TypedDict
+
+from backend.server import checkpointer as checkpointer_module
+from backend.server.checkpointer import (
+    GraphCheckpointer,
+    bind_checkpointer,
+    close_graph_checkpointer,
+    init_graph_checkpointer,
+)
+
+
+class _State(TypedDict):
+    count: int
+
+
+def _graph():
+    builder = StateGraph(_State)
+    builder.add_node("increment", lambda state: {"count": state["count"] + 1})
+    builder.add_edge(START, "increment")
+    builder.add_edge("increment", END)
+    return builder.compile(checkpointer=MemorySaver())
+
+
+class TestGraphCheckpointer:
+    def test_bind_returns_copy_without_mutating_shared_graph(self):
+        graph = _graph()
+        original_saver = graph.checkpointer
+        checkpointer = GraphCheckpointer("postgresql://unused")
+        checkpointer.saver = MemorySaver()
+        store = InMemoryStore()
+
+        bound = checkpointer.bind(graph, store=store)
+
+        assert bound is not graph
+        assert bound.checkpointer is checkpointer.saver
+        assert bound.store is store
+        assert graph.checkpointer is original_saver
+        assert graph.store is None
+
+    @pytest.mark.asyncio
+    async def test_bound_graph_persists_to_shared_saver(self):
+        graph = _graph()
+        checkpointer = GraphCheckpointer("postgresql://unused")
+        checkpointer.saver = MemorySaver()
+        config = {"configurable": {"thread_id": "t1"}}
+
+        await checkpointer.bind(graph).ainvoke({"count": 1}, config)
+
+        state = await checkpointer.bind(graph).aget_state(config)
+        assert state.values == {"count": 2}
+
+    def test_bind_without_saver_returns_graph(self):
+        graph = _graph()
+        assert GraphCheckpointer("postgresql://unused").bind(graph) is graph
+
+    @pytest.mark.asyncio
+    async def test_unsupported_scheme_leaves_checkpointer_disabled(self):
+        checkpointer = GraphCheckpointer("sqlite:///tmp/db")
+        await checkpointer.start()
+        assert checkpointer.saver is None
+        assert checkpointer.get_stats() == {"enabled": False, "backend": None}
+
+
+class TestModuleCheckpointer:
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("LANGGRAPH_CHECKPOINT_SAVER", raising=False)
+        assert await init_graph_checkpointer() is None
+        graph = _graph()
+        assert bind_checkpointer(graph) is graph
+
+    @pytest.mark.asyncio
+    async def test_init_reads_pool_sizes_and_binds(self, monkeypatch):
+        monkeypatch.setenv("LANGGRAPH_CHECKPOINT_SAVER", "true")
+        monkeypatch.setenv("LANGGRAPH_CHECKPOINT_DB_URL", "postgresql://localhost/db")
+        monkeypatch.setenv("LANGGRAPH_CHECKPOINT_POOL_MIN_SIZE", "2")
+        monkeypatch.setenv("LANGGRAPH_CHECKPOINT_POOL_MAX_SIZE", "8")
+
+        async def fake_start(self):
+            self.saver = MemorySaver()
+
+        monkeypatch.setattr(GraphCheckpointer, "start", fake_start)
+        try:
+            checkpointer = await init_graph_checkpointer()
+            assert (checkpointer.pool_min_size, checkpointer.pool_max_size) == (2, 8)
+            graph = _graph()
+            assert bind_checkpointer(graph).checkpointer is checkpointer.saver
+        finally:
+            await close_graph_checkpointer()
+        assert checkpointer_module.get_graph_checkpointer() is None
+
+    @pytest.mark.asyncio
+    async def test_start_failure_disables_checkpointer(self, monkeypatch):
+        monkeypatch.setenv("LANGGRAPH_CHECKPOINT_SAVER", "true")
+        monkeypatch.setenv("LANGGRAPH_CHECKPOINT_DB_URL", "postgresql://localhost/db")
+
+        async def failing_start(self):
+            raise ConnectionError("database unreachable")
+
+        monkeypatch.setattr(GraphCheckpointer, "start", failing_start)
+        assert await init_graph_checkpointer() is None
+        assert checkpointer_module.get_graph_checkpointer() is None
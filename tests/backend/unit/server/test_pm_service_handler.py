@@ -6,6 +6,7 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from backend.server.pm_service_client import PMServiceHandler, get_pm_service_handler
+from backend.utils.pm_read_memo import pm_read_scope
 
 
 @pytest.fixture
@@ -308,6 +309,52 @@ class TestPMServiceHandlerProviders:
             assert result["success"] is True
 
 
+class TestPMServiceHandlerReadMemo:
+    """Tests for turn-scoped memoization of reads."""
+
+    @pytest.mark.asyncio
+    async def test_reads_in_a_turn_hit_pm_service_once(self, handler, mock_client):
+        """Test repeated reads in one turn share one PM Service call."""
+        mock_client.list_tasks.return_value = {"items": [{"id": "task1"}], "total": 1}
+
+        with patch.object(handler, '_client', mock_client), pm_read_scope() as memo:
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+
+            first = await handler.list_project_tasks("proj1")
+            second = await handler.list_project_tasks("proj1")
+            await handler.list_project_tasks("proj2")
+
+            assert first == second == [{"id": "task1"}]
+            assert mock_client.list_tasks.await_count == 2
+            assert memo.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_reads(self, handler, mock_client):
+        """Test a write makes the next read go to PM Service again."""
+        with patch.object(handler, '_client', mock_client), pm_read_scope():
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+
+            await handler.list_project_tasks("proj1")
+            await handler.assign_task_to_sprint("proj1", "task1", "sprint1")
+            await handler.list_project_tasks("proj1")
+
+            assert mock_client.list_tasks.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_no_memo_outside_a_turn(self, handler, mock_client):
+        """Test reads are not memoized without an active turn."""
+        with patch.object(handler, '_client', mock_client):
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+
+            await handler.list_project_tasks("proj1")
+            await handler.list_project_tasks("proj1")
+
+            assert mock_client.list_tasks.await_count == 2
+
+
 class TestGetPMServiceHandler:
     """Tests for get_pm_service_handler function."""
     
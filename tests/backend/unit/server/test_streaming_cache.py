@@ -0,0 +1,100 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""
+Unit tests for the stream-scoped caches in the streaming module.
+"""
+
+from backend.server.streaming import (
+    StreamScopedCache,
+    cache_thoughts,
+    clear_thoughts_cache,
+    get_cached_thoughts,
+    get_stream_cache,
+    get_stream_cache_stats,
+    release_stream_state,
+)
+from backend.utils.streaming_state import current_thread_id
+
+
+class TestStreamScopedCache:
+    """Test cases for StreamScopedCache."""
+
+    def test_entries_are_isolated_per_thread(self):
+        cache = StreamScopedCache("test")
+        cache.set("msg-1", ["a"], thread_id="thread-a")
+        cache.set("msg-1", ["b"], thread_id="thread-b")
+
+        assert cache.lookup("msg-1", thread_id="thread-a") == ["a"]
+        assert cache.lookup("msg-1", thread_id="thread-b") == ["b"]
+        assert cache.lookup("msg-1", thread_id="thread-c") is None
+
+    def test_mapping_interface_uses_current_thread(self):
+        cache = StreamScopedCache("test")
+        token = current_thread_id.set("thread-a")
+        try:
+            cache["msg-1"] = "hello"
+            cache["msg-1"] += " world"
+            assert "msg-1" in cache
+            assert cache["msg-1"] == "hello world"
+            assert list(cache) == ["msg-1"]
+        finally:
+            current_thread_id.reset(token)
+
+        token = current_thread_id.set("thread-b")
+        try:
+            assert "msg-1" not in cache
+            assert len(cache) == 0
+        finally:
+            current_thread_id.reset(token)
+
+    def test_clear_scope_only_drops_one_stream(self):
+        cache = StreamScopedCache("test")
+        cache.set("m1", 1, thread_id="thread-a")
+        cache.set("m2", 2, thread_id="thread-a")
+        cache.set("m1", 3, thread_id="thread-b")
+
+        assert cache.clear_scope("thread-a") == 2
+        assert cache.lookup("m1", thread_id="thread-a") is None
+        assert cache.lookup("m1", thread_id="thread-b") == 3
+        assert cache.stats()["streams"] == 1
+
+    def test_lru_bound_evicts_least_recently_used(self):
+        cache = StreamScopedCache("test", max_entries=2)
+        cache.set("m1", 1, thread_id="t")
+        cache.set("m2", 2, thread_id="t")
+        # Touch m1 so m2 becomes the least recently used entry
+        assert cache.lookup("m1", thread_id="t") == 1
+        cache.set("m3", 3, thread_id="t")
+
+        assert cache.lookup("m2", thread_id="t") is None
+        assert cache.lookup("m1", thread_id="t") == 1
+        stats = cache.stats()
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 1
+
+
+class TestThoughtsCache:
+    """Test cases for the react_thoughts helpers."""
+
+    def teardown_method(self):
+        clear_thoughts_cache()
+
+    def test_thoughts_released_with_stream(self):
+        cache_thoughts("msg-1", [{"thought": "x"}], thread_id="thread-a")
+        cache_thoughts("msg-1", [{"thought": "y"}], thread_id="thread-b")
+
+        release_stream_state("thread-a")
+
+        assert get_cached_thoughts("msg-1", thread_id="thread-a") is None
+        assert get_cached_thoughts("msg-1", thread_id="thread-b") == [{"thought": "y"}]
+
+    def test_empty_thoughts_are_not_cached(self):
+        cache_thoughts("msg-1", [], thread_id="thread-a")
+        assert get_cached_thoughts("msg-1", thread_id="thread-a") is None
+
+    def test_stats_report_registered_caches(self):
+        cache_thoughts("msg-1", ["t"], thread_id="thread-a")
+        stats = get_stream_cache_stats()
+        assert stats["react_thoughts"]["entries"] >= 1
+        assert get_stream_cache("react_thoughts") is get_stream_cache("react_thoughts")
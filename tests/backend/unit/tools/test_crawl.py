@@ -1,5 +1,8 @@
+import asyncio
 import json
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
 
 from backend.tools.crawl import crawl_tool
 
@@ -131,3 +134,76 @@ class TestCrawlTool:
         assert result_dict["url"] == url
         assert "crawled_content" in result_dict
         assert "No content available" in result_dict["crawled_content"]
+
+    @patch("backend.tools.crawl.Crawler")
+    def test_crawl_tool_several_urls(self, mock_crawler_class):
+        mock_crawler = Mock()
+        mock_article = Mock()
+        mock_article.to_markdown.return_value = "content"
+        mock_crawler.crawl.side_effect = [mock_article, Exception("Network error")]
+        mock_crawler_class.return_value = mock_crawler
+
+        result = json.loads(
+            crawl_tool.invoke({"url": "https://a.com", "more_urls": ["https://b.com", "https://a.com"]})
+        )
+
+        assert result[0] == {"url": "https://a.com", "crawled_content": "content"}
+        assert result[1]["url"] == "https://b.com"
+        assert "Network error" in result[1]["error"]
+        assert mock_crawler.crawl.call_count == 2
+
+
+class TestCrawlToolAsync:
+    @pytest.mark.asyncio
+    @patch("backend.tools.crawl.Crawler")
+    async def test_ainvoke_uses_async_crawl(self, mock_crawler_class):
+        mock_crawler = Mock()
+        mock_article = Mock()
+        mock_article.to_markdown.return_value = "content"
+        mock_crawler.acrawl = AsyncMock(return_value=mock_article)
+        mock_crawler_class.return_value = mock_crawler
+
+        result = json.loads(await crawl_tool.ainvoke({"url": "https://example.com"}))
+
+        assert result == {"url": "https://example.com", "crawled_content": "content"}
+        mock_crawler.acrawl.assert_awaited_once_with("https://example.com")
+        mock_crawler.crawl.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("backend.tools.crawl.Crawler")
+    async def test_ainvoke_crawls_several_urls_concurrently(self, mock_crawler_class):
+        mock_crawler = Mock()
+        mock_article = Mock()
+        mock_article.to_markdown.return_value = "content"
+        mock_crawler.acrawl_many = AsyncMock(return_value=[mock_article, ValueError("status 404")])
+        mock_crawler_class.return_value = mock_crawler
+
+        result = json.loads(
+            await crawl_tool.ainvoke({"url": "https://a.com", "more_urls": ["https://b.com"]})
+        )
+
+        mock_crawler.acrawl_many.assert_awaited_once_with(["https://a.com", "https://b.com"])
+        assert result[0] == {"url": "https://a.com", "crawled_content": "content"}
+        assert "status 404" in result[1]["error"]
+
+    @pytest.mark.asyncio
+    @patch("backend.tools.crawl.Crawler")
+    async def test_ainvoke_propagates_cancellation(self, mock_crawler_class):
+        mock_crawler = Mock()
+        mock_crawler.acrawl = AsyncMock(side_effect=asyncio.CancelledError())
+        mock_crawler_class.return_value = mock_crawler
+
+        with pytest.raises(asyncio.CancelledError):
+            await crawl_tool.ainvoke({"url": "https://example.com"})
+
+    @pytest.mark.asyncio
+    @patch("backend.tools.crawl.Crawler")
+    async def test_ainvoke_reraises_cancelled_fetch_of_several_urls(self, mock_crawler_class):
+        mock_crawler = Mock()
+        mock_article = Mock()
+        mock_article.to_markdown.return_value = "content"
+        mock_crawler.acrawl_many = AsyncMock(return_value=[mock_article, asyncio.CancelledError()])
+        mock_crawler_class.return_value = mock_crawler
+
+        with pytest.raises(asyncio.CancelledError):
+            await crawl_tool.ainvoke({"url": "https://a.com", "more_urls": ["https://b.com"]})
@@ -274,3 +274,64 @@ class TestGetWebSearchTool:
         assert tool.include_raw_content is True  # default
         assert tool.include_domains == []  # default
         assert tool.exclude_domains == []  # default
+
+
+class _FakeDDGS:
+    def __init__(self):
+        self.calls = 0
+
+    def text(self, query, max_results):
+        self.calls += 1
+        return [{"title": query, "href": "http://example.com", "body": "body"}]
+
+
+@pytest.fixture
+def web_cache_enabled(monkeypatch, tmp_path):
+    from backend.crawler import web_cache
+
+    monkeypatch.setenv("WEB_CACHE_ENABLED", "true")
+    monkeypatch.setenv("WEB_CACHE_PATH", str(tmp_path / "web_cache.sqlite3"))
+    web_cache.reset_web_cache()
+    yield web_cache.get_web_cache()
+    web_cache.reset_web_cache()
+
+
+class TestSearchCaching:
+    def test_repeated_queries_are_served_from_cache(self, web_cache_enabled):
+        from backend.tools.search import LoggedDuckDuckGoSearch
+
+        tool = LoggedDuckDuckGoSearch(name="web_search", num_results=3)
+        tool.ddgs = _FakeDDGS()
+
+        first = tool.invoke("kubernetes  autoscaling")
+        second = tool.invoke("kubernetes autoscaling")
+        tool.num_results = 5
+        tool.invoke("kubernetes autoscaling")
+
+        assert first == second
+        assert tool.ddgs.calls == 2
+        assert web_cache_enabled.get_stats()["namespaces"]["search"]["hits"] == 1
+
+    def test_errors_are_not_cached(self, web_cache_enabled):
+        from backend.tools.search import LoggedDuckDuckGoSearch
+
+        tool = LoggedDuckDuckGoSearch(name="web_search")
+        tool.ddgs = None
+        assert "ERROR" in tool.invoke("query")
+        assert len(web_cache_enabled) == 0
+
+    @patch.dict(os.environ, {"SEARCH_PROVIDER_CACHE_TTL_SECONDS": "60"})
+    @patch("backend.tools.search._load_search_provider_from_db")
+    def test_provider_lookup_is_memoized(self, mock_load):
+        from backend.tools.search import clear_search_provider_cache, get_search_provider_from_db
+
+        mock_load.return_value = {"provider_id": "duckduckgo", "additional_config": {}}
+        clear_search_provider_cache()
+        get_search_provider_from_db()
+        get_search_provider_from_db()
+        assert mock_load.call_count == 1
+
+        clear_search_provider_cache()
+        get_search_provider_from_db()
+        assert mock_load.call_count == 2
+        clear_search_provider_cache()
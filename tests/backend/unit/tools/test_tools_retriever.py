@@ -66,23 +66,36 @@ async def test_retriever_tool_arun():
     mock_retriever = Mock(spec=Retriever)
     chunk = Chunk(content="async content", similarity=0.8)
     doc = Document(id="doc2", chunks=[chunk])
-    mock_retriever.query_relevant_documents.return_value = [doc]
+    mock_retriever.aquery_relevant_documents.return_value = [doc]
 
     resources = [Resource(uri="test://uri", title="Test")]
     tool = RetrieverTool(retriever=mock_retriever, resources=resources)
 
     mock_run_manager = Mock(spec=AsyncCallbackManagerForToolRun)
-    mock_sync_manager = Mock(spec=CallbackManagerForToolRun)
-    mock_run_manager.get_sync.return_value = mock_sync_manager
 
     result = await tool._arun("async keywords", mock_run_manager)
 
-    mock_run_manager.get_sync.assert_called_once()
+    mock_retriever.aquery_relevant_documents.assert_awaited_once_with(
+        "async keywords", resources
+    )
+    mock_retriever.query_relevant_documents.assert_not_called()
     assert isinstance(result, list)
     assert len(result) == 1
     assert result[0] == doc.to_dict()
 
 
+@pytest.mark.asyncio
+async def test_retriever_tool_arun_no_results():
+    mock_retriever = Mock(spec=Retriever)
+    mock_retriever.aquery_relevant_documents.return_value = []
+
+    tool = RetrieverTool(
+        retriever=mock_retriever, resources=[Resource(uri="test://uri", title="Test")]
+    )
+
+    assert await tool._arun("nothing") == "No results found from the local knowledge base."
+
+
 @patch("backend.tools.retriever.build_retriever")
 def test_get_retriever_tool_success(mock_build_retriever):
     mock_retriever = Mock(spec=Retriever)
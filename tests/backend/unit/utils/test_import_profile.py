@@ -0,0 +1,33 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+from backend.utils.import_profile import format_import_report, parse_import_times
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       161 |        161 |   _io
+import time:       445 |       1008 | _frozen_importlib_external
+import time:        55 |         55 |     _codecs
+import time:       300 |        355 |   json.decoder
+import time:       800 |       1155 | json
+some other stderr line
+"""
+
+
+def test_parse_import_times():
+    timings = parse_import_times(IMPORTTIME_OUTPUT.splitlines())
+
+    assert [t.module for t in timings] == ["_io", "_frozen_importlib_external", "_codecs", "json.decoder", "json"]
+    assert [t.depth for t in timings] == [1, 0, 2, 1, 0]
+    assert timings[-1].self_us == 800 and timings[-1].cumulative_us == 1155
+
+
+def test_format_import_report_orders_by_time():
+    report = format_import_report(parse_import_times(IMPORTTIME_OUTPUT.splitlines()), top=2)
+    lines = report.splitlines()
+
+    assert lines[0].startswith("Total import time: 0.00s (5 modules)")
+    modules = lines[4:6]
+    assert modules[0].endswith("json") and modules[1].endswith("_frozen_importlib_external")
+    # Per-package self time folds json.decoder into json
+    assert lines[-2].strip() == "1.1ms  json"
@@ -0,0 +1,161 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import json
+
+import pytest
+
+from backend.utils.json_compactor import (
+    TaskSummaryAccumulator,
+    compact_json,
+    iter_array_items,
+)
+from backend.utils.json_utils import _compress_large_array, sanitize_tool_response
+
+
+def _tasks(count: int) -> list:
+    return [
+        {
+            "id": f"478:{i}",
+            "title": f"Task {i}",
+            "description": "Long description " * 20,
+            "status": ["open", "done", "in_progress"][i % 3],
+            "priority": ["high", "normal", "low", "critical"][i % 4],
+            "assigned_to": ["Minh", "Alice", None][i % 3],
+            "estimated_hours": [1, 2, None, 4][i % 4],
+            "updated_at": f"2025-01-{(i * 7) % 28 + 1:02d}",
+        }
+        for i in range(count)
+    ]
+
+
+def _sprints(count: int) -> list:
+    return [
+        {
+            "id": f"s{i}",
+            "name": f"Sprint {i}",
+            "status": "active",
+            "project_id": "478",
+            "goal": "Deliver the increment " * 5,
+        }
+        for i in range(count)
+    ]
+
+
+def _projects(count: int) -> list:
+    return [{"id": f"p:{i}", "name": f"Project {i}", "description": "d" * 100} for i in range(count)]
+
+
+def _previous(payload) -> str:
+    return json.dumps(_compress_large_array(payload), ensure_ascii=False, default=str)
+
+
+class TestIterArrayItems:
+    def test_decodes_items_lazily(self):
+        items = iter_array_items('[1, {"a": [2, 3]}, "x"] ')
+        assert next(items) == 1
+        assert list(items) == [{"a": [2, 3]}, "x"]
+
+    def test_empty_array(self):
+        assert list(iter_array_items(" [ ] ")) == []
+
+    def test_malformed_array_raises(self):
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_array_items("[1, 2 3]"))
+
+
+class TestTaskSummaryAccumulator:
+    def test_samples_prefer_high_priority_then_recent(self):
+        accumulator = TaskSummaryAccumulator(max_items=4)
+        for task in _tasks(40):
+            accumulator.add(task)
+
+        samples = accumulator.samples()
+        assert len(samples) == 4
+        assert [t["priority"] for t in samples[:2]] == ["high", "critical"]
+        dates = [t["updated_at"] for t in samples[2:]]
+        assert dates == sorted(dates, reverse=True)
+
+    def test_statistics(self):
+        accumulator = TaskSummaryAccumulator(max_items=5)
+        for task in _tasks(6):
+            accumulator.add(task)
+
+        stats = accumulator.statistics()
+        assert stats["total_tasks"] == 6
+        assert stats["status_breakdown"] == {"open": 2, "done": 2, "in_progress": 2}
+        assert stats["assignee_breakdown"]["unassigned"] == 2
+
+
+class TestCompactJson:
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"tasks": _tasks(200), "total": 200},
+            {"tasks": _tasks(5)},
+            _tasks(100),
+            {"sprints": _sprints(40)},
+            {"projects": _projects(40), "count": 40},
+            [1, "a", {"b": 1}] * 20,
+            {"items": [{"y": 1}] * 30},
+            {},
+            [],
+        ],
+    )
+    def test_matches_previous_compression_without_budget(self, payload):
+        assert compact_json(json.dumps(payload, indent=2)) == _previous(payload)
+
+    def test_task_summary_samples_fit_budget(self):
+        content = json.dumps({"tasks": _tasks(2000), "total": 2000})
+        result = compact_json(content, max_length=3000)
+
+        data = json.loads(result)
+        assert len(result) <= 3000
+        assert data["_total_tasks"] == 2000
+        assert data["tasks"][0]["total_tasks"] == 2000
+        assert data["total"] == 2000
+
+    def test_top_level_list_stops_at_budget(self):
+        content = json.dumps(_tasks(5000))
+        result = compact_json(content, max_length=2000)
+
+        data = json.loads(result)
+        assert len(result) <= 2000
+        assert data[-1]["_summary_type"] == "truncated"
+        assert data[-1]["_shown_items"] == len(data) - 1
+        assert set(data[0]) == {"id", "title", "status", "assignee", "priority"}
+
+    def test_named_list_reports_omitted_items(self):
+        content = json.dumps({"projects": _projects(500)})
+        result = compact_json(content, max_length=2000)
+
+        data = json.loads(result)
+        assert len(result) <= 2000
+        assert data["_omitted_projects"] == 500 - len(data["projects"])
+        assert data["_compression_method"] == "project_list_preserve_ids"
+
+    def test_non_json_raises(self):
+        with pytest.raises(json.JSONDecodeError):
+            compact_json("plain text")
+
+
+class TestSanitizeToolResponseCompaction:
+    def test_large_task_list_is_intact_by_default(self):
+        content = json.dumps({"tasks": _tasks(1000)})
+        result = sanitize_tool_response(content, max_length=4000, compress_arrays=True)
+        assert result == content
+        assert len(json.loads(result)["tasks"]) == 1000
+
+    def test_large_top_level_list_is_intact_by_default(self):
+        content = json.dumps(_tasks(1000))
+        assert sanitize_tool_response(content, max_length=4000) == content
+
+    def test_large_json_is_compacted_when_opted_in(self):
+        content = json.dumps({"tasks": _tasks(1000)})
+        result = sanitize_tool_response(content, max_length=4000, compact=True)
+        assert len(result) <= 4000
+        assert json.loads(result)["_compressed"] is True
+
+    def test_small_json_is_unchanged(self):
+        content = json.dumps({"tasks": _tasks(2)})
+        assert sanitize_tool_response(content) == content
@@ -0,0 +1,112 @@
+"""
+Unit tests for the turn-scoped PM read memo.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.utils.pm_read_memo import PMReadMemo, current_pm_read_memo, pm_read_scope
+
+
+def _loader(calls, value):
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return value
+    return load
+
+
+class TestPMReadMemo:
+    """Tests for PMReadMemo."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_load_once(self):
+        memo = PMReadMemo()
+        calls = []
+
+        first = await memo.get_or_load("k", _loader(calls, {"items": [1]}))
+        second = await memo.get_or_load("k", _loader(calls, {"items": [2]}))
+
+        assert first == second == {"items": [1]}
+        assert len(calls) == 1
+        assert memo.stats()["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_results_are_copies(self):
+        memo = PMReadMemo()
+        first = await memo.get_or_load("k", _loader([], {"items": [1]}))
+        first["items"].append(2)
+
+        assert await memo.get_or_load("k", _loader([], None)) == {"items": [1]}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_share_one_load(self):
+        memo = PMReadMemo()
+        calls = []
+
+        results = await asyncio.gather(*[memo.get_or_load("k", _loader(calls, "v")) for _ in range(5)])
+
+        assert results == ["v"] * 5
+        assert len(calls) == 1
+        assert memo.stats()["shared_in_flight"] == 4
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_reload(self):
+        memo = PMReadMemo()
+        calls = []
+        await memo.get_or_load("k", _loader(calls, "old"))
+
+        memo.invalidate()
+
+        assert await memo.get_or_load("k", _loader(calls, "new")) == "new"
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_memoized(self):
+        memo = PMReadMemo()
+
+        async def fail():
+            raise RuntimeError("down")
+
+        with pytest.raises(RuntimeError):
+            await memo.get_or_load("k", fail)
+        assert await memo.get_or_load("k", _loader([], "ok")) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_reader_does_not_cancel_sibling_reads(self):
+        memo = PMReadMemo()
+        started = asyncio.Event()
+
+        async def slow():
+            started.set()
+            await asyncio.sleep(0.05)
+            return "v"
+
+        aborted = asyncio.create_task(memo.get_or_load("k", slow))
+        await started.wait()
+        sibling = asyncio.create_task(memo.get_or_load("k", slow))
+        await asyncio.sleep(0)
+        aborted.cancel()
+
+        assert await sibling == "v"
+        assert aborted.cancelled()
+        assert await memo.get_or_load("k", _loader([], "other")) == "v"
+
+
+class TestPMReadScope:
+    """Tests for pm_read_scope."""
+
+    def test_scope_sets_and_clears_memo(self):
+        assert current_pm_read_memo() is None
+        with pm_read_scope() as memo:
+            assert current_pm_read_memo() is memo
+            with pm_read_scope() as inner:
+                assert inner is memo
+        assert current_pm_read_memo() is None
+
+    def test_disabled_by_env(self, monkeypatch):
+        monkeypatch.setenv("PM_READ_MEMO_ENABLED", "false")
+        with pm_read_scope() as memo:
+            assert memo is None
+            assert current_pm_read_memo() is None
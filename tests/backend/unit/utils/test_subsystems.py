@@ -0,0 +1,112 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from backend.utils.subsystems import SubsystemRegistry
+
+
+def _counting_factory(value="built", delay=0.0):
+    calls = []
+
+    def factory():
+        calls.append(threading.get_ident())
+        time.sleep(delay)
+        return value
+
+    return factory, calls
+
+
+class TestSubsystemRegistry:
+    def test_builds_once_on_first_use(self):
+        registry = SubsystemRegistry()
+        factory, calls = _counting_factory()
+        registry.register("graph", factory)
+
+        assert not registry.is_loaded("graph")
+        assert registry.get("graph") == "built"
+        assert registry.get("graph") == "built"
+        assert len(calls) == 1
+        assert registry.stats()["graph"]["loaded"] is True
+
+    def test_concurrent_callers_share_one_build(self):
+        registry = SubsystemRegistry()
+        factory, calls = _counting_factory(delay=0.05)
+        registry.register("graph", factory)
+        results = []
+
+        threads = [threading.Thread(target=lambda: results.append(registry.get("graph"))) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == ["built"] * 5
+        assert len(calls) == 1
+
+    def test_failed_build_is_retried(self):
+        registry = SubsystemRegistry()
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("milvus unavailable")
+            return "ok"
+
+        registry.register("examples", flaky)
+
+        with pytest.raises(RuntimeError):
+            registry.get("examples")
+        assert registry.stats()["examples"]["error"] == "milvus unavailable"
+        assert registry.get("examples") == "ok"
+        assert registry.stats()["examples"]["error"] is None
+
+    def test_reset_rebuilds(self):
+        registry = SubsystemRegistry()
+        factory, calls = _counting_factory()
+        registry.register("graph", factory)
+        registry.get("graph")
+
+        registry.reset("graph")
+
+        assert not registry.is_loaded("graph")
+        registry.get("graph")
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_prewarm_builds_off_loop_and_skips_failures(self):
+        registry = SubsystemRegistry()
+        factory, calls = _counting_factory()
+        lazy_factory, lazy_calls = _counting_factory()
+        registry.register("graph", factory)
+        registry.register("broken", lambda: 1 / 0)
+        registry.register("on_demand", lazy_factory, prewarm=False)
+
+        await registry.prewarm()
+
+        assert registry.is_loaded("graph")
+        assert calls[0] != threading.get_ident()
+        assert not registry.is_loaded("broken")
+        assert not lazy_calls
+
+        await registry.prewarm(["on_demand"])
+        assert registry.is_loaded("on_demand")
+
+    @pytest.mark.asyncio
+    async def test_aget_builds_off_loop_once(self):
+        registry = SubsystemRegistry()
+        factory, calls = _counting_factory(delay=0.05)
+        registry.register("graph", factory)
+
+        results = await asyncio.gather(*(registry.aget("graph") for _ in range(3)))
+
+        assert results == ["built"] * 3
+        assert len(calls) == 1
+        assert calls[0] != threading.get_ident()
+        assert await registry.aget("graph") == "built"
+        assert len(calls) == 1
@@ -0,0 +1,70 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+"""
+Unit tests for the benchmark harness.
+"""
+
+import pytest
+
+from benchmarks.harness import Benchmark, Comparison, compare, format_comparison, run_case
+
+
+def _report(**medians):
+    return {"results": {name: {"median_ms": ms} for name, ms in medians.items()}}
+
+
+def test_compare_pairs_cases_by_name():
+    comparisons = compare(_report(a=1.0, gone=2.0), _report(a=1.5, new=3.0))
+
+    assert [(c.name, c.baseline_ms, c.current_ms) for c in comparisons] == [
+        ("a", 1.0, 1.5),
+        ("gone", 2.0, None),
+        ("new", None, 3.0),
+    ]
+
+
+@pytest.mark.parametrize(
+    "baseline, current, status",
+    [
+        (1.0, 1.1, "ok"),
+        (1.0, 1.3, "regressed"),
+        (1.0, 0.7, "improved"),
+        (None, 1.0, "new"),
+        (1.0, None, "missing"),
+        (0.0, 0.0, "ok"),
+        (0.0, 0.5, "regressed"),
+    ],
+)
+def test_comparison_status(baseline, current, status):
+    assert Comparison("case", baseline, current).status(0.2) == status
+
+
+def test_zero_baseline_has_no_ratio_and_formats():
+    comparison = Comparison("case", 0.0, 0.5)
+
+    assert comparison.ratio is None
+    assert "regressed" in format_comparison([comparison], 0.2)
+
+
+def test_run_case_runs_teardown_after_timing():
+    events = []
+
+    def setup(n):
+        events.append("setup")
+
+        async def call():
+            return n
+
+        yield call
+        events.append("teardown")
+
+    bench = Benchmark(name="t", group="t", setup=setup, params={"n": [1]})
+    [(name, kwargs)] = list(bench.cases())
+
+    result = run_case(bench, name, kwargs, rounds=3)
+
+    assert name == "t[n=1]"
+    assert events == ["setup", "teardown"]
+    assert result.rounds == 3
+    assert result.min_ms <= result.median_ms <= result.max_ms
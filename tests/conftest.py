@@ -23,3 +23,12 @@ if str(project_root) not in sys.path:
 def project_root_path():
     """Return the project root path."""
     return project_root
+
+
+@pytest.fixture(autouse=True)
+def isolated_web_cache(monkeypatch):
+    """Keep tests off the persistent web and TTS caches and the search provider memo."""
+    monkeypatch.setenv("WEB_CACHE_ENABLED", "false")
+    monkeypatch.setenv("PODCAST_TTS_CACHE_ENABLED", "false")
+    monkeypatch.setenv("SEARCH_PROVIDER_CACHE_TTL_SECONDS", "0")
+    monkeypatch.setenv("ENTITY_RESOLVER_TTL_SECONDS", "0")
@@ -0,0 +1,185 @@
+"""
+Unit tests for the process-wide MCP tool catalog
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from mcp.types import TextContent, Tool
+
+from mcp_server import server as server_module
+from mcp_server.config import PMServerConfig
+from mcp_server.core import tool_catalog
+from mcp_server.core.tool_catalog import (
+    BoundToolFunctions,
+    build_tool_catalog,
+    get_tool_catalog,
+)
+from mcp_server.core.tool_context import ContextProxy, bind_tool_context
+from mcp_server.services.user_context import UserContext
+from mcp_server.tools.pm_service_base import PMServiceTool
+
+
+class _WhoAmITool:
+    """Class-based tool that reads the user from its context at call time."""
+
+    def __init__(self, context):
+        self.context = context
+
+    async def __call__(self, arguments):
+        await asyncio.sleep(0.01)
+        return [TextContent(type="text", text=self.context.user_id)]
+
+
+def _make_register(calls):
+    def register_whoami_tools(server, context, tool_names=None, tool_functions=None):
+        calls.append(context)
+        instance = _WhoAmITool(context)
+
+        @server.call_tool()
+        async def whoami(name, arguments=None):
+            """Return the calling user."""
+            return await instance(arguments or {})
+
+        tool_names.append("whoami")
+        tool_functions["whoami"] = whoami
+        server._tool_cache["whoami"] = Tool(name="whoami", description="Who am I", inputSchema={"type": "object"})
+        return 1
+
+    return register_whoami_tools
+
+
+def _context(user_id):
+    context = MagicMock()
+    context.user_id = user_id
+    return context
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def catalog(calls):
+    return build_tool_catalog([("whoami", _make_register(calls))])
+
+
+@pytest.fixture(autouse=True)
+def reset_catalog():
+    tool_catalog.reset_tool_catalog()
+    yield
+    tool_catalog.reset_tool_catalog()
+
+
+class TestBuildToolCatalog:
+    """Tests for building the catalog."""
+
+    def test_registers_against_proxy(self, catalog, calls):
+        """Test modules receive a ContextProxy and results are frozen."""
+        assert len(calls) == 1
+        assert isinstance(calls[0], ContextProxy)
+        assert catalog.tool_names == ("whoami",)
+        assert catalog.modules == ("whoami",)
+        assert [t.name for t in catalog.list_tools()] == ["whoami"]
+        with pytest.raises(TypeError):
+            catalog.handlers["other"] = None
+
+    def test_list_tools_falls_back_to_generic_schema(self):
+        """Test tools without SDK definitions are listed with an open schema."""
+
+        def register(server, context, tool_names=None, tool_functions=None):
+            tool_names.append("bare")
+            tool_functions["bare"] = MagicMock()
+            return 1
+
+        tools = build_tool_catalog([("bare", register)]).list_tools()
+        assert [t.name for t in tools] == ["bare"]
+        assert tools[0].inputSchema["additionalProperties"] is True
+
+    def test_get_tool_catalog_builds_once(self, calls):
+        """Test the process-wide catalog is only built on first use."""
+        modules = [("whoami", _make_register(calls))]
+        first = get_tool_catalog(modules)
+        assert get_tool_catalog(modules) is first
+        assert len(calls) == 1
+
+
+class TestContextBinding:
+    """Tests for binding a ToolContext to shared handlers."""
+
+    @pytest.mark.asyncio
+    async def test_proxy_requires_bound_context(self, catalog):
+        """Test shared tools cannot run without a bound context."""
+        with pytest.raises(RuntimeError):
+            await catalog.handlers["whoami"]("whoami", {})
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_see_their_own_context(self, catalog):
+        """Test overlapping calls from different users stay isolated."""
+        alice = BoundToolFunctions(catalog.handlers, _context("alice"))
+        bob = BoundToolFunctions(catalog.handlers, _context("bob"))
+
+        results = await asyncio.gather(
+            alice["whoami"]("whoami", {}),
+            bob["whoami"]("whoami", {}),
+            alice["whoami"]("whoami", {}),
+        )
+
+        assert [r[0].text for r in results] == ["alice", "bob", "alice"]
+
+    def test_bound_functions_mapping(self, catalog):
+        """Test the bound view behaves like the old tool_functions dict."""
+        functions = BoundToolFunctions(catalog.handlers, _context("alice"))
+        assert "whoami" in functions
+        assert "missing" not in functions
+        assert functions.get("missing") is None
+        assert list(functions) == ["whoami"]
+        assert functions["whoami"].__doc__ == "Return the calling user."
+
+    def test_pm_service_client_is_per_context(self):
+        """Test a shared PM Service tool keeps one client per user context."""
+        tool = PMServiceTool(ContextProxy())
+        alice = _context("alice")
+        alice._pm_service_url = "http://alice:8001"
+        bob = _context("bob")
+        bob._pm_service_url = "http://bob:8001"
+
+        with bind_tool_context(alice):
+            alice_client = tool.client
+            assert tool.client is alice_client
+        with bind_tool_context(bob):
+            bob_client = tool.client
+
+        assert alice_client is not bob_client
+        assert alice_client.base_url.startswith("http://alice:8001")
+        assert bob_client.base_url.startswith("http://bob:8001")
+
+
+class TestUserScopedServer:
+    """Tests for user-scoped servers sharing the catalog."""
+
+    @pytest.mark.asyncio
+    async def test_user_servers_share_catalog(self, calls):
+        """Test connecting does not re-register tools or query providers."""
+
+        def fake_session():
+            yield MagicMock()
+
+        config = PMServerConfig(server_name="Test Server", server_version="1.0.0", enable_auth=False)
+        modules = [("whoami", _make_register(calls))]
+        with patch.object(server_module, "TOOL_MODULES", modules), \
+                patch.object(server_module, "get_mcp_db_session", fake_session):
+            alice = UserContext.create_user_scoped_server("alice", config)
+            bob = UserContext.create_user_scoped_server("bob", config)
+
+        assert len(calls) == 1
+        assert alice._tool_names is bob._tool_names
+        assert "whoami" in alice.server._tool_cache
+        alice.db_session.query.assert_not_called()
+
+        result = await alice._tool_functions["whoami"]("whoami", {})
+        assert result[0].text == "alice"
+        result = await bob._tool_functions["whoami"]("whoami", {})
+        assert result[0].text == "bob"
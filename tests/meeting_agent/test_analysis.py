@@ -0,0 +1,276 @@
+"""
+Tests for the Meeting Agent transcript analysis pipeline.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from meeting_agent.analysis import (
+    ActionExtractor,
+    MeetingSummarizer,
+    TranscriptAnalyzer,
+    chunk_transcript,
+    merge_chunk_results,
+)
+from meeting_agent.models import Meeting, MeetingSummary, Transcript, TranscriptSegment
+
+
+def word_count(text):
+    return len(text.split())
+
+
+def make_transcript(turns):
+    """Build a transcript from (speaker, text) pairs, one segment each"""
+    return Transcript(
+        meeting_id="mtg_1",
+        segments=[
+            TranscriptSegment(id=f"seg_{i}", speaker=speaker, text=text, start_time=i * 10.0, end_time=i * 10.0 + 9)
+            for i, (speaker, text) in enumerate(turns)
+        ],
+    )
+
+
+def usage(prompt_tokens, completion_tokens):
+    return SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+
+
+class TestChunkTranscript:
+    """Tests for speaker-turn chunking"""
+
+    def test_consecutive_segments_merge_into_one_turn(self):
+        transcript = make_transcript([
+            ("Alice", "one two"),
+            ("Alice", "three four"),
+            ("Bob", "five six"),
+        ])
+
+        chunks = chunk_transcript(transcript, max_tokens=100, counter=word_count)
+
+        assert len(chunks) == 1
+        assert chunks[0].text == "[Alice]: one two three four\n[Bob]: five six"
+        assert (chunks[0].start_time, chunks[0].end_time) == (0.0, 29.0)
+
+    def test_chunks_respect_budget_without_splitting_turns(self):
+        transcript = make_transcript([
+            ("Alice", "a b c d"),
+            ("Bob", "e f g h"),
+            ("Alice", "i j k l"),
+        ])
+
+        chunks = chunk_transcript(transcript, max_tokens=10, counter=word_count)
+
+        assert [chunk.text for chunk in chunks] == [
+            "[Alice]: a b c d\n[Bob]: e f g h",
+            "[Alice]: i j k l",
+        ]
+        assert all(chunk.tokens <= 10 for chunk in chunks)
+        assert [chunk.index for chunk in chunks] == [0, 1]
+
+    def test_oversized_turn_splits_on_sentences(self):
+        transcript = make_transcript([
+            ("Alice", "First sentence here. Second sentence here. Third sentence here."),
+        ])
+
+        chunks = chunk_transcript(transcript, max_tokens=5, counter=word_count)
+
+        assert [chunk.text for chunk in chunks] == [
+            "[Alice]: First sentence here.",
+            "[Alice]: Second sentence here.",
+            "[Alice]: Third sentence here.",
+        ]
+
+    def test_full_text_is_chunked_by_line(self):
+        transcript = Transcript(meeting_id="mtg_1", full_text="a b c\n\nd e f\ng h i")
+
+        chunks = chunk_transcript(transcript, max_tokens=6, counter=word_count)
+
+        assert [chunk.text for chunk in chunks] == ["a b c\nd e f", "g h i"]
+
+
+class TestMergeChunkResults:
+    """Tests for the reduce-step de-duplication"""
+
+    def test_near_duplicate_items_are_merged(self):
+        merged = merge_chunk_results([
+            {
+                "key_points": ["Launch moved to May"],
+                "action_items": [
+                    {"description": "Update the release plan", "priority": "medium"},
+                ],
+                "decisions": [
+                    {"summary": "Launch in May", "decision_makers": ["Alice"]},
+                ],
+            },
+            {
+                "key_points": ["Launch moved to May.", "Budget approved"],
+                "action_items": [
+                    {"description": "Update the release plan.", "assignee": "Bob", "priority": "high"},
+                    {"description": "Book the venue", "assignee": "Carol"},
+                ],
+                "decisions": [
+                    {"summary": "Launch in May", "decision_makers": ["Bob", "Alice"]},
+                ],
+                "participant_contributions": {"Bob": ["Owns the plan"]},
+            },
+        ])
+
+        assert merged["key_points"] == ["Launch moved to May", "Budget approved"]
+        assert merged["action_items"] == [
+            {"description": "Update the release plan", "priority": "high", "assignee": "Bob"},
+            {"description": "Book the venue", "assignee": "Carol"},
+        ]
+        assert merged["decisions"] == [
+            {"summary": "Launch in May", "decision_makers": ["Alice", "Bob"]},
+        ]
+        assert merged["participant_contributions"] == {"Bob": ["Owns the plan"]}
+
+    @pytest.mark.parametrize(
+        "first, second",
+        [
+            ({"description": "Prepare release 2.3 notes"}, {"description": "Prepare release 2.4 notes"}),
+            ({"description": "Send the report by Monday"}, {"description": "Send the report by Friday"}),
+            ({"description": "Alice to review the PR"}, {"description": "Bob to review the PR"}),
+            (
+                {"description": "Review the PR", "assignee": "Alice"},
+                {"description": "Review the PR", "assignee": "Bob"},
+            ),
+            (
+                {"description": "Send the report", "due_date": "2025-03-03"},
+                {"description": "Send the report", "due_date": "2025-03-07"},
+            ),
+        ],
+    )
+    def test_near_miss_action_items_are_kept_apart(self, first, second):
+        merged = merge_chunk_results([{"action_items": [first]}, {"action_items": [second]}])
+
+        assert merged["action_items"] == [first, second]
+
+    def test_merge_fills_fields_only_from_compatible_duplicates(self):
+        merged = merge_chunk_results([
+            {"action_items": [{"description": "Review the PR", "assignee": "Alice"}]},
+            {"action_items": [
+                {"description": "Review the PR", "assignee": "Bob", "due_date": "2025-03-07"},
+                {"description": "Review the PR.", "due_date": "2025-03-03"},
+            ]},
+        ])
+
+        assert merged["action_items"] == [
+            {"description": "Review the PR", "assignee": "Alice", "due_date": "2025-03-03"},
+            {"description": "Review the PR", "assignee": "Bob", "due_date": "2025-03-07"},
+        ]
+
+    def test_key_points_with_different_numbers_are_kept(self):
+        merged = merge_chunk_results([
+            {"key_points": ["Revenue grew 10%"]},
+            {"key_points": ["Revenue grew 12%", "Revenue grew 10 %"]},
+        ])
+
+        assert merged["key_points"] == ["Revenue grew 10%", "Revenue grew 12%"]
+
+
+class TestTranscriptAnalyzer:
+    """Tests for TranscriptAnalyzer"""
+
+    @pytest.mark.asyncio
+    async def test_short_transcript_runs_summary_and_extraction_concurrently(self):
+        meeting = Meeting(id="mtg_1", title="Sync", transcript=make_transcript([("Alice", "Ship it")]))
+        summarizer = MeetingSummarizer()
+        extractor = ActionExtractor()
+        both_started = asyncio.Event()
+        started = []
+
+        async def wait_for_other(name, metrics):
+            started.append(name)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            metrics.record_usage(usage(100, 20))
+
+        async def summarize(meeting, project_context=None, api_key=None, metrics=None):
+            await wait_for_other("summary", metrics)
+            return MeetingSummary(meeting_id=meeting.id, executive_summary="Shipped")
+
+        async def extract(meeting, participant_mapping=None, project_context=None, api_key=None, metrics=None):
+            await wait_for_other("extraction", metrics)
+            return [], [], []
+
+        summarizer.summarize = summarize
+        extractor.extract = extract
+        analyzer = TranscriptAnalyzer(summarizer, extractor, max_chunk_tokens=100, token_counter=word_count)
+
+        analysis = await analyzer.analyze(meeting)
+
+        assert analysis.summary.executive_summary == "Shipped"
+        report = analysis.metrics.to_dict()
+        assert report["chunks"] == 1
+        assert report["total_tokens"] == 240
+        assert set(report["stages"]) == {"summary", "extraction"}
+        assert report["stages"]["summary"]["calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_long_transcript_is_map_reduced(self):
+        turns = [("Alice" if i % 2 else "Bob", f"Point number {i} is discussed here today") for i in range(6)]
+        meeting = Meeting(id="mtg_1", title="Planning", transcript=make_transcript(turns))
+        analyzer = TranscriptAnalyzer(max_chunk_tokens=16, max_concurrency=2, token_counter=word_count)
+        in_flight = 0
+        peak = 0
+
+        async def map_llm(prompt, api_key=None, metrics=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            metrics.record_usage(usage(50, 10))
+            if "part 2 of" in prompt:
+                raise RuntimeError("rate limited")
+            return json.dumps({
+                "key_points": ["Release planning"],
+                "action_items": [{"description": "Write the release notes", "assignee": "Alice", "priority": "low"}],
+                "decisions": [],
+                "follow_ups": [],
+            })
+
+        reduce_prompts = []
+
+        async def reduce_llm(prompt, api_key=None, metrics=None):
+            reduce_prompts.append(prompt)
+            metrics.record_usage(usage(80, 30))
+            return json.dumps({"summary": "Release planned", "key_points": ["Release planning"]})
+
+        analyzer._call_llm = map_llm
+        analyzer.summarizer._call_llm = reduce_llm
+        analyzer.summarizer.summarize = AsyncMock()
+        analyzer.extractor.extract = AsyncMock()
+
+        analysis = await analyzer.analyze(meeting, participant_mapping={"Alice": "user_1"})
+
+        assert analysis.metrics.chunks == 3
+        assert peak == 2
+        assert analysis.metrics.failed_chunks == [1]
+        assert analysis.summary.executive_summary == "Release planned"
+        assert [item.description for item in analysis.action_items] == ["Write the release notes"]
+        assert analysis.action_items[0].assignee_id == "user_1"
+        assert analysis.summary.action_items == analysis.action_items
+        assert len(reduce_prompts) == 1 and "Release planning" in reduce_prompts[0]
+        analyzer.summarizer.summarize.assert_not_called()
+        analyzer.extractor.extract.assert_not_called()
+
+        stages = analysis.metrics.to_dict()["stages"]
+        assert set(stages) == {"map", "merge", "reduce"}
+        assert stages["map"]["calls"] == 3 and stages["map"]["total_tokens"] == 180
+        assert stages["reduce"]["total_tokens"] == 110
+
+    @pytest.mark.asyncio
+    async def test_all_chunks_failing_raises(self):
+        turns = [("Alice", "word " * 10), ("Bob", "word " * 10)]
+        meeting = Meeting(id="mtg_1", title="Planning", transcript=make_transcript(turns))
+        analyzer = TranscriptAnalyzer(max_chunk_tokens=12, token_counter=word_count)
+        analyzer._call_llm = AsyncMock(side_effect=RuntimeError("down"))
+
+        with pytest.raises(RuntimeError, match="all 2 transcript chunks"):
+            await analyzer.analyze(meeting)
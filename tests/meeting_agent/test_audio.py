@@ -8,13 +8,21 @@ from unittest.mock import Mock, patch, AsyncMock
 import tempfile
 import os
 
-from meeting_agent.audio.processor import AudioProcessor, AudioInfo
+import asyncio
+import subprocess
+import sys
+import time
+
+from meeting_agent.audio import transcriber as transcriber_module
+from meeting_agent.audio.processor import AudioChunk, AudioProcessor, AudioInfo, AudioSplitError
 from meeting_agent.audio.transcriber import (
+    LocalWhisperTranscriber,
     Transcriber,
     TranscriptionResult,
     WhisperTranscriber,
 )
 from meeting_agent.config import TranscriptionProvider
+from meeting_agent.models import Transcript, TranscriptSegment
 
 
 class TestAudioProcessor:
@@ -76,6 +84,182 @@ class TestAudioProcessor:
         assert self.processor.SUPPORTED_FORMATS == expected
 
 
+FAKE_FFMPEG = """#!{python}
+import os, sys, time
+args = sys.argv[1:]
+out = args[-1]
+if "segment" in args:
+    seconds = float(args[args.index("-segment_time") + 1])
+    for i in range(3):
+        time.sleep(0.2)
+        name = out % i
+        with open(name, "wb") as f:
+            f.write(b"chunk")
+        print("%s,%.6f,%.6f" % (os.path.basename(name), i * seconds + 0.05 * i, (i + 1) * seconds), flush=True)
+    sys.exit(0)
+time.sleep(0.3)
+with open(out, "wb") as f:
+    f.write(b"converted")
+"""
+
+
+FAILING_FFMPEG = """#!{python}
+import os, sys
+out = sys.argv[-1]
+name = out % 0
+with open(name, "wb") as f:
+    f.write(b"chunk")
+print("%s,0.000000,600.000000" % os.path.basename(name), flush=True)
+sys.stderr.write("Error while decoding stream")
+sys.exit(1)
+"""
+
+
+def _install_ffmpeg(tmp_path, monkeypatch, source):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "ffmpeg"
+    script.write_text(source.format(python=sys.executable))
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    return script
+
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path, monkeypatch):
+    """Put a stand-in ffmpeg (segment muxer and converter) first on PATH"""
+    return _install_ffmpeg(tmp_path, monkeypatch, FAKE_FFMPEG)
+
+
+@pytest.fixture
+def failing_ffmpeg(tmp_path, monkeypatch):
+    """Put a stand-in ffmpeg that cuts one segment and then exits 1 first on PATH"""
+    return _install_ffmpeg(tmp_path, monkeypatch, FAILING_FFMPEG)
+
+
+class TestAsyncAudioPipeline:
+    """Tests for the asyncio subprocess audio pipeline"""
+
+    @pytest.mark.asyncio
+    async def test_stream_chunks_yields_while_splitting(self, fake_ffmpeg, tmp_path):
+        """Test chunks arrive one by one with offsets from the segment list"""
+        processor = AudioProcessor(work_dir=str(tmp_path / "work"))
+        source = tmp_path / "meeting.mp3"
+        source.write_bytes(b"audio")
+
+        started = time.monotonic()
+        arrivals = []
+        chunks = []
+        async for chunk in processor.stream_chunks(str(source), chunk_duration_seconds=600):
+            arrivals.append(time.monotonic() - started)
+            chunks.append(chunk)
+
+        assert [c.index for c in chunks] == [0, 1, 2]
+        assert [c.start_seconds for c in chunks] == [0.0, 600.05, 1200.1]
+        assert all(Path(c.path).exists() for c in chunks)
+        assert Path(chunks[0].path).name == "meeting_chunk000.mp3"
+        # The first chunk is available well before ffmpeg finishes
+        assert arrivals[0] < arrivals[2] - 0.2
+
+    @pytest.mark.asyncio
+    async def test_transcription_overlaps_splitting(self, fake_ffmpeg, tmp_path):
+        """Test chunk 1 is transcribed before the last chunk has been cut"""
+        processor = AudioProcessor(work_dir=str(tmp_path / "work"))
+        source = tmp_path / "meeting.mp3"
+        source.write_bytes(b"audio")
+        transcriber = Transcriber()
+        events = []
+
+        async def produced():
+            async for chunk in processor.stream_chunks(str(source)):
+                events.append(("cut", chunk.index))
+                yield chunk
+
+        async def fake_transcribe(path, language=None):
+            events.append(("transcribed", int(Path(path).stem[-3:])))
+            return TranscriptionResult(success=True, transcript=_chunk_transcript(0))
+
+        transcriber.transcribe = fake_transcribe
+        result = await transcriber.transcribe_chunks(produced())
+
+        assert result.success is True
+        assert events.index(("transcribed", 0)) < events.index(("cut", 2))
+        assert result.transcript.segments[2].start_time == 600.05
+
+    @pytest.mark.asyncio
+    async def test_stream_chunks_raises_when_ffmpeg_fails_midway(self, failing_ffmpeg, tmp_path):
+        """Test a split that dies after one segment raises instead of ending normally"""
+        processor = AudioProcessor(work_dir=str(tmp_path / "work"))
+        source = tmp_path / "meeting.mp3"
+        source.write_bytes(b"audio")
+        chunks = []
+
+        with pytest.raises(AudioSplitError) as excinfo:
+            async for chunk in processor.stream_chunks(str(source)):
+                chunks.append(chunk)
+
+        assert [c.index for c in chunks] == [0]
+        assert excinfo.value.chunks_emitted == 1
+        assert "Error while decoding stream" in str(excinfo.value)
+
+    @pytest.mark.asyncio
+    async def test_incomplete_split_fails_transcription(self, failing_ffmpeg, tmp_path):
+        """Test chunks cut before a split failure are transcribed but the result is not a success"""
+        processor = AudioProcessor(work_dir=str(tmp_path / "work"))
+        source = tmp_path / "meeting.mp3"
+        source.write_bytes(b"audio")
+        transcriber = Transcriber()
+        transcriber.transcribe = AsyncMock(
+            return_value=TranscriptionResult(success=True, transcript=_chunk_transcript(0))
+        )
+
+        result = await transcriber.transcribe_chunks(processor.stream_chunks(str(source)))
+
+        assert result.success is False
+        assert result.raw_response["incomplete"] is True
+        assert result.raw_response["chunks"] == 1
+        assert "after 1 chunks" in result.error
+        assert len(result.transcript.segments) == 2
+        transcriber.transcribe.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_chunks_without_ffmpeg_yields_whole_file(self, tmp_path, monkeypatch):
+        """Test a missing ffmpeg falls back to one chunk for the whole file"""
+        monkeypatch.setenv("PATH", str(tmp_path))
+        processor = AudioProcessor(work_dir=str(tmp_path / "work"))
+
+        chunks = [c async for c in processor.stream_chunks(str(tmp_path / "meeting.mp3"))]
+
+        assert [(c.index, c.path, c.start_seconds) for c in chunks] == [(0, str(tmp_path / "meeting.mp3"), 0.0)]
+
+    @pytest.mark.asyncio
+    async def test_conversion_does_not_block_event_loop(self, fake_ffmpeg, tmp_path):
+        """Test the event loop keeps running while ffmpeg converts"""
+        processor = AudioProcessor(work_dir=str(tmp_path / "work"))
+        source = tmp_path / "meeting.wav"
+        source.write_bytes(b"audio")
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        prepared = await processor.prepare_for_transcription(str(source))
+        task.cancel()
+
+        assert Path(prepared).read_bytes() == b"converted"
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_run_command_timeout_kills_process(self):
+        """Test a hung command is killed and reported like subprocess.run"""
+        with pytest.raises(subprocess.TimeoutExpired):
+            await AudioProcessor._run_command([sys.executable, "-c", "import time; time.sleep(10)"], timeout=0.1)
+
+
 class TestTranscriber:
     """Tests for Transcriber"""
 
@@ -160,3 +344,119 @@ class TestTranscriptionResult:
         assert result.success is False
         assert result.transcript is None
         assert result.error == "API error"
+
+
+def _chunk_transcript(index: int) -> Transcript:
+    """Transcript of one 600s chunk with two chunk-relative segments"""
+    return Transcript(
+        meeting_id="",
+        language="en",
+        segments=[
+            TranscriptSegment(id="seg_0", text=f"chunk {index} start", start_time=0.0, end_time=5.0),
+            TranscriptSegment(id="seg_1", text=f"chunk {index} end", start_time=590.0, end_time=600.0),
+        ],
+        full_text=f"chunk {index} start chunk {index} end",
+        duration_seconds=600.0,
+    )
+
+
+class TestChunkedTranscription:
+    """Tests for concurrent chunk transcription"""
+
+    def _chunks(self, count: int):
+        return [AudioChunk(index=i, path=f"chunk{i}.mp3", start_seconds=i * 600) for i in range(count)]
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency_and_offsets(self):
+        """Test chunks overlap up to the limit and are stitched with offsets"""
+        transcriber = Transcriber()
+        state = {"in_flight": 0, "max_in_flight": 0}
+
+        async def fake_transcribe(path, language=None):
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+            await asyncio.sleep(0.02)
+            state["in_flight"] -= 1
+            index = int(path[len("chunk"):-len(".mp3")])
+            return TranscriptionResult(success=True, transcript=_chunk_transcript(index))
+
+        transcriber.transcribe = fake_transcribe
+        result = await transcriber.transcribe_chunks(self._chunks(6), max_concurrency=3)
+
+        assert result.success is True
+        assert state["max_in_flight"] == 3
+        segments = result.transcript.segments
+        assert [seg.id for seg in segments] == [f"seg_{i}" for i in range(12)]
+        assert segments[2].text == "chunk 1 start" and segments[2].start_time == 600.0
+        assert segments[-1].end_time == 3600.0
+        assert result.transcript.duration_seconds == 3600.0
+        assert result.transcript.full_text.startswith("chunk 0 start")
+        assert result.raw_response["failed_chunks"] == []
+
+    @pytest.mark.asyncio
+    async def test_failed_chunks_are_retried_then_skipped(self):
+        """Test a flaky chunk is retried and a dead chunk does not fail the meeting"""
+        transcriber = Transcriber()
+        calls = {}
+
+        async def fake_transcribe(path, language=None):
+            calls[path] = calls.get(path, 0) + 1
+            if path == "chunk2.mp3" or (path == "chunk1.mp3" and calls[path] == 1):
+                return TranscriptionResult(success=False, error="rate limited")
+            return TranscriptionResult(success=True, transcript=_chunk_transcript(int(path[5])))
+
+        transcriber.transcribe = fake_transcribe
+        result = await transcriber.transcribe_chunks(
+            self._chunks(3), max_attempts=3, retry_delay_seconds=0
+        )
+
+        assert result.success is True
+        assert calls == {"chunk0.mp3": 1, "chunk1.mp3": 2, "chunk2.mp3": 3}
+        assert result.raw_response["failed_chunks"] == [2]
+        assert result.raw_response["attempts"] == {"0": 1, "1": 2, "2": 3}
+        assert len(result.transcript.segments) == 4
+
+    @pytest.mark.asyncio
+    async def test_all_chunks_failing_fails(self):
+        """Test the result is a failure only when no chunk succeeds"""
+        transcriber = Transcriber()
+        transcriber.transcribe = AsyncMock(side_effect=RuntimeError("boom"))
+
+        result = await transcriber.transcribe_chunks(self._chunks(2), max_attempts=2, retry_delay_seconds=0)
+
+        assert result.success is False
+        assert "boom" in result.error
+        assert transcriber.transcribe.await_count == 4
+
+
+class TestLocalWhisperTranscriber:
+    """Tests for LocalWhisperTranscriber"""
+
+    @pytest.mark.asyncio
+    async def test_in_process_mode(self):
+        """Test max_workers=0 runs the model in this process"""
+        transcriber = LocalWhisperTranscriber(max_workers=0)
+        transcriber._model = Mock()
+        transcriber._model.transcribe.return_value = {
+            "text": " hello world",
+            "language": "en",
+            "segments": [{"text": " hello world", "start": 0.0, "end": 2.0, "tokens": [1, 2]}],
+        }
+
+        result = await transcriber.transcribe("audio.mp3")
+
+        assert result.success is True
+        assert result.transcript.segments[0].text == "hello world"
+        assert "tokens" not in result.raw_response["segments"][0]
+
+    def test_process_pool_is_shared(self, monkeypatch):
+        """Test handlers created per request reuse one worker pool"""
+        monkeypatch.setenv("WHISPER_LOCAL_WORKERS", "2")
+        try:
+            first = LocalWhisperTranscriber()
+            assert first.max_workers == 2
+            pool = transcriber_module._get_whisper_pool(first.model_size, first.max_workers)
+            assert transcriber_module._get_whisper_pool("base", 2) is pool
+        finally:
+            transcriber_module.shutdown_whisper_pools()
+        assert transcriber_module._whisper_pools == {}
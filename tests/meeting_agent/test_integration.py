@@ -11,6 +11,7 @@ from pathlib import Path
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from meeting_agent.audio import AudioChunk, AudioSplitError
 from meeting_agent.handlers import MeetingHandler
 from meeting_agent.config import MeetingAgentConfig, TranscriptionProvider
 from meeting_agent.models import (
@@ -134,6 +135,72 @@ class TestMeetingHandlerIntegration:
         # Verify transcriber was called
         handler.transcriber.transcribe.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_long_recording_is_transcribed_in_parallel_chunks(self, handler, mock_transcription_result):
+        """Test large files are split, transcribed per chunk and stitched with offsets"""
+        temp_audio = os.path.join(handler.config.upload_dir, "long.mp3")
+        with open(temp_audio, "wb") as f:
+            f.truncate(26 * 1024 * 1024)
+        chunk_paths = []
+        for i in range(3):
+            chunk_path = os.path.join(handler.config.upload_dir, f"long_chunk{i:03d}.mp3")
+            Path(chunk_path).write_bytes(b"chunk")
+            chunk_paths.append(chunk_path)
+
+        handler.provider_manager = MagicMock()
+        handler.provider_manager.get_ai_provider.return_value = {"api_key": "test-key"}
+
+        async def fake_stream_chunks(path, chunk_duration_seconds=600):
+            for i, chunk_path in enumerate(chunk_paths):
+                yield AudioChunk(index=i, path=chunk_path, start_seconds=i * 600.0)
+
+        handler.audio_processor.stream_chunks = fake_stream_chunks
+        handler.transcriber.transcribe = AsyncMock(return_value=mock_transcription_result)
+        handler.summarizer.summarize = AsyncMock(
+            return_value=MeetingSummary(meeting_id="test", executive_summary="Long meeting")
+        )
+        handler.action_extractor.extract = AsyncMock(return_value=([], [], []))
+        handler.repository = MagicMock()
+
+        result = await handler.execute(HandlerContext(user_id="test_user"), audio_path=temp_audio)
+
+        assert result.is_success
+        assert handler.transcriber.transcribe.await_count == 3
+        transcript = handler.repository.save_transcript.call_args[0][1]
+        assert [seg.start_time for seg in transcript.segments] == [0.0, 3.5, 600.0, 603.5, 1200.0, 1203.5]
+        assert not any(Path(p).exists() for p in chunk_paths)
+        assert result.metadata["failed_chunks"] == []
+
+    @pytest.mark.asyncio
+    async def test_incomplete_split_fails_meeting(self, handler, mock_transcription_result):
+        """Test a recording whose split stops early is not reported as processed"""
+        temp_audio = os.path.join(handler.config.upload_dir, "long.mp3")
+        with open(temp_audio, "wb") as f:
+            f.truncate(26 * 1024 * 1024)
+        chunk_path = os.path.join(handler.config.upload_dir, "long_chunk000.mp3")
+        Path(chunk_path).write_bytes(b"chunk")
+
+        handler.provider_manager = MagicMock()
+        handler.provider_manager.get_ai_provider.return_value = {"api_key": "test-key"}
+
+        async def fake_stream_chunks(path, chunk_duration_seconds=600):
+            yield AudioChunk(index=0, path=chunk_path, start_seconds=0.0)
+            raise AudioSplitError("Audio splitting failed after 1 chunks: corrupt packet", 1)
+
+        handler.audio_processor.stream_chunks = fake_stream_chunks
+        handler.transcriber.transcribe = AsyncMock(return_value=mock_transcription_result)
+        handler.summarizer.summarize = AsyncMock()
+        handler.repository = MagicMock()
+
+        result = await handler.execute(HandlerContext(user_id="test_user"), audio_path=temp_audio)
+
+        assert result.is_failed
+        assert "partially transcribed" in result.message
+        assert result.metadata["incomplete"] is True
+        handler.summarizer.summarize.assert_not_awaited()
+        handler.repository.create_meeting.assert_not_called()
+        assert not Path(chunk_path).exists()
+
     @pytest.mark.asyncio
     async def test_process_from_text(self, handler):
         """Test processing from raw transcript text"""
@@ -0,0 +1,19 @@
+"""
+Test fixtures for PM Service tests.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_entity_index(monkeypatch, tmp_path):
+    """Keep listings in tests from writing the on-disk entity index."""
+    from pm_service.config import settings
+    from pm_service.search import reset_entity_index
+
+    monkeypatch.setattr(settings, "entity_index_enabled", True)
+    monkeypatch.setattr(settings, "entity_index_backend", "local")
+    monkeypatch.setattr(settings, "entity_index_path", str(tmp_path / "entity_index"))
+    reset_entity_index()
+    yield
+    reset_entity_index()
@@ -139,6 +139,26 @@ class TestAsyncPMServiceClientProjects:
             )
             assert result["name"] == "Project 1"
 
+    @pytest.mark.asyncio
+    async def test_get_project_timeline_not_modified(self, client, mock_response):
+        """Test a 304 for the timeline returns no body and keeps the ETag."""
+        mock_response.status_code = 304
+        mock_response.headers = {"etag": '"abc"'}
+        http = MagicMock()
+        http.get = AsyncMock(return_value=mock_response)
+
+        with patch.object(client, '_get_client', return_value=http):
+            result = await client.get_project_timeline(
+                "prov1:proj1", start="2025-01-01", etag='"abc"'
+            )
+
+        http.get.assert_called_once_with(
+            "/api/v1/projects/prov1:proj1/timeline",
+            params={"start": "2025-01-01"},
+            headers={"If-None-Match": '"abc"'}
+        )
+        assert result == {"timeline": None, "etag": '"abc"', "not_modified": True}
+
 
 class TestAsyncPMServiceClientTasks:
     """Tests for task operations."""
@@ -209,6 +229,26 @@ class TestAsyncPMServiceClientTasks:
             assert call_json["description"] == "Description"
             assert call_json["story_points"] == 5
     
+    @pytest.mark.asyncio
+    async def test_create_tasks_bulk(self, client):
+        """Test creating several tasks in one request."""
+        with patch.object(client, '_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = {"results": [], "created": 2, "failed": 0}
+
+            result = await client.create_tasks_bulk(
+                project_id="prov1:proj1",
+                tasks=[{"title": "A"}, {"title": "B", "assignee_name": "Alice"}],
+                max_concurrency=4
+            )
+
+            mock_request.assert_called_once()
+            assert mock_request.call_args[0] == ("POST", "/api/v1/tasks/bulk")
+            call_json = mock_request.call_args[1]["json"]
+            assert call_json["project_id"] == "prov1:proj1"
+            assert len(call_json["tasks"]) == 2
+            assert call_json["max_concurrency"] == 4
+            assert result["created"] == 2
+
     @pytest.mark.asyncio
     async def test_update_task(self, client):
         """Test updating a task."""
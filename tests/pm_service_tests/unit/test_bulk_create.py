@@ -0,0 +1,182 @@
+"""
+Unit tests for bulk task creation.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import replace
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from pm_service.database import get_db_session
+from pm_service.handlers.pm_handler import PMHandler
+from pm_service.providers.base import BasePMProvider
+from pm_service.providers.models import PMProviderConfig, PMTask, PMUser
+from pm_service.providers.openproject import OpenProjectProvider
+from pm_service.routers import tasks as tasks_router
+
+
+class MockProvider:
+    """Provider whose create_tasks is the BasePMProvider default."""
+
+    create_tasks = BasePMProvider.create_tasks
+
+    def __init__(self, fail_titles=()):
+        self.fail_titles = set(fail_titles)
+        self.created = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def list_users(self, project_id=None):
+        yield PMUser(id="7", name="Alice Smith")
+
+    async def create_task(self, task):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if task.title in self.fail_titles:
+                raise RuntimeError(f"rejected {task.title}")
+            self.created.append(task)
+            return replace(task, id=str(len(self.created)))
+        finally:
+            self.in_flight -= 1
+
+
+class MockConnection:
+    id = "conn1"
+    name = "Mock Connection"
+    backend_provider_id = None
+
+
+def _handler(provider):
+    handler = PMHandler(db_session=MagicMock())
+    handler.get_provider_by_id = lambda pid: MockConnection()
+    handler.create_provider_instance = lambda conn: provider
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_handler_reports_each_item_on_partial_failure():
+    provider = MockProvider(fail_titles={"Second"})
+    handler = _handler(provider)
+
+    results = await handler.create_tasks_bulk("conn1:478", [
+        {"title": "First", "assignee_name": "alice smith"},
+        {"title": "Second"},
+        {"title": "Third", "assignee_id": "conn1:9", "parent_id": "conn1:100"},
+    ])
+
+    assert [r["success"] for r in results] == [True, False, True]
+    assert [r["index"] for r in results] == [0, 1, 2]
+    assert "rejected Second" in results[1]["error"]
+    assert results[0]["task"]["id"].startswith("conn1:")
+    assert results[0]["task"]["provider_name"] == "Mock Connection"
+    first, third = provider.created
+    assert first.assignee_id == "7" and first.project_id == "478"
+    assert third.assignee_id == "9" and third.parent_task_id == "100"
+
+
+@pytest.mark.asyncio
+async def test_handler_limits_concurrent_creates():
+    provider = MockProvider()
+    handler = _handler(provider)
+
+    results = await handler.create_tasks_bulk(
+        "conn1:478", [{"title": f"Task {i}"} for i in range(10)], max_concurrency=3
+    )
+
+    assert all(r["success"] for r in results)
+    assert provider.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_handler_requires_composite_project_id():
+    with pytest.raises(ValueError):
+        await _handler(MockProvider()).create_tasks_bulk("478", [{"title": "Task"}])
+
+
+@pytest.mark.asyncio
+async def test_openproject_create_tasks_posts_from_threads_over_one_session(monkeypatch):
+    lock = threading.Lock()
+    state = {"in_flight": 0, "max_in_flight": 0, "sessions": set()}
+
+    def fake_post(session, url, json=None, **kwargs):
+        with lock:
+            state["sessions"].add(id(session))
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        time.sleep(0.02)
+        with lock:
+            state["in_flight"] -= 1
+        if json["subject"] == "Broken":
+            raise requests.HTTPError("422 Unprocessable Entity")
+        response = MagicMock(status_code=201)
+        response.json.return_value = {"id": len(json["subject"]), "subject": json["subject"]}
+        return response
+
+    monkeypatch.setattr(requests.Session, "post", fake_post)
+    provider = OpenProjectProvider(PMProviderConfig(
+        provider_type="openproject", base_url="https://op.example.com", api_key="key",
+    ))
+    tasks = [PMTask(title=title, project_id="478") for title in ["One", "Broken", "Three", "Four"]]
+
+    results = await provider.create_tasks(tasks, max_concurrency=2)
+
+    assert isinstance(results[1], requests.HTTPError)
+    assert [r.title for i, r in enumerate(results) if i != 1] == ["One", "Three", "Four"]
+    assert state["max_in_flight"] == 2
+    assert len(state["sessions"]) == 1
+
+
+class FakeHandler:
+    def __init__(self, db):
+        pass
+
+    async def create_tasks_bulk(self, project_id, tasks, max_concurrency):
+        if ":" not in project_id:
+            raise ValueError("project_id must include provider_id")
+        FakeHandler.calls.append((project_id, tasks, max_concurrency))
+        return [
+            {"index": 0, "success": True, "task": {"id": "conn1:1", "title": tasks[0]["title"]}},
+            {"index": 1, "success": False, "error": "rejected"},
+        ]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    FakeHandler.calls = []
+    monkeypatch.setattr(tasks_router, "PMHandler", FakeHandler)
+    app = FastAPI()
+    app.include_router(tasks_router.router, prefix="/api/v1")
+    app.dependency_overrides[get_db_session] = lambda: MagicMock()
+    return TestClient(app)
+
+
+def test_bulk_route_returns_per_item_results(client):
+    response = client.post("/api/v1/tasks/bulk", json={
+        "project_id": "conn1:478",
+        "tasks": [{"title": "A", "due_date": "2025-03-01"}, {"title": "B"}],
+        "max_concurrency": 4,
+    })
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["created"], body["failed"]) == (1, 1)
+    assert body["results"][1]["error"] == "rejected"
+    [(project_id, tasks, max_concurrency)] = FakeHandler.calls
+    assert project_id == "conn1:478" and max_concurrency == 4
+    assert str(tasks[0]["due_date"]) == "2025-03-01"
+
+
+def test_bulk_route_validates_request(client):
+    empty = client.post("/api/v1/tasks/bulk", json={"project_id": "conn1:478", "tasks": []})
+    bad_id = client.post("/api/v1/tasks/bulk", json={"project_id": "478", "tasks": [{"title": "A"}]})
+
+    assert empty.status_code == 422
+    assert bad_id.status_code == 400
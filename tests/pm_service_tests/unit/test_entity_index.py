@@ -0,0 +1,303 @@
+"""
+Unit tests for the PM entity search index.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import httpx
+import numpy as np
+import pytest
+from sqlalchemy import text
+
+from pm_service.handlers.pm_handler import PMHandler
+from pm_service.config import settings
+from pm_service.search import get_entity_index
+from pm_service.search.embeddings import HashEmbedder, OpenAIEmbedder, create_embedder, hash_embed
+from pm_service.search import entity_index as entity_index_module
+from pm_service.search.entity_index import EntityIndex, LocalVectorStore, PgVectorStore
+
+DIMS = 256
+
+TASKS = [
+    {"id": "p1:1", "title": "Retry failed card payments", "description": "Exponential backoff for the payment gateway",
+     "status": "open", "project_id": "p1:478", "sprint_id": "p1:9", "assignee_id": "p1:u1", "provider_id": "conn1"},
+    {"id": "p1:2", "title": "Update onboarding docs", "description": "Rewrite the getting started guide",
+     "status": "open", "project_id": "p1:478", "sprint_id": "p1:9", "assignee_id": "p1:u2", "provider_id": "conn1"},
+    {"id": "p1:3", "title": "Payment retry alerts", "description": "Notify finance when retries are exhausted",
+     "status": "closed", "project_id": "p1:478", "sprint_id": "p1:10", "assignee_id": "p1:u1", "provider_id": "conn1"},
+    {"id": "p1:4", "title": "Card payment retries for subscriptions", "description": None,
+     "status": "open", "project_id": "p1:500", "provider_id": "conn1"},
+]
+
+
+class CountingEmbedder:
+    def __init__(self):
+        self.texts = []
+
+    def __call__(self, texts):
+        self.texts.extend(texts)
+        return np.stack([hash_embed(t, DIMS) for t in texts])
+
+
+@pytest.fixture
+def embedder():
+    return CountingEmbedder()
+
+
+@pytest.fixture
+def index(tmp_path, embedder):
+    index = EntityIndex(LocalVectorStore(str(tmp_path / "index"), DIMS), embed=embedder)
+    index.index_entities("task", [dict(t) for t in TASKS])
+    return index
+
+
+def _ids(results):
+    return [r["id"] for r in results]
+
+
+def test_search_ranks_by_shared_words(index):
+    results = index.search("payment retries", top_k=3)
+
+    assert set(_ids(results)[:3]) == {"p1:1", "p1:3", "p1:4"}
+    assert results[0]["score"] >= results[-1]["score"]
+    assert results[0]["entity_type"] == "task"
+
+
+def test_filters_are_applied_before_ranking(index):
+    assert _ids(index.search("payment retries", project_id="p1:478", status="open", min_score=0.0)) == [
+        "p1:1",
+        "p1:2",
+    ]
+    assert _ids(index.search("payment retries", sprint_id="p1:10")) == ["p1:3"]
+    assert _ids(index.search("payment", project_id="500", top_k=5)) == ["p1:4"]
+    # The project filter accepts either the PM Service or the backend provider id
+    assert "p1:4" in _ids(index.search("payment", project_id="conn1:500"))
+    assert index.search("payment", project_id="other:478") == []
+
+
+def test_min_score_drops_unrelated_entities(tmp_path):
+    index = EntityIndex(LocalVectorStore(str(tmp_path / "index"), DIMS))
+    index.index_entities("task", [dict(t) for t in TASKS])
+
+    assert index.lexical
+    assert index.min_score == HashEmbedder.min_score
+    results = index.search("payment retries", project_id="p1:478", status="open")
+    assert _ids(results) == ["p1:1"]
+    assert index.search("kubernetes cluster autoscaling") == []
+    assert "p1:2" in _ids(index.search("payment retries", top_k=10, min_score=0.0))
+
+
+def test_unchanged_entities_are_not_reembedded(index, embedder):
+    embedder.texts.clear()
+    changed = [dict(t) for t in TASKS]
+    changed[1]["title"] = "Update payment onboarding docs"
+
+    assert index.index_entities("task", changed) == 1
+    assert embedder.texts == ["Update payment onboarding docs\nRewrite the getting started guide"]
+
+
+def test_switching_embedder_reembeds_entities(tmp_path, embedder):
+    store = LocalVectorStore(str(tmp_path / "index"), DIMS)
+    EntityIndex(store).index_entities("task", [dict(t) for t in TASKS])
+
+    assert EntityIndex(store, embed=embedder).index_entities("task", [dict(t) for t in TASKS]) == len(TASKS)
+
+
+def test_complete_listing_removes_missing_entities(index):
+    remaining = [dict(t) for t in TASKS if t["id"] != "p1:3" and t["project_id"] == "p1:478"]
+
+    index.index_entities("task", remaining, complete_for={"project_id": "p1:478"})
+
+    assert "p1:3" not in _ids(index.search("payment retries", top_k=10))
+    # Other projects are outside the listing's scope
+    assert "p1:4" in _ids(index.search("payment retries", top_k=10))
+
+
+def test_index_persists_and_reloads(tmp_path, index):
+    reloaded = EntityIndex(LocalVectorStore(str(tmp_path / "index"), DIMS))
+
+    assert _ids(reloaded.search("payment retries", top_k=3)) == _ids(index.search("payment retries", top_k=3))
+
+
+def test_delete_keeps_rows_and_vectors_aligned(tmp_path):
+    store = LocalVectorStore(None, DIMS)
+    index = EntityIndex(store)
+    index.index_entities("task", [{"id": f"p:{i}", "title": f"topic{i} words"} for i in range(5)])
+
+    store.delete(["p:1", "p:3"])
+
+    assert len(store) == 3
+    for i in (0, 2, 4):
+        assert _ids(index.search(f"topic{i}", top_k=1)) == [f"p:{i}"]
+
+
+def _embeddings_transport(requests, dims=DIMS):
+    def handler(request):
+        body = json.loads(request.content)
+        requests.append(body)
+        # Unnormalised vectors, returned out of order
+        data = [
+            {"index": i, "embedding": [float(len(text))] + [0.0] * (dims - 1)}
+            for i, text in enumerate(body["input"])
+        ]
+        return httpx.Response(200, json={"data": list(reversed(data))})
+
+    return httpx.MockTransport(handler)
+
+
+def test_openai_embedder_batches_and_normalises():
+    requests = []
+    embed = OpenAIEmbedder(
+        "text-embedding-3-small", DIMS, api_key="key", transport=_embeddings_transport(requests)
+    )
+    embed.batch_size = 2
+
+    vectors = embed(["a", "bb", "ccc"])
+
+    assert [r["input"] for r in requests] == [["a", "bb"], ["ccc"]]
+    assert requests[0]["model"] == "text-embedding-3-small"
+    assert requests[0]["dimensions"] == DIMS
+    assert vectors.shape == (3, DIMS)
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0)
+    assert not embed.lexical
+    assert embed.name == f"openai:text-embedding-3-small-{DIMS}"
+
+
+def test_openai_embedder_rejects_dimension_mismatch():
+    embed = OpenAIEmbedder("model", DIMS, transport=_embeddings_transport([], dims=DIMS // 2))
+
+    with pytest.raises(ValueError, match="PM_SERVICE_ENTITY_INDEX_DIMS"):
+        embed(["text"])
+
+
+def test_create_embedder():
+    assert isinstance(create_embedder("hash", DIMS), HashEmbedder)
+    assert isinstance(create_embedder("openai", DIMS, model="m"), OpenAIEmbedder)
+    with pytest.raises(ValueError):
+        create_embedder("openai", DIMS)
+    with pytest.raises(ValueError):
+        create_embedder("word2vec", DIMS)
+
+
+def test_auto_embedder_uses_model_only_with_api_key(monkeypatch):
+    from pm_service.search import reset_entity_index
+
+    monkeypatch.setattr(settings, "entity_index_embedder", "auto")
+    monkeypatch.setattr(settings, "entity_index_embedding_api_key", None)
+    assert get_entity_index().lexical
+
+    reset_entity_index()
+    monkeypatch.setattr(settings, "entity_index_embedding_api_key", "key")
+    index = get_entity_index()
+    assert not index.lexical
+    assert index.embedder_name.startswith("openai:")
+
+
+def test_failed_init_retries_after_backoff_without_disabling_search(monkeypatch):
+    from pm_service.search import reset_entity_index
+
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(entity_index_module.time, "monotonic", lambda: clock["now"])
+    reset_entity_index()
+    monkeypatch.setattr(settings, "entity_index_embedder", "word2vec")
+
+    assert get_entity_index() is None
+    assert settings.entity_index_enabled
+    monkeypatch.setattr(settings, "entity_index_embedder", "hash")
+    assert get_entity_index() is None
+
+    clock["now"] += entity_index_module.INIT_RETRY_MIN_SECONDS
+    assert get_entity_index() is not None
+
+
+def test_pgvector_filtered_search_widens_hnsw_candidates():
+    class FakeConn:
+        def __init__(self):
+            self.statements = []
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def execute(self, statement, params=None):
+            self.statements.append(str(statement))
+            return []
+
+    conn = FakeConn()
+    store = PgVectorStore.__new__(PgVectorStore)
+    store.engine = MagicMock()
+    store.engine.begin.return_value = conn
+    store._text = text
+
+    store.search(np.zeros(DIMS, dtype=np.float32), 5, {})
+    assert not any("ef_search" in s for s in conn.statements)
+
+    store.search(np.zeros(DIMS, dtype=np.float32), 5, {"status": "open"})
+    assert "SET LOCAL hnsw.ef_search = 400" in conn.statements
+
+
+def test_remove_provider(index):
+    assert index.remove_provider("conn1") == len(TASKS)
+    assert index.search("payment") == []
+
+
+class MockProvider:
+    def __init__(self, tasks):
+        self.tasks = tasks
+        self.calls = 0
+
+    async def list_tasks(self, **kwargs):
+        self.calls += 1
+        for task in self.tasks:
+            yield task
+
+
+class MockConnection:
+    id = "conn1"
+    name = "Mock Connection"
+    backend_provider_id = None
+
+
+@pytest.mark.asyncio
+async def test_handler_listing_feeds_search_and_cold_start_lists_project():
+    provider = MockProvider([
+        {"id": "1", "title": "Retry failed card payments", "status": "open", "project_id": "478"},
+        {"id": "2", "title": "Update onboarding docs", "status": "open", "project_id": "478"},
+    ])
+    handler = PMHandler(db_session=MagicMock())
+    handler.get_active_providers = lambda: [MockConnection()]
+    handler.create_provider_instance = lambda conn: provider
+    handler.get_provider_by_id = lambda pid: MockConnection()
+
+    results = await handler.search_entities("payment retries", project_id="conn1:478", top_k=1)
+
+    assert provider.calls == 1
+    assert _ids(results) == ["conn1:1"]
+    assert results[0]["provider_name"] == "Mock Connection"
+
+    await handler.search_entities("onboarding", project_id="conn1:478")
+    assert provider.calls == 1
+    assert len(get_entity_index().store) == 2
+
+
+@pytest.mark.asyncio
+async def test_search_without_project_lists_unindexed_providers():
+    provider = MockProvider([
+        {"id": "1", "title": "Retry failed card payments", "status": "open", "project_id": "478"},
+        {"id": "2", "title": "Update onboarding docs", "status": "open", "project_id": "501"},
+    ])
+    handler = PMHandler(db_session=MagicMock())
+    handler.get_active_providers = lambda: [MockConnection()]
+    handler.create_provider_instance = lambda conn: provider
+    handler.get_provider_by_id = lambda pid: MockConnection()
+
+    results = await handler.search_entities("payment retries")
+
+    assert provider.calls == 1
+    assert _ids(results) == ["conn1:1"]
+
+    await handler.search_entities("onboarding docs")
+    assert provider.calls == 1
@@ -0,0 +1,79 @@
+"""
+Unit tests for JIRA worklogs as time entries.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from pm_service.providers import jira as jira_module
+from pm_service.providers.jira import JIRAProvider
+from pm_service.providers.models import PMProviderConfig
+
+WORKLOGS = {
+    "KEY-1": [
+        {"id": "1", "started": "2025-03-03T09:00:00.000+0000", "timeSpentSeconds": 3600,
+         "author": {"accountId": "alice"}},
+        {"id": "2", "started": "2025-03-10T09:00:00.000+0000", "timeSpentSeconds": 1800,
+         "author": {"accountId": "bob"}},
+    ],
+    "KEY-2": [
+        {"id": "3", "started": "2025-03-04T09:00:00.000+0000", "timeSpentSeconds": 7200,
+         "author": {"accountId": "alice"}},
+    ],
+}
+
+
+def _response(payload):
+    response = MagicMock(status_code=200)
+    response.json.return_value = payload
+    return response
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    searches = []
+
+    def fake_post(url, json=None, **kwargs):
+        searches.append(json["jql"])
+        return _response({"issues": [{"key": key} for key in WORKLOGS]})
+
+    def fake_get(url, params=None, **kwargs):
+        key = url.rstrip("/").split("/")[-2]
+        worklogs = WORKLOGS[key]
+        return _response({"worklogs": worklogs, "total": len(worklogs)})
+
+    monkeypatch.setattr(jira_module.requests, "post", fake_post)
+    monkeypatch.setattr(jira_module.requests, "get", fake_get)
+    provider = JIRAProvider(PMProviderConfig(
+        provider_type="jira", base_url="https://jira.example.com",
+        api_token="token", username="me@example.com",
+    ))
+    provider.searches = searches
+    return provider
+
+
+async def _collect(iterator):
+    return [entry async for entry in iterator]
+
+
+@pytest.mark.asyncio
+async def test_time_entries_of_one_issue(provider):
+    entries = await _collect(provider.get_time_entries(task_id="KEY-1"))
+
+    assert [e["id"] for e in entries] == ["1", "2"]
+    assert {e["issueKey"] for e in entries} == {"KEY-1"}
+    assert provider.searches == []
+
+
+@pytest.mark.asyncio
+async def test_time_entries_filtered_by_author_and_dates(provider):
+    entries = await _collect(provider.get_time_entries(
+        user_id="alice", project_id="conn1:KEY", start_date="2025-03-01", end_date="2025-03-07"
+    ))
+
+    assert [e["id"] for e in entries] == ["1", "3"]
+    assert provider.searches == [
+        'project = "KEY" AND worklogAuthor = "alice" '
+        'AND worklogDate >= "2025-03-01" AND worklogDate <= "2025-03-07"'
+    ]
@@ -83,6 +83,22 @@ async def test_list_projects_streaming(mock_handler):
     assert projects[0]["id"] == "mock:0"
     assert projects[4]["id"] == "mock:4"
 
+class NoUserFilterProvider:
+    """Provider whose list_projects takes no user_id, like JIRA and ClickUp"""
+
+    async def list_projects(self):
+        yield {"id": "1", "name": "Project 1"}
+
+
+@pytest.mark.asyncio
+async def test_list_projects_without_user_filter_support(mock_handler):
+    mock_handler.create_provider_instance = MagicMock(return_value=NoUserFilterProvider())
+
+    projects = await mock_handler.list_projects()
+
+    assert [p["id"] for p in projects] == ["mock:1"]
+    assert not mock_handler.get_errors()
+
 @pytest.mark.asyncio
 async def test_list_users_compatibility(mock_handler):
     # This tests ensure_async_iterator with a List return
@@ -0,0 +1,105 @@
+"""
+Unit tests for server-side timeline assembly.
+"""
+
+import asyncio
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+from pm_service.handlers.pm_handler import PMHandler
+from pm_service.utils.timeline import build_timeline, etag_matches, timeline_etag
+
+SPRINTS = [
+    {"id": "p:1", "name": "Sprint 1", "start_date": "2025-01-01", "end_date": "2025-01-14",
+     "status": "closed", "provider_name": "OpenProject"},
+    {"id": "p:2", "name": "Sprint 2", "start_date": "2025-02-01T00:00:00", "end_date": "2025-02-14"},
+    {"id": "p:3", "name": "Backlog sprint"},
+]
+
+TASKS = [
+    {"id": "p:10", "title": "Early task", "start_date": "2025-01-02", "due_date": "2025-01-05",
+     "sprint_id": "p:1", "description": "x" * 5000, "status": "done"},
+    {"id": "p:11", "title": "Spans window start", "start_date": "2025-01-10", "due_date": "2025-02-03",
+     "sprint_id": "p:2", "sprint_name": "Renamed"},
+    {"id": "p:12", "title": "No dates", "due_date": "2025-03-01"},
+]
+
+
+def _ids(items):
+    return [i["id"] for i in items]
+
+
+class TestBuildTimeline:
+    """Tests for build_timeline."""
+
+    def test_splits_scheduled_and_trims_fields(self):
+        timeline = build_timeline("p:478", SPRINTS, TASKS)
+
+        assert _ids(timeline["sprints"]) == ["p:1", "p:2"]
+        assert _ids(timeline["unscheduled"]["sprints"]) == ["p:3"]
+        assert timeline["unscheduled"]["tasks"][0]["missing_reason"] == "missing_start"
+        early = timeline["tasks"][0]
+        assert "description" not in early
+        assert "provider_name" not in timeline["sprints"][0]
+        assert early["is_scheduled"] is True and early["missing_reason"] is None
+
+    def test_fills_sprint_details_without_overriding(self):
+        tasks = {t["id"]: t for t in build_timeline("p:478", SPRINTS, TASKS)["tasks"]}
+
+        assert tasks["p:10"]["sprint_name"] == "Sprint 1"
+        assert tasks["p:10"]["sprint_end_date"] == "2025-01-14"
+        assert tasks["p:11"]["sprint_name"] == "Renamed"
+
+    def test_window_keeps_overlapping_items(self):
+        timeline = build_timeline("p:478", SPRINTS, TASKS, start=date(2025, 2, 1), end=date(2025, 2, 28))
+
+        assert _ids(timeline["sprints"]) == ["p:2"]
+        assert _ids(timeline["tasks"]) == ["p:11"]
+        # Unscheduled items are never windowed out
+        assert _ids(timeline["unscheduled"]["tasks"]) == ["p:12"]
+        assert timeline["window"] == {"start": "2025-02-01", "end": "2025-02-28"}
+
+
+class TestTimelineETag:
+    """Tests for ETag helpers."""
+
+    def test_etag_is_stable_and_content_sensitive(self):
+        first = build_timeline("p:478", SPRINTS, TASKS)
+        again = build_timeline("p:478", list(SPRINTS), list(TASKS))
+        changed = build_timeline("p:478", SPRINTS, TASKS[:2])
+
+        assert timeline_etag(first) == timeline_etag(again)
+        assert timeline_etag(first) != timeline_etag(changed)
+
+    def test_if_none_match(self):
+        etag = timeline_etag({"a": 1})
+
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches(None, etag)
+        assert not etag_matches('"other"', etag)
+
+
+@pytest.mark.asyncio
+async def test_handler_fetches_sprints_and_tasks_concurrently():
+    handler = PMHandler(db_session=MagicMock())
+    running = set()
+    overlapped = []
+
+    async def fake_list(name, items):
+        running.add(name)
+        await asyncio.sleep(0.01)
+        overlapped.append(len(running) == 2)
+        running.discard(name)
+        return items
+
+    handler.list_sprints = lambda project_id: fake_list("sprints", SPRINTS)
+    handler.list_tasks = lambda project_id: fake_list("tasks", TASKS)
+
+    timeline = await handler.get_project_timeline("p:478")
+
+    assert any(overlapped)
+    assert _ids(timeline["tasks"]) == ["p:10", "p:11"]
@@ -0,0 +1,170 @@
+"""
+Tests for PM entity name resolution.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+
+from shared.resolution import AmbiguousEntityError, EntityResolver, NameIndex
+
+
+SPRINTS = [
+    {"id": "prov:613", "name": "Sprint 4"},
+    {"id": "prov:615", "name": "Sprint 6 - Payments"},
+    {"id": "prov:620", "name": "Sprint 16"},
+    {"id": "prov:700", "name": "Hardening"},
+]
+
+USERS = [
+    {"id": "u1", "name": "Nguyen Van Minh", "email": "minh.nguyen@example.com"},
+    {"id": "u2", "name": "Tran Thi Lan", "username": "lant"},
+    {"id": "u3", "name": "Minh Anh Le"},
+]
+
+
+@dataclass
+class Sprint:
+    id: str
+    name: str
+    status: Optional[str] = None
+
+
+class TestNameIndex:
+    """Tests for NameIndex lookup tiers."""
+
+    def test_id_and_composite_id(self):
+        index = NameIndex("sprint", SPRINTS)
+
+        assert index.lookup("prov:613")[0].name == "Sprint 4"
+        assert index.lookup("613")[0].match == "id"
+        assert index.lookup("other:478:615")[0].id == "prov:615"
+
+    def test_exact_name_ignores_case_and_separators(self):
+        index = NameIndex("sprint", SPRINTS)
+
+        assert index.lookup("sprint-4")[0].id == "prov:613"
+        assert index.lookup("SPRINT_4")[0].match == "exact"
+
+    def test_number_does_not_match_longer_numbers(self):
+        index = NameIndex("sprint", SPRINTS)
+
+        matches = index.lookup("6")
+        assert [m.id for m in matches] == ["prov:615"]
+        assert matches[0].match == "number"
+        assert [m.id for m in index.lookup("sprint 16")] == ["prov:620"]
+
+    def test_user_tokens_and_email_alias(self):
+        index = NameIndex("user", USERS)
+
+        assert [m.id for m in index.lookup("lan")] == ["u2"]
+        assert [m.id for m in index.lookup("lant")] == ["u2"]
+        assert {m.id for m in index.lookup("minh")} == {"u1", "u3"}
+        assert [m.id for m in index.lookup("minh.nguyen")] == ["u1"]
+
+    def test_partial_and_fuzzy(self):
+        index = NameIndex("sprint", SPRINTS)
+
+        assert index.lookup("harden")[0].match == "partial"
+        fuzzy = index.lookup("hardning")
+        assert [m.id for m in fuzzy] == ["prov:700"]
+        assert fuzzy[0].match == "fuzzy"
+        assert index.lookup("retrospective") == []
+        assert index.lookup("sprnt 7") == []
+        assert [m.id for m in index.lookup("sprnt 4")] == ["prov:613"]
+
+    def test_objects_are_indexed_like_dicts(self):
+        index = NameIndex("sprint", [Sprint(id="613", name="Sprint 4", status="active")])
+
+        assert index.lookup("4")[0].entity.status == "active"
+
+
+class TestEntityResolver:
+    """Tests for caching and refresh in EntityResolver."""
+
+    @staticmethod
+    def _loader(items, calls):
+        async def load():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return list(items)
+        return load
+
+    @pytest.mark.asyncio
+    async def test_lookups_reuse_one_listing(self):
+        resolver = EntityResolver(ttl_seconds=300, miss_refresh_seconds=30)
+        calls = []
+        loader = self._loader(SPRINTS, calls)
+
+        first = await resolver.resolve("sprint", "Sprint 4", loader, scope="s", project_id="478")
+        second = await resolver.resolve("sprint", "6", loader, scope="s", project_id="478")
+
+        assert (first.id, second.id) == ("prov:613", "prov:615")
+        assert len(calls) == 1
+        assert resolver.stats["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_the_load(self):
+        resolver = EntityResolver(ttl_seconds=300, miss_refresh_seconds=30)
+        calls = []
+        loader = self._loader(SPRINTS, calls)
+
+        results = await asyncio.gather(*[
+            resolver.resolve("sprint", name, loader, project_id="478")
+            for name in ("Sprint 4", "6", "16", "hardening")
+        ])
+
+        assert [r.id for r in results] == ["prov:613", "prov:615", "prov:620", "prov:700"]
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_miss_reloads_only_when_index_is_old_enough(self):
+        resolver = EntityResolver(ttl_seconds=300, miss_refresh_seconds=30)
+        items = list(SPRINTS)
+        calls = []
+        loader = self._loader(items, calls)
+        await resolver.resolve("sprint", "Sprint 4", loader, project_id="478")
+        items.append({"id": "prov:800", "name": "Sprint 7"})
+
+        assert await resolver.resolve("sprint", "Sprint 7", loader, project_id="478") is None
+        assert len(calls) == 1
+
+        resolver.miss_refresh_seconds = 0
+        assert (await resolver.resolve("sprint", "Sprint 7", loader, project_id="478")).id == "prov:800"
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_ambiguous_reference_raises(self):
+        resolver = EntityResolver()
+        calls = []
+
+        with pytest.raises(AmbiguousEntityError) as exc:
+            await resolver.resolve("user", "minh", self._loader(USERS, calls))
+
+        assert {c.id for c in exc.value.candidates} == {"u1", "u3"}
+        assert isinstance(exc.value, ValueError)
+
+    @pytest.mark.asyncio
+    async def test_prime_and_invalidate(self):
+        resolver = EntityResolver(ttl_seconds=300)
+        calls = []
+        resolver.prime("user", USERS, scope="s", project_id="478")
+
+        assert (await resolver.resolve("user", "lan", self._loader([], calls), scope="s", project_id="478")).id == "u2"
+        assert calls == []
+
+        resolver.invalidate(kind="user", scope="s")
+        assert await resolver.resolve("user", "lan", self._loader([], calls), scope="s", project_id="478") is None
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_scopes_and_projects_are_separate(self):
+        resolver = EntityResolver(ttl_seconds=300)
+        resolver.prime("sprint", SPRINTS, scope="a", project_id="478")
+        calls = []
+
+        assert await resolver.resolve("sprint", "Sprint 4", self._loader([], calls), scope="b", project_id="478") is None
+        assert await resolver.resolve("sprint", "Sprint 4", self._loader([], calls), scope="a", project_id="479") is None
+        assert len(calls) == 2
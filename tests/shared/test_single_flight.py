@@ -0,0 +1,94 @@
+"""
+Tests for shared single-flight loads.
+"""
+
+import asyncio
+
+import pytest
+
+from shared.concurrency import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_load():
+    flights = SingleFlight()
+    calls = []
+    joined = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    results = await asyncio.gather(
+        *(flights.run("key", load, on_join=lambda: joined.append(1)) for _ in range(3))
+    )
+
+    assert results == ["value"] * 3
+    assert len(calls) == 1
+    assert len(joined) == 2
+
+
+@pytest.mark.asyncio
+async def test_failure_reaches_every_waiter_and_is_not_shared_afterwards():
+    flights = SingleFlight()
+    attempts = []
+
+    async def load():
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        flights.run("key", load), flights.run("key", load), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(attempts) == 1
+    with pytest.raises(RuntimeError):
+        await flights.run("key", load)
+    assert len(attempts) == 2
+
+
+@pytest.mark.asyncio
+async def test_waiters_run_their_own_load_when_the_runner_is_cancelled():
+    flights = SingleFlight()
+    started = asyncio.Event()
+    calls = []
+
+    async def load():
+        calls.append(1)
+        started.set()
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    runner = asyncio.create_task(flights.run("key", load))
+    await started.wait()
+    waiter = asyncio.create_task(flights.run("key", load))
+    await asyncio.sleep(0)
+    runner.cancel()
+
+    assert await waiter == 2
+    assert runner.cancelled()
+    assert not waiter.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_cancelling_a_waiter_does_not_cancel_the_load():
+    flights = SingleFlight()
+    started = asyncio.Event()
+
+    async def load():
+        started.set()
+        await asyncio.sleep(0.02)
+        return "value"
+
+    runner = asyncio.create_task(flights.run("key", load))
+    await started.wait()
+    waiter = asyncio.create_task(flights.run("key", load))
+    await asyncio.sleep(0)
+    waiter.cancel()
+
+    assert await runner == "value"
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
@@ -13,7 +13,9 @@ export async function GET(
 ) {
   const { project_id: projectId } = await params;
   const decodedProjectId = decodeURIComponent(projectId);
-  const url = `${BACKEND_URL}/api/pm/projects/${encodeURIComponent(decodedProjectId)}/timeline`;
+  // Forward the date window (start/end) untouched
+  const url = `${BACKEND_URL}/api/pm/projects/${encodeURIComponent(decodedProjectId)}/timeline${request.nextUrl.search}`;
+  const ifNoneMatch = request.headers.get('if-none-match');
   
   try {
     const controller = new AbortController();
@@ -23,12 +25,23 @@ export async function GET(
       method: 'GET',
       headers: {
         'Content-Type': 'application/json',
+        ...(ifNoneMatch ? { 'If-None-Match': ifNoneMatch } : {}),
       },
       signal: controller.signal,
     });
 
     clearTimeout(timeoutId);
 
+    const etag = response.headers.get('etag');
+    const cacheHeaders: Record<string, string> = { 'Cache-Control': 'private, no-cache' };
+    if (etag) {
+      cacheHeaders.ETag = etag;
+    }
+
+    if (response.status === 304) {
+      return new NextResponse(null, { status: 304, headers: cacheHeaders });
+    }
+
     if (!response.ok) {
       const errorText = await response.text().catch(() => response.statusText);
       console.error('[API Proxy] Backend error:', response.status, errorText);
@@ -39,7 +52,7 @@ export async function GET(
     }
 
     const data = await response.json();
-    return NextResponse.json(data);
+    return NextResponse.json(data, { headers: cacheHeaders });
   } catch (error) {
     console.error('[API Proxy] Error fetching timeline:', error);
     const errorMessage = error instanceof Error ? error.message : String(error);
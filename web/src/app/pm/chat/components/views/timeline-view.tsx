@@ -7,6 +7,8 @@ import { useMemo, useState } from "react";
 import {
   AlertCircle,
   CalendarRange,
+  ChevronLeft,
+  ChevronRight,
   ListChecks,
   Loader2,
   Users,
@@ -23,6 +25,7 @@ import {
 } from "recharts";
 
 import { Badge } from "~/components/ui/badge";
+import { Button } from "~/components/ui/button";
 import { Card } from "~/components/ui/card";
 import {
   Select,
@@ -45,6 +48,29 @@ import {
 const DAY_IN_MS = 1000 * 60 * 60 * 24;
 const UNASSIGNED_KEY = "__unassigned__";
 
+// Visible window lengths; "all" loads the whole project timeline
+type TimelineZoom = "month" | "quarter" | "half" | "year" | "all";
+
+const ZOOM_DAYS: Record<Exclude<TimelineZoom, "all">, number> = {
+  month: 31,
+  quarter: 91,
+  half: 182,
+  year: 365,
+};
+
+const ZOOM_LABELS: Record<TimelineZoom, string> = {
+  month: "1 month",
+  quarter: "3 months",
+  half: "6 months",
+  year: "1 year",
+  all: "All dates",
+};
+
+// A new window starts a little before today so recent work stays in view
+const WINDOW_LEAD_DAYS = 14;
+
+type TimelineWindow = { start: Date; end: Date };
+
 const shortDateFormatter = new Intl.DateTimeFormat(undefined, {
   month: "short",
   day: "numeric",
@@ -70,6 +96,18 @@ function addDays(base: Date, days: number) {
   return next;
 }
 
+function startOfDay(date: Date) {
+  const day = new Date(date);
+  day.setHours(0, 0, 0, 0);
+  return day;
+}
+
+function toISODate(date: Date) {
+  const month = String(date.getMonth() + 1).padStart(2, "0");
+  const day = String(date.getDate()).padStart(2, "0");
+  return `${date.getFullYear()}-${month}-${day}`;
+}
+
 function parseISO(value: string | null | undefined): Date | null {
   if (!value) return null;
   const parsed = new Date(value);
@@ -162,6 +200,7 @@ function buildChartData<T extends TimelineSprint | TimelineTask>(
   getEnd: (item: T) => Date | null,
   getColor: (item: T) => string,
   getDetails: (item: T, start: Date, end: Date) => Record<string, string | null | undefined>,
+  visibleWindow: TimelineWindow | null = null,
 ) {
   const scheduled = items.filter((item) => item.is_scheduled);
   if (scheduled.length === 0) {
@@ -183,13 +222,20 @@ function buildChartData<T extends TimelineSprint | TimelineTask>(
     return { data: [] as ChartDatum[], minDate: null, totalDays: 0 };
   }
 
-  const minDate = addDays(new Date(Math.min(...startValues)), -1);
-  const maxDate = addDays(new Date(Math.max(...endValues)), 1);
+  // With a visible window the axis spans exactly that window and bars are clipped to it
+  const minDate = visibleWindow
+    ? visibleWindow.start
+    : addDays(new Date(Math.min(...startValues)), -1);
+  const maxDate = visibleWindow
+    ? visibleWindow.end
+    : addDays(new Date(Math.max(...endValues)), 1);
   const totalDays = Math.max(1, Math.round((maxDate.getTime() - minDate.getTime()) / DAY_IN_MS));
 
   const data = scheduled.map((item) => {
-    const start = getStart(item)!;
-    const end = getEnd(item)!;
+    const itemStart = getStart(item)!;
+    const itemEnd = getEnd(item)!;
+    const start = visibleWindow && itemStart < minDate ? minDate : itemStart;
+    const end = visibleWindow && itemEnd > maxDate ? maxDate : itemEnd;
     const startOffset = Math.max(0, Math.round((start.getTime() - minDate.getTime()) / DAY_IN_MS));
     const duration = Math.max(1, Math.round((end.getTime() - start.getTime()) / DAY_IN_MS) || 1);
 
@@ -199,7 +245,7 @@ function buildChartData<T extends TimelineSprint | TimelineTask>(
       startOffset,
       duration,
       color: getColor(item),
-      details: getDetails(item, start, end),
+      details: getDetails(item, itemStart, itemEnd),
     };
   });
 
@@ -262,10 +308,20 @@ function TimelineContent({
   timeline,
   timelineError,
   activeProjectName,
+  refreshing,
+  zoom,
+  visibleWindow,
+  onZoomChange,
+  onPan,
 }: {
   timeline: ProjectTimelineResponse | null;
   timelineError: Error | null;
   activeProjectName: string | null;
+  refreshing: boolean;
+  zoom: TimelineZoom;
+  visibleWindow: TimelineWindow | null;
+  onZoomChange: (zoom: TimelineZoom) => void;
+  onPan: (direction: -1 | 1) => void;
 }) {
   const [sprintFilter, setSprintFilter] = useState<string>("all");
   const [statusFilter, setStatusFilter] = useState<string>("all");
@@ -347,8 +403,9 @@ function TimelineContent({
         start_date: formatDateLong(start),
         end_date: formatDateLong(end),
       }),
+      visibleWindow,
     );
-  }, [scheduledSprints]);
+  }, [scheduledSprints, visibleWindow]);
 
   const taskChart = useMemo(() => {
     return buildChartData(
@@ -363,8 +420,9 @@ function TimelineContent({
         start_date: formatDateLong(start),
         due_date: formatDateLong(end),
       }),
+      visibleWindow,
     );
-  }, [filteredTasks]);
+  }, [filteredTasks, visibleWindow]);
 
   const unscheduledTaskPreview = unscheduledTasks.slice(0, 6);
 
@@ -377,11 +435,39 @@ function TimelineContent({
             {activeProjectName ?? "Selected project"}
           </p>
         </div>
-        {timelineError ? (
-          <Badge variant="destructive" className="text-xs">
-            {timelineError.message}
-          </Badge>
-        ) : null}
+        <div className="flex flex-wrap items-center gap-2">
+          {timelineError ? (
+            <Badge variant="destructive" className="text-xs">
+              {timelineError.message}
+            </Badge>
+          ) : null}
+          {refreshing ? <Loader2 className="h-4 w-4 animate-spin text-gray-400" /> : null}
+          {visibleWindow ? (
+            <div className="flex items-center gap-1">
+              <Button variant="outline" size="icon" aria-label="Earlier" onClick={() => onPan(-1)}>
+                <ChevronLeft className="h-4 w-4" />
+              </Button>
+              <span className="min-w-[11rem] text-center text-sm text-gray-600 dark:text-gray-300">
+                {formatDateLong(visibleWindow.start)} – {formatDateLong(visibleWindow.end)}
+              </span>
+              <Button variant="outline" size="icon" aria-label="Later" onClick={() => onPan(1)}>
+                <ChevronRight className="h-4 w-4" />
+              </Button>
+            </div>
+          ) : null}
+          <Select value={zoom} onValueChange={(value) => onZoomChange(value as TimelineZoom)}>
+            <SelectTrigger className="w-[130px]">
+              <SelectValue />
+            </SelectTrigger>
+            <SelectContent>
+              {(Object.keys(ZOOM_LABELS) as TimelineZoom[]).map((value) => (
+                <SelectItem key={value} value={value}>
+                  {ZOOM_LABELS[value]}
+                </SelectItem>
+              ))}
+            </SelectContent>
+          </Select>
+        </div>
       </div>
 
       <div className="grid gap-4 sm:grid-cols-2 xl:grid-cols-4">
@@ -668,11 +754,34 @@ function TimelineContent({
 
 export function TimelineView() {
   const { activeProject, projectIdForData, projectsLoading } = useProjectData();
+  const [zoom, setZoom] = useState<TimelineZoom>("quarter");
+  const [windowStart, setWindowStart] = useState<Date>(() =>
+    addDays(startOfDay(new Date()), -WINDOW_LEAD_DAYS),
+  );
+
+  const visibleWindow = useMemo<TimelineWindow | null>(
+    () => (zoom === "all" ? null : { start: windowStart, end: addDays(windowStart, ZOOM_DAYS[zoom]) }),
+    [zoom, windowStart],
+  );
+  // Only the visible window is requested; panning or zooming fetches the next one
+  const range = useMemo(
+    () =>
+      visibleWindow
+        ? { start: toISODate(visibleWindow.start), end: toISODate(visibleWindow.end) }
+        : undefined,
+    [visibleWindow],
+  );
   const {
     timeline,
     loading: timelineLoading,
     error: timelineError,
-  } = useTimeline(projectIdForData);
+  } = useTimeline(projectIdForData, range);
+
+  const panWindow = (direction: -1 | 1) => {
+    if (zoom === "all") return;
+    // Step by half a window so consecutive views overlap
+    setWindowStart((start) => addDays(start, direction * Math.round(ZOOM_DAYS[zoom] / 2)));
+  };
 
   if (!projectIdForData) {
     return (
@@ -685,7 +794,8 @@ export function TimelineView() {
     );
   }
 
-  const isLoading = projectsLoading || timelineLoading;
+  // Keep the current chart on screen while the next window loads
+  const isLoading = projectsLoading || (timelineLoading && !timeline);
 
   // Get counts for progressive loading display
   const sprintsCount = timeline?.sprints?.length || 0;
@@ -710,6 +820,11 @@ export function TimelineView() {
       timeline={timeline}
       timelineError={timelineError}
       activeProjectName={activeProject?.name ?? null}
+      refreshing={timelineLoading}
+      zoom={zoom}
+      visibleWindow={visibleWindow}
+      onZoomChange={setZoom}
+      onPan={panWindow}
     />
   );
 }
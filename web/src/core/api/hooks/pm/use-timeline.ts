@@ -1,4 +1,4 @@
-import { useCallback, useEffect, useState } from "react";
+import { useCallback, useEffect, useRef, useState } from "react";
 
 import { resolveServiceURL } from "~/core/api/resolve-service-url";
 import { usePMRefresh } from "./use-pm-refresh";
@@ -42,6 +42,7 @@ export interface ProjectTimelineResponse {
   project_id: string;
   project_key?: string;
   project_name?: string;
+  window?: { start: string | null; end: string | null };
   sprints: TimelineSprint[];
   tasks: TimelineTask[];
   unscheduled: {
@@ -50,22 +51,72 @@ export interface ProjectTimelineResponse {
   };
 }
 
-const fetchTimeline = async (projectId: string): Promise<ProjectTimelineResponse> => {
-  const url = resolveServiceURL(`pm/projects/${projectId}/timeline`);
-  const response = await fetch(url);
+// Last timeline per project and window, revalidated with its ETag so an
+// unchanged timeline comes back as an empty 304 instead of the full payload.
+// Panning visits a new window per step, so only the most recent ones are kept.
+const MAX_CACHED_TIMELINES = 24;
+const timelineCache = new Map<string, { etag: string; data: ProjectTimelineResponse }>();
+
+const rememberTimeline = (url: string, entry: { etag: string; data: ProjectTimelineResponse }) => {
+  // Map iteration follows insertion order, so re-inserting marks it most recent
+  timelineCache.delete(url);
+  timelineCache.set(url, entry);
+  while (timelineCache.size > MAX_CACHED_TIMELINES) {
+    const oldest = timelineCache.keys().next().value;
+    if (oldest === undefined) break;
+    timelineCache.delete(oldest);
+  }
+};
+
+const fetchTimeline = async (
+  projectId: string,
+  range?: { start?: string; end?: string },
+  signal?: AbortSignal,
+): Promise<ProjectTimelineResponse> => {
+  const params = new URLSearchParams();
+  if (range?.start) params.set("start", range.start);
+  if (range?.end) params.set("end", range.end);
+  const query = params.toString();
+  const url = resolveServiceURL(`pm/projects/${projectId}/timeline${query ? `?${query}` : ""}`);
+
+  const cached = timelineCache.get(url);
+  const response = await fetch(url, {
+    headers: cached ? { "If-None-Match": cached.etag } : undefined,
+    signal,
+  });
+  if (response.status === 304 && cached) {
+    rememberTimeline(url, cached);
+    return cached.data;
+  }
   if (!response.ok) {
     const message = await response.text();
     throw new Error(message || `Failed to load project timeline (status ${response.status})`);
   }
-  return response.json();
+  const data = (await response.json()) as ProjectTimelineResponse;
+  const etag = response.headers.get("etag");
+  if (etag) {
+    rememberTimeline(url, { etag, data });
+  }
+  return data;
 };
 
-export function useTimeline(projectId?: string | null) {
+export function useTimeline(
+  projectId?: string | null,
+  range?: { start?: string; end?: string },
+) {
   const [timeline, setTimeline] = useState<ProjectTimelineResponse | null>(null);
   const [loading, setLoading] = useState<boolean>(!!projectId);
   const [error, setError] = useState<Error | null>(null);
+  const windowStart = range?.start;
+  const windowEnd = range?.end;
+  // Request of the current (projectId, window); older ones are aborted so a
+  // slow response for a previous window cannot overwrite the current one
+  const requestRef = useRef<AbortController | null>(null);
 
   const refresh = useCallback(() => {
+    requestRef.current?.abort();
+    requestRef.current = null;
+
     if (!projectId) {
       setTimeline(null);
       setLoading(false);
@@ -73,25 +124,32 @@ export function useTimeline(projectId?: string | null) {
       return;
     }
 
+    const controller = new AbortController();
+    requestRef.current = controller;
     setLoading(true);
     setError(null);
-    fetchTimeline(projectId)
+    fetchTimeline(projectId, { start: windowStart, end: windowEnd }, controller.signal)
       .then((data) => {
+        if (controller.signal.aborted) return;
         setTimeline(data);
       })
       .catch((err: Error) => {
+        if (controller.signal.aborted) return;
         setTimeline(null);
         setError(err);
       })
       .finally(() => {
+        if (controller.signal.aborted) return;
         setLoading(false);
       });
-  }, [projectId]);
+  }, [projectId, windowStart, windowEnd]);
 
   useEffect(() => {
     refresh();
   }, [refresh]);
 
+  useEffect(() => () => requestRef.current?.abort(), []);
+
   usePMRefresh(refresh);
 
   return { timeline, loading, error, refresh };